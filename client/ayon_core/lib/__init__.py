@@ -94,12 +94,22 @@ from .profiles_filtering import (
     filter_profiles
 )
 
+from .media_jobs import (
+    MediaJob,
+    MediaJobResult,
+    MediaJobOrchestrator,
+    get_media_job_orchestrator,
+    run_media_batch,
+)
+
 from .transcoding import (
     get_transcode_temp_directory,
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
     convert_input_paths_for_ffmpeg,
+    convert_input_paths_for_ffmpeg_async,
     get_ffprobe_data,
+    get_ffprobe_data_async,
     get_ffprobe_streams,
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
@@ -107,6 +117,7 @@ from .transcoding import (
     convert_ffprobe_fps_to_float,
     get_rescaled_command_arguments,
     get_media_mime_type,
+    is_tiled_exr,
 )
 
 from .plugin_tools import (
@@ -194,11 +205,19 @@ __all__ = [
     "import_module_from_dirpath",
     "is_func_signature_supported",
 
+    "MediaJob",
+    "MediaJobResult",
+    "MediaJobOrchestrator",
+    "get_media_job_orchestrator",
+    "run_media_batch",
+
     "get_transcode_temp_directory",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
     "convert_input_paths_for_ffmpeg",
+    "convert_input_paths_for_ffmpeg_async",
     "get_ffprobe_data",
+    "get_ffprobe_data_async",
     "get_ffprobe_streams",
     "get_ffmpeg_codec_args",
     "get_ffmpeg_format_args",
@@ -206,6 +225,7 @@ __all__ = [
     "convert_ffprobe_fps_to_float",
     "get_rescaled_command_arguments",
     "get_media_mime_type",
+    "is_tiled_exr",
 
     "compile_list_of_regexes",
 
@@ -1,15 +1,22 @@
 import os
+import re
 import sys
-import subprocess
-import platform
 import json
+import platform
 import tempfile
+import threading
+import subprocess
+import collections
 
 from .log import Logger
 from .vendor_bin_utils import find_executable
 
 # MSDN process creation flag (Windows only)
 CREATE_NO_WINDOW = 0x08000000
+# Number of kept output lines of each stream when output is streamed
+DEFAULT_MAX_OUTPUT_LINES = 1000
+_STREAM_CHUNK_SIZE = 65536
+_LINE_SPLIT_REGEX = re.compile(b"\r\n|\r|\n")
 
 
 def execute(args, silent=False, cwd=None, env=None, shell=None):
@@ -79,14 +86,29 @@ def run_subprocess(*args, **kwargs):
     On windows are 'creationflags' filled with flags that should cause ignore
     creation of new window.
 
+    Output can be streamed, in that case both pipes are read incrementally
+    while the process is running and only last lines of the output are
+    kept. Streaming is enabled with 'stream_output' or if any of
+    'line_callback', 'progress_callback' or 'max_output_lines' is passed.
+
+    Progress of ffmpeg is available only if ffmpeg is launched with
+    '-progress pipe:1' arguments. Progress callback receives dictionary
+    with keys 'frame', 'fps', 'speed', 'out_time' (in seconds) and
+    'finished', values are None if ffmpeg did not report them.
+
     Args:
         *args: Variable length argument list passed to Popen.
         **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
             pass `logging.Logger` object under "logger" to use custom logger
-            for output.
+            for output. Streaming can be enabled with "stream_output" and
+            configured with "line_callback" (called with line and stream
+            name 'stdout' or 'stderr'),
+            "progress_callback" (called with ffmpeg progress) and
+            "max_output_lines" (number of kept lines per stream).
 
     Returns:
-        str: Full output of subprocess concatenated stdout and stderr.
+        str: Full output of subprocess concatenated stdout and stderr. Only
+            last lines of each stream if output is streamed.
 
     Raises:
         RuntimeError: Exception is raised if process finished with nonzero
@@ -133,6 +155,16 @@ def run_subprocess(*args, **kwargs):
     if logger is None:
         logger = Logger.get_logger("run_subprocess")
 
+    line_callback = kwargs.pop("line_callback", None)
+    progress_callback = kwargs.pop("progress_callback", None)
+    max_output_lines = kwargs.pop("max_output_lines", None)
+    stream_output = (
+        kwargs.pop("stream_output", False)
+        or line_callback is not None
+        or progress_callback is not None
+        or max_output_lines is not None
+    )
+
     # set overrides
     kwargs["stdout"] = kwargs.get("stdout", subprocess.PIPE)
     kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
@@ -141,15 +173,27 @@ def run_subprocess(*args, **kwargs):
 
     proc = subprocess.Popen(*args, **kwargs)
 
+    if stream_output:
+        _stdout, _stderr = _stream_process_output(
+            proc,
+            logger,
+            line_callback,
+            progress_callback,
+            max_output_lines or DEFAULT_MAX_OUTPUT_LINES,
+        )
+    else:
+        _stdout, _stderr = proc.communicate()
+        if _stdout:
+            _stdout = _stdout.decode("utf-8", errors="backslashreplace")
+        if _stderr:
+            _stderr = _stderr.decode("utf-8", errors="backslashreplace")
+
     full_output = ""
-    _stdout, _stderr = proc.communicate()
     if _stdout:
-        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
         full_output += _stdout
         logger.debug(_stdout)
 
     if _stderr:
-        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
         # Add additional line break if output already contains stdout
         if full_output:
             full_output += "\n"
@@ -169,6 +213,184 @@ def run_subprocess(*args, **kwargs):
     return full_output
 
 
+class _OutputTail:
+    """Last lines of process output stream."""
+
+    def __init__(self, max_lines):
+        self._lines = collections.deque(maxlen=max_lines)
+        self._skipped = 0
+
+    def add(self, line):
+        if len(self._lines) == self._lines.maxlen:
+            self._skipped += 1
+        self._lines.append(line)
+
+    def get_output(self):
+        lines = list(self._lines)
+        if self._skipped:
+            lines.insert(
+                0, "... ({} lines skipped)".format(self._skipped)
+            )
+        return "\n".join(lines)
+
+
+class _FFmpegProgressParser:
+    """Parse progress written by ffmpeg with '-progress' argument.
+
+    Progress is written as block of 'key=value' lines, each block ends
+    with 'progress' key.
+    """
+
+    _line_regex = re.compile(
+        r"^(frame|fps|bitrate|total_size|out_time(?:_ms|_us)?|dup_frames"
+        r"|drop_frames|speed|progress|stream_\d+_\d+_q)=(.*)$"
+    )
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._values = {}
+
+    def feed_line(self, line):
+        """Process output line.
+
+        Returns:
+            bool: Line is part of progress output.
+        """
+        match = self._line_regex.match(line.strip())
+        if match is None:
+            return False
+
+        key, value = match.groups()
+        if key != "progress":
+            self._values[key] = value.strip()
+            return True
+
+        values = self._values
+        self._values = {}
+        self._callback({
+            "frame": self._to_number(values.get("frame"), int),
+            "fps": self._to_number(values.get("fps"), float),
+            "speed": self._to_number(
+                values.get("speed", "").rstrip("x"), float
+            ),
+            "out_time": self._get_out_time(values),
+            "finished": value.strip() == "end",
+        })
+        return True
+
+    @staticmethod
+    def _to_number(value, number_type):
+        try:
+            return number_type(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _get_out_time(self, values):
+        # 'out_time_ms' is in microseconds too
+        for key in ("out_time_us", "out_time_ms"):
+            value = self._to_number(values.get(key), int)
+            if value is not None:
+                return value / 1000000.0
+        return None
+
+
+def _iter_stream_lines(stream):
+    """Read lines from binary stream as they come.
+
+    Lines are split by both new line and carriage return, so progress
+    lines rewritten with carriage return are not accumulated.
+    """
+    remainder = b""
+    read = getattr(stream, "read1", stream.read)
+    while True:
+        chunk = read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        lines = _LINE_SPLIT_REGEX.split(remainder + chunk)
+        remainder = lines.pop(-1)
+        for line in lines:
+            if line:
+                yield line.decode("utf-8", errors="backslashreplace")
+
+    if remainder:
+        yield remainder.decode("utf-8", errors="backslashreplace")
+
+
+def _stream_process_output(
+    proc, logger, line_callback, progress_callback, max_output_lines
+):
+    """Read output pipes of running process line by line.
+
+    Each pipe is read in its own thread so process is not blocked by full
+    pipe. Callbacks are not called at the same time from both threads.
+
+    Returns:
+        tuple[Union[str, None], Union[str, None]]: Last lines of stdout
+            and stderr, or None if stream was not piped.
+    """
+    if proc.stdin is not None:
+        proc.stdin.close()
+
+    lock = threading.Lock()
+    progress_parser = None
+    if progress_callback is not None:
+        progress_parser = _FFmpegProgressParser(progress_callback)
+
+    def _read_stream(stream, stream_name, tail):
+        callback_failed = False
+        for line in _iter_stream_lines(stream):
+            with lock:
+                try:
+                    if (
+                        progress_parser is not None
+                        and progress_parser.feed_line(line)
+                    ):
+                        continue
+                    tail.add(line)
+                    if line_callback is not None:
+                        line_callback(line, stream_name)
+                except Exception:
+                    # Pipe must be read until the end even if callback
+                    #   fails, otherwise the process may hang
+                    if not callback_failed:
+                        callback_failed = True
+                        logger.warning(
+                            "Failed to process output line of {}".format(
+                                stream_name
+                            ),
+                            exc_info=True
+                        )
+        stream.close()
+
+    tails = []
+    threads = []
+    for stream, stream_name in (
+        (proc.stdout, "stdout"),
+        (proc.stderr, "stderr"),
+    ):
+        if stream is None:
+            tails.append(None)
+            continue
+        tail = _OutputTail(max_output_lines)
+        tails.append(tail)
+        thread = threading.Thread(
+            target=_read_stream,
+            args=(stream, stream_name, tail),
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+    proc.wait()
+
+    return tuple(
+        tail.get_output() if tail is not None else None
+        for tail in tails
+    )
+
+
 def clean_envs_for_ayon_process(env=None):
     """Modify environments that may affect ayon-launcher process.
 
@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import errno
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ayon_core.lib import create_hard_link
 
@@ -48,12 +49,21 @@ class FileTransaction:
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger.
+        allow_queue_replacements (bool): Allow to replace queued transfer
+            with different source path.
+        max_workers (Optional[int]): Number of threads used to transfer
+            files. Files are transferred one by one if not set.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self, log=None, allow_queue_replacements=False, max_workers=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
@@ -71,6 +81,8 @@ class FileTransaction:
 
         self._allow_queue_replacements = allow_queue_replacements
 
+        self._max_workers = max_workers or 1
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
@@ -108,7 +120,14 @@ class FileTransaction:
 
         self._transfers[dst] = (src, opts)
 
-    def process(self):
+    def process(self, progress_callback=None):
+        """Backup existing files and transfer queued files.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                with number of transferred files and number of all files
+                after each transfer.
+        """
         # Backup any existing files
         for dst, (src, _) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
@@ -125,6 +144,7 @@ class FileTransaction:
             os.rename(dst, backup)
 
         # Copy the files to transfer
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
             if path_same:
@@ -132,18 +152,54 @@ class FileTransaction:
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
-
-            self._create_folder_for_file(dst)
-
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
-
-            self._transferred.append(dst)
+            transfers.append((src, dst, opts))
+
+        total = len(transfers)
+        if self._max_workers < 2 or total < 2:
+            for src, dst, opts in transfers:
+                self._transfer_file(src, dst, opts)
+                self._transferred.append(dst)
+                if progress_callback is not None:
+                    progress_callback(len(self._transferred), total)
+            return
+
+        # Transferred files are tracked even if any transfer fails so
+        #   rollback can remove them
+        first_exc = None
+        max_workers = min(self._max_workers, total)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._transfer_file, src, dst, opts): dst
+                for src, dst, opts in transfers
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                exc = future.exception()
+                if exc is not None:
+                    if first_exc is None:
+                        first_exc = exc
+                        for other_future in futures:
+                            other_future.cancel()
+                    continue
+
+                self._transferred.append(futures[future])
+                if progress_callback is not None:
+                    progress_callback(len(self._transferred), total)
+
+        if first_exc is not None:
+            raise first_exc
+
+    def _transfer_file(self, src, dst, opts):
+        self._create_folder_for_file(dst)
+
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
 
     def finalize(self):
         # Delete any backed up files
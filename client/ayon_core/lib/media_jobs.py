@@ -0,0 +1,476 @@
+"""Bounded pool of external media processes (ffmpeg, ffprobe, oiiotool).
+
+All jobs run in an asyncio event loop of a background thread, so the
+limit of concurrently running processes is shared by all callers, no
+matter from which thread or event loop they submit jobs.
+"""
+import os
+import time
+import uuid
+import asyncio
+import logging
+import platform
+import threading
+import subprocess
+import collections
+import concurrent.futures
+
+# Expected memory used by one media process
+MEMORY_PER_JOB = 2 * 1024 ** 3
+
+
+def _get_total_memory():
+    """Total physical memory in bytes or None if can't be determined."""
+    try:
+        import psutil
+
+        return psutil.virtual_memory().total
+    except Exception:
+        pass
+
+    if platform.system().lower() == "windows":
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+            return status.ullTotalPhys
+        except Exception:
+            return None
+
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def get_default_max_media_jobs():
+    """Default maximum number of concurrently running media processes.
+
+    Value can be set with 'AYON_MEDIA_MAX_JOBS' environment variable,
+    otherwise is based on CPU count and physical memory. Media tools are
+    multithreaded on their own so only half of CPU cores is used.
+
+    Returns:
+        int: Maximum number of running processes.
+    """
+    env_value = os.environ.get("AYON_MEDIA_MAX_JOBS")
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            pass
+
+    max_jobs = max(1, (os.cpu_count() or 1) // 2)
+    total_memory = _get_total_memory()
+    if total_memory:
+        max_jobs = min(max_jobs, max(1, total_memory // MEMORY_PER_JOB))
+    return max_jobs
+
+
+class MediaJobResult:
+    """Result of finished process.
+
+    Args:
+        returncode (int): Return code of process.
+        stdout (str): Decoded stdout.
+        stderr (str): Decoded stderr.
+    """
+
+    def __init__(self, returncode, stdout, stderr):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def output(self):
+        """Stdout and stderr concatenated like 'run_subprocess' does."""
+        output = self.stdout
+        if self.stderr:
+            if output:
+                output += "\n"
+            output += self.stderr
+        return output
+
+
+class MediaJob:
+    """External process job submitted to 'MediaJobOrchestrator'.
+
+    Job behaves like a future, it is possible to wait for result or cancel
+    it. Running process is killed when job is cancelled.
+
+    Args:
+        args (list[str]): Process arguments.
+        label (Optional[str]): Label of job used in logs.
+        check (bool): Raise 'RuntimeError' if process fails.
+        logger (Optional[logging.Logger]): Logger used for process output.
+        log_output (bool): Log output of process when finished.
+    """
+
+    def __init__(
+        self, args, label=None, check=True, logger=None, log_output=True
+    ):
+        self.id = uuid.uuid4().hex
+        self.args = list(args)
+        self.label = label or os.path.basename(str(self.args[0]))
+        self.check = check
+        self.logger = logger
+        self.log_output = log_output
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+
+    @property
+    def wait_time(self):
+        """Seconds the job waited in queue."""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def duration(self):
+        """Seconds the process was running."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def done(self):
+        return self.future.done()
+
+    def cancel(self):
+        return self.future.cancel()
+
+    def cancelled(self):
+        return self.future.cancelled()
+
+    def result(self, timeout=None):
+        """Wait for process to finish.
+
+        Returns:
+            MediaJobResult: Result of the process.
+
+        Raises:
+            RuntimeError: Process finished with nonzero return code and
+                'check' is enabled.
+        """
+        return self.future.result(timeout)
+
+
+class MediaJobOrchestrator:
+    """Run external media processes with global concurrency limit.
+
+    Jobs can be submitted from any thread with 'submit' or awaited from
+    any event loop with 'run'. Processes run in event loop of a daemon
+    thread which is started on first job.
+
+    Args:
+        max_jobs (Optional[int]): Maximum number of running processes.
+            Default is based on CPU count and memory.
+        history_size (int): Number of finished jobs kept for statistics.
+    """
+
+    def __init__(self, max_jobs=None, history_size=100):
+        if max_jobs is None:
+            max_jobs = get_default_max_media_jobs()
+        self._max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._running_jobs = {}
+        self._finished_jobs = collections.deque(maxlen=history_size)
+        self._log = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def max_jobs(self):
+        return self._max_jobs
+
+    def get_running_jobs(self):
+        with self._lock:
+            return list(self._running_jobs.values())
+
+    def get_finished_jobs(self):
+        """Last finished jobs with their timing."""
+        with self._lock:
+            return list(self._finished_jobs)
+
+    def submit(
+        self, args, label=None, check=True, logger=None, log_output=True
+    ):
+        """Submit process to run.
+
+        Args:
+            args (list[str]): Process arguments.
+            label (Optional[str]): Label of job used in logs.
+            check (bool): Raise 'RuntimeError' if process fails.
+            logger (Optional[logging.Logger]): Logger for process output.
+            log_output (bool): Log output of process when finished.
+
+        Returns:
+            MediaJob: Submitted job.
+        """
+        job = MediaJob(
+            args,
+            label=label,
+            check=check,
+            logger=logger,
+            log_output=log_output,
+        )
+        loop = self._get_loop()
+        job.future = asyncio.run_coroutine_threadsafe(
+            self._run_job(job), loop
+        )
+        return job
+
+    def submit_batch(self, args_list, check=True, logger=None):
+        """Submit multiple processes at once.
+
+        Args:
+            args_list (Iterable[list[str]]): Arguments of processes.
+            check (bool): Raise 'RuntimeError' if process fails.
+            logger (Optional[logging.Logger]): Logger for process output.
+
+        Returns:
+            list[MediaJob]: Submitted jobs.
+        """
+        return [
+            self.submit(args, check=check, logger=logger)
+            for args in args_list
+        ]
+
+    async def run(
+        self, args, label=None, check=True, logger=None, log_output=True
+    ):
+        """Run process and wait for result in any event loop.
+
+        Arguments are same as for 'submit'. Cancellation of awaiting task
+        kills the process.
+
+        Returns:
+            MediaJobResult: Result of the process.
+        """
+        job = MediaJob(
+            args,
+            label=label,
+            check=check,
+            logger=logger,
+            log_output=log_output,
+        )
+        loop = self._get_loop()
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        if current_loop is loop:
+            job.future = asyncio.ensure_future(self._run_job(job))
+            return await job.future
+
+        job.future = asyncio.run_coroutine_threadsafe(
+            self._run_job(job), loop
+        )
+        return await asyncio.wrap_future(job.future)
+
+    def run_coroutines(self, coroutines, timeout=None):
+        """Run coroutines in orchestrator event loop and wait for them.
+
+        Sync facade for async helpers, e.g. run multiple conversions
+        at once from synchronous code. Remaining coroutines are cancelled
+        if any of them fails.
+
+        Args:
+            coroutines (Iterable[Coroutine]): Coroutines to run.
+            timeout (Optional[float]): Timeout in seconds.
+
+        Returns:
+            list[Any]: Results of coroutines in the same order.
+        """
+        loop = self._get_loop()
+        futures = [
+            asyncio.run_coroutine_threadsafe(coroutine, loop)
+            for coroutine in coroutines
+        ]
+        try:
+            done, _ = concurrent.futures.wait(
+                futures,
+                timeout=timeout,
+                return_when=concurrent.futures.FIRST_EXCEPTION,
+            )
+            for future in done:
+                if not future.cancelled() and future.exception():
+                    raise future.exception()
+            return [future.result(0) for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def stop(self):
+        """Stop event loop thread.
+
+        Running processes are killed.
+        """
+        with self._lock:
+            loop = self._loop
+            thread = self._thread
+            self._loop = None
+            self._thread = None
+            self._semaphore = None
+
+        if loop is None:
+            return
+
+        async def _cancel_tasks():
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(_cancel_tasks(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop, ),
+                    name="MediaJobOrchestrator",
+                    daemon=True,
+                )
+                self._loop = loop
+                self._thread = thread
+                thread.start()
+            return self._loop
+
+    def _run_loop(self, loop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    async def _run_job(self, job):
+        # Semaphore is created in orchestrator loop thread, older Python
+        #   versions bind it to event loop on creation
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_jobs)
+        async with self._semaphore:
+            job.started_at = time.time()
+            with self._lock:
+                self._running_jobs[job.id] = job
+            try:
+                return await self._run_process(job)
+            finally:
+                job.finished_at = time.time()
+                with self._lock:
+                    self._running_jobs.pop(job.id, None)
+                    self._finished_jobs.append(job)
+                self._log.debug(
+                    "Job \"{}\" waited {:.2f}s, ran {:.2f}s".format(
+                        job.label, job.wait_time, job.duration
+                    )
+                )
+
+    async def _run_process(self, job):
+        logger = job.logger or self._log
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            # Hide console window of the process
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+        env = {str(k): str(v) for k, v in os.environ.items()}
+        proc = await asyncio.create_subprocess_exec(
+            *job.args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            **kwargs
+        )
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+
+        result = MediaJobResult(
+            proc.returncode,
+            stdout.decode("utf-8", errors="backslashreplace"),
+            stderr.decode("utf-8", errors="backslashreplace"),
+        )
+        if job.log_output:
+            if result.stdout:
+                logger.debug(result.stdout)
+            if result.stderr:
+                logger.info(result.stderr)
+
+        if job.check and result.returncode != 0:
+            exc_msg = "Executing arguments was not successful: \"{}\"".format(
+                job.args
+            )
+            if result.stdout:
+                exc_msg += "\n\nOutput:\n{}".format(result.stdout)
+            if result.stderr:
+                exc_msg += "\n\nError:\n{}".format(result.stderr)
+            raise RuntimeError(exc_msg)
+        return result
+
+
+class _Cache:
+    orchestrator = None
+    lock = threading.Lock()
+
+
+def get_media_job_orchestrator():
+    """Shared orchestrator of media processes.
+
+    Returns:
+        MediaJobOrchestrator: Orchestrator shared in whole process.
+    """
+    with _Cache.lock:
+        if _Cache.orchestrator is None:
+            _Cache.orchestrator = MediaJobOrchestrator()
+        return _Cache.orchestrator
+
+
+def run_media_batch(coroutines, timeout=None):
+    """Run async media helpers from synchronous code.
+
+    Example:
+        >>> run_media_batch([
+        ...     get_ffprobe_data_async(path)
+        ...     for path in paths
+        ... ])
+
+    Args:
+        coroutines (Iterable[Coroutine]): Coroutines to run.
+        timeout (Optional[float]): Timeout in seconds.
+
+    Returns:
+        list[Any]: Results of coroutines in the same order.
+    """
+    return get_media_job_orchestrator().run_coroutines(
+        coroutines, timeout=timeout
+    )
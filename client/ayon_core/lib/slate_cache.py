@@ -0,0 +1,224 @@
+"""Content addressed cache of rendered slate frames and encoded clips.
+
+Slates are usually the same for all review outputs of an instance and
+for re-publishes of the same version. Files are stored under key created
+from hash of everything that affects the result, so identical slate is
+rendered and encoded only once.
+
+Module does use only standard library so it can be used by standalone
+slate scripts.
+"""
+import os
+import re
+import time
+import json
+import uuid
+import hashlib
+import getpass
+import logging
+import tempfile
+import threading
+
+SLATE_CACHE_DIR_ENV = "AYON_SLATE_CACHE_DIR"
+
+log = logging.getLogger(__name__)
+
+
+def _get_user_name():
+    try:
+        user_name = getpass.getuser()
+    except (ImportError, KeyError, OSError):
+        return "unknown"
+    return re.sub(r"[^\w.-]", "_", user_name)
+
+
+def get_slate_cache_dir():
+    """Directory where slate cache is stored.
+
+    Can be changed with 'AYON_SLATE_CACHE_DIR' environment variable,
+    directory of current user in temp directory is used by default.
+
+    Returns:
+        str: Path to cache directory.
+    """
+    cache_dir = os.getenv(SLATE_CACHE_DIR_ENV)
+    if not cache_dir:
+        cache_dir = os.path.join(
+            tempfile.gettempdir(),
+            "ayon_slate_cache_{}".format(_get_user_name())
+        )
+    return os.path.normpath(cache_dir)
+
+
+def get_file_hash(filepath, chunk_size=1024 * 1024):
+    """Hash of file content.
+
+    Args:
+        filepath (str): Path to file.
+        chunk_size (int): Size of chunks read from the file.
+
+    Returns:
+        str: Hex digest of file content.
+    """
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_slate_cache_key(*data):
+    """Create cache key from data that affect the slate.
+
+    Args:
+        *data (Any): JSON serializable data, e.g. slate template, fill data,
+            resolution or ffmpeg arguments.
+
+    Returns:
+        str: Cache key.
+    """
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class SlateCache:
+    """Cache of slate files stored by key.
+
+    Files older than 'lifetime' are removed when cache is used for the first
+    time in a process.
+
+    Args:
+        cache_dir (Optional[str]): Cache directory. Output of
+            'get_slate_cache_dir' is used if not passed.
+    """
+    # Three days
+    lifetime = 3 * 24 * 60 * 60
+
+    _pruned_dirs = set()
+    _lock = threading.Lock()
+    _key_locks = {}
+
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = get_slate_cache_dir()
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def get_path(self, key, ext):
+        """Path where file of key is stored.
+
+        Args:
+            key (str): Cache key.
+            ext (str): File extension with dot.
+
+        Returns:
+            str: Path to file in cache. File may not exist.
+        """
+        return os.path.join(self._cache_dir, key[:2], key + ext)
+
+    def get_cached(self, key, ext):
+        """Path to cached file if it exists.
+
+        Returns:
+            Union[str, None]: Path to cached file.
+        """
+        path = self.get_path(key, ext)
+        if os.path.exists(path):
+            return path
+        return None
+
+    def get_or_create(self, key, ext, create_func, fallback_path=None):
+        """Get cached file or create it.
+
+        File is created to temporary path next to final path and moved
+        to final path when finished, so other processes never see
+        incomplete files.
+
+        Args:
+            key (str): Cache key.
+            ext (str): File extension with dot.
+            create_func (Callable[[str], None]): Function which creates
+                file at passed path.
+            fallback_path (Optional[str]): File is created at this path
+                without cache when cache directory can't be used.
+
+        Returns:
+            str: Path to cached file or fallback path.
+        """
+        self._prune()
+        path = self.get_path(key, ext)
+        # Same file is created only once when requested from more threads
+        with self._get_key_lock(path):
+            return self._get_or_create(key, ext, create_func, fallback_path)
+
+    def _get_or_create(self, key, ext, create_func, fallback_path):
+        path = self.get_cached(key, ext)
+        if path is not None:
+            log.debug(f"Using cached slate file: {path}")
+            return path
+
+        path = self.get_path(key, ext)
+        dirpath = os.path.dirname(path)
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+            if not os.access(dirpath, os.W_OK):
+                raise PermissionError(
+                    f"Slate cache directory is not writable: {dirpath}"
+                )
+        except OSError:
+            if fallback_path is None:
+                raise
+            log.warning(
+                "Slate cache is not available, creating file without cache.",
+                exc_info=True
+            )
+            create_func(fallback_path)
+            return fallback_path
+
+        tmp_path = os.path.join(
+            dirpath, "{}_{}{}".format(key, uuid.uuid4().hex, ext)
+        )
+        try:
+            create_func(tmp_path)
+            if not os.path.exists(tmp_path):
+                raise RuntimeError(
+                    f"Slate file was not created: {tmp_path}"
+                )
+            os.replace(tmp_path, path)
+
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return path
+
+    @classmethod
+    def _get_key_lock(cls, path):
+        with cls._lock:
+            lock = cls._key_locks.get(path)
+            if lock is None:
+                lock = threading.Lock()
+                cls._key_locks[path] = lock
+        return lock
+
+    def _prune(self):
+        with self._lock:
+            if self._cache_dir in self._pruned_dirs:
+                return
+            self._pruned_dirs.add(self._cache_dir)
+
+        if not os.path.exists(self._cache_dir):
+            return
+
+        outdate_time = time.time() - self.lifetime
+        for root, _, filenames in os.walk(self._cache_dir):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    if os.path.getmtime(path) < outdate_time:
+                        os.remove(path)
+                except OSError:
+                    # File can be used or removed by other process
+                    pass
@@ -2,6 +2,9 @@ import os
 import re
 import logging
 import json
+import struct
+import asyncio
+import functools
 import collections
 import tempfile
 import subprocess
@@ -11,6 +14,7 @@ from typing import Optional
 import xml.etree.ElementTree
 
 from .execute import run_subprocess
+from .media_jobs import get_media_job_orchestrator
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
     get_oiio_tool_args,
@@ -39,6 +43,13 @@ INT_TAGS = {
     "subimages",
 }
 
+# OpenEXR header
+EXR_MAGIC_NUMBER = b"\x76\x2f\x31\x01"
+EXR_TILED_FLAG = 0x200
+EXR_NON_IMAGE_FLAG = 0x800
+EXR_MULTIPART_FLAG = 0x1000
+EXR_TILED_PART_TYPES = {b"tiledimage", b"deeptile"}
+
 XML_CHAR_REF_REGEX_HEX = re.compile(r"&#x?[0-9a-fA-F]+;")
 
 # Regex to parse array attributes
@@ -84,6 +95,26 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     Stdout should contain xml format string.
     """
+    args = _get_oiio_info_args(filepath, subimages)
+    output = run_subprocess(args, logger=logger)
+    return _parse_oiio_info_output(filepath, output, subimages, logger)
+
+
+async def get_oiio_info_for_input_async(
+    filepath, logger=None, subimages=False
+):
+    """Awaitable variant of 'get_oiio_info_for_input'.
+
+    Process runs in shared pool of media processes.
+    """
+    args = _get_oiio_info_args(filepath, subimages)
+    result = await get_media_job_orchestrator().run(args, logger=logger)
+    return _parse_oiio_info_output(
+        filepath, result.output, subimages, logger
+    )
+
+
+def _get_oiio_info_args(filepath, subimages):
     args = get_oiio_tool_args(
         "oiiotool",
         "--info",
@@ -93,8 +124,10 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
         args.append("-a")
 
     args.extend(["-i:infoformat=xml", filepath])
+    return args
 
-    output = run_subprocess(args, logger=logger)
+
+def _parse_oiio_info_output(filepath, output, subimages, logger):
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -688,16 +721,60 @@ def convert_input_paths_for_ffmpeg(
         logger = logging.getLogger(__name__)
 
     first_input_path = input_paths[0]
-    ext = os.path.splitext(first_input_path)[1].lower()
+    _validate_convert_for_ffmpeg_ext(first_input_path)
+
+    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+    for oiio_cmd in _get_convert_for_ffmpeg_commands(
+        input_paths, output_dir, input_info, logger
+    ):
+        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        run_subprocess(oiio_cmd, logger=logger)
 
+
+async def convert_input_paths_for_ffmpeg_async(
+    input_paths,
+    output_dir,
+    logger=None
+):
+    """Awaitable variant of 'convert_input_paths_for_ffmpeg'.
+
+    Input files are converted concurrently in shared pool of media
+    processes.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    first_input_path = input_paths[0]
+    _validate_convert_for_ffmpeg_ext(first_input_path)
+    input_info = await get_oiio_info_for_input_async(
+        first_input_path, logger=logger
+    )
+    orchestrator = get_media_job_orchestrator()
+    await asyncio.gather(*(
+        orchestrator.run(oiio_cmd, logger=logger)
+        for oiio_cmd in _get_convert_for_ffmpeg_commands(
+            input_paths, output_dir, input_info, logger
+        )
+    ))
+
+
+def _validate_convert_for_ffmpeg_ext(first_input_path):
+    ext = os.path.splitext(first_input_path)[1].lower()
     if ext != ".exr":
         raise ValueError((
             "Function 'convert_for_ffmpeg' currently support only"
             " \".exr\" extension. Got \"{}\"."
         ).format(ext))
 
-    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
 
+def _get_convert_for_ffmpeg_commands(
+    input_paths, output_dir, input_info, logger
+):
+    """Prepare oiiotool commands converting inputs for ffmpeg.
+
+    Returns:
+        list[list[str]]: Command for each input path.
+    """
     # Change compression only if source compression is "dwaa" or "dwab"
     #   - they're not supported in ffmpeg
     compression = input_info["attribs"].get("compression")
@@ -707,6 +784,7 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
+    commands = []
     for input_path in input_paths:
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
@@ -763,9 +841,8 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
-
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+        commands.append(oiio_cmd)
+    return commands
 
 
 # FFMPEG functions
@@ -781,20 +858,7 @@ def get_ffprobe_data(path_to_file, logger=None):
     logger.debug(
         "Getting information about input \"{}\".".format(path_to_file)
     )
-    ffprobe_args = get_ffmpeg_tool_args("ffprobe")
-    args = ffprobe_args + [
-        "-hide_banner",
-        "-loglevel", "fatal",
-        "-show_error",
-        "-show_format",
-        "-show_streams",
-        "-show_programs",
-        "-show_chapters",
-        "-show_private_data",
-        "-print_format", "json",
-        path_to_file
-    ]
-
+    args = _get_ffprobe_args(path_to_file)
     logger.debug("FFprobe command: {}".format(
         subprocess.list2cmdline(args)
     ))
@@ -812,17 +876,58 @@ def get_ffprobe_data(path_to_file, logger=None):
     popen = subprocess.Popen(args, **kwargs)
 
     popen_stdout, popen_stderr = popen.communicate()
-    if popen_stdout:
-        logger.debug("FFprobe stdout:\n{}".format(
-            popen_stdout.decode("utf-8")
-        ))
+    return _parse_ffprobe_output(
+        popen_stdout.decode("utf-8"),
+        popen_stderr.decode("utf-8"),
+        logger,
+    )
+
+
+async def get_ffprobe_data_async(path_to_file, logger=None):
+    """Awaitable variant of 'get_ffprobe_data'.
+
+    Process runs in shared pool of media processes.
+    """
+    if not logger:
+        logger = logging.getLogger(__name__)
+    logger.debug(
+        "Getting information about input \"{}\".".format(path_to_file)
+    )
+    args = _get_ffprobe_args(path_to_file)
+    logger.debug("FFprobe command: {}".format(
+        subprocess.list2cmdline(args)
+    ))
+    # Output is logged by '_parse_ffprobe_output'
+    result = await get_media_job_orchestrator().run(
+        args, check=False, log_output=False
+    )
+    return _parse_ffprobe_output(result.stdout, result.stderr, logger)
+
+
+def _get_ffprobe_args(path_to_file):
+    ffprobe_args = get_ffmpeg_tool_args("ffprobe")
+    return ffprobe_args + [
+        "-hide_banner",
+        "-loglevel", "fatal",
+        "-show_error",
+        "-show_format",
+        "-show_streams",
+        "-show_programs",
+        "-show_chapters",
+        "-show_private_data",
+        "-print_format", "json",
+        path_to_file
+    ]
+
 
-    if popen_stderr:
-        logger.warning("FFprobe stderr:\n{}".format(
-            popen_stderr.decode("utf-8")
-        ))
+def _parse_ffprobe_output(stdout, stderr, logger):
+    if stdout:
+        logger.debug("FFprobe stdout:\n{}".format(stdout))
 
-    return json.loads(popen_stdout)
+    if stderr:
+        logger.warning("FFprobe stderr:\n{}".format(stderr))
+
+    return json.loads(stdout)
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -1136,7 +1241,68 @@ def convert_colorspace(
         logger = logging.getLogger(__name__)
 
     input_info = get_oiio_info_for_input(input_path, logger=logger)
+    oiio_cmd = _get_convert_colorspace_args(
+        input_info,
+        input_path,
+        output_path,
+        config_path,
+        source_colorspace,
+        target_colorspace,
+        view,
+        display,
+        additional_command_args,
+    )
+    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+    run_subprocess(oiio_cmd, logger=logger)
 
+
+async def convert_colorspace_async(
+    input_path,
+    output_path,
+    config_path,
+    source_colorspace,
+    target_colorspace=None,
+    view=None,
+    display=None,
+    additional_command_args=None,
+    logger=None,
+):
+    """Awaitable variant of 'convert_colorspace'.
+
+    Processes run in shared pool of media processes.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    input_info = await get_oiio_info_for_input_async(
+        input_path, logger=logger
+    )
+    oiio_cmd = _get_convert_colorspace_args(
+        input_info,
+        input_path,
+        output_path,
+        config_path,
+        source_colorspace,
+        target_colorspace,
+        view,
+        display,
+        additional_command_args,
+    )
+    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+    await get_media_job_orchestrator().run(oiio_cmd, logger=logger)
+
+
+def _get_convert_colorspace_args(
+    input_info,
+    input_path,
+    output_path,
+    config_path,
+    source_colorspace,
+    target_colorspace,
+    view,
+    display,
+    additional_command_args,
+):
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
@@ -1175,8 +1341,7 @@ def convert_colorspace(
 
     oiio_cmd.extend(["-o", output_path])
 
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+    return oiio_cmd
 
 
 def split_cmd_args(in_args):
@@ -1456,6 +1621,89 @@ def get_oiio_input_and_channel_args(oiio_input_info, alpha_default=None):
     return input_arg, channels_arg
 
 
+def is_tiled_exr(filepath, logger=None):
+    """Check if EXR file stores pixels in tiles.
+
+    Only header of the file is read. Result is cached by path, modification
+    time and size of the file so repeated checks of a sequence are cheap.
+
+    File which is not EXR file or has invalid header is considered as not
+    tiled.
+
+    Args:
+        filepath (str): Path to EXR file.
+        logger (Optional[logging.Logger]): Logger used to log invalid file.
+
+    Returns:
+        bool: At least one part of the file is tiled.
+    """
+    stat = os.stat(filepath)
+    try:
+        return _is_tiled_exr(
+            os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size
+        )
+    except (ValueError, struct.error) as exc:
+        if logger is None:
+            logger = logging.getLogger(__name__)
+        logger.warning(
+            f"Failed to read EXR header, file is handled as not tiled: {exc}"
+        )
+    return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_tiled_exr(filepath, _mtime, _size):
+    with open(filepath, "rb") as stream:
+        if stream.read(4) != EXR_MAGIC_NUMBER:
+            raise ValueError(f"File is not an EXR file: {filepath}")
+        version = struct.unpack("<i", stream.read(4))[0]
+        if version & EXR_MULTIPART_FLAG:
+            return _has_exr_tiled_part(stream, filepath)
+        # Single-part deep file defines tiling only in 'type' attribute
+        if version & EXR_NON_IMAGE_FLAG:
+            return _has_exr_tiled_part(stream, filepath, multipart=False)
+        return bool(version & EXR_TILED_FLAG)
+
+
+def _read_exr_string(stream, filepath):
+    chars = bytearray()
+    while True:
+        char = stream.read(1)
+        if not char:
+            raise ValueError(f"Unexpected end of EXR header: {filepath}")
+        if char == b"\0":
+            return bytes(chars)
+        chars += char
+
+
+def _has_exr_tiled_part(stream, filepath, multipart=True):
+    """Check 'type' attribute of each part in EXR header.
+
+    Headers of parts in multi-part file are separated by null byte and the
+    list of headers ends with an empty header. Single-part file has only
+    one header.
+    """
+    part_is_empty = True
+    while True:
+        attr_name = _read_exr_string(stream, filepath)
+        if not attr_name:
+            if part_is_empty or not multipart:
+                return False
+            part_is_empty = True
+            continue
+
+        part_is_empty = False
+        # Attribute type name is not needed
+        _read_exr_string(stream, filepath)
+        size = struct.unpack("<i", stream.read(4))[0]
+        value = stream.read(size)
+        if (
+            attr_name == b"type"
+            and value.rstrip(b"\0") in EXR_TILED_PART_TYPES
+        ):
+            return True
+
+
 def _get_media_mime_type_from_ftyp(content):
     if content[8:10] == b"qt":
         return "video/quicktime"
@@ -1,5 +1,40 @@
 # -*- coding: utf-8 -*-
 import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _compile_aov_patterns(patterns):
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+def get_aov_pattern_matcher(host_name, aov_patterns):
+    """Get callable matching render file names against AOV patterns.
+
+    Patterns for the host are compiled only once and cached, so the returned
+    callable can be used for every expected file without recompiling
+    the patterns.
+
+    Args:
+        host_name (str): Host name.
+        aov_patterns (dict): AOV patterns from AOV filters.
+
+    Returns:
+        Callable[[str], bool]: Function returning 'True' if render file
+            name matches any of the AOV patterns of the host.
+    """
+    patterns = aov_patterns.get(host_name) or []
+    if not patterns:
+        return lambda render_file_name: False
+
+    compiled_patterns = _compile_aov_patterns(tuple(patterns))
+
+    def _matcher(render_file_name):
+        return any(
+            pattern.match(render_file_name)
+            for pattern in compiled_patterns
+        )
+    return _matcher
 
 
 def match_aov_pattern(host_name, aov_patterns, render_file_name):
@@ -18,7 +53,5 @@ def match_aov_pattern(host_name, aov_patterns, render_file_name):
     Returns:
         bool: Review state for rendered file (render_file_name).
     """
-    aov_pattern = aov_patterns.get(host_name, [])
-    if not aov_pattern:
-        return False
-    return any(re.match(p, render_file_name) for p in aov_pattern)
+    matcher = get_aov_pattern_matcher(host_name, aov_patterns)
+    return matcher(render_file_name)
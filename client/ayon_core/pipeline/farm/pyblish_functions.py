@@ -2,21 +2,27 @@ import copy
 import os
 import re
 import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 
 import attr
 import ayon_api
 import clique
-from ayon_core.lib import Logger
+from ayon_core.lib import Logger, create_hard_link, format_file_size
 from ayon_core.pipeline import (
     get_current_project_name,
     get_representation_path,
 )
 from ayon_core.pipeline.create import get_product_name
-from ayon_core.pipeline.farm.patterning import match_aov_pattern
+from ayon_core.pipeline.farm.patterning import get_aov_pattern_matcher
 from ayon_core.pipeline.publish import KnownPublishError
 
 
+_R_FRAME_NUMBER = re.compile(r".+\.(?P<frame>[0-9]+)\..+")
+_FRAMES_PATTERN = re.compile(clique.PATTERNS["frames"])
+
+
 @attr.s
 class TimeData(object):
     """Structure used to handle time related data."""
@@ -54,7 +60,75 @@ def remap_source(path, anatomy):
     return source
 
 
-def extend_frames(folder_path, product_name, start, end):
+def get_last_versions_by_product_names(
+    project_name, product_names_by_folder_path, fields=None
+):
+    """Get last versions of products in bulk.
+
+    Folders, products and last versions are queried with one request
+    each, regardless of how many products are requested.
+
+    Args:
+        project_name (str): Project name.
+        product_names_by_folder_path (dict[str, Iterable[str]]): Product
+            names by folder path.
+        fields (Optional[Iterable[str]]): Fields of version entities.
+
+    Returns:
+        dict[tuple[str, str], Union[dict[str, Any], None]]: Last version
+            entities by folder path and product name. Value is 'None' if
+            product does not have any version.
+
+    """
+    output = {}
+    product_names = set()
+    for folder_path, names in product_names_by_folder_path.items():
+        for product_name in names:
+            output[(folder_path, product_name)] = None
+            product_names.add(product_name)
+
+    if not output:
+        return output
+
+    folder_paths_by_id = {
+        folder_entity["id"]: folder_entity["path"]
+        for folder_entity in ayon_api.get_folders(
+            project_name,
+            folder_paths=set(product_names_by_folder_path.keys()),
+            fields={"id", "path"}
+        )
+    }
+    if not folder_paths_by_id:
+        return output
+
+    keys_by_product_id = {}
+    for product_entity in ayon_api.get_products(
+        project_name,
+        folder_ids=folder_paths_by_id.keys(),
+        product_names=product_names,
+        fields={"id", "name", "folderId"}
+    ):
+        folder_path = folder_paths_by_id[product_entity["folderId"]]
+        key = (folder_path, product_entity["name"])
+        # Filter product entities by names under parent
+        if key in output:
+            keys_by_product_id[product_entity["id"]] = key
+
+    if not keys_by_product_id:
+        return output
+
+    if fields is not None:
+        fields = set(fields) | {"productId"}
+
+    last_versions_by_product_id = ayon_api.get_last_versions(
+        project_name, keys_by_product_id.keys(), fields=fields
+    )
+    for product_id, version_entity in last_versions_by_product_id.items():
+        output[keys_by_product_id[product_id]] = version_entity
+    return output
+
+
+def extend_frames(folder_path, product_name, start, end, version_entity=None):
     """Get latest version of asset nad update frame range.
 
     Based on minimum and maximum values.
@@ -64,29 +138,23 @@ def extend_frames(folder_path, product_name, start, end):
         product_name (str): Product name.
         start (int): Start frame.
         end (int): End frame.
+        version_entity (Optional[dict[str, Any]]): Last version entity
+            of the product. Queried if not passed in.
 
     Returns:
         (int, int): update frame start/end
 
     """
-    # Frame comparison
-    prev_start = None
-    prev_end = None
+    if version_entity is None:
+        project_name = get_current_project_name()
+        version_entity = get_last_versions_by_product_names(
+            project_name,
+            {folder_path: [product_name]},
+            fields={"attrib.frameStart", "attrib.frameEnd"}
+        )[(folder_path, product_name)]
 
-    project_name = get_current_project_name()
-    folder_entity = ayon_api.get_folder_by_path(
-        project_name, folder_path, fields={"id"}
-    )
-    version_entity = ayon_api.get_last_version_by_product_name(
-        project_name,
-        product_name,
-        folder_entity["id"]
-    )
-
-    # Set prev start / end frames for comparison
-    if not prev_start and not prev_end:
-        prev_start = version_entity["attrib"]["frameStart"]
-        prev_end = version_entity["attrib"]["frameEnd"]
+    prev_start = version_entity["attrib"]["frameStart"]
+    prev_end = version_entity["attrib"]["frameEnd"]
 
     updated_start = min(start, prev_start)
     updated_end = max(end, prev_end)
@@ -332,6 +400,7 @@ def prepare_representations(
     """
     representations = []
     host_name = os.environ.get("AYON_HOST_NAME", "")
+    is_preview_aov = get_aov_pattern_matcher(host_name, aov_filter)
     collections, remainders = clique.assemble(exp_files)
 
     log = Logger.get_logger("farm_publishing")
@@ -364,9 +433,7 @@ def prepare_representations(
                 render_file_name = list(collection)[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
-                preview = match_aov_pattern(
-                    host_name, aov_filter, render_file_name
-                )
+                preview = is_preview_aov(render_file_name)
 
         staging = os.path.dirname(list(collection)[0])
         success, rootless_staging_dir = (
@@ -442,9 +509,7 @@ def prepare_representations(
             "stagingDir": staging,
         }
 
-        preview = match_aov_pattern(
-            host_name, aov_filter, remainder
-        )
+        preview = is_preview_aov(remainder)
         preview = preview and not do_not_add_review
         if preview:
             rep.update({
@@ -726,6 +791,10 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
     This will create new instance for every AOV it can detect in expected
     files list.
 
+    AOV filter patterns are compiled once, values shared by all AOVs are
+    resolved before the loop and last versions needed to extend frames
+    are queried in one batch for all created instances.
+
     Args:
         instance (pyblish.api.Instance): Original instance.
         skeleton (dict): Skeleton data for instance (those needed) later
@@ -744,12 +813,49 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
 
     """
 
-    anatomy = instance.context.data["anatomy"]
+    context = instance.context
+    anatomy = context.data["anatomy"]
     source_product_name = skeleton["productName"]
     cameras = instance.data.get("cameras", [])
     expected_files = instance.data["expectedFiles"]
     log = Logger.get_logger("farm_publishing")
 
+    project_settings = context.data.get("project_settings")
+    try:
+        use_legacy_product_name = (
+            project_settings
+            ["core"]
+            ["tools"]
+            ["creator"]
+            ["use_legacy_product_names_for_renders"]
+        )
+    except KeyError:
+        warnings.warn(
+            ("use_legacy_for_renders not found in project settings. "
+             "Using legacy product name for renders. Please update "
+             "your ayon-core version."), DeprecationWarning)
+        use_legacy_product_name = True
+
+    app = os.environ.get("AYON_HOST_NAME", "")
+    is_preview_aov = get_aov_pattern_matcher(app, aov_filter)
+
+    # Copy render product "colorspace" data to representation.
+    colorspace_by_product_name = {}
+    for product in additional_data["renderProducts"].layer_data.products:
+        colorspace_by_product_name.setdefault(
+            product.productName, product.colorspace
+        )
+
+    is_redshift = instance.data.get("renderer") == "redshift"
+    is_multipart = bool(instance.data.get("multipartExr"))
+    convert_to_scanline = bool(instance.data.get("convertToScanline"))
+    frame_start = int(skeleton["frameStartHandle"])
+    frame_end = int(skeleton["frameEndHandle"])
+    colorspace_config = {
+        "path": additional_data["colorspaceConfig"],
+        "template": additional_data["colorspaceTemplate"]
+    }
+
     instances = []
     # go through AOVs in expected files
     for aov, files in expected_files[0].items():
@@ -777,23 +883,6 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
         if camera:
             dynamic_data["camera"] = camera[0]
 
-        project_settings = instance.context.data.get("project_settings")
-
-        try:
-            use_legacy_product_name = (
-                project_settings
-                ["core"]
-                ["tools"]
-                ["creator"]
-                ["use_legacy_product_names_for_renders"]
-            )
-        except KeyError:
-            warnings.warn(
-                ("use_legacy_for_renders not found in project settings. "
-                 "Using legacy product name for renders. Please update "
-                 "your ayon-core version."), DeprecationWarning)
-            use_legacy_product_name = True
-
         if use_legacy_product_name:
             product_name, group_name = _get_legacy_product_name_and_group(
                 product_type=skeleton["productType"],
@@ -806,8 +895,8 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
                 product_name, group_name
             ) = get_product_name_and_group_from_template(
                 task_entity=instance.data["taskEntity"],
-                project_name=instance.context.data["projectName"],
-                host_name=instance.context.data["hostName"],
+                project_name=context.data["projectName"],
+                host_name=context.data["hostName"],
                 product_type=skeleton["productType"],
                 variant=instance.data.get("variant", source_product_name),
                 dynamic_data=dynamic_data
@@ -822,13 +911,9 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
 
         log.info("Creating data for: {}".format(product_name))
 
-        app = os.environ.get("AYON_HOST_NAME", "")
-
         render_file_name = os.path.basename(expected_filepath)
 
-        aov_patterns = aov_filter
-
-        preview = match_aov_pattern(app, aov_patterns, render_file_name)
+        preview = is_preview_aov(render_file_name)
 
         new_instance = deepcopy(skeleton)
         new_instance["productName"] = product_name
@@ -843,16 +928,16 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
         # files even when the rest of the AOVs are merged into a single EXR.
         # There might be an edge case where the main instance has cryptomatte
         # in the name even though it's a multipart EXR.
-        if instance.data.get("renderer") == "redshift":
+        if is_redshift:
             if (
-                instance.data.get("multipartExr") and
+                is_multipart and
                 "cryptomatte" not in render_file_name.lower()
             ):
                 log.debug("Adding preview tag because it's multipartExr")
                 preview = True
             else:
                 new_instance["multipartExr"] = False
-        elif instance.data.get("multipartExr"):
+        elif is_multipart:
             log.debug("Adding preview tag because its multipartExr")
             preview = True
 
@@ -864,14 +949,6 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
         # create representation
         ext = os.path.splitext(render_file_name)[-1].lstrip(".")
 
-        # Copy render product "colorspace" data to representation.
-        colorspace = ""
-        products = additional_data["renderProducts"].layer_data.products
-        for product in products:
-            if product.productName == aov:
-                colorspace = product.colorspace
-                break
-
         if isinstance(collected_files, (list, tuple)):
             collected_files = [os.path.basename(f) for f in collected_files]
         else:
@@ -881,25 +958,22 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
             "name": ext,
             "ext": ext,
             "files": collected_files,
-            "frameStart": int(skeleton["frameStartHandle"]),
-            "frameEnd": int(skeleton["frameEndHandle"]),
+            "frameStart": frame_start,
+            "frameEnd": frame_end,
             # If expectedFile are absolute, we need only filenames
             "stagingDir": staging,
             "fps": new_instance.get("fps"),
             "tags": ["review"] if preview else [],
             "colorspaceData": {
-                "colorspace": colorspace,
-                "config": {
-                    "path": additional_data["colorspaceConfig"],
-                    "template": additional_data["colorspaceTemplate"]
-                },
+                "colorspace": colorspace_by_product_name.get(aov, ""),
+                "config": dict(colorspace_config),
                 "display": additional_data["display"],
                 "view": additional_data["view"]
             }
         }
 
         # support conversion from tiled to scanline
-        if instance.data.get("convertToScanline"):
+        if convert_to_scanline:
             log.info("Adding scanline conversion.")
             rep["tags"].append("toScanline")
 
@@ -912,16 +986,66 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
                 new_instance["families"])
 
         new_instance["representations"] = [rep]
-
-        # if extending frames from existing version, copy files from there
-        # into our destination directory
-        if new_instance.get("extendFrames", False):
-            copy_extend_frames(new_instance, rep)
         instances.append(new_instance)
-        log.debug("instances:{}".format(instances))
+
+    # if extending frames from existing version, copy files from there
+    # into our destination directory
+    _copy_extend_frames_for_instances(context, instances)
+    log.debug("instances:{}".format(instances))
     return instances
 
 
+def _copy_extend_frames_for_instances(context, instances, dry_run=False):
+    """Copy existing frames from latest versions for created instances.
+
+    Last versions of all products are queried at once instead of
+    per instance.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        instances (list[dict[str, Any]]): Created instances data.
+        dry_run (bool): Only log what would be transferred.
+
+    Returns:
+        list[ExtendFrameTransfer]: Planned transfers.
+
+    """
+    instances = [
+        new_instance
+        for new_instance in instances
+        if new_instance.get("extendFrames", False)
+    ]
+    if not instances:
+        return []
+
+    project_name = context.data["projectName"]
+    anatomy = context.data["anatomy"]
+    product_names_by_folder_path = defaultdict(set)
+    for new_instance in instances:
+        product_names_by_folder_path[new_instance["folderPath"]].add(
+            new_instance["productName"]
+        )
+
+    last_versions = get_last_versions_by_product_names(
+        project_name, product_names_by_folder_path, fields={"id"}
+    )
+    transfers = []
+    for new_instance in instances:
+        version_entity = last_versions[
+            (new_instance["folderPath"], new_instance["productName"])
+        ]
+        for repre in new_instance["representations"]:
+            transfers.extend(_copy_extend_frames(
+                project_name,
+                anatomy,
+                new_instance,
+                repre,
+                version_entity,
+                dry_run=dry_run,
+            ))
+    return transfers
+
+
 def _collect_expected_files_for_aov(files):
     """Collect expected files.
 
@@ -935,7 +1059,7 @@ def _collect_expected_files_for_aov(files):
         ValueError: If there are multiple collections.
 
     """
-    cols, rem = clique.assemble(files)
+    cols, rem = _assemble_expected_files(files)
     # we shouldn't have any reminders. And if we do, it should
     # be just one item for single frame renders.
     if not cols and rem:
@@ -951,6 +1075,30 @@ def _collect_expected_files_for_aov(files):
     return list(cols[0])
 
 
+def _assemble_expected_files(files):
+    """Assemble expected files of one AOV into collections.
+
+    Default 'clique.assemble' creates collection candidate for every
+    number in every path (e.g. shot or version numbers) which is slow
+    for long sequences. Frame numbers are tried first and full assemble
+    is used only if not all files are part of a single frame sequence.
+
+    Args:
+        files (list[str]): Expected files.
+
+    Returns:
+        tuple[list[clique.Collection], list[str]]: Collections
+            and remainders.
+
+    """
+    cols, rem = clique.assemble(
+        files, patterns=[_FRAMES_PATTERN], minimum_items=1
+    )
+    if len(cols) == 1 and not rem and len(cols[0].indexes) > 1:
+        return cols, rem
+    return clique.assemble(files)
+
+
 def get_resources(project_name, version_entity, extension=None):
     """Get the files from the specific version.
 
@@ -1177,7 +1325,7 @@ def create_instances_for_cache(instance, skeleton):
     instances = []
     # go through AOVs in expected files
     for _, files in exp_files[0].items():
-        cols, rem = clique.assemble(files)
+        cols, rem = _assemble_expected_files(files)
         # we shouldn't have any reminders. And if we do, it should
         # be just one item for single frame renders.
         if not cols and rem:
@@ -1230,17 +1378,16 @@ def create_instances_for_cache(instance, skeleton):
         }
 
         new_instance["representations"] = [rep]
-
-        # if extending frames from existing version, copy files from there
-        # into our destination directory
-        if new_instance.get("extendFrames", False):
-            copy_extend_frames(new_instance, rep)
         instances.append(new_instance)
-        log.debug("instances:{}".format(instances))
+
+    # if extending frames from existing version, copy files from there
+    # into our destination directory
+    _copy_extend_frames_for_instances(instance.context, instances)
+    log.debug("instances:{}".format(instances))
     return instances
 
 
-def copy_extend_frames(instance, representation):
+def copy_extend_frames(instance, representation, dry_run=False):
     """Copy existing frames from latest version.
 
     This will copy all existing frames from product's latest version back
@@ -1250,81 +1397,259 @@ def copy_extend_frames(instance, representation):
         instance (pyblish.plugin.Instance): instance to get required
             data from
         representation (dict): presentation to operate on
+        dry_run (bool): Only log what would be transferred.
+
+    Returns:
+        list[ExtendFrameTransfer]: Planned transfers.
 
     """
+    context = instance.context
+    return _copy_extend_frames_for_instances(
+        context,
+        [{
+            "extendFrames": True,
+            "folderPath": instance.data.get("folderPath"),
+            "productName": instance.data.get("productName"),
+            "frameStart": instance.data.get("frameStart"),
+            "frameEnd": instance.data.get("frameEnd"),
+            "overrideExistingFrame": instance.data.get(
+                "overrideExistingFrame"
+            ),
+            "representations": [representation],
+        }],
+        dry_run=dry_run
+    )
+
+
+@attr.s
+class ExtendFrameTransfer(object):
+    """Transfer of one frame from last version to render directory."""
+    frame = attr.ib(type=int)
+    src = attr.ib(type=str)
+    dst = attr.ib(type=str)
+    size = attr.ib(default=0, type=int)
+    hardlink = attr.ib(default=False, type=bool)
+
+
+def _get_existing_dir_device(dirpath):
+    """Device id of directory or its closest existing parent."""
+    while dirpath:
+        try:
+            return os.stat(dirpath).st_dev
+        except OSError:
+            parent = os.path.dirname(dirpath)
+            if parent == dirpath:
+                break
+            dirpath = parent
+    return None
+
+
+def plan_extend_frames_transfers(
+    src_collection,
+    dst_dir,
+    dst_head,
+    dst_tail,
+    rendered_frames,
+    skip_rendered_frames,
+    use_hardlinks=True,
+):
+    """Plan which frames of last version must be transferred.
+
+    Only frames which are not in destination yet are planned. Frames that
+    will be rendered are skipped when 'skip_rendered_frames' is enabled.
+
+    Hardlinks are used only for files on the same device as destination
+    and only for frames that won't be rendered, because renderer would
+    write into the published file through the shared inode.
+
+    Args:
+        src_collection (clique.Collection): Frames of last version.
+        dst_dir (str): Destination directory.
+        dst_head (str): Destination filename part before frame number.
+        dst_tail (str): Destination filename part after frame number.
+        rendered_frames (set[int]): Frames expected to be rendered.
+        skip_rendered_frames (bool): Do not transfer rendered frames.
+        use_hardlinks (bool): Allow hardlinks.
+
+    Returns:
+        list[ExtendFrameTransfer]: Planned transfers.
+
+    """
+    dst_device = None
+    if use_hardlinks:
+        dst_device = _get_existing_dir_device(dst_dir)
+
+    padding = src_collection.format("{padding}")
+    transfers = []
+    for frame in sorted(src_collection.indexes):
+        if skip_rendered_frames and frame in rendered_frames:
+            continue
+
+        frame_str = padding % frame
+        dst_path = os.path.join(
+            dst_dir, "{}{}{}".format(dst_head, frame_str, dst_tail)
+        )
+        if os.path.exists(dst_path):
+            continue
+
+        src_path = "{}{}{}".format(
+            src_collection.head, frame_str, src_collection.tail
+        )
+        src_stat = os.stat(src_path)
+        hardlink = (
+            dst_device is not None
+            and src_stat.st_dev == dst_device
+            and frame not in rendered_frames
+        )
+        transfers.append(ExtendFrameTransfer(
+            frame=frame,
+            src=src_path,
+            dst=dst_path,
+            size=src_stat.st_size,
+            hardlink=hardlink,
+        ))
+    return transfers
+
+
+def _transfer_extend_frame(transfer):
     import speedcopy
 
-    R_FRAME_NUMBER = re.compile(
-        r".+\.(?P<frame>[0-9]+)\..+")
+    if transfer.hardlink:
+        try:
+            create_hard_link(transfer.src, transfer.dst)
+            return
+        except OSError:
+            # Fallback to copy e.g. if filesystem does not support links
+            transfer.hardlink = False
+    speedcopy.copyfile(transfer.src, transfer.dst)
 
-    log = Logger.get_logger("farm_publishing")
-    log.info("Preparing to copy ...")
-    start = instance.data.get("frameStart")
-    end = instance.data.get("frameEnd")
-    project_name = instance.context.data["project"]
-    anatomy = instance.context.data["anatomy"]
 
-    folder_entity = ayon_api.get_folder_by_path(
-        project_name, instance.data.get("folderPath")
-    )
+def execute_extend_frames_transfers(transfers, max_workers=None, log=None):
+    """Execute planned transfers on bounded thread pool.
 
-    # get latest version of product
-    # this will stop if product wasn't published yet
+    Args:
+        transfers (list[ExtendFrameTransfer]): Planned transfers.
+        max_workers (Optional[int]): Maximum number of threads.
+        log (Optional[logging.Logger]): Logger used for progress.
 
-    version_entity = ayon_api.get_last_version_by_product_name(
-        project_name,
-        instance.data.get("productName"),
-        folder_entity["id"]
-    )
+    """
+    if log is None:
+        log = Logger.get_logger("farm_publishing")
+
+    if not transfers:
+        return
+
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 1) + 4)
+
+    total_count = len(transfers)
+    total_size = sum(transfer.size for transfer in transfers)
+    progress_step = max(1, total_count // 10)
+    done_count = 0
+    done_size = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_transfer_extend_frame, transfer): transfer
+            for transfer in transfers
+        }
+        for future in as_completed(futures):
+            # Re-raise any error from the worker
+            future.result()
+            done_count += 1
+            done_size += futures[future].size
+            if done_count % progress_step == 0 or done_count == total_count:
+                log.info("Transferred {}/{} files ({}/{})".format(
+                    done_count,
+                    total_count,
+                    format_file_size(done_size),
+                    format_file_size(total_size),
+                ))
+
+
+def _copy_extend_frames(
+    project_name,
+    anatomy,
+    instance_data,
+    representation,
+    version_entity,
+    dry_run=False,
+):
+    """Copy existing frames of last version to render directory.
+
+    Arguments:
+        project_name (str): Project name.
+        anatomy (Anatomy): Project anatomy.
+        instance_data (dict[str, Any]): Data of instance.
+        representation (dict[str, Any]): Representation to operate on.
+        version_entity (dict[str, Any]): Last version of the product.
+        dry_run (bool): Only log what would be transferred.
+
+    Returns:
+        list[ExtendFrameTransfer]: Planned transfers.
+
+    """
+    log = Logger.get_logger("farm_publishing")
+    log.info("Preparing to copy ...")
+    start = instance_data.get("frameStart")
+    end = instance_data.get("frameEnd")
 
     # get its files based on extension
     product_resources = get_resources(
         project_name, version_entity, representation.get("ext")
     )
-    r_col, _ = clique.assemble(product_resources)
-
-    # if override remove all frames we are expecting to be rendered,
-    # so we'll copy only those missing from current render
-    if instance.data.get("overrideExistingFrame"):
-        for frame in range(start, end + 1):
-            if frame not in r_col.indexes:
-                continue
-            r_col.indexes.remove(frame)
+    r_cols, _ = clique.assemble(product_resources)
+    if not r_cols:
+        log.warning("No frames found in last version to copy.")
+        return []
 
     # now we need to translate published names from representation
     # back. This is tricky, right now we'll just use same naming
     # and only switch frame numbers
-    resource_files = []
     r_filename = os.path.basename(
         representation.get("files")[0])  # first file
-    op = re.search(R_FRAME_NUMBER, r_filename)
-    pre = r_filename[:op.start("frame")]
-    post = r_filename[op.end("frame"):]
+    op = _R_FRAME_NUMBER.search(r_filename)
     assert op is not None, "padding string wasn't found"
-    for frame in list(r_col):
-        fn = re.search(R_FRAME_NUMBER, frame)
-        # silencing linter as we need to compare to True, not to
-        # type
-        assert fn is not None, "padding string wasn't found"
-        # list of tuples (source, destination)
-        staging = representation.get("stagingDir")
-        staging = anatomy.fill_root(staging)
-        resource_files.append(
-            (frame, os.path.join(
-                staging, "{}{}{}".format(pre, fn["frame"], post)))
+
+    staging = anatomy.fill_root(representation.get("stagingDir"))
+    # if override skip all frames we are expecting to be rendered,
+    # so we'll copy only those missing from current render
+    transfers = plan_extend_frames_transfers(
+        r_cols[0],
+        staging,
+        r_filename[:op.start("frame")],
+        r_filename[op.end("frame"):],
+        rendered_frames=set(range(start, end + 1)),
+        skip_rendered_frames=bool(
+            instance_data.get("overrideExistingFrame")
+        ),
+    )
+    total_size = format_file_size(
+        sum(transfer.size for transfer in transfers)
+    )
+    if dry_run:
+        hardlinks_count = sum(
+            1 for transfer in transfers if transfer.hardlink
         )
+        log.info(
+            "Dry run: would copy {} files ({}, {} hardlinked) to {}".format(
+                len(transfers), total_size, hardlinks_count, staging
+            )
+        )
+        return transfers
 
+    log.info("Copying {} files ({}) to {}".format(
+        len(transfers), total_size, staging
+    ))
     # test if destination dir exists and create it if not
-    output_dir = os.path.dirname(representation.get("files")[0])
-    if not os.path.isdir(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(staging, exist_ok=True)
 
-    # copy files
-    for source in resource_files:
-        speedcopy.copy(source[0], source[1])
-        log.info("  > {}".format(source[1]))
+    execute_extend_frames_transfers(transfers, log=log)
 
-    log.info("Finished copying %i files" % len(resource_files))
+    hardlinks_count = sum(1 for transfer in transfers if transfer.hardlink)
+    log.info("Finished copying {} files ({} hardlinked)".format(
+        len(transfers), hardlinks_count
+    ))
+    return transfers
 
 
 def attach_instances_to_product(attach_to, instances):
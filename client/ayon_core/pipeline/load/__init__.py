@@ -34,6 +34,7 @@ from .utils import (
     loaders_from_repre_context,
     loaders_from_representation,
     filter_repre_contexts_by_loader,
+    LoaderCompatibilityIndex,
 
     any_outdated_containers,
     get_outdated_containers,
@@ -89,6 +90,7 @@ __all__ = (
     "loaders_from_repre_context",
     "loaders_from_representation",
     "filter_repre_contexts_by_loader",
+    "LoaderCompatibilityIndex",
 
     "any_outdated_containers",
     "get_outdated_containers",
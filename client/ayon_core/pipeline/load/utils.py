@@ -907,6 +907,194 @@ def filter_repre_contexts_by_loader(repre_contexts, loader):
     ]
 
 
+def _get_repre_context_extension(repre_context):
+    """Representation extension in the same way as loaders resolve it.
+
+    Mirrors 'LoaderPlugin.has_valid_extension' to be able to use the
+    extension as index key.
+
+    Returns:
+        Union[str, None]: Lowered extension or 'None' if is not available.
+    """
+
+    repre_entity = repre_context["representation"]
+    ext = (repre_entity.get("context") or {}).get("ext")
+    if not ext:
+        path = repre_entity.get("attrib", {}).get("path")
+        if path:
+            ext = os.path.splitext(path)[-1].lstrip(".")
+    if not ext:
+        return None
+    return ext.lower()
+
+
+class LoaderCompatibilityIndex:
+    """Index of loaders by product type, representation name and extension.
+
+    Index is built once for discovered loaders. It is used to find only
+    candidate loaders for a group of representation contexts instead of
+    calling 'is_compatible_loader' of each loader for each context.
+
+    Loaders that override compatibility check methods can't be indexed
+    and their 'is_compatible_loader' is called for each context.
+
+    Args:
+        loaders (Iterable[LoaderPlugin]): Representation loader plugins.
+    """
+
+    def __init__(self, loaders):
+        from .plugins import LoaderPlugin
+
+        self._loaders = list(loaders)
+        self._generic_loaders = set()
+        self._loaders_by_product_type = collections.defaultdict(set)
+        self._loaders_by_repre_name = collections.defaultdict(set)
+        self._loaders_by_ext = collections.defaultdict(set)
+        self._any_product_type_loaders = set()
+        self._any_repre_name_loaders = set()
+        self._any_ext_loaders = set()
+        self._candidates_by_key = {}
+
+        default_compatible_func = LoaderPlugin.is_compatible_loader.__func__
+        default_ext_func = LoaderPlugin.has_valid_extension.__func__
+        for loader in self._loaders:
+            compatible_func = getattr(
+                loader.is_compatible_loader, "__func__", None
+            )
+            ext_func = getattr(loader.has_valid_extension, "__func__", None)
+            if (
+                compatible_func is not default_compatible_func
+                or ext_func is not default_ext_func
+            ):
+                self._generic_loaders.add(loader)
+                continue
+
+            repre_names = set(loader.get_representations() or [])
+            product_types = set(loader.product_types or [])
+            extensions = {ext.lower() for ext in loader.extensions or []}
+            # Loader is not compatible with anything
+            if not repre_names or not product_types or not extensions:
+                continue
+
+            self._add_to_index(
+                loader,
+                repre_names,
+                self._loaders_by_repre_name,
+                self._any_repre_name_loaders,
+            )
+            self._add_to_index(
+                loader,
+                product_types,
+                self._loaders_by_product_type,
+                self._any_product_type_loaders,
+            )
+            self._add_to_index(
+                loader,
+                extensions,
+                self._loaders_by_ext,
+                self._any_ext_loaders,
+            )
+
+    @staticmethod
+    def _add_to_index(loader, values, loaders_by_value, any_value_loaders):
+        if "*" in values:
+            any_value_loaders.add(loader)
+            return
+        for value in values:
+            loaders_by_value[value].add(loader)
+
+    def get_candidate_loaders(self, product_type, repre_name, ext):
+        """Loaders compatible with passed representation information.
+
+        Loaders that can't be indexed are not part of the output.
+
+        Args:
+            product_type (str): Product type.
+            repre_name (str): Representation name.
+            ext (Union[str, None]): Lowered representation extension.
+
+        Returns:
+            set[LoaderPlugin]: Compatible loaders.
+        """
+
+        key = (product_type, repre_name, ext)
+        candidates = self._candidates_by_key.get(key)
+        if candidates is not None:
+            return candidates
+
+        candidates = (
+            self._loaders_by_repre_name.get(repre_name, set())
+            | self._any_repre_name_loaders
+        )
+        if candidates:
+            candidates = candidates & (
+                self._loaders_by_product_type.get(product_type, set())
+                | self._any_product_type_loaders
+            )
+        if candidates:
+            ext_loaders = self._any_ext_loaders
+            if ext:
+                ext_loaders = ext_loaders | self._loaders_by_ext.get(
+                    ext, set()
+                )
+            candidates = candidates & ext_loaders
+
+        self._candidates_by_key[key] = candidates
+        return candidates
+
+    def get_compatible_contexts(self, repre_contexts):
+        """Compatible representation contexts by loader.
+
+        Result is the same as calling 'filter_repre_contexts_by_loader'
+        for each indexed loader.
+
+        Args:
+            repre_contexts (list[dict[str, Any]]): Representation contexts.
+
+        Returns:
+            dict[LoaderPlugin, list[dict[str, Any]]]: Compatible
+                representation contexts by loader. Loaders without any
+                compatible context are not in the output.
+        """
+
+        contexts_by_key = collections.defaultdict(list)
+        position_by_id = {}
+        for idx, repre_context in enumerate(repre_contexts):
+            if not repre_context.get("representation"):
+                continue
+            position_by_id[id(repre_context)] = idx
+            key = (
+                repre_context["product"]["productType"],
+                repre_context["representation"]["name"],
+                _get_repre_context_extension(repre_context),
+            )
+            contexts_by_key[key].append(repre_context)
+
+        contexts_by_loader = collections.defaultdict(list)
+        keys_count_by_loader = collections.Counter()
+        for key, key_contexts in contexts_by_key.items():
+            for loader in self.get_candidate_loaders(*key):
+                contexts_by_loader[loader].extend(key_contexts)
+                keys_count_by_loader[loader] += 1
+
+        output = {}
+        for loader in self._loaders:
+            if loader in self._generic_loaders:
+                filtered_contexts = filter_repre_contexts_by_loader(
+                    repre_contexts, loader
+                )
+            else:
+                filtered_contexts = contexts_by_loader.get(loader)
+                # Keep order of passed contexts
+                if filtered_contexts and keys_count_by_loader[loader] > 1:
+                    filtered_contexts.sort(
+                        key=lambda c: position_by_id[id(c)]
+                    )
+            if filtered_contexts:
+                output[loader] = filtered_contexts
+        return output
+
+
 def loaders_from_representation(loaders, representation):
     """Return all compatible loaders for a representation."""
     from ayon_core.pipeline import get_current_project_name
@@ -48,6 +48,12 @@ from .lib import (
     main_cli_publish,
 )
 
+from .uploads import (
+    UploadResult,
+    PublishUploadQueue,
+    get_file_content_hash,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -100,6 +106,10 @@ __all__ = (
 
     "main_cli_publish",
 
+    "UploadResult",
+    "PublishUploadQueue",
+    "get_file_content_hash",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -0,0 +1,342 @@
+"""Bounded concurrent upload queue used by integrator plugins.
+
+Uploads are executed in a thread pool with limited amount of workers.
+Failed uploads caused by connection issues or by server responses that
+are worth to retry are retried with exponential backoff. Each upload
+stores timing and size information which can be logged to publish report.
+"""
+import os
+import time
+import hashlib
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import requests
+
+from ayon_core.lib import Logger, format_file_size
+
+# Server responses that may succeed on next attempt
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class UploadResult:
+    """Result of single upload.
+
+    Attributes:
+        filepath (str): Uploaded file.
+        label (str): Label used in logs.
+        size (int): Size of uploaded file in bytes.
+        duration (float): Duration of successful attempt in seconds.
+        attempts (int): Number of attempts.
+        output (Any): Output of upload function.
+        error (Optional[Exception]): Error of last attempt if upload failed.
+    """
+    filepath: str
+    label: str
+    size: int
+    duration: float = 0.0
+    attempts: int = 0
+    output: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    @property
+    def bytes_per_second(self) -> float:
+        if not self.duration:
+            return 0.0
+        return self.size / self.duration
+
+    def to_data(self) -> dict:
+        return {
+            "filepath": self.filepath,
+            "label": self.label,
+            "size": self.size,
+            "duration": self.duration,
+            "attempts": self.attempts,
+            "bytes_per_second": self.bytes_per_second,
+            "error": str(self.error) if self.error is not None else None,
+        }
+
+
+def get_file_content_hash(filepath: str, chunk_size: int = 1024 * 1024):
+    """Content hash of a file.
+
+    Args:
+        filepath (str): Path to file.
+        chunk_size (int): Size of chunks read from the file.
+
+    Returns:
+        str: Hex digest of file content.
+    """
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def is_retryable_upload_error(exc: Exception) -> bool:
+    """Upload error that may not happen on next attempt.
+
+    Args:
+        exc (Exception): Exception raised by upload.
+
+    Returns:
+        bool: Upload should be retried.
+    """
+    if isinstance(
+        exc,
+        (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    ):
+        return True
+    if isinstance(exc, requests.exceptions.HTTPError):
+        response = exc.response
+        return (
+            response is not None
+            and response.status_code in RETRY_STATUS_CODES
+        )
+    return False
+
+
+class PublishUploadQueue:
+    """Bounded concurrent upload queue.
+
+    Upload function is called with filepath as first argument and must
+    raise an exception on failure.
+
+    Example:
+        >>> queue = PublishUploadQueue(max_workers=4)
+        >>> future = queue.submit(upload_func, "/path/to/file.mp4")
+        >>> results = queue.wait()
+
+    Args:
+        max_workers (int): Maximum number of concurrent uploads.
+        max_retries (int): Number of retries after failed attempt.
+        backoff (float): Delay before first retry in seconds. The delay
+            is doubled with each next retry.
+        max_backoff (float): Maximum delay between retries in seconds.
+        log (Optional[logging.Logger]): Logger.
+    """
+    context_key = "publishUploadQueue"
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        log=None,
+    ):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        self._max_workers = max(1, max_workers)
+        self._max_retries = max(0, max_retries)
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._futures = []
+        self._futures_by_hash = {}
+        self._deduplicated_count = 0
+        self._start_time = None
+        self._end_time = None
+
+    @classmethod
+    def get_from_context(cls, context, **kwargs):
+        """Get upload queue shared by plugins of the publish context.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+            **kwargs: Arguments used to create the queue if does not exist.
+
+        Returns:
+            PublishUploadQueue: Upload queue stored in context.
+        """
+        queue = context.data.get(cls.context_key)
+        if queue is None:
+            queue = cls(**kwargs)
+            context.data[cls.context_key] = queue
+        return queue
+
+    @property
+    def deduplicated_count(self) -> int:
+        return self._deduplicated_count
+
+    def has_uploads(self) -> bool:
+        return bool(self._futures)
+
+    def submit(
+        self,
+        upload_func: Callable,
+        filepath: str,
+        label: Optional[str] = None,
+        deduplicate: bool = False,
+        **kwargs
+    ):
+        """Add upload to the queue.
+
+        Args:
+            upload_func (Callable): Function uploading the file.
+            filepath (str): Path to uploaded file.
+            label (Optional[str]): Label used in logs. Filename is used
+                if not passed.
+            deduplicate (bool): Upload file with same content only once.
+                Future of the first upload is returned for duplicates.
+            **kwargs: Keyword arguments passed to upload function.
+
+        Returns:
+            concurrent.futures.Future: Future with 'UploadResult'.
+        """
+        content_hash = None
+        if deduplicate:
+            content_hash = get_file_content_hash(filepath)
+            with self._lock:
+                future = self._futures_by_hash.get(content_hash)
+                if future is not None:
+                    self._deduplicated_count += 1
+                    return future
+
+        if label is None:
+            label = os.path.basename(filepath)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="PublishUpload",
+                )
+            if self._start_time is None:
+                self._start_time = time.perf_counter()
+            future = self._executor.submit(
+                self._upload, upload_func, filepath, label, kwargs
+            )
+            self._futures.append(future)
+            if content_hash is not None:
+                self._futures_by_hash[content_hash] = future
+        return future
+
+    def wait(self):
+        """Wait for all submitted uploads.
+
+        Returns:
+            list[UploadResult]: Results of all uploads in order
+                of submission.
+        """
+        with self._lock:
+            futures = list(self._futures)
+            executor = self._executor
+            self._executor = None
+
+        results = [future.result() for future in futures]
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._end_time = time.perf_counter()
+        return results
+
+    def get_report(self, results=None):
+        """Summary of uploads.
+
+        Args:
+            results (Optional[list[UploadResult]]): Results to use. Results
+                of all submitted uploads are used if not passed.
+
+        Returns:
+            dict[str, Any]: Uploads summary with per-file information.
+        """
+        if results is None:
+            results = [
+                future.result()
+                for future in self._futures
+                if future.done()
+            ]
+        duration = 0.0
+        if self._start_time is not None:
+            end_time = self._end_time or time.perf_counter()
+            duration = end_time - self._start_time
+        size = sum(result.size for result in results if result.success)
+        return {
+            "files": [result.to_data() for result in results],
+            "uploaded": sum(1 for result in results if result.success),
+            "failed": sum(1 for result in results if not result.success),
+            "deduplicated": self._deduplicated_count,
+            "size": size,
+            "duration": duration,
+            "bytes_per_second": size / duration if duration else 0.0,
+        }
+
+    def log_results(self, results, log=None):
+        """Log upload timing of each file and summary.
+
+        Args:
+            results (list[UploadResult]): Upload results.
+            log (Optional[logging.Logger]): Logger used instead of queue
+                logger, e.g. plugin logger to have the output in publish
+                report.
+        """
+        if log is None:
+            log = self.log
+        for result in results:
+            if not result.success:
+                log.warning(
+                    f"Upload of '{result.label}' failed after"
+                    f" {result.attempts} attempt/s: {result.error}"
+                )
+                continue
+            log.info(
+                f"Uploaded '{result.label}'"
+                f" ({format_file_size(result.size)})"
+                f" in {result.duration:.2f}s"
+                f" ({format_file_size(result.bytes_per_second, 'B/s')})"
+                f" attempts: {result.attempts}"
+            )
+        report = self.get_report(results)
+        log.info(
+            f"Uploaded {report['uploaded']} file/s"
+            f" ({format_file_size(report['size'])})"
+            f" in {report['duration']:.2f}s"
+            f" ({format_file_size(report['bytes_per_second'], 'B/s')}),"
+            f" failed: {report['failed']},"
+            f" deduplicated: {report['deduplicated']}"
+        )
+
+    def _get_retry_delay(self, attempt):
+        return min(self._backoff * (2 ** (attempt - 1)), self._max_backoff)
+
+    def _upload(self, upload_func, filepath, label, kwargs):
+        result = UploadResult(
+            filepath=filepath,
+            label=label,
+            size=os.path.getsize(filepath),
+        )
+        attempts_count = self._max_retries + 1
+        for attempt in range(1, attempts_count + 1):
+            result.attempts = attempt
+            start = time.perf_counter()
+            try:
+                result.output = upload_func(filepath, **kwargs)
+                result.duration = time.perf_counter() - start
+                result.error = None
+                break
+
+            except Exception as exc:
+                result.error = exc
+                if (
+                    attempt == attempts_count
+                    or not is_retryable_upload_error(exc)
+                ):
+                    break
+                delay = self._get_retry_delay(attempt)
+                self.log.debug(
+                    f"Upload of '{label}' failed ({exc})."
+                    f" Retrying in {delay:.1f}s."
+                )
+                time.sleep(delay)
+        return result
@@ -5,6 +5,7 @@ from .path_resolving import (
     get_workdir,
 
     get_last_workfile_with_version,
+    get_last_workfiles_with_version,
     get_last_workfile,
 
     get_custom_workfile_template,
@@ -13,6 +14,11 @@ from .path_resolving import (
     create_workdir_extra_folders,
 )
 
+from .workdir_index import (
+    WorkfileEntry,
+    WorkdirIndex,
+    get_workdir_index,
+)
 from .utils import (
     should_use_last_workfile_on_launch,
     should_open_workfiles_tool_on_launch,
@@ -37,8 +43,13 @@ __all__ = (
     "get_workdir",
 
     "get_last_workfile_with_version",
+    "get_last_workfiles_with_version",
     "get_last_workfile",
 
+    "WorkfileEntry",
+    "WorkdirIndex",
+    "get_workdir_index",
+
     "get_custom_workfile_template",
     "get_custom_workfile_template_by_string_context",
 
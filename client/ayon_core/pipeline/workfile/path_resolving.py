@@ -1,5 +1,4 @@
 import os
-import re
 import copy
 import platform
 from typing import Optional, Dict, Any
@@ -15,6 +14,8 @@ from ayon_core.lib import (
 from ayon_core.pipeline import version_start, Anatomy
 from ayon_core.pipeline.template_data import get_template_data
 
+from .workdir_index import get_workdir_index
+
 
 def get_workfile_template_key_from_context(
     project_name: str,
@@ -221,6 +222,9 @@ def get_last_workfile_with_version(
     The last modified file is used if more files can be considered as
     last workfile.
 
+    Listing and parsing of the workdir is cached until the workdir
+    is modified, see 'WorkdirIndex'.
+
     Args:
         workdir (str): Path to dir where workfiles are stored.
         file_template (str): Template of file name.
@@ -232,84 +236,31 @@ def get_last_workfile_with_version(
             if there is any workfile otherwise None for both.
     """
 
-    if not os.path.exists(workdir):
-        return None, None
-
-    dotted_extensions = set()
-    for ext in extensions:
-        if not ext.startswith("."):
-            ext = ".{}".format(ext)
-        dotted_extensions.add(ext)
-
-    # Fast match on extension
-    filenames = [
-        filename
-        for filename in os.listdir(workdir)
-        if os.path.splitext(filename)[-1] in dotted_extensions
-    ]
-
-    # Build template without optionals, version to digits only regex
-    # and comment to any definable value.
-    # Escape extensions dot for regex
-    regex_exts = [
-        "\\" + ext
-        for ext in dotted_extensions
-    ]
-    ext_expression = "(?:" + "|".join(regex_exts) + ")"
-
-    # Replace `.{ext}` with `{ext}` so we are sure there is not dot at the end
-    file_template = re.sub(r"\.?{ext}", ext_expression, file_template)
-    # Replace optional keys with optional content regex
-    file_template = re.sub(r"<.*?>", r".*?", file_template)
-    # Replace `{version}` with group regex
-    file_template = re.sub(r"{version.*?}", r"([0-9]+)", file_template)
-    file_template = re.sub(r"{comment.*?}", r".+?", file_template)
-    file_template = StringTemplate.format_strict_template(
-        file_template, fill_data
+    return get_workdir_index().get_last_workfile_with_version(
+        workdir, file_template, fill_data, extensions
     )
 
-    # Match with ignore case on Windows due to the Windows
-    # OS not being case-sensitive. This avoids later running
-    # into the error that the file did exist if it existed
-    # with a different upper/lower-case.
-    kwargs = {}
-    if platform.system().lower() == "windows":
-        kwargs["flags"] = re.IGNORECASE
-
-    # Get highest version among existing matching files
-    version = None
-    output_filenames = []
-    for filename in sorted(filenames):
-        match = re.match(file_template, filename, **kwargs)
-        if not match:
-            continue
 
-        if not match.groups():
-            output_filenames.append(filename)
-            continue
+def get_last_workfiles_with_version(items, max_workers=8):
+    """Return last workfile versions of multiple contexts.
+
+    Faster variant of 'get_last_workfile_with_version' when last workfiles
+    of many tasks are resolved at once, e.g. in launcher. Work directories
+    are listed concurrently and each directory is listed only once.
 
-        file_version = int(match.group(1))
-        if version is None or file_version > version:
-            output_filenames[:] = []
-            version = file_version
-
-        if file_version == version:
-            output_filenames.append(filename)
-
-    output_filename = None
-    if output_filenames:
-        if len(output_filenames) == 1:
-            output_filename = output_filenames[0]
-        else:
-            last_time = None
-            for _output_filename in output_filenames:
-                full_path = os.path.join(workdir, _output_filename)
-                mod_time = os.path.getmtime(full_path)
-                if last_time is None or last_time < mod_time:
-                    output_filename = _output_filename
-                    last_time = mod_time
-
-    return output_filename, version
+    Args:
+        items (Iterable[Tuple[str, str, Dict[str, Any], Iterable[str]]]):
+            Tuples with workdir, file template, fill data and extensions.
+        max_workers (Optional[int]): Maximum number of directories listed
+            at the same time.
+
+    Returns:
+        List[Tuple[Union[str, None], Union[int, None]]]: Last workfile with
+            version for each item in order of passed items.
+    """
+    return get_workdir_index().get_last_workfiles_with_version(
+        items, max_workers=max_workers
+    )
 
 
 def get_last_workfile(
@@ -0,0 +1,424 @@
+"""Cached index of workfiles in work directories.
+
+Finding last workfile requires to list the work directory and match each
+filename with a regex created from the workfile template. Work directories
+are often on network shares and contain a lot of files (e.g. autosaves),
+so the listing and parsing is cached per directory and is invalidated when
+modification time of the directory changes. Modification time of directory
+changes when a file is created, removed or renamed in it.
+"""
+import os
+import re
+import time
+import platform
+import threading
+import collections
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Iterable, List, Tuple, Dict, Any
+
+from ayon_core.lib import StringTemplate
+
+# Filesystems may store modification time with low resolution (e.g. 2
+#   seconds on FAT or some network shares). Listing which was made shortly
+#   after last change of the directory is not trusted.
+_RACY_MTIME_WINDOW = 2.0
+_VERSION_EXPRESSION = r"(?:[0-9]+)"
+_COMMENT_EXPRESSION = r"(?:.+?)"
+
+
+@dataclass(frozen=True)
+class WorkfileEntry:
+    """Workfile in work directory matching workfile template.
+
+    Attributes:
+        filename (str): Filename of workfile.
+        version (Optional[int]): Version parsed from filename. Is 'None'
+            if template does not contain version.
+        comment (Optional[str]): Comment parsed from filename.
+    """
+    filename: str
+    version: Optional[int]
+    comment: Optional[str]
+
+
+def _get_dotted_extensions(extensions: Iterable[str]) -> Tuple[str, ...]:
+    dotted_extensions = set()
+    for ext in extensions:
+        if not ext.startswith("."):
+            ext = ".{}".format(ext)
+        dotted_extensions.add(ext)
+    return tuple(sorted(dotted_extensions))
+
+
+def _get_optional_expression(match):
+    content = match.group(1)
+    content = re.sub(r"{comment.*?}", _COMMENT_EXPRESSION, content)
+    content = re.sub(r"{version.*?}", _VERSION_EXPRESSION, content)
+    # Other keys of optional part may not be available in fill data
+    content = re.sub(r"{.*?}", r".+?", content)
+    return "(?:{})?".format(content)
+
+
+class _WorkdirState:
+    """Cached listing of one directory."""
+
+    def __init__(self, mtime: float, filenames: List[str]):
+        self.mtime = mtime
+        self.listed_at = time.time()
+        self.filenames = filenames
+        self.entries_by_key = {}
+
+    def is_valid(self, mtime: float) -> bool:
+        if mtime != self.mtime:
+            return False
+        return (self.listed_at - self.mtime) > _RACY_MTIME_WINDOW
+
+
+class WorkdirIndex:
+    """Cache of workfiles in work directories.
+
+    Compiled regexes of workfile templates are cached and parsed workfile
+    entries are cached per directory. Cache of a directory is invalidated
+    when its modification time changes, so only one 'stat' call is needed
+    to validate it.
+
+    Args:
+        max_workdirs (int): Maximum number of cached directories. Least
+            recently used directories are removed from cache.
+    """
+    def __init__(self, max_workdirs: int = 512):
+        self._max_workdirs = max_workdirs
+        self._lock = threading.Lock()
+        self._states = collections.OrderedDict()
+        self._regex_templates = {}
+        self._regexes = {}
+        self._regex_flags = 0
+        if platform.system().lower() == "windows":
+            # Match with ignore case on Windows due to the Windows
+            # OS not being case-sensitive. This avoids later running
+            # into the error that the file did exist if it existed
+            # with a different upper/lower-case.
+            self._regex_flags = re.IGNORECASE
+
+    def reset(self):
+        """Clear cache of all directories and regexes."""
+        with self._lock:
+            self._states.clear()
+            self._regex_templates.clear()
+            self._regexes.clear()
+
+    def invalidate(self, workdir: Optional[str] = None):
+        """Invalidate cached directory.
+
+        Args:
+            workdir (Optional[str]): Directory to invalidate. All directories
+                are invalidated if not passed.
+        """
+        with self._lock:
+            if workdir is None:
+                self._states.clear()
+            else:
+                self._states.pop(os.path.normpath(workdir), None)
+
+    def get_workfile_regex(
+        self,
+        file_template: str,
+        fill_data: Dict[str, Any],
+        extensions: Iterable[str],
+    ) -> "re.Pattern":
+        """Regex matching workfiles of a context.
+
+        Template is converted to regex without optional keys, version is
+        replaced with digits group and comment with any value.
+
+        Args:
+            file_template (str): Template of file name.
+            fill_data (Dict[str, Any]): Data for filling template.
+            extensions (Iterable[str]): All allowed file extensions.
+
+        Returns:
+            re.Pattern: Compiled regex with optional 'version' named group.
+        """
+        return self._get_regexes(file_template, fill_data, extensions)[0]
+
+    def get_workfile_entries(
+        self,
+        workdir: str,
+        file_template: str,
+        fill_data: Dict[str, Any],
+        extensions: Iterable[str],
+    ) -> List[WorkfileEntry]:
+        """Workfiles in directory matching workfile template.
+
+        Args:
+            workdir (str): Path to dir where workfiles are stored.
+            file_template (str): Template of file name.
+            fill_data (Dict[str, Any]): Data for filling template.
+            extensions (Iterable[str]): All allowed file extensions.
+
+        Returns:
+            List[WorkfileEntry]: Workfile entries sorted by filename.
+        """
+        dotted_extensions = _get_dotted_extensions(extensions)
+        regexes = self._get_regexes(
+            file_template, fill_data, dotted_extensions
+        )
+        state = self._get_state(workdir)
+        if state is None:
+            return []
+        return self._get_entries(state, regexes, dotted_extensions)
+
+    def get_last_workfile_with_version(
+        self,
+        workdir: str,
+        file_template: str,
+        fill_data: Dict[str, Any],
+        extensions: Iterable[str],
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """Return last workfile version.
+
+        Last modified file is used if more files can be considered as
+        last workfile.
+
+        Args:
+            workdir (str): Path to dir where workfiles are stored.
+            file_template (str): Template of file name.
+            fill_data (Dict[str, Any]): Data for filling template.
+            extensions (Iterable[str]): All allowed file extensions.
+
+        Returns:
+            Tuple[Optional[str], Optional[int]]: Last workfile with version
+                if there is any workfile otherwise None for both.
+        """
+        entries = self.get_workfile_entries(
+            workdir, file_template, fill_data, extensions
+        )
+        return self._get_last_from_entries(workdir, entries)
+
+    def get_last_workfiles_with_version(
+        self,
+        items: Iterable[Tuple[str, str, Dict[str, Any], Iterable[str]]],
+        max_workers: int = 8,
+    ) -> List[Tuple[Optional[str], Optional[int]]]:
+        """Resolve last workfiles of multiple contexts at once.
+
+        Unique directories are validated or listed concurrently, which
+        helps with latency of network shares.
+
+        Args:
+            items (Iterable[Tuple[str, str, Dict[str, Any], Iterable[str]]]):
+                Tuples with workdir, file template, fill data and
+                extensions, same as arguments of
+                'get_last_workfile_with_version'.
+            max_workers (int): Maximum number of directories processed
+                at the same time.
+
+        Returns:
+            List[Tuple[Optional[str], Optional[int]]]: Last workfile with
+                version for each item, in order of passed items.
+        """
+        items = list(items)
+        workdirs = {item[0] for item in items}
+        if len(workdirs) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(workdirs))
+            ) as executor:
+                list(executor.map(self._get_state, workdirs))
+
+        return [
+            self.get_last_workfile_with_version(*item)
+            for item in items
+        ]
+
+    def _get_regexes(self, file_template, fill_data, extensions):
+        """Regexes to match workfile and to parse comment of workfile.
+
+        Returns:
+            Tuple[re.Pattern, Optional[re.Pattern]]: Regex to match
+                workfiles and regex to parse comment. Comment regex is
+                'None' if template does not contain comment.
+        """
+        dotted_extensions = _get_dotted_extensions(extensions)
+        regex_templates = self._get_regex_templates(
+            file_template, dotted_extensions
+        )
+        regexes = []
+        for regex_template in regex_templates:
+            if regex_template is None:
+                regexes.append(None)
+                continue
+            pattern = StringTemplate.format_strict_template(
+                regex_template, fill_data
+            )
+            regex = self._regexes.get(pattern)
+            if regex is None:
+                # Groups are named after the template is filled because
+                #   '<' would be handled as optional key by
+                #   'StringTemplate'. Only first occurrence can be
+                #   a named group.
+                named_pattern = pattern.replace(
+                    _VERSION_EXPRESSION, r"(?P<version>[0-9]+)", 1
+                ).replace(
+                    _COMMENT_EXPRESSION, r"(?P<comment>.+?)", 1
+                )
+                regex = re.compile(named_pattern, self._regex_flags)
+                self._regexes[pattern] = regex
+            regexes.append(regex)
+        return tuple(regexes)
+
+    def _get_regex_templates(self, file_template, dotted_extensions):
+        key = (file_template, dotted_extensions)
+        regex_templates = self._regex_templates.get(key)
+        if regex_templates is not None:
+            return regex_templates
+
+        # Build template without optionals, version to digits only regex
+        # and comment to any definable value.
+        # Escape extensions dot for regex
+        regex_exts = [
+            "\\" + ext
+            for ext in dotted_extensions
+        ]
+        ext_expression = "(?:" + "|".join(regex_exts) + ")"
+
+        # Replace `.{ext}` with `{ext}` so we are sure there is not dot at
+        #   the end
+        base_template = re.sub(r"\.?{ext}", ext_expression, file_template)
+        # Replace optional keys with optional content regex
+        regex_template = re.sub(r"<.*?>", r".*?", base_template)
+        # Replace `{version}` with group regex
+        regex_template = re.sub(
+            r"{version.*?}", _VERSION_EXPRESSION, regex_template
+        )
+        regex_template = re.sub(
+            r"{comment.*?}", r".+?", regex_template
+        )
+
+        # Comment is usually in optional part of template which is
+        #   not part of the regex above, so comment is parsed with more
+        #   strict regex keeping content of optional parts
+        comment_template = None
+        if "{comment" in file_template:
+            comment_template = re.sub(
+                r"<(.*?)>", _get_optional_expression, base_template
+            )
+            comment_template = re.sub(
+                r"{version.*?}", _VERSION_EXPRESSION, comment_template
+            )
+            comment_template = re.sub(
+                r"{comment.*?}", _COMMENT_EXPRESSION, comment_template
+            ) + "$"
+
+        regex_templates = (regex_template, comment_template)
+        self._regex_templates[key] = regex_templates
+        return regex_templates
+
+    def _get_state(self, workdir):
+        workdir = os.path.normpath(workdir)
+        try:
+            mtime = os.stat(workdir).st_mtime
+        except OSError:
+            self.invalidate(workdir)
+            return None
+
+        with self._lock:
+            state = self._states.get(workdir)
+            if state is not None and state.is_valid(mtime):
+                self._states.move_to_end(workdir)
+                return state
+
+        try:
+            with os.scandir(workdir) as scan:
+                filenames = sorted(
+                    entry.name
+                    for entry in scan
+                    if not entry.is_dir()
+                )
+        except OSError:
+            self.invalidate(workdir)
+            return None
+
+        state = _WorkdirState(mtime, filenames)
+        with self._lock:
+            self._states[workdir] = state
+            self._states.move_to_end(workdir)
+            while len(self._states) > self._max_workdirs:
+                self._states.popitem(last=False)
+        return state
+
+    def _get_entries(self, state, regexes, dotted_extensions):
+        key = (regexes, dotted_extensions)
+        entries = state.entries_by_key.get(key)
+        if entries is not None:
+            return entries
+
+        regex, comment_regex = regexes
+        has_version = "version" in regex.groupindex
+        entries = []
+        for filename in state.filenames:
+            # Fast match on extension
+            if os.path.splitext(filename)[-1] not in dotted_extensions:
+                continue
+            match = regex.match(filename)
+            if not match:
+                continue
+            version = comment = None
+            if has_version:
+                version = int(match.group("version"))
+            if comment_regex is not None:
+                comment_match = comment_regex.match(filename)
+                if comment_match:
+                    comment = comment_match.group("comment")
+            entries.append(WorkfileEntry(filename, version, comment))
+
+        state.entries_by_key[key] = entries
+        return entries
+
+    def _get_last_from_entries(self, workdir, entries):
+        version = None
+        output_filenames = []
+        for entry in entries:
+            if entry.version is None:
+                output_filenames.append(entry.filename)
+                continue
+
+            if version is None or entry.version > version:
+                output_filenames[:] = []
+                version = entry.version
+
+            if entry.version == version:
+                output_filenames.append(entry.filename)
+
+        if not output_filenames:
+            return None, version
+
+        if len(output_filenames) == 1:
+            return output_filenames[0], version
+
+        # Modification time is not cached because overwriting of existing
+        #   file does not change modification time of the directory
+        output_filename = None
+        last_time = None
+        for filename in output_filenames:
+            full_path = os.path.join(workdir, filename)
+            try:
+                mod_time = os.path.getmtime(full_path)
+            except OSError:
+                continue
+            if last_time is None or last_time < mod_time:
+                output_filename = filename
+                last_time = mod_time
+        return output_filename, version
+
+
+_workdir_index = WorkdirIndex()
+
+
+def get_workdir_index() -> WorkdirIndex:
+    """Workdir index shared by the process.
+
+    Returns:
+        WorkdirIndex: Shared workdir index.
+    """
+    return _workdir_index
@@ -28,10 +28,12 @@ class PushToLibraryProject(load.ProductLoaderPlugin):
         if not filtered_contexts:
             raise LoadError("Nothing to push for your selection")
 
-        if len(filtered_contexts) > 1:
-            raise LoadError("Please select only one item")
-
-        context = tuple(filtered_contexts)[0]
+        project_names = {
+            context["project"]["name"]
+            for context in filtered_contexts
+        }
+        if len(project_names) > 1:
+            raise LoadError("Please select versions from one project")
 
         push_tool_script_path = os.path.join(
             AYON_CORE_ROOT,
@@ -40,13 +42,21 @@ class PushToLibraryProject(load.ProductLoaderPlugin):
             "main.py"
         )
 
-        project_name = context["project"]["name"]
-        version_id = context["version"]["id"]
+        project_name = project_names.pop()
+        version_ids = []
+        for context in filtered_contexts:
+            version_id = context["version"]["id"]
+            if version_id not in version_ids:
+                version_ids.append(version_id)
+
+        version_args = []
+        for version_id in version_ids:
+            version_args.extend(["--version", version_id])
 
         args = get_ayon_launcher_args(
             "run",
             push_tool_script_path,
             "--project", project_name,
-            "--version", version_id
+            *version_args
         )
         run_detached_process(args)
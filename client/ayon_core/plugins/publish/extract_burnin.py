@@ -16,7 +16,8 @@ from ayon_core.pipeline import (
 from ayon_core.lib import (
     run_ayon_launcher_process,
 
-    convert_input_paths_for_ffmpeg,
+    convert_input_paths_for_ffmpeg_async,
+    run_media_batch,
     should_convert_for_ffmpeg
 )
 from ayon_core.lib.profiles_filtering import filter_profiles
@@ -258,11 +259,14 @@ class ExtractBurnin(publish.Extractor):
                 )
                 repre["stagingDir"] = new_staging_dir
 
-                convert_input_paths_for_ffmpeg(
-                    src_filepaths,
-                    new_staging_dir,
-                    self.log
-                )
+                # Files are converted in shared pool of media processes
+                run_media_batch([
+                    convert_input_paths_for_ffmpeg_async(
+                        src_filepaths,
+                        new_staging_dir,
+                        self.log
+                    )
+                ])
 
             # Add anatomy keys to burnin_data.
             filled_anatomy = anatomy.format_all(burnin_data)
@@ -387,7 +391,8 @@ class ExtractBurnin(publish.Extractor):
 
                 # Run burnin script
                 process_kwargs = {
-                    "logger": self.log
+                    "logger": self.log,
+                    "stream_output": True,
                 }
 
                 run_ayon_launcher_process(*args, **process_kwargs)
@@ -9,9 +9,10 @@ from ayon_core.pipeline import (
 )
 from ayon_core.lib import (
     is_oiio_supported,
+    run_media_batch,
 )
 from ayon_core.lib.transcoding import (
-    convert_colorspace,
+    convert_colorspace_async,
 )
 
 from ayon_core.lib.profiles_filtering import filter_profiles
@@ -158,6 +159,7 @@ class ExtractOIIOTranscode(publish.Extractor):
                 files_to_convert = self._translate_to_sequence(
                     files_to_convert)
                 self.log.debug("Files to convert: {}".format(files_to_convert))
+                conversions = []
                 for file_name in files_to_convert:
                     self.log.debug("Transcoding file: `{}`".format(file_name))
                     input_path = os.path.join(original_staging_dir,
@@ -166,7 +168,7 @@ class ExtractOIIOTranscode(publish.Extractor):
                                                              new_staging_dir,
                                                              output_extension)
 
-                    convert_colorspace(
+                    conversions.append(convert_colorspace_async(
                         input_path,
                         output_path,
                         config_path,
@@ -176,7 +178,9 @@ class ExtractOIIOTranscode(publish.Extractor):
                         display,
                         additional_command_args,
                         self.log
-                    )
+                    ))
+                # Files are converted in shared pool of media processes
+                run_media_batch(conversions)
 
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
@@ -97,7 +97,7 @@ class ExtractOtioAudioTracks(pyblish.api.ContextPlugin):
 
                 # run subprocess
                 self.log.debug("Executing: {}".format(" ".join(cmd)))
-                run_subprocess(cmd, logger=self.log)
+                run_subprocess(cmd, logger=self.log, stream_output=True)
             else:
                 audio_fpath = recycling_file.pop()
 
@@ -226,7 +226,7 @@ class ExtractOtioAudioTracks(pyblish.api.ContextPlugin):
         self.log.debug("Executing: {}".format(" ".join(cmd)))
 
         run_subprocess(
-            cmd, logger=self.log
+            cmd, logger=self.log, stream_output=True
         )
 
         # return dict with output
@@ -308,7 +308,7 @@ class ExtractOtioAudioTracks(pyblish.api.ContextPlugin):
 
         # run subprocess
         self.log.debug("Executing: {}".format(args))
-        run_subprocess(args, logger=self.log)
+        run_subprocess(args, logger=self.log, stream_output=True)
 
         os.remove(filters_tmp_filepath)
 
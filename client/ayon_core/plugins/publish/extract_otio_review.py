@@ -532,7 +532,7 @@ class ExtractOTIOReview(
         # execute
         self.log.debug("Executing: {}".format(" ".join(command)))
         output = run_subprocess(
-            command, logger=self.log
+            command, logger=self.log, stream_output=True
         )
         self.log.debug("Output: {}".format(output))
 
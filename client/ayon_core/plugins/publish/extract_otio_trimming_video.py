@@ -96,7 +96,7 @@ class ExtractOTIOTrimmingVideo(publish.Extractor):
         # execute
         self.log.debug("Executing: {}".format(" ".join(command)))
         output = run_subprocess(
-            command, logger=self.log
+            command, logger=self.log, stream_output=True
         )
         self.log.debug("Output: {}".format(output))
 
@@ -4,7 +4,10 @@ import copy
 import json
 import shutil
 import subprocess
+import tempfile
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import clique
 import speedcopy
@@ -15,13 +18,14 @@ from ayon_core.lib import (
     filter_profiles,
     path_to_subprocess_arg,
     run_subprocess,
+    run_media_batch,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
     get_ffprobe_streams,
     should_convert_for_ffmpeg,
     get_review_layer_name,
-    convert_input_paths_for_ffmpeg,
+    convert_input_paths_for_ffmpeg_async,
 )
 from ayon_core.pipeline import get_temp_dir
 from ayon_core.pipeline.publish import (
@@ -103,6 +107,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = []
+    concurrent_outputs = True
+    max_concurrent_outputs = 0
+    # Seconds between progress logs of rendered output
+    progress_log_interval = 5.0
+    fill_gaps_mode = "link"
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -316,11 +325,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 )
                 repre["stagingDir"] = new_staging_dir
 
-                convert_input_paths_for_ffmpeg(
-                    input_filepaths,
-                    new_staging_dir,
-                    self.log
-                )
+                # Files are converted in shared pool of media processes
+                run_media_batch([
+                    convert_input_paths_for_ffmpeg_async(
+                        input_filepaths,
+                        new_staging_dir,
+                        self.log
+                    )
+                ])
 
             try:
                 self._render_output_definitions(
@@ -349,133 +361,172 @@ class ExtractReview(pyblish.api.InstancePlugin):
         output_definitions,
         layer_name
     ):
-        fill_data = copy.deepcopy(instance.data["anatomyData"])
-        for _output_def in output_definitions:
-            output_def = copy.deepcopy(_output_def)
-            # Make sure output definition has "tags" key
-            if "tags" not in output_def:
-                output_def["tags"] = []
-
-            if "burnins" not in output_def:
-                output_def["burnins"] = []
-
-            # Create copy of representation
-            new_repre = copy.deepcopy(repre)
-            new_tags = new_repre.get("tags") or []
-            # Make sure new representation has origin staging dir
-            #   - this is because source representation may change
-            #       it's staging dir because of ffmpeg conversion
-            new_repre["stagingDir"] = src_repre_staging_dir
-
-            # Remove "delete" tag from new repre if there is
-            if "delete" in new_tags:
-                new_tags.remove("delete")
-
-            if "need_thumbnail" in new_tags:
-                new_tags.remove("need_thumbnail")
-
-            # Add additional tags from output definition to representation
-            for tag in output_def["tags"]:
-                if tag not in new_tags:
-                    new_tags.append(tag)
-
-            # Return tags to new representation
-            new_repre["tags"] = new_tags
-
-            # Add burnin link from output definition to representation
-            for burnin in output_def["burnins"]:
-                if burnin not in new_repre.get("burnins", []):
-                    if not new_repre.get("burnins"):
-                        new_repre["burnins"] = []
-                    new_repre["burnins"].append(str(burnin))
-
-            self.log.debug(
-                "Linked burnins: `{}`".format(new_repre.get("burnins"))
-            )
-
-            self.log.debug(
-                "New representation tags: `{}`".format(
-                    new_repre.get("tags"))
+        # Sequence gaps are filled only once for all outputs
+        # - all outputs read the same input files
+        # - gaps in handles are filled too, same as in 'fill_sequence_gaps'
+        fill_gaps_with_concat = False
+        if self.input_is_sequence(repre):
+            handle_start, handle_end = self._get_handles(instance)
+            fill_gaps_with_concat = (
+                self.fill_gaps_mode == "concat"
+                and self._sequence_has_gaps(
+                    repre["files"],
+                    instance.data["frameStart"] - handle_start,
+                    instance.data["frameEnd"] + handle_end
+                )
             )
 
-            temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
+        # Prepare all output commands first, so they can run concurrently
+        output_jobs = []
+        # Files created for rendering, removed when outputs are rendered
+        files_to_clean = []
+        try:
+            for _output_def in output_definitions:
+                output_def = copy.deepcopy(_output_def)
+                # Make sure output definition has "tags" key
+                if "tags" not in output_def:
+                    output_def["tags"] = []
+
+                if "burnins" not in output_def:
+                    output_def["burnins"] = []
+
+                # Create copy of representation
+                new_repre = copy.deepcopy(repre)
+                new_tags = new_repre.get("tags") or []
+                # Make sure new representation has origin staging dir
+                #   - this is because source representation may change
+                #       it's staging dir because of ffmpeg conversion
+                new_repre["stagingDir"] = src_repre_staging_dir
+
+                # Remove "delete" tag from new repre if there is
+                if "delete" in new_tags:
+                    new_tags.remove("delete")
+
+                if "need_thumbnail" in new_tags:
+                    new_tags.remove("need_thumbnail")
+
+                # Add additional tags from output definition to representation
+                for tag in output_def["tags"]:
+                    if tag not in new_tags:
+                        new_tags.append(tag)
+
+                # Return tags to new representation
+                new_repre["tags"] = new_tags
+
+                # Add burnin link from output definition to representation
+                for burnin in output_def["burnins"]:
+                    if burnin not in new_repre.get("burnins", []):
+                        if not new_repre.get("burnins"):
+                            new_repre["burnins"] = []
+                        new_repre["burnins"].append(str(burnin))
+
+                self.log.debug(
+                    "Linked burnins: `{}`".format(new_repre.get("burnins"))
                 )
 
-            # create or update outputName
-            output_name = new_repre.get("outputName", "")
-            output_ext = new_repre["ext"]
-            if output_name:
-                output_name += "_"
-            output_name += output_def["filename_suffix"]
-            if temp_data["without_handles"]:
-                output_name += "_noHandles"
-
-            # add outputName to anatomy format fill_data
-            fill_data.update({
-                "output": output_name,
-                "ext": output_ext,
-
-                # By adding `timecode` as data we can use it
-                # in the ffmpeg arguments for `--timecode` so that editorial
-                # like Resolve or Premiere can detect the start frame for e.g.
-                # review output files
-                "timecode": frame_to_timecode(
-                    frame=temp_data["frame_start_handle"],
-                    fps=float(instance.data["fps"])
+                self.log.debug(
+                    "New representation tags: `{}`".format(
+                        new_repre.get("tags"))
                 )
-            })
 
-            try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def,
-                    instance,
-                    new_repre,
-                    temp_data,
-                    fill_data,
-                    layer_name,
-                )
-            except ZeroDivisionError:
-                # TODO recalculate width and height using OIIO before
-                #   conversion
-                if 'exr' in temp_data["origin_repre"]["ext"]:
-                    self.log.warning(
-                        (
-                            "Unsupported compression on input files."
-                            " Skipping!!!"
-                        ),
-                        exc_info=True
+                temp_data = self.prepare_temp_data(instance, repre, output_def)
+                temp_data["fill_gaps_with_concat"] = fill_gaps_with_concat
+
+                # create or update outputName
+                output_name = new_repre.get("outputName", "")
+                output_ext = new_repre["ext"]
+                if output_name:
+                    output_name += "_"
+                output_name += output_def["filename_suffix"]
+                if temp_data["without_handles"]:
+                    output_name += "_noHandles"
+
+                # add outputName to anatomy format fill_data
+                # - values are only read so shallow copy is enough
+                fill_data = dict(instance.data["anatomyData"])
+                fill_data.update({
+                    "output": output_name,
+                    "ext": output_ext,
+
+                    # By adding `timecode` as data we can use it
+                    # in the ffmpeg arguments for `--timecode` so that
+                    # editorial like Resolve or Premiere can detect the start
+                    # frame for e.g. review output files
+                    "timecode": frame_to_timecode(
+                        frame=temp_data["frame_start_handle"],
+                        fps=float(instance.data["fps"])
                     )
-                    return
-                raise NotImplementedError
-
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+                })
+
+                try:  # temporary until oiiotool is supported cross platform
+                    ffmpeg_args = self._ffmpeg_arguments(
+                        output_def,
+                        instance,
+                        new_repre,
+                        temp_data,
+                        fill_data,
+                        layer_name,
+                    )
+                except ZeroDivisionError:
+                    # TODO recalculate width and height using OIIO before
+                    #   conversion
+                    if 'exr' in temp_data["origin_repre"]["ext"]:
+                        self.log.warning(
+                            (
+                                "Unsupported compression on input files."
+                                " Skipping!!!"
+                            ),
+                            exc_info=True
+                        )
+                        break
+                    raise NotImplementedError
+
+                finally:
+                    # Remove concat manifest even if preparation fails
+                    manifest_path = temp_data.get("concat_manifest_path")
+                    if manifest_path:
+                        files_to_clean.append(manifest_path)
+
+                output_jobs.append({
+                    "output_name": output_name,
+                    "output_def": output_def,
+                    "new_repre": new_repre,
+                    "temp_data": temp_data,
+                    "ffmpeg_cmd": " ".join(ffmpeg_args),
+                })
+
+            if not output_jobs:
+                return
+
+            temp_data = output_jobs[0]["temp_data"]
+            if temp_data["input_is_sequence"] and not fill_gaps_with_concat:
+                self.log.debug("Checking sequence to fill gaps in sequence..")
+                files_to_clean.extend(self.fill_sequence_gaps(
+                    files=repre["files"],
+                    staging_dir=repre["stagingDir"],
+                    start_frame=temp_data["frame_start_handle"],
+                    end_frame=temp_data["frame_end_handle"]
+                ))
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            self._run_output_jobs(output_jobs)
 
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+        finally:
+            # delete files added to fill gaps and concat manifests
+            for filepath in files_to_clean:
+                os.unlink(filepath)
 
+        for output_job in output_jobs:
+            output_name = output_job["output_name"]
+            new_repre = output_job["new_repre"]
+            temp_data = output_job["temp_data"]
             new_repre.update({
                 "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
+                "name": "{}_{}".format(output_name, new_repre["ext"]),
                 "outputName": output_name,
-                "outputDef": output_def,
+                "outputDef": output_job["output_def"],
                 "frameStartFtrack": temp_data["output_frame_start"],
                 "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
+                "ffmpeg_cmd": output_job["ffmpeg_cmd"]
             })
 
             # Force to pop these key if are in new repre
@@ -491,6 +542,103 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _get_max_concurrent_outputs(self, jobs_count):
+        if not self.concurrent_outputs or jobs_count < 2:
+            return 1
+
+        max_workers = self.max_concurrent_outputs
+        if max_workers < 1:
+            # ffmpeg is multithreaded on its own
+            max_workers = max(1, min(4, (os.cpu_count() or 1) // 2))
+        return min(max_workers, jobs_count)
+
+    def _run_output_jobs(self, output_jobs):
+        """Run ffmpeg commands of output definitions.
+
+        Commands run concurrently on bounded pool of worker threads, each
+        waiting for its ffmpeg process, if concurrent outputs are enabled.
+
+        Args:
+            output_jobs (list[dict[str, Any]]): Prepared output jobs.
+
+        """
+        max_workers = self._get_max_concurrent_outputs(len(output_jobs))
+        if max_workers < 2:
+            for output_job in output_jobs:
+                self._run_output_job(output_job)
+            return
+
+        self.log.debug(
+            "Running {} outputs with {} concurrent processes".format(
+                len(output_jobs), max_workers
+            )
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._run_output_job, output_job)
+                for output_job in output_jobs
+            ]
+        # Re-raise first error
+        for future in futures:
+            future.result()
+
+    def _run_output_job(self, output_job):
+        subprcs_cmd = output_job["ffmpeg_cmd"]
+        # run subprocess
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+
+        start = time.perf_counter()
+        run_subprocess(
+            subprcs_cmd,
+            shell=True,
+            logger=self.log,
+            progress_callback=self._get_progress_callback(output_job),
+        )
+        duration = time.perf_counter() - start
+        output_job["duration"] = duration
+        self.log.info("Output \"{}\" rendered in {:.2f}s".format(
+            output_job["output_name"], duration
+        ))
+
+    def _get_progress_callback(self, output_job):
+        """Callback logging progress of output rendering.
+
+        Progress is logged at most once per 'progress_log_interval'
+        seconds.
+        """
+        output_name = output_job["output_name"]
+        temp_data = output_job["temp_data"]
+        frames_count = (
+            temp_data["output_frame_end"]
+            - temp_data["output_frame_start"]
+            + 1
+        )
+        last_log_time = time.perf_counter()
+
+        def _log_progress(progress):
+            nonlocal last_log_time
+            now = time.perf_counter()
+            if (
+                not progress["finished"]
+                and now - last_log_time < self.progress_log_interval
+            ):
+                return
+            last_log_time = now
+            frame = progress["frame"] or 0
+            self.log.debug(
+                "Output \"{}\" progress: frame {}/{} ({:.0%}),"
+                " fps {}, speed {}x".format(
+                    output_name,
+                    frame,
+                    frames_count,
+                    min(1.0, frame / max(1, frames_count)),
+                    progress["fps"],
+                    progress["speed"],
+                )
+            )
+
+        return _log_progress
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -523,15 +671,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         frame_start = instance.data["frameStart"]
         frame_end = instance.data["frameEnd"]
-
-        # Try to get handles from instance
-        handle_start = instance.data.get("handleStart")
-        handle_end = instance.data.get("handleEnd")
-        # If even one of handle values is not set on instance use
-        # handles from context
-        if handle_start is None or handle_end is None:
-            handle_start = instance.context.data["handleStart"]
-            handle_end = instance.context.data["handleEnd"]
+        handle_start, handle_end = self._get_handles(instance)
 
         frame_start_handle = frame_start - handle_start
         frame_end_handle = frame_end + handle_end
@@ -600,6 +740,22 @@ class ExtractReview(pyblish.api.InstancePlugin):
             "handles_are_set": handles_are_set
         }
 
+    def _get_handles(self, instance):
+        """Handles of instance.
+
+        Returns:
+            tuple[int, int]: Handle start and handle end.
+        """
+        # Try to get handles from instance
+        handle_start = instance.data.get("handleStart")
+        handle_end = instance.data.get("handleEnd")
+        # If even one of handle values is not set on instance use
+        # handles from context
+        if handle_start is None or handle_end is None:
+            handle_start = instance.context.data["handleStart"]
+            handle_end = instance.context.data["handleEnd"]
+        return handle_start, handle_end
+
     def _ffmpeg_arguments(
         self,
         output_def,
@@ -686,20 +842,34 @@ class ExtractReview(pyblish.api.InstancePlugin):
             start_number = temp_data["first_sequence_frame"]
             if temp_data["without_handles"] and temp_data["handles_are_set"]:
                 start_number += temp_data["handle_start"]
-            ffmpeg_input_args.extend([
-                "-start_number", str(start_number)
-            ])
 
-            # TODO add fps mapping `{fps: fraction}` ?
-            # - e.g.: {
-            #     "25": "25/1",
-            #     "24": "24/1",
-            #     "23.976": "24000/1001"
-            # }
-            # Add framerate to input when input is sequence
-            ffmpeg_input_args.extend([
-                "-framerate", str(temp_data["fps"])
-            ])
+            if temp_data["fill_gaps_with_concat"]:
+                # Missing frames are held by durations in concat manifest
+                manifest_path = self._create_concat_manifest(
+                    temp_data, start_number
+                )
+                temp_data["concat_manifest_path"] = manifest_path
+                temp_data["full_input_path"] = manifest_path
+                ffmpeg_input_args.extend(["-f", "concat", "-safe", "0"])
+                # Keep frame rate from output definition if is set
+                if not self._output_args_have_frame_rate(ffmpeg_output_args):
+                    ffmpeg_output_args.extend(["-r", str(temp_data["fps"])])
+
+            else:
+                ffmpeg_input_args.extend([
+                    "-start_number", str(start_number)
+                ])
+
+                # TODO add fps mapping `{fps: fraction}` ?
+                # - e.g.: {
+                #     "25": "25/1",
+                #     "24": "24/1",
+                #     "23.976": "24000/1001"
+                # }
+                # Add framerate to input when input is sequence
+                ffmpeg_input_args.extend([
+                    "-framerate", str(temp_data["fps"])
+                ])
             # Add duration of an input sequence if output is video
             if not temp_data["output_is_sequence"]:
                 ffmpeg_input_args.extend([
@@ -828,6 +998,21 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     splitted_args.append(arg)
         return splitted_args
 
+    def _output_args_have_frame_rate(self, output_args):
+        """Output arguments already define output frame rate.
+
+        Args:
+            output_args (list[str]): Output arguments, one item can contain
+                multiple arguments.
+
+        Returns:
+            bool: Frame rate is set in arguments.
+        """
+        return any(
+            arg.split(" ")[0] in ("-r", "-r:v")
+            for arg in self.split_ffmpeg_args(output_args)
+        )
+
     def ffmpeg_full_args(
         self, input_args, video_filters, audio_filters, output_args
     ):
@@ -865,7 +1050,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     audio_filters.append(arg)
 
         all_args = [
-            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")),
+            # Report progress to stdout instead of stats to stderr
+            "-progress", "pipe:1",
+            "-nostats",
         ]
         all_args.extend(input_args)
         if video_filters:
@@ -880,13 +1068,70 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return all_args
 
+    def _get_hole_frames_to_nearest(self, col, start_frame, end_frame):
+        """Map missing frames in range to nearest previous existing frame.
+
+        Args:
+            col (clique.Collection): Collection of existing files.
+            start_frame (int): Sequence start (no matter what files are there)
+            end_frame (int): Sequence end (no matter what files are there)
+
+        Returns:
+            dict[int, int]: Existing frame to use for each missing frame.
+        """
+        # Prepare which hole is filled with what frame
+        #   - the frame is filled only with already existing frames
+        prev_frame = next(iter(col.indexes))
+        hole_frame_to_nearest = {}
+        for frame in range(int(start_frame), int(end_frame) + 1):
+            if frame in col.indexes:
+                prev_frame = frame
+            else:
+                # Use previous frame as source for hole
+                hole_frame_to_nearest[frame] = prev_frame
+        return hole_frame_to_nearest
+
+    def _get_single_collection(self, files):
+        collections = clique.assemble(files)[0]
+        if len(collections) != 1:
+            raise KnownPublishError(
+                "Multiple collections {} found.".format(collections))
+        return collections[0]
+
+    def _sequence_has_gaps(self, files, start_frame, end_frame):
+        col = self._get_single_collection(files)
+        return bool(
+            self._get_hole_frames_to_nearest(col, start_frame, end_frame)
+        )
+
+    def _create_gap_file(self, src_path, dst_path):
+        """Create file filling a gap in sequence.
+
+        Hardlink or symlink is used when 'fill_gaps_mode' is set to 'link'
+        and filesystem allows it, otherwise the file is copied.
+        """
+        if self.fill_gaps_mode == "link":
+            try:
+                os.link(src_path, dst_path)
+                return
+            except OSError:
+                pass
+
+            try:
+                os.symlink(src_path, dst_path)
+                return
+            except (OSError, NotImplementedError):
+                pass
+
+        speedcopy.copyfile(src_path, dst_path)
+
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        This will take nearest frame file and link or copy it with so as
+        to fill gaps in sequence. Last existing file there is is used to for
+        the hole ahead.
 
         Args:
             files (list): List of representation files.
@@ -902,23 +1147,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             KnownPublishError: if more than one collection is obtained.
         """
 
-        collections = clique.assemble(files)[0]
-        if len(collections) != 1:
-            raise KnownPublishError(
-                "Multiple collections {} found.".format(collections))
-
-        col = collections[0]
-
-        # Prepare which hole is filled with what frame
-        #   - the frame is filled only with already existing frames
-        prev_frame = next(iter(col.indexes))
-        hole_frame_to_nearest = {}
-        for frame in range(int(start_frame), int(end_frame) + 1):
-            if frame in col.indexes:
-                prev_frame = frame
-            else:
-                # Use previous frame as source for hole
-                hole_frame_to_nearest[frame] = prev_frame
+        col = self._get_single_collection(files)
+        hole_frame_to_nearest = self._get_hole_frames_to_nearest(
+            col, start_frame, end_frame
+        )
 
         # Calculate paths
         added_files = []
@@ -930,11 +1162,63 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            self._create_gap_file(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
         return added_files
 
+    def _create_concat_manifest(self, temp_data, start_number):
+        """Create ffmpeg concat demuxer manifest for sequence with gaps.
+
+        Each existing frame is listed once with duration covering following
+        missing frames, so no files have to be created to fill gaps.
+
+        Args:
+            temp_data (dict): Base data for successful process.
+            start_number (int): First frame used as input.
+
+        Returns:
+            str: Path to manifest file.
+        """
+        repre = temp_data["origin_repre"]
+        col = self._get_single_collection(repre["files"])
+        end_frame = max(
+            max(col.indexes), int(temp_data["frame_end_handle"])
+        )
+        hole_frame_to_nearest = self._get_hole_frames_to_nearest(
+            col, start_number, end_frame
+        )
+
+        # Collapse frames into (source frame, frames count) runs
+        runs = []
+        for frame in range(int(start_number), end_frame + 1):
+            src_frame = hole_frame_to_nearest.get(frame, frame)
+            if runs and runs[-1][0] == src_frame:
+                runs[-1][1] += 1
+            else:
+                runs.append([src_frame, 1])
+
+        col_format = col.format("{head}{padding}{tail}")
+        fps = temp_data["fps"]
+        lines = ["ffconcat version 1.0"]
+        src_path = None
+        for src_frame, frames_count in runs:
+            src_path = os.path.join(
+                repre["stagingDir"], col_format % src_frame
+            ).replace("\\", "/").replace("'", "'\\''")
+            lines.append("file '{}'".format(src_path))
+            lines.append("duration {:0.10f}".format(frames_count / fps))
+        # Last entry has to be repeated for its duration to be respected
+        if src_path:
+            lines.append("file '{}'".format(src_path))
+
+        fd, manifest_path = tempfile.mkstemp(
+            prefix="extract_review_", suffix=".ffconcat"
+        )
+        with os.fdopen(fd, "w") as stream:
+            stream.write("\n".join(lines) + "\n")
+        return manifest_path
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
@@ -2,6 +2,7 @@ import os
 import re
 import subprocess
 from pprint import pformat
+from concurrent.futures import ThreadPoolExecutor
 
 import pyblish.api
 
@@ -14,6 +15,11 @@ from ayon_core.lib import (
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
 )
+from ayon_core.lib.slate_cache import (
+    SlateCache,
+    get_file_hash,
+    get_slate_cache_key,
+)
 from ayon_core.pipeline import publish
 from ayon_core.pipeline.publish import KnownPublishError
 
@@ -33,6 +39,44 @@ class ExtractReviewSlate(publish.Extractor):
     hosts = ["nuke", "shell"]
     optional = True
 
+    # Join slate with review without re-encoding when streams match
+    stream_copy_concat = False
+    concurrent_representations = True
+    max_concurrent_representations = 0
+
+    # Intra-only video codecs which can be joined by stream copy. Concat
+    #   of long-GOP codecs (e.g. h264) would use codec extradata of slate
+    #   for the whole output, so review frames could decode corrupted.
+    stream_copy_video_codecs = {"prores", "dnxhd", "mjpeg"}
+
+    # Stream parameters which must match for stream copy concat
+    stream_copy_keys = {
+        "video": (
+            "codec_name",
+            "codec_tag_string",
+            "profile",
+            "width",
+            "height",
+            "level",
+            "pix_fmt",
+            "has_b_frames",
+            "r_frame_rate",
+            "time_base",
+            "sample_aspect_ratio",
+            "field_order",
+            "color_space",
+            "color_transfer",
+            "color_primaries",
+        ),
+        "audio": (
+            "codec_name",
+            "sample_fmt",
+            "sample_rate",
+            "channels",
+            "channel_layout",
+        ),
+    }
+
     def process(self, instance):
         inst_data = instance.data
         if "representations" not in inst_data:
@@ -58,333 +102,605 @@ class ExtractReviewSlate(publish.Extractor):
         fps = inst_data.get("fps")
         self.log.debug("fps {} ".format(fps))
 
+        repre_items = []
         for idx, repre in enumerate(inst_data["representations"]):
             self.log.debug("repre ({}): `{}`".format(idx + 1, repre))
 
             p_tags = repre.get("tags", [])
-            if "slate-frame" not in p_tags:
-                continue
+            if "slate-frame" in p_tags:
+                repre_items.append((idx, repre))
 
-            # get repre file
-            stagingdir = repre["stagingDir"]
-            input_file = "{0}".format(repre["files"])
-            input_path = os.path.join(
-                os.path.normpath(stagingdir), repre["files"])
-            self.log.debug("__ input_path: {}".format(input_path))
+        # Representations are processed concurrently, each job only waits
+        #   for its ffmpeg processes
+        max_workers = self._get_max_concurrent_representations(
+            len(repre_items)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._process_representation,
+                    inst_data,
+                    repre,
+                    slates_data,
+                    use_legacy_code,
+                    pixel_aspect,
+                    fps,
+                )
+                for _, repre in repre_items
+            ]
+        # Re-raise first error
+        for (idx, _), future in zip(repre_items, futures):
+            repre_update = future.result()
+            inst_data["representations"][idx].update(repre_update)
+            self.log.debug(
+                "_ representation {}: `{}`".format(
+                    idx, inst_data["representations"][idx]))
 
-            streams = get_ffprobe_streams(
-                input_path, self.log
-            )
-            # get slate data
-            slate_path = self._get_slate_path(input_file, slates_data)
-            self.log.debug("_ slate_path: {}".format(slate_path))
+        # Remove any representations tagged for deletion.
+        for repre in inst_data.get("representations", []):
+            tags = repre.get("tags", [])
+            if "delete" not in tags:
+                continue
+            if "need_thumbnail" in tags:
+                continue
+            self.log.debug("Removing representation: {}".format(repre))
+            inst_data["representations"].remove(repre)
 
-            slate_width, slate_height = self._get_slates_resolution(slate_path)
+        self.log.debug(inst_data["representations"])
 
-            # Get video metadata
-            (
-                input_width,
-                input_height,
-                input_timecode,
-                input_frame_rate,
-                input_pixel_aspect
-            ) = self._get_video_metadata(streams)
-            if input_pixel_aspect:
-                pixel_aspect = input_pixel_aspect
-
-            # Raise exception of any stream didn't define input resolution
-            if input_width is None:
-                raise KnownPublishError(
-                    "FFprobe couldn't read resolution from input file: \"{}\""
-                    .format(input_path)
-                )
+    def _get_max_concurrent_representations(self, repres_count):
+        if not self.concurrent_representations or repres_count < 2:
+            return 1
 
-            (
-                audio_codec,
-                audio_channels,
-                audio_sample_rate,
-                audio_channel_layout,
-                input_audio
-            ) = self._get_audio_metadata(streams)
+        max_workers = self.max_concurrent_representations
+        if max_workers < 1:
+            # ffmpeg is multithreaded on its own
+            max_workers = max(1, min(4, (os.cpu_count() or 1) // 2))
+        return min(max_workers, repres_count)
 
-            # values are set in ExtractReview
-            if use_legacy_code:
-                to_width = inst_data["reviewToWidth"]
-                to_height = inst_data["reviewToHeight"]
-            else:
-                to_width = input_width
-                to_height = input_height
+    def _process_representation(
+        self,
+        inst_data,
+        repre,
+        slates_data,
+        use_legacy_code,
+        pixel_aspect,
+        fps,
+    ):
+        """Add slate to representation.
 
-            self.log.debug("to_width: `{}`".format(to_width))
-            self.log.debug("to_height: `{}`".format(to_height))
+        Returns:
+            dict[str, Any]: Data to update on representation.
+        """
+        p_tags = repre.get("tags", [])
+
+        # get repre file
+        stagingdir = repre["stagingDir"]
+        input_file = "{0}".format(repre["files"])
+        input_path = os.path.join(
+            os.path.normpath(stagingdir), repre["files"])
+        self.log.debug("__ input_path: {}".format(input_path))
+
+        # Input is probed only once, data are used for metadata, codec
+        #   arguments and to validate stream copy of slate
+        input_ffprobe_data = get_ffprobe_data(input_path, self.log)
+        streams = input_ffprobe_data["streams"]
+        # get slate data
+        slate_path = self._get_slate_path(input_file, slates_data)
+        self.log.debug("_ slate_path: {}".format(slate_path))
+
+        slate_width, slate_height = self._get_slates_resolution(slate_path)
+
+        # Get video metadata
+        (
+            input_width,
+            input_height,
+            input_timecode,
+            input_frame_rate,
+            input_pixel_aspect
+        ) = self._get_video_metadata(streams)
+        if input_pixel_aspect:
+            pixel_aspect = input_pixel_aspect
 
-            # defining image ratios
-            resolution_ratio = (
-                (float(slate_width) * pixel_aspect) / slate_height
-            )
-            delivery_ratio = float(to_width) / float(to_height)
-            self.log.debug("resolution_ratio: `{}`".format(resolution_ratio))
-            self.log.debug("delivery_ratio: `{}`".format(delivery_ratio))
-
-            # get scale factor
-            scale_factor_by_height = float(to_height) / slate_height
-            scale_factor_by_width = float(to_width) / (
-                slate_width * pixel_aspect
+        # Raise exception of any stream didn't define input resolution
+        if input_width is None:
+            raise KnownPublishError(
+                "FFprobe couldn't read resolution from input file: \"{}\""
+                .format(input_path)
             )
 
-            # shorten two decimals long float number for testing conditions
-            resolution_ratio_test = float("{:0.2f}".format(resolution_ratio))
-            delivery_ratio_test = float("{:0.2f}".format(delivery_ratio))
-
-            self.log.debug("__ scale_factor_by_width: `{}`".format(
-                scale_factor_by_width
-            ))
-            self.log.debug("__ scale_factor_by_height: `{}`".format(
-                scale_factor_by_height
-            ))
+        (
+            audio_codec,
+            audio_channels,
+            audio_sample_rate,
+            audio_channel_layout,
+            input_audio
+        ) = self._get_audio_metadata(streams)
 
-            _remove_at_end = []
+        # values are set in ExtractReview
+        if use_legacy_code:
+            to_width = inst_data["reviewToWidth"]
+            to_height = inst_data["reviewToHeight"]
+        else:
+            to_width = input_width
+            to_height = input_height
 
-            ext = os.path.splitext(input_file)[1]
-            output_file = input_file.replace(ext, "") + self.SUFFIX + ext
+        self.log.debug("to_width: `{}`".format(to_width))
+        self.log.debug("to_height: `{}`".format(to_height))
 
-            _remove_at_end.append(input_path)
+        # defining image ratios
+        resolution_ratio = (
+            (float(slate_width) * pixel_aspect) / slate_height
+        )
+        delivery_ratio = float(to_width) / float(to_height)
+        self.log.debug("resolution_ratio: `{}`".format(resolution_ratio))
+        self.log.debug("delivery_ratio: `{}`".format(delivery_ratio))
+
+        # get scale factor
+        scale_factor_by_height = float(to_height) / slate_height
+        scale_factor_by_width = float(to_width) / (
+            slate_width * pixel_aspect
+        )
 
-            output_path = os.path.join(
-                os.path.normpath(stagingdir), output_file)
-            self.log.debug("__ output_path: {}".format(output_path))
+        # shorten two decimals long float number for testing conditions
+        resolution_ratio_test = float("{:0.2f}".format(resolution_ratio))
+        delivery_ratio_test = float("{:0.2f}".format(delivery_ratio))
 
-            input_args = []
-            output_args = []
+        self.log.debug("__ scale_factor_by_width: `{}`".format(
+            scale_factor_by_width
+        ))
+        self.log.debug("__ scale_factor_by_height: `{}`".format(
+            scale_factor_by_height
+        ))
 
-            # preset's input data
-            if use_legacy_code:
-                input_args.extend(repre["_profile"].get('input', []))
-            else:
-                input_args.extend(repre["outputDef"].get('input', []))
-
-            input_args.extend([
-                "-loop", "1",
-                "-i", path_to_subprocess_arg(slate_path),
-                "-r", str(input_frame_rate),
-                "-frames:v", "1",
-            ])
-
-            # add timecode from source to the slate, substract one frame
-            offset_timecode = ""
-            if input_timecode:
-                offset_timecode = self._tc_offset(
-                    str(input_timecode),
-                    framerate=fps,
-                    frame_offset=-1
-                )
-                self.log.debug("Slate Timecode: `{}`".format(
-                    offset_timecode
-                ))
-
-            if use_legacy_code:
-                format_args = []
-                codec_args = repre["_profile"].get('codec', [])
-                output_args.extend(codec_args)
-                # preset's output data
-                output_args.extend(repre["_profile"].get('output', []))
-            else:
-                # Codecs are copied from source for whole input
-                format_args, codec_args = self._get_format_codec_args(repre)
-                output_args.extend(format_args)
-                output_args.extend(codec_args)
-
-            # make sure colors are correct
-            output_args.extend([
-                "-color_primaries", "bt709",
-                "-color_trc", "bt709",
-                "-colorspace", "bt709",
-            ])
-
-            # scaling none square pixels and 1920 width
-            if (
-                # Always scale slate if not legacy
-                not use_legacy_code or
-                # Legacy code required reformat tag
-                (use_legacy_code and "reformat" in p_tags)
-            ):
-                if resolution_ratio_test < delivery_ratio_test:
-                    self.log.debug("lower then delivery")
-                    width_scale = int(slate_width * scale_factor_by_height)
-                    width_half_pad = int((to_width - width_scale) / 2)
-                    height_scale = to_height
-                    height_half_pad = 0
-                else:
-                    self.log.debug("heigher then delivery")
-                    width_scale = to_width
-                    width_half_pad = 0
-                    height_scale = int(slate_height * scale_factor_by_width)
-                    height_half_pad = int((to_height - height_scale) / 2)
+        _remove_at_end = []
 
-                self.log.debug(
-                    "__ width_scale: `{}`".format(width_scale)
-                )
-                self.log.debug(
-                    "__ width_half_pad: `{}`".format(width_half_pad)
-                )
-                self.log.debug(
-                    "__ height_scale: `{}`".format(height_scale)
-                )
-                self.log.debug(
-                    "__ height_half_pad: `{}`".format(height_half_pad)
-                )
+        ext = os.path.splitext(input_file)[1]
+        output_file = input_file.replace(ext, "") + self.SUFFIX + ext
 
-                scaling_arg = (
-                    "scale={0}x{1}:flags=lanczos"
-                    ":out_color_matrix=bt709"
-                    ",pad={2}:{3}:{4}:{5}:black"
-                    ",setsar=1"
-                    ",fps={6}"
-                ).format(
-                    width_scale,
-                    height_scale,
-                    to_width,
-                    to_height,
-                    width_half_pad,
-                    height_half_pad,
-                    input_frame_rate
-                )
+        _remove_at_end.append(input_path)
 
-                vf_back = self.add_video_filter_args(output_args, scaling_arg)
-                # add it to output_args
-                output_args.insert(0, vf_back)
+        output_path = os.path.join(
+            os.path.normpath(stagingdir), output_file)
+        self.log.debug("__ output_path: {}".format(output_path))
 
-            # overrides output file
-            output_args.append("-y")
+        input_args = []
+        output_args = []
 
-            slate_v_path = slate_path.replace(".png", ext)
-            output_args.append(
-                path_to_subprocess_arg(slate_v_path)
+        # preset's input data
+        if use_legacy_code:
+            input_args.extend(repre["_profile"].get('input', []))
+        else:
+            input_args.extend(repre["outputDef"].get('input', []))
+
+        # Input arguments without slate path used for slate cache key
+        slate_key_args = list(input_args)
+        input_args.extend([
+            "-loop", "1",
+            "-i", path_to_subprocess_arg(slate_path),
+            "-r", str(input_frame_rate),
+            "-frames:v", "1",
+        ])
+
+        # add timecode from source to the slate, substract one frame
+        offset_timecode = ""
+        if input_timecode:
+            offset_timecode = self._tc_offset(
+                str(input_timecode),
+                framerate=fps,
+                frame_offset=-1
             )
-            _remove_at_end.append(slate_v_path)
+            self.log.debug("Slate Timecode: `{}`".format(
+                offset_timecode
+            ))
 
-            slate_args = [
-                subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")),
-                " ".join(input_args),
-                " ".join(output_args)
-            ]
-            slate_subprocess_cmd = " ".join(slate_args)
+        if use_legacy_code:
+            format_args = []
+            codec_args = repre["_profile"].get('codec', [])
+            output_args.extend(codec_args)
+            # preset's output data
+            output_args.extend(repre["_profile"].get('output', []))
+        else:
+            # Codecs are copied from source for whole input
+            format_args, codec_args = self._get_format_codec_args(
+                repre, input_ffprobe_data
+            )
+            output_args.extend(format_args)
+            output_args.extend(codec_args)
+
+        # make sure colors are correct
+        output_args.extend([
+            "-color_primaries", "bt709",
+            "-color_trc", "bt709",
+            "-colorspace", "bt709",
+        ])
+
+        # scaling none square pixels and 1920 width
+        if (
+            # Always scale slate if not legacy
+            not use_legacy_code or
+            # Legacy code required reformat tag
+            (use_legacy_code and "reformat" in p_tags)
+        ):
+            if resolution_ratio_test < delivery_ratio_test:
+                self.log.debug("lower then delivery")
+                width_scale = int(slate_width * scale_factor_by_height)
+                width_half_pad = int((to_width - width_scale) / 2)
+                height_scale = to_height
+                height_half_pad = 0
+            else:
+                self.log.debug("heigher then delivery")
+                width_scale = to_width
+                width_half_pad = 0
+                height_scale = int(slate_height * scale_factor_by_width)
+                height_half_pad = int((to_height - height_scale) / 2)
 
-            # run slate generation subprocess
             self.log.debug(
-                "Slate Executing: {}".format(slate_subprocess_cmd)
+                "__ width_scale: `{}`".format(width_scale)
             )
-            run_subprocess(
-                slate_subprocess_cmd, shell=True, logger=self.log
+            self.log.debug(
+                "__ width_half_pad: `{}`".format(width_half_pad)
+            )
+            self.log.debug(
+                "__ height_scale: `{}`".format(height_scale)
+            )
+            self.log.debug(
+                "__ height_half_pad: `{}`".format(height_half_pad)
+            )
+
+            scaling_arg = (
+                "scale={0}x{1}:flags=lanczos"
+                ":out_color_matrix=bt709"
+                ",pad={2}:{3}:{4}:{5}:black"
+                ",setsar=1"
+                ",fps={6}"
+            ).format(
+                width_scale,
+                height_scale,
+                to_width,
+                to_height,
+                width_half_pad,
+                height_half_pad,
+                input_frame_rate
             )
 
-            # Create slate with silent audio track
-            if input_audio:
-                # silent slate output path
-                slate_silent_path = "_silent".join(
-                    os.path.splitext(slate_v_path))
-                _remove_at_end.append(slate_silent_path)
-                self._create_silent_slate(
-                    slate_v_path,
-                    slate_silent_path,
+            vf_back = self.add_video_filter_args(output_args, scaling_arg)
+            # add it to output_args
+            output_args.insert(0, vf_back)
+
+        # overrides output file
+        output_args.append("-y")
+
+        # Encoded slate is cached by content of slate image and all
+        #   arguments affecting the encoding, so outputs with the same
+        #   slate and codec, and re-publishes, encode the slate only once
+        slate_cache = SlateCache()
+        slate_v_key = get_slate_cache_key(
+            "slate_video",
+            get_file_hash(slate_path),
+            slate_key_args,
+            input_frame_rate,
+            output_args,
+            ext,
+        )
+        # Slate is encoded next to slate image if cache is not available
+        fallback_v_path = os.path.splitext(slate_path)[0] + ext
+        slate_video_path = slate_v_path = slate_cache.get_or_create(
+            slate_v_key,
+            ext,
+            lambda path: self._create_slate_video(
+                input_args, output_args, path
+            ),
+            fallback_path=fallback_v_path,
+        )
+        if slate_video_path == fallback_v_path:
+            _remove_at_end.append(fallback_v_path)
+
+        # Create slate with silent audio track
+        if input_audio:
+            slate_silent_key = get_slate_cache_key(
+                "slate_silent",
+                slate_v_key,
+                audio_codec,
+                audio_channels,
+                audio_sample_rate,
+                audio_channel_layout,
+            )
+            fallback_silent_path = "_silent".join(
+                os.path.splitext(fallback_v_path)
+            )
+            # replace slate with silent slate for concat
+            slate_v_path = slate_cache.get_or_create(
+                slate_silent_key,
+                ext,
+                lambda path: self._create_silent_slate(
+                    slate_video_path,
+                    path,
                     audio_codec,
                     audio_channels,
                     audio_sample_rate,
                     audio_channel_layout,
                     input_frame_rate
-                )
+                ),
+                fallback_path=fallback_silent_path,
+            )
+            if slate_v_path == fallback_silent_path:
+                _remove_at_end.append(fallback_silent_path)
+
+        self._concat_slate(
+            repre,
+            slate_v_path,
+            input_path,
+            output_path,
+            input_audio,
+            offset_timecode,
+            format_args,
+            codec_args,
+            input_ffprobe_data,
+        )
 
-                # replace slate with silent slate for concat
-                slate_v_path = slate_silent_path
-
-            # concat slate and videos together with concat filter
-            # this will reencode the output
-            if input_audio:
-                fmap = [
-                    "-filter_complex",
-                    "[0:v] [0:a] [1:v] [1:a] concat=n=2:v=1:a=1 [v] [a]",
-                    "-map", '[v]',
-                    "-map", '[a]'
-                ]
-            else:
-                fmap = [
-                    "-filter_complex",
-                    "[0:v] [1:v] concat=n=2:v=1:a=0 [v]",
-                    "-map", '[v]'
-                ]
-            concat_args = get_ffmpeg_tool_args(
-                "ffmpeg",
-                "-y",
-                "-i", slate_v_path,
-                "-i", input_path,
+        self.log.debug("__ repre[tags]: {}".format(repre["tags"]))
+        repre_update = {
+            "files": output_file,
+            "name": repre["name"],
+            "tags": [x for x in repre["tags"] if x != "delete"]
+        }
+
+        # removing temp files
+        for f in _remove_at_end:
+            os.remove(f)
+            self.log.debug("Removed: `{}`".format(f))
+        return repre_update
+
+    def _concat_slate(
+        self,
+        repre,
+        slate_path,
+        input_path,
+        output_path,
+        input_audio,
+        offset_timecode,
+        format_args,
+        codec_args,
+        input_ffprobe_data,
+    ):
+        """Prepend slate clip to representation file.
+
+        Slate clip is joined with concat demuxer without re-encoding if
+        its streams match streams of the review. Concat filter which
+        re-encodes whole review is used otherwise.
+        """
+        if self.stream_copy_concat:
+            slate_ffprobe_data = get_ffprobe_data(slate_path, self.log)
+            mismatches = self._get_stream_copy_mismatches(
+                slate_ffprobe_data, input_ffprobe_data, input_audio
             )
-            concat_args.extend(fmap)
-            if offset_timecode:
-                concat_args.extend(["-timecode", offset_timecode])
-            # NOTE: Added because of OP Atom demuxers
-            # Add format arguments if there are any
-            # - keep format of output
-            if format_args:
-                concat_args.extend(format_args)
-
-            if codec_args:
-                concat_args.extend(codec_args)
-
-            # Use arguments from ffmpeg preset
-            source_ffmpeg_cmd = repre.get("ffmpeg_cmd")
-            if source_ffmpeg_cmd:
-                copy_args = (
-                    "-metadata",
-                    "-metadata:s:v:0",
-                    "-b:v",
-                    "-b:a",
+            if not mismatches:
+                try:
+                    self._concat_with_demuxer(
+                        repre,
+                        slate_path,
+                        input_path,
+                        output_path,
+                        input_audio,
+                        offset_timecode,
+                        format_args,
+                    )
+                    return
+                except RuntimeError:
+                    self.log.warning(
+                        "Stream copy concat failed, re-encoding review.",
+                        exc_info=True
+                    )
+            else:
+                self.log.debug(
+                    "Slate can't be joined by stream copy, re-encoding"
+                    " review. Mismatching parameters: {}".format(
+                        ", ".join(mismatches)
+                    )
                 )
-                args = source_ffmpeg_cmd.split(" ")
-                for indx, arg in enumerate(args):
-                    if arg in copy_args:
-                        concat_args.append(arg)
-                        # assumes arg has one parameter
-                        concat_args.append(args[indx + 1])
 
-            # add final output path
-            concat_args.append(output_path)
+        self._concat_with_filter(
+            repre,
+            slate_path,
+            input_path,
+            output_path,
+            input_audio,
+            offset_timecode,
+            format_args,
+            codec_args,
+        )
 
-            # ffmpeg concat subprocess
-            self.log.debug(
-                "Executing concat filter: {}".format
-                (" ".join(concat_args))
+    def _get_stream_copy_mismatches(
+        self, slate_ffprobe_data, input_ffprobe_data, input_audio
+    ):
+        """Compare streams of slate clip and review.
+
+        Returns:
+            list[str]: Parameters which don't match. Empty list means that
+                slate and review can be joined without re-encoding.
+        """
+        mismatches = []
+        codec_types = ["video"]
+        if input_audio:
+            codec_types.append("audio")
+
+        for codec_type in codec_types:
+            slate_stream = self._get_first_stream(
+                slate_ffprobe_data, codec_type
             )
-            run_subprocess(
-                concat_args, logger=self.log
+            input_stream = self._get_first_stream(
+                input_ffprobe_data, codec_type
             )
+            if slate_stream is None or input_stream is None:
+                mismatches.append(codec_type)
+                continue
 
-            self.log.debug("__ repre[tags]: {}".format(repre["tags"]))
-            repre_update = {
-                "files": output_file,
-                "name": repre["name"],
-                "tags": [x for x in repre["tags"] if x != "delete"]
-            }
-            inst_data["representations"][idx].update(repre_update)
-            self.log.debug(
-                "_ representation {}: `{}`".format(
-                    idx, inst_data["representations"][idx]))
+            if (
+                codec_type == "video"
+                and input_stream.get("codec_name")
+                not in self.stream_copy_video_codecs
+            ):
+                mismatches.append("video:not_intra_only")
+
+            for key in self.stream_copy_keys[codec_type]:
+                input_value = input_stream.get(key)
+                slate_value = slate_stream.get(key)
+                if key == "sample_aspect_ratio":
+                    input_value = self._normalize_aspect_ratio(input_value)
+                    slate_value = self._normalize_aspect_ratio(slate_value)
+                # Values not defined on review can't be compared
+                if input_value is None:
+                    continue
+                if str(input_value) != str(slate_value):
+                    mismatches.append("{}:{}".format(codec_type, key))
+        return mismatches
+
+    @staticmethod
+    def _get_first_stream(ffprobe_data, codec_type):
+        for stream in ffprobe_data.get("streams") or []:
+            if stream.get("codec_type") == codec_type:
+                return stream
+        return None
+
+    @staticmethod
+    def _normalize_aspect_ratio(value):
+        # Undefined sample aspect ratio means square pixels
+        if not value or value in ("0:1", "N/A"):
+            return "1:1"
+        return value
+
+    def _concat_with_demuxer(
+        self,
+        repre,
+        slate_path,
+        input_path,
+        output_path,
+        input_audio,
+        offset_timecode,
+        format_args,
+    ):
+        concat_list_path = "{}_concat.txt".format(
+            os.path.splitext(output_path)[0]
+        )
+        with open(concat_list_path, "w") as stream:
+            for path in (slate_path, input_path):
+                # Escape single quotes for concat demuxer
+                path = path.replace("\\", "/").replace("'", "'\\''")
+                stream.write("file '{}'\n".format(path))
 
-            # removing temp files
-            for f in _remove_at_end:
-                os.remove(f)
-                self.log.debug("Removed: `{}`".format(f))
+        concat_args = get_ffmpeg_tool_args(
+            "ffmpeg",
+            "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", concat_list_path,
+            "-map", "0:v:0",
+        )
+        if input_audio:
+            concat_args.extend(["-map", "0:a:0"])
+        concat_args.extend(["-c", "copy"])
+        if offset_timecode:
+            concat_args.extend(["-timecode", offset_timecode])
+        # NOTE: Added because of OP Atom demuxers
+        if format_args:
+            concat_args.extend(format_args)
+
+        # Metadata from ffmpeg preset, bit rates are kept by stream copy
+        concat_args.extend(self._get_source_ffmpeg_args(
+            repre, ("-metadata", "-metadata:s:v:0")
+        ))
+        concat_args.append(output_path)
 
-        # Remove any representations tagged for deletion.
-        for repre in inst_data.get("representations", []):
-            tags = repre.get("tags", [])
-            if "delete" not in tags:
-                continue
-            if "need_thumbnail" in tags:
-                continue
-            self.log.debug("Removing representation: {}".format(repre))
-            inst_data["representations"].remove(repre)
+        self.log.debug(
+            "Executing concat demuxer: {}".format(" ".join(concat_args))
+        )
+        try:
+            run_subprocess(concat_args, logger=self.log)
+        finally:
+            os.remove(concat_list_path)
 
-        self.log.debug(inst_data["representations"])
+    def _concat_with_filter(
+        self,
+        repre,
+        slate_path,
+        input_path,
+        output_path,
+        input_audio,
+        offset_timecode,
+        format_args,
+        codec_args,
+    ):
+        # concat slate and videos together with concat filter
+        # this will reencode the output
+        if input_audio:
+            fmap = [
+                "-filter_complex",
+                "[0:v] [0:a] [1:v] [1:a] concat=n=2:v=1:a=1 [v] [a]",
+                "-map", '[v]',
+                "-map", '[a]'
+            ]
+        else:
+            fmap = [
+                "-filter_complex",
+                "[0:v] [1:v] concat=n=2:v=1:a=0 [v]",
+                "-map", '[v]'
+            ]
+        concat_args = get_ffmpeg_tool_args(
+            "ffmpeg",
+            "-y",
+            "-i", slate_path,
+            "-i", input_path,
+        )
+        concat_args.extend(fmap)
+        if offset_timecode:
+            concat_args.extend(["-timecode", offset_timecode])
+        # NOTE: Added because of OP Atom demuxers
+        # Add format arguments if there are any
+        # - keep format of output
+        if format_args:
+            concat_args.extend(format_args)
+
+        if codec_args:
+            concat_args.extend(codec_args)
+
+        # Use arguments from ffmpeg preset
+        concat_args.extend(self._get_source_ffmpeg_args(
+            repre,
+            (
+                "-metadata",
+                "-metadata:s:v:0",
+                "-b:v",
+                "-b:a",
+            )
+        ))
+
+        # add final output path
+        concat_args.append(output_path)
+
+        # ffmpeg concat subprocess
+        self.log.debug(
+            "Executing concat filter: {}".format
+            (" ".join(concat_args))
+        )
+        run_subprocess(
+            concat_args, logger=self.log
+        )
+
+    def _get_source_ffmpeg_args(self, repre, copy_args):
+        """Arguments copied from command which created representation."""
+        output = []
+        source_ffmpeg_cmd = repre.get("ffmpeg_cmd")
+        if not source_ffmpeg_cmd:
+            return output
+
+        args = source_ffmpeg_cmd.split(" ")
+        for indx, arg in enumerate(args):
+            if arg in copy_args:
+                output.append(arg)
+                # assumes arg has one parameter
+                output.append(args[indx + 1])
+        return output
 
     def _get_slate_path(self, input_file, slates_data):
         slate_path = None
@@ -507,6 +823,23 @@ class ExtractReviewSlate(publish.Extractor):
             input_audio,
         )
 
+    def _create_slate_video(self, input_args, output_args, dst_path):
+        slate_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")),
+            " ".join(input_args),
+            " ".join(output_args),
+            path_to_subprocess_arg(dst_path),
+        ]
+        slate_subprocess_cmd = " ".join(slate_args)
+
+        # run slate generation subprocess
+        self.log.debug(
+            "Slate Executing: {}".format(slate_subprocess_cmd)
+        )
+        run_subprocess(
+            slate_subprocess_cmd, shell=True, logger=self.log
+        )
+
     def _create_silent_slate(
         self,
         src_path,
@@ -595,27 +928,34 @@ class ExtractReviewSlate(publish.Extractor):
 
         return vf_back
 
-    def _get_format_codec_args(self, repre):
-        """Detect possible codec arguments from representation."""
-        codec_args = []
+    def _get_format_codec_args(self, repre, ffprobe_data=None):
+        """Detect possible codec arguments from representation.
 
-        # Get one filename of representation files
-        filename = repre["files"]
-        # If files is list then pick first filename in list
-        if isinstance(filename, (tuple, list)):
-            filename = filename[0]
-        # Get full path to the file
-        full_input_path = os.path.join(repre["stagingDir"], filename)
+        Args:
+            repre (dict[str, Any]): Representation.
+            ffprobe_data (Optional[dict[str, Any]]): Already loaded ffprobe
+                data of representation file.
+        """
+        codec_args = []
 
-        try:
-            # Get information about input file via ffprobe tool
-            ffprobe_data = get_ffprobe_data(full_input_path, self.log)
-        except Exception:
-            self.log.warning(
-                "Could not get codec data from input.",
-                exc_info=True
-            )
-            return codec_args
+        if ffprobe_data is None:
+            # Get one filename of representation files
+            filename = repre["files"]
+            # If files is list then pick first filename in list
+            if isinstance(filename, (tuple, list)):
+                filename = filename[0]
+            # Get full path to the file
+            full_input_path = os.path.join(repre["stagingDir"], filename)
+
+            try:
+                # Get information about input file via ffprobe tool
+                ffprobe_data = get_ffprobe_data(full_input_path, self.log)
+            except Exception:
+                self.log.warning(
+                    "Could not get codec data from input.",
+                    exc_info=True
+                )
+                return codec_args
 
         source_ffmpeg_cmd = repre.get("ffmpeg_cmd")
         format_args = get_ffmpeg_format_args(ffprobe_data, source_ffmpeg_cmd)
@@ -1,26 +1,40 @@
 # -*- coding: utf-8 -*-
 """Convert exrs in representation to tiled exrs usin oiio tools."""
 import os
+import time
+import math
 import shutil
 
+import clique
 import pyblish.api
 
 from ayon_core.lib import (
-    run_subprocess,
     get_oiio_tool_args,
+    get_media_job_orchestrator,
+    run_media_batch,
+    is_tiled_exr,
     ToolNotFoundError,
 )
 from ayon_core.pipeline import KnownPublishError
 
 
 class ExtractScanlineExr(pyblish.api.InstancePlugin):
-    """Convert tiled EXRs to scanline using OIIO tool."""
+    """Convert tiled EXRs to scanline using OIIO tool.
+
+    Files that are already scanline are skipped. Contiguous frames of
+    a sequence are converted in chunks with single oiiotool process per
+    chunk using '--frames'. Chunks run in parallel in shared pool of
+    media processes.
+    """
 
     label = "Extract Scanline EXR"
     hosts = ["shell"]
     order = pyblish.api.ExtractorOrder
     families = ["imagesequence", "render", "render2d", "source"]
 
+    # Maximum number of frames converted by one oiiotool process
+    max_frames_per_chunk = 100
+
     def process(self, instance):
         """Plugin entry point."""
         # get representation and loop them
@@ -56,33 +70,7 @@ class ExtractScanlineExr(pyblish.api.InstancePlugin):
                 self.log.error("OIIO tool not found.")
                 raise KnownPublishError("OIIO tool not found")
 
-            for file in input_files:
-
-                original_name = os.path.join(stagingdir, file)
-                temp_name = os.path.join(stagingdir, "__{}".format(file))
-                # move original render to temp location
-                shutil.move(original_name, temp_name)
-                oiio_cmd = oiio_tool_args + [
-                    os.path.join(stagingdir, temp_name), "--scanline", "-o",
-                    os.path.join(stagingdir, original_name)
-                ]
-
-                subprocess_exr = " ".join(oiio_cmd)
-                self.log.debug(f"running: {subprocess_exr}")
-                run_subprocess(subprocess_exr, logger=self.log)
-
-                # raise error if there is no ouptput
-                if not os.path.exists(os.path.join(stagingdir, original_name)):
-                    self.log.error(
-                        ("File {} was not converted "
-                         "by oiio tool!").format(original_name))
-                    raise AssertionError("OIIO tool conversion failed")
-                else:
-                    try:
-                        os.remove(temp_name)
-                    except OSError as e:
-                        self.log.warning("Unable to delete temp file")
-                        self.log.warning(e)
+            self._convert_files(oiio_tool_args, stagingdir, input_files)
 
             repre['name'] = 'exr'
             try:
@@ -92,3 +80,179 @@ class ExtractScanlineExr(pyblish.api.InstancePlugin):
                 pass
 
         instance.data["representations"] += representations_new
+
+    def _convert_files(self, oiio_tool_args, stagingdir, input_files):
+        tiled_files = []
+        for filename in input_files:
+            if is_tiled_exr(os.path.join(stagingdir, filename), self.log):
+                tiled_files.append(filename)
+
+        skipped_count = len(input_files) - len(tiled_files)
+        if skipped_count:
+            self.log.debug(
+                f"Skipped {skipped_count} files already in scanline format."
+            )
+        if not tiled_files:
+            return
+
+        # move original renders to temp location
+        for filename in tiled_files:
+            shutil.move(
+                os.path.join(stagingdir, filename),
+                os.path.join(stagingdir, "__{}".format(filename))
+            )
+
+        orchestrator = get_media_job_orchestrator()
+        conversions = [
+            orchestrator.run(
+                oiio_tool_args + chunk_args,
+                label="Scanline EXR",
+                logger=self.log,
+            )
+            for chunk_args in self._get_chunks_args(
+                stagingdir, tiled_files, orchestrator.max_jobs
+            )
+        ]
+        started = time.time()
+        try:
+            run_media_batch(conversions)
+
+        finally:
+            missing_files = self._finish_conversion(stagingdir, tiled_files)
+
+        # raise error if there is no ouptput
+        if missing_files:
+            self.log.error(
+                "Files were not converted by oiio tool: {}".format(
+                    ", ".join(missing_files)
+                )
+            )
+            raise AssertionError("OIIO tool conversion failed")
+
+        duration = max(time.time() - started, 0.001)
+        self.log.info(
+            "Converted {} files to scanline in {:.2f}s"
+            " ({:.1f} frames/sec).".format(
+                len(tiled_files), duration, len(tiled_files) / duration
+            )
+        )
+
+    def _get_chunks_args(self, stagingdir, filenames, max_jobs):
+        """Prepare oiiotool arguments for chunks of files.
+
+        Args:
+            stagingdir (str): Directory with files.
+            filenames (list[str]): Names of files to convert. Files are
+                expected to be moved to temp location with '__' prefix.
+            max_jobs (int): Number of processes that can run in parallel.
+
+        Returns:
+            list[list[str]]: Arguments for oiiotool without executable.
+        """
+        collections, remainders = clique.assemble(
+            filenames,
+            patterns=[clique.PATTERNS["frames"]],
+            minimum_items=2,
+        )
+        output = []
+        for filename in remainders:
+            output.append([
+                os.path.join(stagingdir, "__{}".format(filename)),
+                "--scanline",
+                "-o",
+                os.path.join(stagingdir, filename),
+            ])
+
+        # Spread frames between processes but don't create too small chunks
+        frames_count = sum(
+            len(collection.indexes) for collection in collections
+        )
+        chunk_size = max(
+            1,
+            min(
+                self.max_frames_per_chunk,
+                math.ceil(frames_count / max(1, max_jobs))
+            )
+        )
+        for collection in collections:
+            frame_template = "%d"
+            if collection.padding:
+                frame_template = "%0{}d".format(collection.padding)
+            input_template = os.path.join(
+                stagingdir,
+                "__{}{}{}".format(
+                    collection.head, frame_template, collection.tail
+                )
+            )
+            output_template = os.path.join(
+                stagingdir,
+                "{}{}{}".format(
+                    collection.head, frame_template, collection.tail
+                )
+            )
+            for frame_start, frame_end in self._get_frame_chunks(
+                sorted(collection.indexes), chunk_size
+            ):
+                output.append([
+                    "--frames", "{}-{}".format(frame_start, frame_end),
+                    input_template,
+                    "--scanline",
+                    "-o",
+                    output_template,
+                ])
+        return output
+
+    @staticmethod
+    def _get_frame_chunks(frames, chunk_size):
+        """Split frames to contiguous ranges with maximum size.
+
+        Args:
+            frames (list[int]): Sorted frames.
+            chunk_size (int): Maximum number of frames in range.
+
+        Returns:
+            list[tuple[int, int]]: Frame start and end of chunks.
+        """
+        chunks = []
+        chunk_start = chunk_end = None
+        for frame in frames:
+            if (
+                chunk_start is not None
+                and frame == chunk_end + 1
+                and frame - chunk_start < chunk_size
+            ):
+                chunk_end = frame
+                continue
+
+            if chunk_start is not None:
+                chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end = frame
+
+        if chunk_start is not None:
+            chunks.append((chunk_start, chunk_end))
+        return chunks
+
+    def _finish_conversion(self, stagingdir, filenames):
+        """Validate outputs and remove temp files.
+
+        Original files are moved back when they were not converted.
+
+        Returns:
+            list[str]: Paths to files that were not converted.
+        """
+        missing_files = []
+        for filename in filenames:
+            output_path = os.path.join(stagingdir, filename)
+            temp_path = os.path.join(stagingdir, "__{}".format(filename))
+            if not os.path.exists(output_path):
+                missing_files.append(output_path)
+                shutil.move(temp_path, output_path)
+                continue
+
+            try:
+                os.remove(temp_path)
+            except OSError as e:
+                self.log.warning("Unable to delete temp file")
+                self.log.warning(e)
+
+        return missing_files
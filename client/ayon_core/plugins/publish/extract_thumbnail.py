@@ -1,10 +1,11 @@
-import copy
 import os
-import subprocess
-import tempfile
 import re
+import shlex
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import pyblish.api
+import pyblish.logic
 from ayon_core.lib import (
     get_ffmpeg_tool_args,
     get_ffprobe_data,
@@ -12,7 +13,6 @@ from ayon_core.lib import (
     is_oiio_supported,
     get_rescaled_command_arguments,
 
-    path_to_subprocess_arg,
     run_subprocess,
 )
 from ayon_core.lib.transcoding import convert_colorspace
@@ -20,6 +20,44 @@ from ayon_core.lib.transcoding import convert_colorspace
 from ayon_core.lib.transcoding import VIDEO_EXTENSIONS
 
 
+class _ThumbnailSource:
+    """Representation used as source for thumbnail.
+
+    Args:
+        repre (dict[str, Any]): Source representation.
+        input_path (str): Path to input file (image or video).
+        is_video (bool): Input is video file.
+        jpeg_file (str): Filename of thumbnail.
+        output_path (str): Full path to thumbnail.
+    """
+
+    def __init__(self, repre, input_path, is_video, jpeg_file, output_path):
+        self.repre = repre
+        self.input_path = input_path
+        self.is_video = is_video
+        self.jpeg_file = jpeg_file
+        self.output_path = output_path
+
+
+class _ThumbnailJob:
+    """Thumbnail extraction of one instance.
+
+    Args:
+        dst_staging (str): Directory where thumbnails are created.
+        sources (list[_ThumbnailSource]): Sources for thumbnail in order
+            in which they are tried.
+        explicit_count (int): Number of explicit sources, thumbnail is
+            created for each of them.
+    """
+
+    def __init__(self, dst_staging, sources, explicit_count):
+        self.dst_staging = dst_staging
+        self.sources = sources
+        self.explicit_count = explicit_count
+        # Future of job running in worker thread
+        self.future = None
+
+
 class ExtractThumbnail(pyblish.api.InstancePlugin):
     """Create jpg thumbnail from sequence using ffmpeg"""
 
@@ -66,6 +104,9 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         "output": []
     }
     product_names = []
+    # Maximum number of instances processed at the same time, value lower
+    #   than 1 is based on number of CPU cores
+    max_concurrent_jobs = 0
 
     def process(self, instance):
         # run main process
@@ -88,13 +129,118 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
                 instance.data["representations"].remove(repre)
 
     def _main_process(self, instance):
+        job = self._get_instance_job(instance)
+        if job is None:
+            return
+
+        # Wait for thumbnails of the instance
+        if job.future is not None:
+            created_sources = job.future.result()
+        else:
+            created_sources = self._run_job(job)
+
+        for source in created_sources:
+            self._add_thumbnail_representation(instance, job, source)
+
+        if not created_sources:
+            self.log.warning("Thumbnail has not been created.")
+
+    def _get_instance_job(self, instance):
+        """Get thumbnail job of instance.
+
+        Pyblish processes all instances of a plugin one after another, so
+        jobs of all instances that will be processed are prepared when
+        the first of them is processed and are running on a pool of worker
+        threads, each waiting for its subprocess. Next instances only wait
+        for their job to finish.
+
+        Returns:
+            Optional[_ThumbnailJob]: Thumbnail job or None if thumbnail
+                should not be created for the instance.
+        """
+        context = instance.context
+        jobs_by_instance_id = context.data.get("extractThumbnailJobs")
+        if jobs_by_instance_id is None:
+            jobs_by_instance_id = {}
+            context.data["extractThumbnailJobs"] = jobs_by_instance_id
+
+        if instance.id in jobs_by_instance_id:
+            return jobs_by_instance_id.pop(instance.id)
+
+        job = self._prepare_job(instance)
+        instances = self._get_pending_instances(
+            instance, jobs_by_instance_id
+        )
+        max_workers = self._get_max_concurrent_jobs(len(instances) + 1)
+        if max_workers < 2:
+            return job
+
+        jobs = []
+        if job is not None:
+            jobs.append(job)
+        for other_instance in instances:
+            other_job = self._prepare_job(other_instance)
+            jobs_by_instance_id[other_instance.id] = other_job
+            if other_job is not None:
+                jobs.append(other_job)
+
+        if len(jobs) < 2:
+            return job
+
+        self.log.debug(
+            "Extracting thumbnails of {} instances with {} workers".format(
+                len(jobs), max_workers
+            )
+        )
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        for batch_job in jobs:
+            batch_job.future = executor.submit(self._run_job, batch_job)
+        # Threads finish running jobs and then are released
+        executor.shutdown(wait=False)
+        return job
+
+    def _get_pending_instances(self, instance, jobs_by_instance_id):
+        """Instances which will be processed by the plugin after instance."""
+        context = instance.context
+        if instance not in context:
+            return []
+
+        instances = pyblish.logic.instances_by_plugin(
+            list(context), self.__class__
+        )
+        found = False
+        output = []
+        for other_instance in instances:
+            if other_instance is instance:
+                found = True
+                continue
+            if (
+                not found
+                or other_instance.id in jobs_by_instance_id
+                or other_instance.data.get("publish") is False
+            ):
+                continue
+            output.append(other_instance)
+        return output
+
+    def _get_max_concurrent_jobs(self, jobs_count):
+        if jobs_count < 2:
+            return 1
+
+        max_workers = self.max_concurrent_jobs
+        if max_workers < 1:
+            # ffmpeg and oiiotool are multithreaded on their own
+            max_workers = max(1, min(4, (os.cpu_count() or 1) // 2))
+        return min(max_workers, jobs_count)
+
+    def _prepare_job(self, instance):
         product_name = instance.data["productName"]
         instance_repres = instance.data.get("representations")
         if not instance_repres:
             self.log.debug((
                 "Instance {} does not have representations. Skipping"
             ).format(product_name))
-            return
+            return None
 
         self.log.debug(
             "Processing instance with product name {}".format(product_name)
@@ -103,12 +249,12 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         # Skip if instance have 'review' key in data set to 'False'
         if not self._is_review_instance(instance):
             self.log.debug("Skipping - no review set on instance.")
-            return
+            return None
 
         # Check if already has thumbnail created
         if self._already_has_thumbnail(instance_repres):
             self.log.debug("Thumbnail representation already present.")
-            return
+            return None
 
         # skip crypto passes.
         # TODO: This is just a quick fix and has its own side-effects - it is
@@ -118,7 +264,7 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         #       with better precision.
         if "crypto" in product_name.lower():
             self.log.debug("Skipping crypto passes.")
-            return
+            return None
 
         # We only want to process the produces needed from settings.
         def validate_string_against_patterns(input_str, patterns):
@@ -136,7 +282,7 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
                 self.log.debug((
                     "Product name \"{}\" did not match settings filters: {}"
                 ).format(product_name, product_names))
-                return
+                return None
 
         # first check for any explicitly marked representations for thumbnail
         explicit_repres = self._get_explicit_repres_for_thumbnail(instance)
@@ -150,7 +296,7 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
                 "Instance doesn't have representations that can be used "
                 "as source for thumbnail. Skipping thumbnail extraction."
             )
-            return
+            return None
 
         # Create temp directory for thumbnail
         # - this is to avoid "override" of source file
@@ -161,136 +307,177 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         # Store new staging to cleanup paths
         instance.context.data["cleanupFullPaths"].append(dst_staging)
 
-        thumbnail_created = False
-        oiio_supported = is_oiio_supported()
-        for repre in filtered_repres:
-            repre_files = repre["files"]
-            src_staging = os.path.normpath(repre["stagingDir"])
-            if not isinstance(repre_files, (list, tuple)):
-                # convert any video file to frame so oiio doesn't need to
-                # read video file (it is slow) and also we are having control
-                # over which frame is used for thumbnail
-                # this will also work with ffmpeg fallback conversion in case
-                # oiio is not supported
-                repre_extension = os.path.splitext(repre_files)[1]
-                if repre_extension in VIDEO_EXTENSIONS:
-                    video_file_path = os.path.join(
-                        src_staging, repre_files
-                    )
-                    file_path = self._create_frame_from_video(
-                        video_file_path,
-                        dst_staging
-                    )
-                    if file_path:
-                        src_staging, input_file = os.path.split(file_path)
-                else:
-                    # if it is not video file then just use first file
-                    input_file = repre_files
-            else:
-                repre_files_thumb = copy.deepcopy(repre_files)
-                # exclude first frame if slate in representation tags
-                if "slate-frame" in repre.get("tags", []):
-                    repre_files_thumb = repre_files_thumb[1:]
-                file_index = int(
-                    float(len(repre_files_thumb)) * self.duration_split)
-                input_file = repre_files[file_index]
-
-            full_input_path = os.path.join(src_staging, input_file)
-            self.log.debug("input {}".format(full_input_path))
-
-            filename = os.path.splitext(input_file)[0]
-            jpeg_file = filename + "_thumb.jpg"
-            full_output_path = os.path.join(dst_staging, jpeg_file)
-            colorspace_data = repre.get("colorspaceData")
-
-            # only use OIIO if it is supported and representation has
-            # colorspace data
-            if oiio_supported and colorspace_data:
-                self.log.debug(
-                    "Trying to convert with OIIO "
-                    "with colorspace data: {}".format(colorspace_data)
-                )
-                # If the input can read by OIIO then use OIIO method for
-                # conversion otherwise use ffmpeg
-                thumbnail_created = self._create_thumbnail_oiio(
+        sources = [
+            self._prepare_source(repre, dst_staging)
+            for repre in filtered_repres
+        ]
+        return _ThumbnailJob(
+            dst_staging, sources, len(explicit_repres)
+        )
+
+    def _prepare_source(self, repre, dst_staging):
+        repre_files = repre["files"]
+        src_staging = os.path.normpath(repre["stagingDir"])
+        is_video = False
+        if not isinstance(repre_files, (list, tuple)):
+            # video file is converted to frame so oiio doesn't need to
+            #   read video file (it is slow) and also we are having control
+            #   over which frame is used for thumbnail
+            input_file = repre_files
+            repre_extension = os.path.splitext(repre_files)[1]
+            is_video = repre_extension in VIDEO_EXTENSIONS
+        else:
+            repre_files_thumb = list(repre_files)
+            # exclude first frame if slate in representation tags
+            if "slate-frame" in repre.get("tags", []):
+                repre_files_thumb = repre_files_thumb[1:]
+            file_index = int(
+                float(len(repre_files_thumb)) * self.duration_split)
+            input_file = repre_files[file_index]
+
+        filename = os.path.splitext(input_file)[0]
+        jpeg_file = filename + "_thumb.jpg"
+        return _ThumbnailSource(
+            repre,
+            os.path.join(src_staging, input_file),
+            is_video,
+            jpeg_file,
+            os.path.join(dst_staging, jpeg_file),
+        )
+
+    def _run_job(self, job):
+        """Create thumbnails of a job.
+
+        Thumbnail is created for each explicit representation, otherwise
+        representations are tried one by one until a thumbnail is created.
+
+        Method does not change instance data so it can run in worker thread.
+
+        Returns:
+            list[_ThumbnailSource]: Sources for which thumbnail was created.
+        """
+        created_sources = []
+        for source in job.sources:
+            if not self._create_thumbnail(source, job.dst_staging):
+                continue
+            created_sources.append(source)
+            if not job.explicit_count:
+                # There is no need to create more then one thumbnail
+                break
+        return created_sources
+
+    def _create_thumbnail(self, source, dst_staging):
+        full_input_path = source.input_path
+        self.log.debug("input {}".format(full_input_path))
+        colorspace_data = source.repre.get("colorspaceData")
+        # only use OIIO if it is supported and representation has
+        # colorspace data
+        use_oiio = bool(colorspace_data) and is_oiio_supported()
+
+        if source.is_video:
+            duration = self._get_video_duration(source)
+            if not use_oiio:
+                # Seek and convert the frame with single ffmpeg process
+                return self._create_thumbnail_ffmpeg(
                     full_input_path,
-                    full_output_path,
-                    colorspace_data
+                    source.output_path,
+                    seek_time=duration * self.duration_split,
                 )
 
-            # Try to use FFMPEG if OIIO is not supported or for cases when
-            #   oiiotool isn't available or representation is not having
-            #   colorspace data
-            if not thumbnail_created:
-                if oiio_supported:
-                    self.log.debug(
-                        "Converting with FFMPEG because input"
-                        " can't be read by OIIO."
-                    )
-
-                thumbnail_created = self._create_thumbnail_ffmpeg(
-                    full_input_path, full_output_path
+            frame_path = self._create_frame_from_video(
+                full_input_path, dst_staging, duration
+            )
+            if not frame_path:
+                # Fallback to pass the video itself to ffmpeg
+                return self._create_thumbnail_ffmpeg(
+                    full_input_path,
+                    source.output_path,
+                    seek_time=duration * self.duration_split,
                 )
+            full_input_path = frame_path
 
-            # Skip representation and try next one if  wasn't created
-            if not thumbnail_created:
-                continue
-
-            if len(explicit_repres) > 1:
-                repre_name = "thumbnail_{}".format(repre["outputName"])
-            else:
-                repre_name = "thumbnail"
+        thumbnail_created = False
+        if use_oiio:
+            self.log.debug(
+                "Trying to convert with OIIO "
+                "with colorspace data: {}".format(colorspace_data)
+            )
+            # If the input can read by OIIO then use OIIO method for
+            # conversion otherwise use ffmpeg
+            thumbnail_created = self._create_thumbnail_oiio(
+                full_input_path,
+                source.output_path,
+                colorspace_data
+            )
 
-            # add thumbnail path to instance data for integrator
-            instance_thumb_path = instance.data.get("thumbnailPath")
-            if (
-                not instance_thumb_path
-                or not os.path.isfile(instance_thumb_path)
-            ):
+        # Try to use FFMPEG if OIIO is not supported or for cases when
+        #   oiiotool isn't available or representation is not having
+        #   colorspace data
+        if not thumbnail_created:
+            if use_oiio:
                 self.log.debug(
-                    "Adding thumbnail path to instance data: {}".format(
-                        full_output_path
-                    )
+                    "Converting with FFMPEG because input"
+                    " can't be read by OIIO."
                 )
-                instance.data["thumbnailPath"] = full_output_path
-
-            new_repre_tags = ["thumbnail"]
-            # for workflows which needs to have thumbnails published as
-            # separate representations `delete` tag should not be added
-            if not self.integrate_thumbnail:
-                new_repre_tags.append("delete")
-
-            new_repre = {
-                "name": repre_name,
-                "ext": "jpg",
-                "files": jpeg_file,
-                "stagingDir": dst_staging,
-                "thumbnail": True,
-                "tags": new_repre_tags,
-                # If source image is jpg then there can be clash when
-                # integrating to making the output name explicit.
-                "outputName": "thumbnail"
-            }
-
-            # adding representation
-            instance.data["representations"].append(new_repre)
-
-            if explicit_repres:
-                # this key will then align assetVersion ftrack thumbnail sync
-                new_repre["outputName"] = (
-                    repre.get("outputName") or repre["name"])
-                self.log.debug(
-                    "Adding explicit thumbnail representation: {}".format(
-                        new_repre))
-            else:
-                self.log.debug(
-                    "Adding thumbnail representation: {}".format(new_repre)
+
+            thumbnail_created = self._create_thumbnail_ffmpeg(
+                full_input_path, source.output_path
+            )
+        return thumbnail_created
+
+    def _add_thumbnail_representation(self, instance, job, source):
+        repre = source.repre
+        full_output_path = source.output_path
+        if job.explicit_count > 1:
+            repre_name = "thumbnail_{}".format(repre["outputName"])
+        else:
+            repre_name = "thumbnail"
+
+        # add thumbnail path to instance data for integrator
+        instance_thumb_path = instance.data.get("thumbnailPath")
+        if (
+            not instance_thumb_path
+            or not os.path.isfile(instance_thumb_path)
+        ):
+            self.log.debug(
+                "Adding thumbnail path to instance data: {}".format(
+                    full_output_path
                 )
-                # There is no need to create more then one thumbnail
-                break
+            )
+            instance.data["thumbnailPath"] = full_output_path
+
+        new_repre_tags = ["thumbnail"]
+        # for workflows which needs to have thumbnails published as
+        # separate representations `delete` tag should not be added
+        if not self.integrate_thumbnail:
+            new_repre_tags.append("delete")
+
+        new_repre = {
+            "name": repre_name,
+            "ext": "jpg",
+            "files": source.jpeg_file,
+            "stagingDir": job.dst_staging,
+            "thumbnail": True,
+            "tags": new_repre_tags,
+            # If source image is jpg then there can be clash when
+            # integrating to making the output name explicit.
+            "outputName": "thumbnail"
+        }
 
-        if not thumbnail_created:
-            self.log.warning("Thumbnail has not been created.")
+        # adding representation
+        instance.data["representations"].append(new_repre)
+
+        if job.explicit_count:
+            # this key will then align assetVersion ftrack thumbnail sync
+            new_repre["outputName"] = (
+                repre.get("outputName") or repre["name"])
+            self.log.debug(
+                "Adding explicit thumbnail representation: {}".format(
+                    new_repre))
+        else:
+            self.log.debug(
+                "Adding thumbnail representation: {}".format(new_repre)
+            )
 
     def _is_review_instance(self, instance):
         # TODO: We should probably handle "not creating" of thumbnail
@@ -426,28 +613,26 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
 
         return True
 
-    def _create_thumbnail_ffmpeg(self, src_path, dst_path):
+    def _create_thumbnail_ffmpeg(self, src_path, dst_path, seek_time=None):
         self.log.debug("Extracting thumbnail with FFMPEG: {}".format(dst_path))
         resolution_arg = self._get_resolution_arg("ffmpeg", src_path)
-        ffmpeg_path_args = get_ffmpeg_tool_args("ffmpeg")
         ffmpeg_args = self.ffmpeg_args or {}
 
-        jpeg_items = [
-            subprocess.list2cmdline(ffmpeg_path_args)
-        ]
         # flag for large file sizes
         max_int = 2147483647
-        jpeg_items.extend([
+        jpeg_items = [
             "-y",
             "-analyzeduration", str(max_int),
             "-probesize", str(max_int),
-        ])
+        ]
+        if seek_time is not None:
+            jpeg_items.extend(["-ss", str(seek_time)])
         # use same input args like with mov
-        jpeg_items.extend(ffmpeg_args.get("input") or [])
+        jpeg_items.extend(self._split_ffmpeg_args(ffmpeg_args.get("input")))
         # input file
-        jpeg_items.extend(["-i", path_to_subprocess_arg(src_path)])
+        jpeg_items.extend(["-i", src_path])
         # output arguments from presets
-        jpeg_items.extend(ffmpeg_args.get("output") or [])
+        jpeg_items.extend(self._split_ffmpeg_args(ffmpeg_args.get("output")))
         # we just want one frame from movie files
         jpeg_items.extend(["-vframes", "1"])
 
@@ -455,13 +640,11 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
             jpeg_items.extend(resolution_arg)
 
         # output file
-        jpeg_items.append(path_to_subprocess_arg(dst_path))
-        subprocess_command = " ".join(jpeg_items)
+        jpeg_items.append(dst_path)
+        cmd = get_ffmpeg_tool_args("ffmpeg", *jpeg_items)
 
         try:
-            run_subprocess(
-                subprocess_command, shell=True, logger=self.log
-            )
+            run_subprocess(cmd, logger=self.log)
             return True
         except Exception:
             self.log.warning(
@@ -470,27 +653,51 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
             )
             return False
 
-    def _create_frame_from_video(self, video_file_path, output_dir):
-        """Convert video file to one frame image via ffmpeg"""
-        # create output file path
-        base_name = os.path.basename(video_file_path)
-        filename = os.path.splitext(base_name)[0]
-        output_thumb_file_path = os.path.join(
-            output_dir, "{}.png".format(filename))
+    def _split_ffmpeg_args(self, args):
+        """Split arguments from settings to subprocess arguments.
 
-        # Set video input attributes
-        max_int = str(2147483647)
-        video_data = get_ffprobe_data(video_file_path, logger=self.log)
+        Item in settings may contain more arguments (e.g. '-apply_trc
+        gamma22').
+        """
+        output = []
+        for arg in args or []:
+            output.extend(shlex.split(arg))
+        return output
+
+    def _get_video_duration(self, source):
+        """Duration of video in seconds.
+
+        Review outputs created by 'ExtractReview' already have information
+        about frame range and fps, so ffprobe is not needed for them.
+        """
+        repre = source.repre
+        fps = repre.get("fps")
+        frame_start = repre.get("frameStartFtrack")
+        frame_end = repre.get("frameEndFtrack")
+        if fps and frame_start is not None and frame_end is not None:
+            return float(frame_end - frame_start + 1) / float(fps)
+
+        video_data = get_ffprobe_data(source.input_path, logger=self.log)
         # Use duration of the individual streams since it is returned with
         # higher decimal precision than 'format.duration'. We need this
         # more precise value for calculating the correct amount of frames
         # for higher FPS ranges or decimal ranges, e.g. 29.97 FPS
-        duration = max(
+        return max(
             float(stream.get("duration", 0))
             for stream in video_data["streams"]
             if stream.get("codec_type") == "video"
         )
 
+    def _create_frame_from_video(self, video_file_path, output_dir, duration):
+        """Convert video file to one frame image via ffmpeg"""
+        # create output file path
+        base_name = os.path.basename(video_file_path)
+        filename = os.path.splitext(base_name)[0]
+        output_thumb_file_path = os.path.join(
+            output_dir, "{}.png".format(filename))
+
+        # Set video input attributes
+        max_int = str(2147483647)
         cmd_args = [
             "-y",
             "-ss", str(duration * self.duration_split),
@@ -1,6 +1,7 @@
 from operator import attrgetter
 import dataclasses
 import os
+import time
 from typing import Dict
 
 import pyblish.api
@@ -71,6 +72,123 @@ class VariantContribution(_BaseContribution):
     variant_is_default: bool  # Whether to author variant selection opinion
 
 
+class USDLayerCache:
+    """Publish-scoped cache of USD layers used by contribution extractors.
+
+    Layers are opened only once per path and exports are deferred so each
+    output layer is written only once at the end of the contributions
+    extraction by 'ExtractUSDLayerCacheWrite'. Resolved publish paths are
+    cached too to avoid repeated server queries for the same product.
+
+    Access the cache of a publish using 'get_from_context'.
+
+    """
+    context_key = "usdLayerCache"
+
+    def __init__(self):
+        self._layers_by_path = {}
+        self._paths_by_key = {}
+        self._exports = {}
+        self.counters = {
+            "opened": 0,
+            "open_hits": 0,
+            "resolved": 0,
+            "resolve_hits": 0,
+            "exported": 0,
+        }
+        self.timings = {
+            "open": 0.0,
+            "resolve": 0.0,
+            "export": 0.0,
+        }
+
+    @classmethod
+    def get_from_context(cls, context):
+        cache = context.data.get(cls.context_key)
+        if cache is None:
+            cache = cls()
+            context.data[cls.context_key] = cache
+        return cache
+
+    def open_layer(self, path):
+        """Open layer as new anonymous layer with content of the file.
+
+        The file is read only once per path. Cached layer is never modified,
+        each call returns a new anonymous layer with copy of its content so
+        edits made for one instance don't leak to other instances.
+
+        Args:
+            path (str): Path to layer.
+
+        Returns:
+            Sdf.Layer: Anonymous layer with content of the file.
+
+        """
+        path = os.path.normpath(path)
+        source_layer = self._layers_by_path.get(path)
+        if source_layer is not None:
+            self.counters["open_hits"] += 1
+        else:
+            start = time.perf_counter()
+            source_layer = Sdf.Layer.OpenAsAnonymous(path)
+            self.timings["open"] += time.perf_counter() - start
+            self.counters["opened"] += 1
+            self._layers_by_path[path] = source_layer
+
+        layer = Sdf.Layer.CreateAnonymous()
+        layer.TransferContent(source_layer)
+        return layer
+
+    def resolve_path(self, key, func, *args, **kwargs):
+        """Resolve path using function, or return cached result for key.
+
+        Args:
+            key (Hashable): Cache key.
+            func (Callable): Function returning the path.
+
+        Returns:
+            Any: Result of the function.
+
+        """
+        if key in self._paths_by_key:
+            self.counters["resolve_hits"] += 1
+            return self._paths_by_key[key]
+
+        start = time.perf_counter()
+        path = func(*args, **kwargs)
+        self.timings["resolve"] += time.perf_counter() - start
+        self.counters["resolved"] += 1
+        self._paths_by_key[key] = path
+        return path
+
+    def add_export(self, layer, filepath):
+        """Schedule layer export to a file.
+
+        Args:
+            layer (Sdf.Layer): Layer to export.
+            filepath (str): Output path.
+
+        """
+        self._exports[os.path.normpath(filepath)] = layer
+
+    def export_all(self):
+        """Export all scheduled layers, each only once.
+
+        Returns:
+            list[str]: Exported file paths.
+
+        """
+        exported = []
+        start = time.perf_counter()
+        for filepath, layer in self._exports.items():
+            layer.Export(filepath, args={"format": "usda"})
+            exported.append(filepath)
+        self._exports.clear()
+        self.timings["export"] += time.perf_counter() - start
+        self.counters["exported"] += len(exported)
+        return exported
+
+
 def get_representation_path_in_publish_context(
     context: pyblish.api.Context,
     project_name,
@@ -174,7 +292,12 @@ def get_instance_uri_path(
 
         # If for whatever reason we were unable to retrieve from the context
         # then get the path from an existing database entry
-        path = get_representation_path_by_names(**query)
+        cache = USDLayerCache.get_from_context(context)
+        path = cache.resolve_path(
+            ("uri", ) + tuple(query.values()),
+            get_representation_path_by_names,
+            **query
+        )
 
         # Ensure `None` for now is also a string
         path = str(path)
@@ -184,12 +307,19 @@ def get_instance_uri_path(
 
 def get_last_publish(instance, representation="usd"):
     """Wrapper to quickly get last representation publish path"""
-    return get_representation_path_by_names(
-        project_name=instance.context.data["projectName"],
-        folder_path=instance.data["folderPath"],
-        product_name=instance.data["productName"],
-        version_name="latest",
-        representation_name=representation
+    context = instance.context
+    names = {
+        "project_name": context.data["projectName"],
+        "folder_path": instance.data["folderPath"],
+        "product_name": instance.data["productName"],
+        "version_name": "latest",
+        "representation_name": representation,
+    }
+    cache = USDLayerCache.get_from_context(context)
+    return cache.resolve_path(
+        ("last_publish", ) + tuple(names.values()),
+        get_representation_path_by_names,
+        **names
     )
 
 
@@ -637,9 +767,10 @@ class ExtractUSDLayerContribution(publish.Extractor):
         product_name = instance.data["productName"]
         self.log.debug(f"Building layer: {folder_path} > {product_name}")
 
+        cache = USDLayerCache.get_from_context(instance.context)
         path = get_last_publish(instance)
         if path and BUILD_INTO_LAST_VERSIONS:
-            sdf_layer = Sdf.Layer.OpenAsAnonymous(path)
+            sdf_layer = cache.open_layer(path)
             default_prim = sdf_layer.defaultPrim
         else:
             default_prim = folder_path.rsplit("/", 1)[-1]  # use folder name
@@ -647,6 +778,24 @@ class ExtractUSDLayerContribution(publish.Extractor):
             set_layer_defaults(sdf_layer, default_prim=default_prim)
 
         contributions = instance.data.get("usd_contributions", [])
+        # Batch layer edits to send change notifications only once
+        with Sdf.ChangeBlock():
+            self.add_contributions(sdf_layer, default_prim, contributions)
+
+        # Save the file (written by 'ExtractUSDLayerCacheWrite')
+        staging_dir = self.staging_dir(instance)
+        filename = f"{instance.name}.usd"
+        filepath = os.path.join(staging_dir, filename)
+        cache.add_export(sdf_layer, filepath)
+
+        add_representation(
+            instance,
+            name="usd",
+            files=filename,
+            staging_dir=staging_dir
+        )
+
+    def add_contributions(self, sdf_layer, default_prim, contributions):
         for contribution in sorted(contributions, key=attrgetter("order")):
             path = get_instance_uri_path(contribution.instance,
                                          resolve=not self.use_ayon_entity_uri)
@@ -709,19 +858,6 @@ class ExtractUSDLayerContribution(publish.Extractor):
             else:
                 raise TypeError(f"Unsupported contribution: {contribution}")
 
-        # Save the file
-        staging_dir = self.staging_dir(instance)
-        filename = f"{instance.name}.usd"
-        filepath = os.path.join(staging_dir, filename)
-        sdf_layer.Export(filepath, args={"format": "usda"})
-
-        add_representation(
-            instance,
-            name="usd",
-            files=filename,
-            staging_dir=staging_dir
-        )
-
     def remove_previous_reference_contribution(self,
                                                prim_spec: "Sdf.PrimSpec",
                                                instance: pyblish.api.Instance):
@@ -802,6 +938,7 @@ class ExtractUSDAssetContribution(publish.Extractor):
 
         # Contribute layers to asset
         # Use existing asset and add to it, or initialize a new asset layer
+        cache = USDLayerCache.get_from_context(instance.context)
         path = get_last_publish(instance)
         payload_layer = None
         if path and BUILD_INTO_LAST_VERSIONS:
@@ -809,9 +946,9 @@ class ExtractUSDAssetContribution(publish.Extractor):
             folder = os.path.dirname(path)
             payload_path = os.path.join(folder, "payload.usd")
             if os.path.exists(payload_path):
-                payload_layer = Sdf.Layer.OpenAsAnonymous(payload_path)
+                payload_layer = cache.open_layer(payload_path)
 
-            asset_layer = Sdf.Layer.OpenAsAnonymous(path)
+            asset_layer = cache.open_layer(path)
         else:
             # If no existing publish of this product exists then we initialize
             # the layer as either a default asset or shot structure.
@@ -861,29 +998,35 @@ class ExtractUSDAssetContribution(publish.Extractor):
         def sort_by_order(instance):
             return instance.data["usd_layer_order"]
 
-        for layer_instance in sorted(layer_instances,
-                                     key=sort_by_order,
-                                     reverse=True):
+        # Batch layer edits to send change notifications only once
+        with Sdf.ChangeBlock():
+            for layer_instance in sorted(layer_instances,
+                                         key=sort_by_order,
+                                         reverse=True):
 
-            layer_id = layer_instance.data["usd_layer_id"]
-            order = layer_instance.data["usd_layer_order"]
+                layer_id = layer_instance.data["usd_layer_id"]
+                order = layer_instance.data["usd_layer_order"]
 
-            path = get_instance_uri_path(instance=layer_instance,
-                                         resolve=not self.use_ayon_entity_uri)
-            add_ordered_sublayer(target_layer,
-                                 contribution_path=path,
-                                 layer_id=layer_id,
-                                 order=order,
-                                 # Add the sdf argument metadata which allows
-                                 # us to later detect whether another path
-                                 # has the same layer id, so we can replace it.
-                                 add_sdf_arguments_metadata=True)
-
-        # Save the file
+                path = get_instance_uri_path(
+                    instance=layer_instance,
+                    resolve=not self.use_ayon_entity_uri
+                )
+                add_ordered_sublayer(
+                    target_layer,
+                    contribution_path=path,
+                    layer_id=layer_id,
+                    order=order,
+                    # Add the sdf argument metadata which allows us to later
+                    # detect whether another path has the same layer id,
+                    # so we can replace it.
+                    add_sdf_arguments_metadata=True
+                )
+
+        # Save the file (written by 'ExtractUSDLayerCacheWrite')
         staging_dir = self.staging_dir(instance)
         filename = f"{instance.name}.usd"
         filepath = os.path.join(staging_dir, filename)
-        asset_layer.Export(filepath, args={"format": "usda"})
+        cache.add_export(asset_layer, filepath)
 
         add_representation(
             instance,
@@ -894,7 +1037,7 @@ class ExtractUSDAssetContribution(publish.Extractor):
 
         if payload_layer:
             payload_path = os.path.join(staging_dir, "payload.usd")
-            payload_layer.Export(payload_path, args={"format": "usda"})
+            cache.add_export(payload_layer, payload_path)
             self.add_relative_file(instance, payload_path)
 
     def init_layer(self, asset_name, init_type):
@@ -950,3 +1093,37 @@ class ExtractUSDAssetContribution(publish.Extractor):
         transfers = instance.data.setdefault("transfers", [])
         self.log.debug(f"Adding relative file {source} -> {relative_path}")
         transfers.append((source, destination))
+
+
+class ExtractUSDLayerCacheWrite(pyblish.api.ContextPlugin):
+    """Write USD layers built by contribution extractors.
+
+    Each layer is written only once, after all contributions were applied,
+    and the layer cache statistics are logged to the publish report.
+    """
+
+    families = ["usdLayer", "usdAsset"]
+    label = "Write USD Layer Contributions"
+    order = ExtractUSDAssetContribution.order + 0.01
+
+    def process(self, context):
+        cache = context.data.get(USDLayerCache.context_key)
+        if cache is None:
+            return
+
+        exported = cache.export_all()
+        for filepath in exported:
+            self.log.debug(f"Exported layer: {filepath}")
+
+        counters = cache.counters
+        timings = cache.timings
+        self.log.info(
+            "USD layer cache: opened {} layers in {:.3f}s ({} cache hits),"
+            " resolved {} paths in {:.3f}s ({} cache hits),"
+            " exported {} layers in {:.3f}s".format(
+                counters["opened"], timings["open"], counters["open_hits"],
+                counters["resolved"], timings["resolve"],
+                counters["resolve_hits"],
+                counters["exported"], timings["export"],
+            )
+        )
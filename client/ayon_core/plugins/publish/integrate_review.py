@@ -5,14 +5,38 @@ import ayon_api
 from ayon_api.server_api import RequestTypes
 
 from ayon_core.lib import get_media_mime_type
-from ayon_core.pipeline.publish import get_publish_repre_path
+from ayon_core.pipeline.publish import (
+    PublishError,
+    PublishUploadQueue,
+    get_publish_repre_path,
+)
+
+
+def _upload_reviewable_file(filepath, ayon_con, endpoint, headers):
+    # Headers are modified by 'upload_file' so each attempt uses a copy
+    return ayon_con.upload_file(
+        endpoint,
+        filepath,
+        headers=dict(headers),
+        request_type=RequestTypes.post,
+    )
 
 
 class IntegrateAYONReview(pyblish.api.InstancePlugin):
+    """Upload reviewables of published versions.
+
+    Reviewables are only added to upload queue shared by the publish
+    context, so uploads of multiple instances run concurrently.
+    The uploads are finished by 'IntegrateAYONReviewUploads'.
+    """
+
     label = "Integrate AYON Review"
     # Must happen after IntegrateAsset
     order = pyblish.api.IntegratorOrder + 0.15
 
+    max_concurrent_uploads = 4
+    upload_retries = 3
+
     def process(self, instance):
         project_name = instance.context.data["projectName"]
         src_version_entity = instance.data.get("versionEntity")
@@ -37,6 +61,11 @@ class IntegrateAYONReview(pyblish.api.InstancePlugin):
             )
             return
 
+        upload_queue = PublishUploadQueue.get_from_context(
+            instance.context,
+            max_workers=self.max_concurrent_uploads,
+            max_retries=self.upload_retries,
+        )
         uploaded_labels = set()
         for repre in instance.data["representations"]:
             repre_tags = repre.get("tags") or []
@@ -69,6 +98,7 @@ class IntegrateAYONReview(pyblish.api.InstancePlugin):
             label = self._get_review_label(repre, uploaded_labels)
             query = ""
             if label:
+                uploaded_labels.add(label)
                 query = f"?label={label}"
 
             endpoint = (
@@ -77,16 +107,17 @@ class IntegrateAYONReview(pyblish.api.InstancePlugin):
             )
             filename = os.path.basename(repre_path)
             # Upload the reviewable
-            self.log.info(f"Uploading reviewable '{label or filename}' ...")
+            self.log.info(f"Queued reviewable upload {repre_path}")
 
             headers = ayon_con.get_headers(content_type)
             headers["x-file-name"] = filename
-            self.log.info(f"Uploading reviewable {repre_path}")
-            ayon_con.upload_file(
-                endpoint,
+            upload_queue.submit(
+                _upload_reviewable_file,
                 repre_path,
+                label=label or filename,
+                ayon_con=ayon_con,
+                endpoint=endpoint,
                 headers=headers,
-                request_type=RequestTypes.post,
             )
 
     def _get_review_label(self, repre, uploaded_labels):
@@ -100,3 +131,43 @@ class IntegrateAYONReview(pyblish.api.InstancePlugin):
             idx += 1
             label = f"{orig_label}_{idx}"
         return label
+
+
+class IntegrateAYONReviewUploads(pyblish.api.ContextPlugin):
+    """Wait for reviewable uploads and report their throughput."""
+
+    label = "Integrate AYON Review Uploads"
+    order = IntegrateAYONReview.order + 0.01
+
+    def process(self, context):
+        upload_queue = context.data.get(PublishUploadQueue.context_key)
+        if upload_queue is None or not upload_queue.has_uploads():
+            self.log.debug("There are no reviewables to upload.")
+            return
+
+        results = upload_queue.wait()
+        upload_queue.log_results(results, self.log)
+        context.data["reviewableUploadsReport"] = (
+            upload_queue.get_report(results)
+        )
+
+        failed_results = [
+            result
+            for result in results
+            if not result.success
+        ]
+        if not failed_results:
+            return
+
+        failed_labels = ", ".join(
+            f"'{result.label}'"
+            for result in failed_results
+        )
+        raise PublishError(
+            f"Failed to upload reviewables {failed_labels}.",
+            title="Reviewable upload failed",
+            detail="\n".join(
+                f"{result.filepath}: {result.error}"
+                for result in failed_results
+            )
+        )
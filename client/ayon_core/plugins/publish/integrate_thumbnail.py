@@ -29,18 +29,27 @@ import pyblish.api
 import ayon_api
 from ayon_api.operations import OperationsSession
 
+from ayon_core.pipeline.publish import PublishError, PublishUploadQueue
+
 InstanceFilterResult = collections.namedtuple(
     "InstanceFilterResult",
     ["instance", "thumbnail_path", "version_id"]
 )
 
 
+def _create_thumbnail(filepath, project_name):
+    return ayon_api.create_thumbnail(project_name, filepath)
+
+
 class IntegrateThumbnailsAYON(pyblish.api.ContextPlugin):
     """Integrate Thumbnails for use in Loaders."""
 
     label = "Integrate Thumbnails to AYON"
     order = pyblish.api.IntegratorOrder + 0.01
 
+    max_concurrent_uploads = 4
+    upload_retries = 3
+
     def process(self, context):
         # Filter instances which can be used for integration
         filtered_instance_items = self._prepare_instances(context)
@@ -167,8 +176,13 @@ class IntegrateThumbnailsAYON(pyblish.api.ContextPlugin):
         version_entities_by_id,
         project_name
     ):
-        # Make sure each entity id has defined only one thumbnail id
-        thumbnail_info_by_entity_id = {}
+        # Upload thumbnails concurrently, files with same content
+        #   are uploaded only once
+        upload_queue = PublishUploadQueue(
+            max_workers=self.max_concurrent_uploads,
+            max_retries=self.upload_retries,
+        )
+        upload_items = []
         for instance_item in filtered_instance_items:
             instance, thumbnail_path, version_id = instance_item
             instance_label = self._get_instance_label(instance)
@@ -179,10 +193,47 @@ class IntegrateThumbnailsAYON(pyblish.api.ContextPlugin):
                 ).format(instance_label))
                 continue
 
-            thumbnail_id = ayon_api.create_thumbnail(
-                project_name, thumbnail_path
+            future = upload_queue.submit(
+                _create_thumbnail,
+                thumbnail_path,
+                label=instance_label,
+                deduplicate=True,
+                project_name=project_name,
+            )
+            upload_items.append((instance_item, version_entity, future))
+
+        results = upload_queue.wait()
+        if results:
+            upload_queue.log_results(results, self.log)
+            context = filtered_instance_items[0].instance.context
+            context.data["thumbnailUploadsReport"] = (
+                upload_queue.get_report(results)
+            )
+
+        failed_results = [
+            result
+            for result in results
+            if not result.success
+        ]
+        if failed_results:
+            raise PublishError(
+                "Failed to upload thumbnails of {}.".format(", ".join(
+                    "\"{}\"".format(result.label)
+                    for result in failed_results
+                )),
+                title="Thumbnail upload failed",
+                detail="\n".join(
+                    "{}: {}".format(result.filepath, result.error)
+                    for result in failed_results
+                )
             )
 
+        # Make sure each entity id has defined only one thumbnail id
+        thumbnail_info_by_entity_id = {}
+        for instance_item, version_entity, future in upload_items:
+            instance, thumbnail_path, version_id = instance_item
+            thumbnail_id = future.result().output
+
             # Set thumbnail id for version
             thumbnail_info_by_entity_id[version_id] = {
                 "thumbnail_id": thumbnail_id,
@@ -1,14 +1,25 @@
 import os
 import sys
+import threading
 import collections
 
 from PIL import ImageFont
 
 
 class FontFactory:
+    """Fonts available on machine.
+
+    Fonts are discovered only once per process. Font objects are created
+    on demand and cached by path and size so the same font is not loaded
+    again for each text item.
+    """
+    # Font paths by family and style
     fonts = None
     default = None
 
+    _font_objects = {}
+    _lock = threading.Lock()
+
     @classmethod
     def get_font(cls, family, font_size=None, italic=False, bold=False):
         if cls.fonts is None:
@@ -30,23 +41,32 @@ class FontFactory:
         if not family_styles:
             return cls.default
 
-        font = family_styles.get(style)
-        if font:
-            if font_size:
-                font = font.font_variant(size=font_size)
-            return font
+        fontpath = family_styles.get(style)
+        if not fontpath:
+            # Use first found
+            fontpath = next(iter(family_styles.values()))
+        return cls._get_font_object(fontpath, font_size)
 
-        # Return first found
-        for font in family_styles:
+    @classmethod
+    def _get_font_object(cls, fontpath, font_size=None):
+        key = (fontpath, font_size)
+        font_obj = cls._font_objects.get(key)
+        if font_obj is None:
             if font_size:
-                font = font.font_variant(size=font_size)
-            return font
-
-        return cls.default
+                font_obj = ImageFont.truetype(fontpath, size=font_size)
+            else:
+                font_obj = ImageFont.truetype(fontpath)
+            cls._font_objects[key] = font_obj
+        return font_obj
 
     @classmethod
     def load_fonts(cls):
+        with cls._lock:
+            if cls.fonts is None:
+                cls._load_fonts()
 
+    @classmethod
+    def _load_fonts(cls):
         cls.default = ImageFont.load_default()
 
         available_font_ext = [".ttf", ".ttc"]
@@ -85,9 +105,13 @@ class FontFactory:
                         continue
 
                     fontpath = os.path.join(walkroot, walkfilename)
-                    font_obj = ImageFont.truetype(fontpath)
+                    try:
+                        font_obj = ImageFont.truetype(fontpath)
+                    except OSError:
+                        continue
                     family = font_obj.font.family.lower()
                     style = font_obj.font.style
-                    available_fonts[family][style] = font_obj
+                    available_fonts[family][style] = fontpath
+                    cls._font_objects[(fontpath, None)] = font_obj
 
         cls.fonts = available_fonts
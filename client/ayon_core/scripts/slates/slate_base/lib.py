@@ -1,11 +1,18 @@
 import os
 import json
+import shutil
 import logging
 try:
     from queue import Queue
 except Exception:
     from Queue import Queue
 
+try:
+    from ayon_core.lib.slate_cache import SlateCache, get_slate_cache_key
+except ImportError:
+    # Script is running outside of AYON environment
+    SlateCache = get_slate_cache_key = None
+
 from .main_frame import MainFrame
 from .layer import Layer
 from .items import (
@@ -122,7 +129,7 @@ def create_slates(
                 "Not implemented object type `{}` - skipping".format(item_type)
             )
 
-    main.draw()
+    _draw_slate(main, slate_data, fill_data)
     log.debug("Slate creation finished")
 
     if not data_output_json:
@@ -141,3 +148,59 @@ def create_slates(
         json_file.write(json.dumps(output_data, indent=4))
 
     log.info("Metadata collected in \"{}\".".format(data_output_json))
+
+
+def _get_slate_image_key(main, slate_data, fill_data):
+    """Cache key of slate image.
+
+    Key is based on slate template, fill data and modification time of
+    images used in the slate. Destination path does not affect the image.
+    """
+    template_data = {
+        key: value
+        for key, value in slate_data.items()
+        if key != "destination_path"
+    }
+    images_data = []
+    for item in main.find_item(obj_type="image"):
+        path = os.path.normpath(item.image_path)
+        stat = os.stat(path)
+        images_data.append((path, stat.st_mtime_ns, stat.st_size))
+
+    ext = os.path.splitext(main.dst_path)[1].lower()
+    return get_slate_cache_key(
+        "slate_image", template_data, fill_data, images_data, ext
+    )
+
+
+def _draw_slate(main, slate_data, fill_data):
+    """Draw slate to destination path or copy it from slate cache."""
+    if SlateCache is None:
+        main.draw()
+        return
+
+    try:
+        key = _get_slate_image_key(main, slate_data, fill_data)
+    except (OSError, TypeError, ValueError):
+        log.debug("Failed to create slate cache key.", exc_info=True)
+        main.draw()
+        return
+
+    dst_path = main.dst_path
+
+    def _draw_to_path(path):
+        main.dst_path = path
+        try:
+            main.draw()
+        finally:
+            main.dst_path = dst_path
+
+    ext = os.path.splitext(dst_path)[1].lower()
+    dst_dir = os.path.dirname(dst_path)
+    if dst_dir and not os.path.exists(dst_dir):
+        os.makedirs(dst_dir)
+    cached_path = SlateCache().get_or_create(
+        key, ext, _draw_to_path, fallback_path=dst_path
+    )
+    if cached_path != dst_path:
+        shutil.copyfile(cached_path, dst_path)
@@ -80,10 +80,15 @@ class _AyonSettingsCache:
         cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
         if cache_item.is_outdated:
             if cls._use_bundles():
-                value = ayon_api.get_addons_settings(
-                    bundle_name=cls._get_bundle_name(),
-                    project_name=project_name,
-                    variant=cls._get_variant()
+                # Settings are shared with other processes through tray
+                from ayon_core.tools.common_models.tray_cache import (
+                    get_addons_settings,
+                )
+
+                value = get_addons_settings(
+                    cls._get_bundle_name(),
+                    cls._get_variant(),
+                    project_name,
                 )
             else:
                 value = ayon_api.get_addons_settings(project_name)
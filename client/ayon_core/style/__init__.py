@@ -1,18 +1,28 @@
 import os
+import re
 import copy
 import json
+import hashlib
 import collections
 
 from ayon_core import resources
+from ayon_core.version import __version__
 
 from .color_defs import parse_color
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Keys in stylesheet are '{key}' or '{key:sub-key}'
+_STYLESHEET_KEY_REGEX = re.compile(r"{([\w\-]+(?::[\w\-]+)*)}")
+
 
 class _Cache:
     stylesheet = None
     font_ids = None
+    resources_registered = False
+
+    colors_raw_data = None
+    colors_raw_data_hash = None
 
     tools_icon_color = None
     default_entity_icon_color = None
@@ -41,10 +51,13 @@ def _get_colors_raw_data():
     Returns:
         dict: Loaded data for stylesheet.
     """
-    data_path = os.path.join(current_dir, "data.json")
-    with open(data_path, "r") as data_stream:
-        data = json.load(data_stream)
-    return data
+    if _Cache.colors_raw_data is None:
+        data_path = os.path.join(current_dir, "data.json")
+        with open(data_path, "rb") as data_stream:
+            content = data_stream.read()
+        _Cache.colors_raw_data_hash = hashlib.sha256(content).hexdigest()
+        _Cache.colors_raw_data = json.loads(content)
+    return copy.deepcopy(_Cache.colors_raw_data)
 
 
 def get_colors_data():
@@ -115,19 +128,61 @@ def get_objected_colors(*keys):
     return copy.deepcopy(output)
 
 
-def _load_stylesheet():
-    """Load strylesheet and trigger all related callbacks.
+def _get_stylesheet_cache_key():
+    """Key of resolved stylesheet.
 
-    Style require more than a stylesheet string. Stylesheet string
-    contains paths to resources which must be registered into Qt application
-    and load fonts used in stylesheets.
+    Key is based on style version and hash of colors data, so resolved
+    stylesheet is not used when any of them changes.
 
-    Also replace values from stylesheet data into stylesheet text.
+    Returns:
+        str: Stylesheet cache key.
     """
-    from . import qrc_resources
+    style_path = os.path.join(current_dir, "style.css")
+    style_stat = os.stat(style_path)
+    _get_colors_raw_data()
+    key_parts = (
+        __version__,
+        str(style_stat.st_size),
+        str(style_stat.st_mtime_ns),
+        _Cache.colors_raw_data_hash,
+    )
+    return hashlib.sha256("|".join(key_parts).encode()).hexdigest()
 
-    qrc_resources.qInitResources()
 
+def _get_stylesheet_cache_path(cache_key):
+    from ayon_core.lib.local_settings import get_launcher_local_dir
+
+    return get_launcher_local_dir("stylesheets", f"{cache_key}.css")
+
+
+def _read_cached_stylesheet(cache_key):
+    try:
+        with open(_get_stylesheet_cache_path(cache_key), "r") as stream:
+            return stream.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_stylesheet(cache_key, stylesheet):
+    cache_path = _get_stylesheet_cache_path(cache_key)
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w") as stream:
+            stream.write(stylesheet)
+        # Other processes may read the file at the same time
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _build_stylesheet():
+    """Replace values from stylesheet data into stylesheet text.
+
+    Returns:
+        str: Resolved stylesheet.
+    """
     style_path = os.path.join(current_dir, "style.css")
     with open(style_path, "r") as style_file:
         stylesheet = style_file.read()
@@ -148,12 +203,40 @@ def _load_stylesheet():
             continue
         fill_data[key] = value
 
-    for key, value in fill_data.items():
-        replacement_key = "{" + key + "}"
-        stylesheet = stylesheet.replace(replacement_key, value)
+    # Replace all keys in single pass, unknown keys are kept
+    return _STYLESHEET_KEY_REGEX.sub(
+        lambda match: fill_data.get(match.group(1), match.group(0)),
+        stylesheet
+    )
+
+
+def _load_stylesheet():
+    """Load resolved stylesheet.
+
+    Resolved stylesheet is cached on disk in launcher local directory
+    by style version and colors data.
+
+    Returns:
+        str: Resolved stylesheet.
+    """
+    cache_key = _get_stylesheet_cache_key()
+    stylesheet = _read_cached_stylesheet(cache_key)
+    if stylesheet is None:
+        stylesheet = _build_stylesheet()
+        _write_cached_stylesheet(cache_key, stylesheet)
     return stylesheet
 
 
+def _register_resources():
+    """Register resources used by stylesheet into Qt application."""
+    if _Cache.resources_registered:
+        return
+    from . import qrc_resources
+
+    qrc_resources.qInitResources()
+    _Cache.resources_registered = True
+
+
 def _load_font():
     """Load and register fonts into Qt application."""
     from qtpy import QtGui
@@ -197,10 +280,16 @@ def _load_font():
 
 
 def load_stylesheet():
-    """Load and return AYON Qt stylesheet."""
+    """Load and return AYON Qt stylesheet.
+
+    Style require more than a stylesheet string. Stylesheet string
+    contains paths to resources which must be registered into Qt application
+    and load fonts used in stylesheets. Both are done on first use.
+    """
 
     if _Cache.stylesheet is None:
         _Cache.stylesheet = _load_stylesheet()
+    _register_resources()
     _load_font()
     return _Cache.stylesheet
 
@@ -7,6 +7,8 @@ import ayon_api
 
 from ayon_core.lib import NestedCacheItem
 
+from . import tray_cache
+
 HIERARCHY_MODEL_SENDER = "hierarchy.model"
 
 
@@ -229,7 +231,7 @@ class HierarchyModel(object):
             project_name (str): Name of project to refresh.
         """
 
-        self._refresh_folders_cache(project_name)
+        self._refresh_folders_cache(project_name, force=True)
 
     def get_folder_items(self, project_name, sender):
         """Get folder items by project name.
@@ -493,16 +495,18 @@ class HierarchyModel(object):
             )
             self._tasks_refreshing.discard(folder_id)
 
-    def _refresh_folders_cache(self, project_name, sender=None):
+    def _refresh_folders_cache(self, project_name, sender=None, force=False):
         if project_name in self._folders_refreshing:
             return
 
         with self._folder_refresh_event_manager(project_name, sender):
-            folder_items = self._query_folders(project_name)
+            folder_items = self._query_folders(project_name, force)
             self._folders_items[project_name].update_data(folder_items)
 
-    def _query_folders(self, project_name):
-        hierarchy = ayon_api.get_folders_hierarchy(project_name)
+    def _query_folders(self, project_name, force=False):
+        hierarchy = tray_cache.get_folders_hierarchy(
+            project_name, refresh=force
+        )
 
         folder_items = {}
         hierachy_queue = collections.deque(hierarchy["hierarchy"])
@@ -545,9 +549,5 @@ class HierarchyModel(object):
             cache.update_data(self._query_tasks(project_name, folder_id))
 
     def _query_tasks(self, project_name, folder_id):
-        tasks = list(ayon_api.get_tasks(
-            project_name,
-            folder_ids=[folder_id],
-            fields={"id", "name", "label", "folderId", "type"}
-        ))
+        tasks = tray_cache.get_folder_tasks(project_name, folder_id)
         return _get_task_items_from_tasks(tasks)
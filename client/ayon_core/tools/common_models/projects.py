@@ -2,11 +2,11 @@ import contextlib
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 
-import ayon_api
-
 from ayon_core.style import get_default_entity_icon_color
 from ayon_core.lib import CacheItem, NestedCacheItem
 
+from . import tray_cache
+
 PROJECTS_MODEL_SENDER = "projects.model"
 
 
@@ -252,7 +252,7 @@ class ProjectsModel(object):
 
         To reset all cached items use 'reset' method.
         """
-        self._refresh_projects_cache()
+        self._refresh_projects_cache(force=True)
 
     def get_project_items(self, sender):
         """
@@ -284,7 +284,7 @@ class ProjectsModel(object):
         if not project_cache.is_valid:
             entity = None
             if project_name:
-                entity = ayon_api.get_project(project_name)
+                entity = tray_cache.get_project(project_name)
             project_cache.update_data(entity)
         return project_cache.get_data()
 
@@ -419,17 +419,17 @@ class ProjectsModel(object):
                 PROJECTS_MODEL_SENDER
             )
 
-    def _refresh_projects_cache(self, sender=None):
+    def _refresh_projects_cache(self, sender=None, force=False):
         if self._is_refreshing:
             return None
 
         with self._project_refresh_event_manager(sender):
-            project_items = self._query_projects()
+            project_items = self._query_projects(force)
             self._projects_cache.update_data(project_items)
         return self._projects_cache.get_data()
 
-    def _query_projects(self):
-        projects = ayon_api.get_projects(fields=["name", "active", "library"])
+    def _query_projects(self, force=False):
+        projects = tray_cache.get_projects(refresh=force)
         return _get_project_items_from_entitiy(projects)
 
     def _status_items_getter(self, project_entity):
@@ -0,0 +1,272 @@
+"""Client of entity cache service running in tray.
+
+Tray hosts read-through cache of entities that are commonly queried by
+tools in every DCC process (projects, folders hierarchy, tasks, product
+types and settings). Helpers in this module ask the tray first and fall
+back to direct server queries when tray is not running, is not reachable
+or returned an error. Output of helpers is the same in both cases.
+
+The service can be disabled by setting environment variable
+'AYON_TRAY_ENTITY_CACHE' to '0'.
+"""
+import os
+import time
+import logging
+
+import ayon_api
+import requests
+
+log = logging.getLogger(__name__)
+
+TRAY_CACHE_ROUTE = "/entity_cache"
+TRAY_CACHE_ENV = "AYON_TRAY_ENTITY_CACHE"
+
+PROJECT_ITEM_FIELDS = ("name", "active", "library")
+TASK_ITEM_FIELDS = ("id", "name", "label", "folderId", "type")
+
+
+class _TrayCacheConnection:
+    """Tray url with timeouts for failed connections."""
+    # Timeout of a request to tray
+    request_timeout = 3
+    # How long is tray url cached
+    url_lifetime = 10
+    # How long is tray not asked after connection error
+    unavailable_lifetime = 30
+
+    url = None
+    url_outdate_time = 0
+    unavailable_until = 0
+
+
+def _is_cache_enabled():
+    value = os.getenv(TRAY_CACHE_ENV)
+    if value is None:
+        return True
+    return value.lower() not in {"0", "false", "no", "off"}
+
+
+def _get_tray_cache_url():
+    if not _is_cache_enabled():
+        return None
+
+    now = time.time()
+    if now < _TrayCacheConnection.unavailable_until:
+        return None
+
+    if now > _TrayCacheConnection.url_outdate_time:
+        from ayon_core.tools.tray.lib import get_tray_file_info
+
+        url = None
+        try:
+            file_info = get_tray_file_info()
+        except Exception:
+            file_info = None
+
+        # Tray process does not ask itself
+        if (
+            file_info
+            and file_info.get("started") is True
+            and file_info.get("pid") != os.getpid()
+        ):
+            url = file_info.get("url")
+        _TrayCacheConnection.url = url
+        _TrayCacheConnection.url_outdate_time = (
+            now + _TrayCacheConnection.url_lifetime
+        )
+
+    if not _TrayCacheConnection.url:
+        return None
+    return _TrayCacheConnection.url + TRAY_CACHE_ROUTE
+
+
+def _request_tray(method, path, params=None, data=None):
+    """Send request to tray entity cache.
+
+    Returns:
+        tuple[bool, Any]: Request was successful and response data.
+    """
+    url = _get_tray_cache_url()
+    if url is None:
+        return False, None
+
+    try:
+        response = requests.request(
+            method,
+            f"{url}{path}",
+            params=params,
+            json=data,
+            timeout=_TrayCacheConnection.request_timeout,
+        )
+        response.raise_for_status()
+        return True, response.json()
+
+    except (requests.ConnectionError, requests.Timeout):
+        log.debug("Tray entity cache is not available.", exc_info=True)
+        _TrayCacheConnection.unavailable_until = (
+            time.time() + _TrayCacheConnection.unavailable_lifetime
+        )
+
+    except (requests.RequestException, ValueError):
+        log.debug("Tray entity cache request failed.", exc_info=True)
+    return False, None
+
+
+def _get_from_tray(path, fallback, params=None):
+    success, data = _request_tray("GET", path, params=params)
+    if success:
+        return data
+    return fallback()
+
+
+def reset_tray_cache_connection():
+    """Forget tray url and connection failures."""
+    _TrayCacheConnection.url = None
+    _TrayCacheConnection.url_outdate_time = 0
+    _TrayCacheConnection.unavailable_until = 0
+
+
+def get_projects(refresh=False):
+    """Projects with 'PROJECT_ITEM_FIELDS' fields.
+
+    Args:
+        refresh (Optional[bool]): Force tray to query the projects again.
+
+    Returns:
+        list[dict[str, Any]]: Project entities.
+    """
+    params = {"refresh": "1"} if refresh else None
+    return _get_from_tray(
+        "/projects",
+        lambda: list(ayon_api.get_projects(fields=PROJECT_ITEM_FIELDS)),
+        params=params,
+    )
+
+
+def get_project(project_name):
+    """Project entity.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        Union[dict[str, Any], None]: Project entity or None if project
+            was not found.
+    """
+    return _get_from_tray(
+        f"/projects/{project_name}",
+        lambda: ayon_api.get_project(project_name)
+    )
+
+
+def get_folders_hierarchy(project_name, refresh=False):
+    """Folders hierarchy of project.
+
+    Args:
+        project_name (str): Project name.
+        refresh (Optional[bool]): Force tray to query the hierarchy again.
+
+    Returns:
+        dict[str, Any]: Folders hierarchy.
+    """
+    params = {"refresh": "1"} if refresh else None
+    return _get_from_tray(
+        f"/projects/{project_name}/hierarchy",
+        lambda: ayon_api.get_folders_hierarchy(project_name),
+        params=params,
+    )
+
+
+def get_folder_tasks(project_name, folder_id, refresh=False):
+    """Tasks of folder with 'TASK_ITEM_FIELDS' fields.
+
+    Args:
+        project_name (str): Project name.
+        folder_id (str): Folder id.
+        refresh (Optional[bool]): Force tray to query the tasks again.
+
+    Returns:
+        list[dict[str, Any]]: Task entities.
+    """
+    params = {"refresh": "1"} if refresh else None
+    return _get_from_tray(
+        f"/projects/{project_name}/folders/{folder_id}/tasks",
+        lambda: list(ayon_api.get_tasks(
+            project_name,
+            folder_ids=[folder_id],
+            fields=TASK_ITEM_FIELDS
+        )),
+        params=params,
+    )
+
+
+def get_project_product_types(project_name):
+    """Product types used in project.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        list[dict[str, Any]]: Product types.
+    """
+    return _get_from_tray(
+        f"/projects/{project_name}/product_types",
+        lambda: ayon_api.get_project_product_types(project_name)
+    )
+
+
+def get_addons_settings(bundle_name, variant, project_name=None):
+    """Addons settings of bundle.
+
+    Args:
+        bundle_name (str): Bundle name.
+        variant (str): Settings variant.
+        project_name (Optional[str]): Project name.
+
+    Returns:
+        dict[str, Any]: Addons settings.
+    """
+    params = {"bundle": bundle_name, "variant": variant}
+    if project_name:
+        params["project"] = project_name
+    return _get_from_tray(
+        "/settings",
+        lambda: ayon_api.get_addons_settings(
+            bundle_name=bundle_name,
+            project_name=project_name,
+            variant=variant,
+        ),
+        params=params,
+    )
+
+
+def invalidate_tray_cache(project_name=None):
+    """Invalidate cached data in tray.
+
+    Should be called after a change of entities that tray would not know
+    about in time, e.g. after folders were created.
+
+    Args:
+        project_name (Optional[str]): Invalidate only data of project.
+            Everything is invalidated if not passed.
+
+    Returns:
+        bool: Tray cache was invalidated.
+    """
+    success, _ = _request_tray(
+        "POST", "/invalidate", data={"project_name": project_name}
+    )
+    return success
+
+
+def get_tray_cache_stats():
+    """Statistics of tray entity cache.
+
+    Returns:
+        Union[dict[str, Any], None]: Statistics or None if tray is not
+            available.
+    """
+    success, data = _request_tray("GET", "/stats")
+    if success:
+        return data
+    return None
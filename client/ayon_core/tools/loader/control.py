@@ -24,7 +24,8 @@ from .models import (
     SelectionModel,
     ProductsModel,
     LoaderActionsModel,
-    SiteSyncModel
+    SiteSyncModel,
+    LoaderEntitiesCache,
 )
 
 
@@ -115,8 +116,11 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         self._expected_selection = ExpectedSelection(self)
         self._projects_model = ProjectsModel(self)
         self._hierarchy_model = HierarchyModel(self)
-        self._products_model = ProductsModel(self)
-        self._loader_actions_model = LoaderActionsModel(self)
+        self._entities_cache = LoaderEntitiesCache()
+        self._products_model = ProductsModel(self, self._entities_cache)
+        self._loader_actions_model = LoaderActionsModel(
+            self, self._entities_cache
+        )
         self._thumbnails_model = ThumbnailsModel()
         self._sitesync_model = SiteSyncModel(self)
 
@@ -148,6 +152,7 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
 
         self._project_anatomy_cache.reset()
         self._loaded_products_cache.reset()
+        self._entities_cache.reset()
 
         self._products_model.reset()
         self._hierarchy_model.reset()
@@ -248,6 +253,16 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         return self._loader_actions_model.get_versions_action_items(
             project_name, version_ids)
 
+    def get_entities_cache_stats(self):
+        """Hit statistics of entities cache used to resolve load contexts.
+
+        Returns:
+            dict[str, dict[str, Union[int, float]]]: Statistics by
+                entity type.
+
+        """
+        return self._entities_cache.get_stats()
+
     def get_representations_action_items(
             self, project_name, representation_ids):
         action_items = (
@@ -2,6 +2,7 @@ from .selection import SelectionModel
 from .products import ProductsModel
 from .actions import LoaderActionsModel
 from .sitesync import SiteSyncModel
+from .contexts import LoaderEntitiesCache, LoaderContextResolver
 
 
 __all__ = (
@@ -9,4 +10,6 @@ __all__ = (
     "ProductsModel",
     "LoaderActionsModel",
     "SiteSyncModel",
+    "LoaderEntitiesCache",
+    "LoaderContextResolver",
 )
@@ -1,16 +1,15 @@
 import sys
+import copy
 import traceback
 import inspect
 import collections
 import uuid
 
-import ayon_api
-
 from ayon_core.lib import NestedCacheItem
 from ayon_core.pipeline.load import (
     discover_loader_plugins,
     ProductLoaderPlugin,
-    filter_repre_contexts_by_loader,
+    LoaderCompatibilityIndex,
     get_loader_identifier,
     load_with_repre_context,
     load_with_product_context,
@@ -20,6 +19,8 @@ from ayon_core.pipeline.load import (
 )
 from ayon_core.tools.loader.abstract import ActionItem
 
+from .contexts import LoaderEntitiesCache, LoaderContextResolver
+
 ACTIONS_MODEL_SENDER = "actions.model"
 NOT_SET = object()
 
@@ -41,8 +42,14 @@ class LoaderActionsModel:
     # NOTE Set to '0' for development
     loaders_cache_lifetime = 30
 
-    def __init__(self, controller):
+    def __init__(self, controller, entities_cache=None):
         self._controller = controller
+        # Entities cache is shared with products model, but model can
+        #   work without it
+        if entities_cache is None:
+            entities_cache = LoaderEntitiesCache()
+        self._entities_cache = entities_cache
+        self._context_resolver = LoaderContextResolver(entities_cache)
         self._current_context_project = NOT_SET
         self._loaders_by_identifier = NestedCacheItem(
             levels=1, lifetime=self.loaders_cache_lifetime)
@@ -50,6 +57,8 @@ class LoaderActionsModel:
             levels=1, lifetime=self.loaders_cache_lifetime)
         self._repre_loaders = NestedCacheItem(
             levels=1, lifetime=self.loaders_cache_lifetime)
+        self._repre_loaders_index = NestedCacheItem(
+            levels=1, lifetime=self.loaders_cache_lifetime)
 
     def reset(self):
         """Reset the model with all cached items."""
@@ -58,6 +67,17 @@ class LoaderActionsModel:
         self._loaders_by_identifier.reset()
         self._product_loaders.reset()
         self._repre_loaders.reset()
+        self._repre_loaders_index.reset()
+
+    def get_cache_stats(self):
+        """Hit statistics of entities cache used to resolve contexts.
+
+        Returns:
+            dict[str, dict[str, Union[int, float]]]: Statistics by
+                entity type.
+        """
+
+        return self._context_resolver.get_stats()
 
     def get_versions_action_items(self, project_name, version_ids):
         """Get action items for given version ids.
@@ -314,6 +334,7 @@ class LoaderActionsModel:
         loaders_by_identifier_c = self._loaders_by_identifier[project_name]
         product_loaders_c = self._product_loaders[project_name]
         repre_loaders_c = self._repre_loaders[project_name]
+        repre_loaders_index_c = self._repre_loaders_index[project_name]
         if loaders_by_identifier_c.is_valid:
             return product_loaders_c.get_data(), repre_loaders_c.get_data()
 
@@ -340,8 +361,24 @@ class LoaderActionsModel:
         loaders_by_identifier_c.update_data(loaders_by_identifier)
         product_loaders_c.update_data(product_loaders)
         repre_loaders_c.update_data(repre_loaders)
+        repre_loaders_index_c.update_data(
+            LoaderCompatibilityIndex(repre_loaders)
+        )
         return product_loaders, repre_loaders
 
+    def _get_repre_loaders_index(self, project_name):
+        """Compatibility index of representation loaders.
+
+        Index is created with discovered loaders in '_get_loaders'.
+
+        Returns:
+            LoaderCompatibilityIndex: Index of representation loaders.
+        """
+
+        if not self._loaders_by_identifier[project_name].is_valid:
+            self._get_loaders(project_name)
+        return self._repre_loaders_index[project_name].get_data()
+
     def _get_loader_by_identifier(self, project_name, identifier):
         if not self._loaders_by_identifier[project_name].is_valid:
             self._get_loaders(project_name)
@@ -378,67 +415,12 @@ class LoaderActionsModel:
         """
 
         # TODO fix hero version
-        version_context_by_id = {}
-        repre_context_by_id = {}
         if not project_name and not version_ids:
-            return version_context_by_id, repre_context_by_id
-
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {}
-        version_entities_by_product_id = collections.defaultdict(list)
-        for version_entity in version_entities:
-            version_id = version_entity["id"]
-            product_id = version_entity["productId"]
-            version_entities_by_id[version_id] = version_entity
-            version_entities_by_product_id[product_id].append(version_entity)
-
-        _product_ids = set(version_entities_by_product_id.keys())
-        _product_entities = ayon_api.get_products(
-            project_name, product_ids=_product_ids
-        )
-        product_entities_by_id = {p["id"]: p for p in _product_entities}
+            return {}, {}
 
-        _folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        _folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=_folder_ids
+        return self._context_resolver.get_version_repre_contexts(
+            project_name, version_ids
         )
-        folder_entities_by_id = {f["id"]: f for f in _folder_entities}
-
-        project_entity = ayon_api.get_project(project_name)
-
-        for version_id, version_entity in version_entities_by_id.items():
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            version_context_by_id[version_id] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-            }
-
-        repre_entities = ayon_api.get_representations(
-            project_name, version_ids=version_ids)
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-
-            repre_context_by_id[repre_entity["id"]] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            }
-
-        return version_context_by_id, repre_context_by_id
 
     def _contexts_for_representations(self, project_name, repre_ids):
         """Get contexts for given representation ids.
@@ -459,64 +441,23 @@ class LoaderActionsModel:
                 representation contexts.
         """
 
-        product_context_by_id = {}
-        repre_context_by_id = {}
         if not project_name and not repre_ids:
-            return product_context_by_id, repre_context_by_id
-
-        repre_entities = list(ayon_api.get_representations(
-            project_name, representation_ids=repre_ids
-        ))
-        version_ids = {r["versionId"] for r in repre_entities}
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {
-            v["id"]: v for v in version_entities
-        }
-
-        product_ids = {v["productId"] for v in version_entities_by_id.values()}
-        product_entities = ayon_api.get_products(
-            project_name, product_ids=product_ids
-        )
-        product_entities_by_id = {
-            p["id"]: p for p in product_entities
-        }
+            return {}, {}
 
-        folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
+        repre_context_by_id = (
+            self._context_resolver.get_representation_contexts(
+                project_name, repre_ids
+            )
         )
-        folder_entities_by_id = {
-            f["id"]: f for f in folder_entities
-        }
-
-        project_entity = ayon_api.get_project(project_name)
-
-        for product_id, product_entity in product_entities_by_id.items():
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            product_context_by_id[product_id] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-            }
-
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-
-            repre_context_by_id[repre_entity["id"]] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            }
+        product_context_by_id = {}
+        for repre_context in repre_context_by_id.values():
+            product_id = repre_context["product"]["id"]
+            if product_id not in product_context_by_id:
+                product_context_by_id[product_id] = {
+                    "project": repre_context["project"],
+                    "folder": repre_context["folder"],
+                    "product": repre_context["product"],
+                }
         return product_context_by_id, repre_context_by_id
 
     def _get_action_items_for_contexts(
@@ -542,16 +483,25 @@ class LoaderActionsModel:
             return action_items
 
         product_loaders, repre_loaders = self._get_loaders(project_name)
+        repre_loaders_index = self._get_repre_loaders_index(project_name)
 
         repre_contexts_by_name = collections.defaultdict(list)
         for repre_context in repre_context_by_id.values():
             repre_name = repre_context["representation"]["name"]
             repre_contexts_by_name[repre_name].append(repre_context)
 
+        # Only candidate loaders from index are checked for each group
+        compatible_contexts_by_name = {
+            repre_name: repre_loaders_index.get_compatible_contexts(
+                repre_contexts
+            )
+            for repre_name, repre_contexts in repre_contexts_by_name.items()
+        }
         for loader in repre_loaders:
             for repre_name, repre_contexts in repre_contexts_by_name.items():
-                filtered_repre_contexts = filter_repre_contexts_by_loader(
-                    repre_contexts, loader)
+                filtered_repre_contexts = (
+                    compatible_contexts_by_name[repre_name].get(loader)
+                )
                 if not filtered_repre_contexts:
                     continue
 
@@ -626,33 +576,11 @@ class LoaderActionsModel:
             version_ids (Iterable[str]): Version ids.
         """
 
-        project_entity = ayon_api.get_project(project_name)
-
-        version_entities = list(ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        ))
-        product_ids = {v["productId"] for v in version_entities}
-        product_entities = ayon_api.get_products(
-            project_name, product_ids=product_ids
-        )
-        product_entities_by_id = {p["id"]: p for p in product_entities}
-        folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
+        version_context_by_id = self._context_resolver.get_version_contexts(
+            project_name, version_ids
         )
-        folder_entities_by_id = {f["id"]: f for f in folder_entities}
-        product_contexts = []
-        for version_entity in version_entities:
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            product_contexts.append({
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-            })
+        # Loaders may modify the contexts which would affect cached entities
+        product_contexts = copy.deepcopy(list(version_context_by_id.values()))
 
         return self._load_products_by_loader(
             loader, product_contexts, options
@@ -678,42 +606,13 @@ class LoaderActionsModel:
             representation_ids (Iterable[str]): Representation ids.
         """
 
-        project_entity = ayon_api.get_project(project_name)
-        repre_entities = list(ayon_api.get_representations(
-            project_name, representation_ids=representation_ids
-        ))
-        version_ids = {r["versionId"] for r in repre_entities}
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {v["id"]: v for v in version_entities}
-        product_ids = {
-            v["productId"] for v in version_entities_by_id.values()
-        }
-        product_entities = ayon_api.get_products(
-            project_name, product_ids=product_ids
-        )
-        product_entities_by_id = {p["id"]: p for p in product_entities}
-        folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
+        repre_context_by_id = (
+            self._context_resolver.get_representation_contexts(
+                project_name, representation_ids
+            )
         )
-        folder_entities_by_id = {f["id"]: f for f in folder_entities}
-        repre_contexts = []
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            repre_contexts.append({
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            })
+        # Loaders may modify the contexts which would affect cached entities
+        repre_contexts = copy.deepcopy(list(repre_context_by_id.values()))
 
         return self._load_representations_by_loader(
             loader, repre_contexts, options
@@ -0,0 +1,366 @@
+import ayon_api
+
+from ayon_core.lib import NestedCacheItem
+
+
+class LoaderEntitiesCache:
+    """Entities cache shared by loader models.
+
+    Entities are cached by id with lifetime so the same selection does
+    not have to be queried again when actions are listed and then
+    triggered. Models that already queried entities can store them to
+    the cache with 'update_entities'.
+
+    Args:
+        lifetime (Optional[int]): Lifetime of cached entities in seconds.
+
+    """
+    lifetime = 60
+    entity_types = ("folder", "product", "version", "representation")
+
+    def __init__(self, lifetime=None):
+        if lifetime is None:
+            lifetime = self.lifetime
+        self._projects_cache = NestedCacheItem(levels=1, lifetime=lifetime)
+        self._entities_caches = {
+            entity_type: NestedCacheItem(levels=2, lifetime=lifetime)
+            for entity_type in self.entity_types
+        }
+        self._repre_ids_by_version_id_cache = NestedCacheItem(
+            levels=2, lifetime=lifetime
+        )
+        self._stats = {}
+        self._reset_stats()
+
+    def reset(self):
+        """Reset all cached entities and statistics."""
+        self._projects_cache.reset()
+        for cache in self._entities_caches.values():
+            cache.reset()
+        self._repre_ids_by_version_id_cache.reset()
+        self._reset_stats()
+
+    def get_stats(self):
+        """Cache hit statistics.
+
+        Returns:
+            dict[str, dict[str, Union[int, float]]]: Hits, misses, number of
+                server queries and hit ratio by entity type.
+
+        """
+        output = {}
+        for entity_type, stats in self._stats.items():
+            stats = dict(stats)
+            total = stats["hits"] + stats["misses"]
+            stats["hit_ratio"] = stats["hits"] / total if total else 0.0
+            output[entity_type] = stats
+        return output
+
+    def update_entities(self, project_name, entity_type, entities):
+        """Store entities queried elsewhere to the cache.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entities (Iterable[dict[str, Any]]): Entities to store.
+
+        """
+        project_cache = self._entities_caches[entity_type][project_name]
+        for entity in entities:
+            project_cache[entity["id"]].update_data(entity)
+
+    def get_project(self, project_name):
+        cache = self._projects_cache[project_name]
+        if cache.is_valid:
+            self._stats["project"]["hits"] += 1
+        else:
+            self._stats["project"]["misses"] += 1
+            self._stats["project"]["queries"] += 1
+            cache.update_data(ayon_api.get_project(project_name))
+        return cache.get_data()
+
+    def get_folders(self, project_name, folder_ids):
+        return self._get_entities(
+            project_name,
+            "folder",
+            folder_ids,
+            lambda ids: ayon_api.get_folders(project_name, folder_ids=ids),
+        )
+
+    def get_products(self, project_name, product_ids):
+        return self._get_entities(
+            project_name,
+            "product",
+            product_ids,
+            lambda ids: ayon_api.get_products(project_name, product_ids=ids),
+        )
+
+    def get_versions(self, project_name, version_ids):
+        return self._get_entities(
+            project_name,
+            "version",
+            version_ids,
+            lambda ids: ayon_api.get_versions(project_name, version_ids=ids),
+        )
+
+    def get_representations(self, project_name, representation_ids):
+        return self._get_entities(
+            project_name,
+            "representation",
+            representation_ids,
+            lambda ids: ayon_api.get_representations(
+                project_name, representation_ids=ids
+            ),
+        )
+
+    def get_representations_by_version_ids(self, project_name, version_ids):
+        """Get representation entities of versions.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            dict[str, list[dict[str, Any]]]: Representation entities by
+                version id.
+
+        """
+        project_cache = self._repre_ids_by_version_id_cache[project_name]
+        repre_ids_by_version_id = {}
+        missing_version_ids = set()
+        for version_id in set(version_ids):
+            cache = project_cache[version_id]
+            if cache.is_valid:
+                repre_ids_by_version_id[version_id] = cache.get_data()
+            else:
+                missing_version_ids.add(version_id)
+
+        if missing_version_ids:
+            repre_entities = list(ayon_api.get_representations(
+                project_name, version_ids=missing_version_ids
+            ))
+            self._stats["representation"]["queries"] += 1
+            self.update_entities(
+                project_name, "representation", repre_entities
+            )
+            new_repre_ids_by_version_id = {
+                version_id: []
+                for version_id in missing_version_ids
+            }
+            for repre_entity in repre_entities:
+                new_repre_ids_by_version_id[repre_entity["versionId"]].append(
+                    repre_entity["id"]
+                )
+            for version_id, repre_ids in new_repre_ids_by_version_id.items():
+                project_cache[version_id].update_data(repre_ids)
+            repre_ids_by_version_id.update(new_repre_ids_by_version_id)
+
+        repre_ids = {
+            repre_id
+            for repre_ids in repre_ids_by_version_id.values()
+            for repre_id in repre_ids
+        }
+        repre_entities_by_id = self.get_representations(
+            project_name, repre_ids
+        )
+        return {
+            version_id: [
+                repre_entities_by_id[repre_id]
+                for repre_id in repre_ids
+                if repre_id in repre_entities_by_id
+            ]
+            for version_id, repre_ids in repre_ids_by_version_id.items()
+        }
+
+    def _reset_stats(self):
+        self._stats = {
+            entity_type: {"hits": 0, "misses": 0, "queries": 0}
+            for entity_type in ("project", ) + self.entity_types
+        }
+
+    def _get_entities(self, project_name, entity_type, entity_ids, query_func):
+        """Get entities by ids from cache or query missing entities.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entity_ids (Iterable[str]): Entity ids.
+            query_func (Callable[[set[str]], Iterable[dict[str, Any]]]):
+                Function querying entities by ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Entities by id. Entities that were
+                not found are not in the output.
+
+        """
+        stats = self._stats[entity_type]
+        project_cache = self._entities_caches[entity_type][project_name]
+        output = {}
+        missing_ids = set()
+        for entity_id in set(entity_ids):
+            cache = project_cache[entity_id]
+            if cache.is_valid:
+                output[entity_id] = cache.get_data()
+            else:
+                missing_ids.add(entity_id)
+
+        stats["hits"] += len(output)
+        stats["misses"] += len(missing_ids)
+        if missing_ids:
+            stats["queries"] += 1
+            for entity in query_func(missing_ids):
+                entity_id = entity["id"]
+                project_cache[entity_id].update_data(entity)
+                output[entity_id] = entity
+        return output
+
+
+class LoaderContextResolver:
+    """Resolve load contexts for versions and representations.
+
+    Contexts contain parent entities of versions or representations which
+    are received from shared entities cache.
+
+    Args:
+        entities_cache (LoaderEntitiesCache): Entities cache.
+
+    """
+    def __init__(self, entities_cache):
+        self._entities_cache = entities_cache
+
+    def get_stats(self):
+        return self._entities_cache.get_stats()
+
+    def get_version_contexts(self, project_name, version_ids):
+        """Get contexts for versions.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Version contexts by version id.
+
+        """
+        version_entities_by_id = self._entities_cache.get_versions(
+            project_name, version_ids
+        )
+        parents_by_product_id = self._get_product_parents(
+            project_name,
+            {v["productId"] for v in version_entities_by_id.values()}
+        )
+        output = {}
+        for version_id, version_entity in version_entities_by_id.items():
+            parents = parents_by_product_id.get(version_entity["productId"])
+            if parents is None:
+                continue
+            context = dict(parents)
+            context["version"] = version_entity
+            output[version_id] = context
+        return output
+
+    def get_version_repre_contexts(self, project_name, version_ids):
+        """Get contexts for versions and all their representations.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+                Version contexts by version id and representation contexts
+                by representation id.
+
+        """
+        version_context_by_id = self.get_version_contexts(
+            project_name, version_ids
+        )
+        repre_entities_by_version_id = (
+            self._entities_cache.get_representations_by_version_ids(
+                project_name, version_context_by_id.keys()
+            )
+        )
+        repre_context_by_id = {}
+        for version_id, repre_entities in (
+            repre_entities_by_version_id.items()
+        ):
+            version_context = version_context_by_id[version_id]
+            for repre_entity in repre_entities:
+                context = dict(version_context)
+                context["representation"] = repre_entity
+                repre_context_by_id[repre_entity["id"]] = context
+        return version_context_by_id, repre_context_by_id
+
+    def get_representation_contexts(self, project_name, representation_ids):
+        """Get contexts for representations.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Representation contexts by
+                representation id.
+
+        """
+        repre_entities_by_id = self._entities_cache.get_representations(
+            project_name, representation_ids
+        )
+        version_context_by_id = self.get_version_contexts(
+            project_name,
+            {r["versionId"] for r in repre_entities_by_id.values()}
+        )
+        output = {}
+        for repre_id, repre_entity in repre_entities_by_id.items():
+            version_context = version_context_by_id.get(
+                repre_entity["versionId"]
+            )
+            if version_context is None:
+                continue
+            context = dict(version_context)
+            context["representation"] = repre_entity
+            output[repre_id] = context
+        return output
+
+    def get_product_contexts(self, project_name, product_ids):
+        """Get contexts for products.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (Iterable[str]): Product ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Product contexts by product id.
+
+        """
+        return {
+            product_id: dict(parents)
+            for product_id, parents in self._get_product_parents(
+                project_name, product_ids
+            ).items()
+        }
+
+    def _get_product_parents(self, project_name, product_ids):
+        product_entities_by_id = self._entities_cache.get_products(
+            project_name, product_ids
+        )
+        if not product_entities_by_id:
+            return {}
+        folder_entities_by_id = self._entities_cache.get_folders(
+            project_name,
+            {p["folderId"] for p in product_entities_by_id.values()}
+        )
+        project_entity = self._entities_cache.get_project(project_name)
+        output = {}
+        for product_id, product_entity in product_entities_by_id.items():
+            folder_entity = folder_entities_by_id.get(
+                product_entity["folderId"]
+            )
+            if folder_entity is None:
+                continue
+            output[product_id] = {
+                "project": project_entity,
+                "folder": folder_entity,
+                "product": product_entity,
+            }
+        return output
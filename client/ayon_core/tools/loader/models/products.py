@@ -7,6 +7,7 @@ from ayon_api.operations import OperationsSession
 
 from ayon_core.lib import NestedCacheItem
 from ayon_core.style import get_default_entity_icon_color
+from ayon_core.tools.common_models import tray_cache
 from ayon_core.tools.loader.abstract import (
     ProductTypeItem,
     ProductItem,
@@ -148,8 +149,10 @@ class ProductsModel:
 
     lifetime = 60  # In seconds (minute by default)
 
-    def __init__(self, controller):
+    def __init__(self, controller, entities_cache=None):
         self._controller = controller
+        # Queried entities are shared with actions model
+        self._entities_cache = entities_cache
 
         # Mapping helpers
         # NOTE - mapping must be cleaned up with cache cleanup
@@ -191,7 +194,9 @@ class ProductsModel:
 
         cache = self._product_type_items_cache[project_name]
         if not cache.is_valid:
-            product_types = ayon_api.get_project_product_types(project_name)
+            product_types = tray_cache.get_project_product_types(
+                project_name
+            )
             cache.update_data([
                 product_type_item_from_data(product_type)
                 for product_type in product_types
@@ -462,6 +467,16 @@ class ProductsModel:
 
         loaded_product_ids = self._controller.get_loaded_product_ids()
 
+        products = list(products)
+        versions = list(versions)
+        if self._entities_cache is not None:
+            self._entities_cache.update_entities(
+                project_name, "product", products
+            )
+            self._entities_cache.update_entities(
+                project_name, "version", versions
+            )
+
         versions_by_product_id = collections.defaultdict(list)
         for version in versions:
             versions_by_product_id[version["productId"]].append(version)
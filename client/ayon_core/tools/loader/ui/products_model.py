@@ -1,3 +1,4 @@
+import time
 import collections
 
 import qtawesome
@@ -105,6 +106,10 @@ class ProductsModel(QtGui.QStandardItemModel):
         sitesync_avail_col: VERSION_AVAILABLE_ROLE,
 
     }
+    # Root rows are populated lazily when refresh would add more rows
+    #   than the threshold
+    lazy_population_threshold = 1000
+    fetch_batch_size = 250
 
     def __init__(self, controller):
         super().__init__()
@@ -120,6 +125,10 @@ class ProductsModel(QtGui.QStandardItemModel):
 
         # product item objects (they have version information)
         self._product_items_by_id = {}
+        self._statuses_by_product_id = {}
+        self._sorted_version_items_by_product_id = {}
+        # Root items waiting for 'fetchMore'
+        self._pending_root_items = []
         self._grouping_enabled = True
         self._reset_merge_color = False
         self._color_iterator = self._color_iter()
@@ -129,11 +138,13 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._last_folder_ids = []
         self._last_project_statuses = {}
         self._last_status_icons_by_name = {}
+        self._last_refresh_info = {}
 
     def get_product_item_indexes(self):
         return [
             self.indexFromItem(item)
             for item in self._items_by_id.values()
+            if item.row() >= 0
         ]
 
     def get_product_item_by_id(self, product_id):
@@ -220,12 +231,7 @@ class ProductsModel(QtGui.QStandardItemModel):
         ):
             index = self.index(index.row(), 0, index.parent())
             product_id = index.data(PRODUCT_ID_ROLE)
-            product_item = self._product_items_by_id.get(product_id)
-            if product_item is None:
-                return None
-            product_items = list(product_item.version_items.values())
-            product_items.sort(reverse=True)
-            return product_items
+            return self._get_sorted_version_items(product_id)
 
         if role == QtCore.Qt.EditRole:
             return None
@@ -257,12 +263,7 @@ class ProductsModel(QtGui.QStandardItemModel):
                 index = self.index(index.row(), 0, index.parent())
             product_id = index.data(PRODUCT_ID_ROLE)
             product_item = self._product_items_by_id[product_id]
-            final_version_item = None
-            for v_id, version_item in product_item.version_items.items():
-                if v_id == value:
-                    final_version_item = version_item
-                    break
-
+            final_version_item = product_item.version_items.get(value)
             if final_version_item is None:
                 return False
             if index.data(VERSION_ID_ROLE) == final_version_item.version_id:
@@ -311,8 +312,79 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._group_items_by_name = {}
         self._merged_items_by_id = {}
         self._product_items_by_id = {}
+        self._statuses_by_product_id = {}
+        self._sorted_version_items_by_product_id = {}
+        self._pending_root_items = []
         self._reset_merge_color = True
 
+    def _remove_items(self, items):
+        if not items:
+            return
+        root_item = self.invisibleRootItem()
+        for item in items:
+            row = item.row()
+            if row < 0:
+                continue
+            parent = item.parent()
+            if parent is None:
+                parent = root_item
+            parent.removeRow(row)
+
+    def _remove_group_items(self, group_names):
+        group_items = [
+            self._group_items_by_name.pop(group_name)
+            for group_name in group_names
+        ]
+        self._remove_items(group_items)
+
+    def _remove_merged_items(self, paths):
+        merged_items = [
+            self._merged_items_by_id.pop(path)
+            for path in paths
+        ]
+        self._remove_items(merged_items)
+
+    def _remove_product_items(self, product_ids):
+        product_items = []
+        for product_id in product_ids:
+            self._product_items_by_id.pop(product_id, None)
+            self._statuses_by_product_id.pop(product_id, None)
+            self._sorted_version_items_by_product_id.pop(product_id, None)
+            product_items.append(self._items_by_id.pop(product_id))
+        self._remove_items(product_items)
+
+    def _add_to_new_items(self, item, parent_item, new_items):
+        """Add item to new items if is not already under parent item.
+
+        Items that are under different parent are taken from the parent
+            first.
+
+        Args:
+            item (QtGui.QStandardItem): Item to add.
+            parent_item (Union[QtGui.QStandardItem, None]): Expected parent
+                item. 'None' for root.
+            new_items (list[QtGui.QStandardItem]): List where new items
+                are added.
+
+        Returns:
+            bool: Item was added to new items.
+
+        """
+        row = item.row()
+        if row < 0:
+            new_items.append(item)
+            return True
+
+        item_parent = item.parent()
+        if item_parent is parent_item:
+            return False
+
+        if item_parent is None:
+            item_parent = self.invisibleRootItem()
+        item_parent.takeRow(row)
+        new_items.append(item)
+        return True
+
     def _get_group_icon(self):
         if self._group_icon is None:
             self._group_icon = qtawesome.icon(
@@ -334,16 +406,21 @@ class ProductsModel(QtGui.QStandardItemModel):
             self._group_items_by_name[group_name] = model_item
         return model_item
 
-    def _get_merged_model_item(self, path, count, hex_color):
+    def _get_merged_model_item(self, path, product_name, count):
         model_item = self._merged_items_by_id.get(path)
         if model_item is None:
+            hex_color, qt_color = self._get_next_color()
             model_item = QtGui.QStandardItem()
             model_item.setData(1, GROUP_TYPE_ROLE)
             model_item.setData(hex_color, MERGED_COLOR_ROLE)
+            model_item.setData(
+                qtawesome.icon("fa.circle", color=qt_color),
+                QtCore.Qt.DecorationRole
+            )
             model_item.setEditable(False)
             model_item.setColumnCount(self.columnCount())
             self._merged_items_by_id[path] = model_item
-        label = "{} ({})".format(path, count)
+        label = "{} ({})".format(product_name, count)
         model_item.setData(label, QtCore.Qt.DisplayRole)
         return model_item
 
@@ -413,15 +490,17 @@ class ProductsModel(QtGui.QStandardItemModel):
         sync_availability_by_version_id,
         last_version_by_product_id,
     ):
-        model_item = self._items_by_id.get(product_item.product_id)
-        last_version = last_version_by_product_id[product_item.product_id]
+        product_id = product_item.product_id
+        model_item = self._items_by_id.get(product_id)
+        # Product items are cached by controller, same object means that
+        #   nothing has changed since last refresh
+        if (
+            model_item is not None
+            and self._product_items_by_id.get(product_id) is product_item
+        ):
+            return model_item
 
-        statuses = {
-            version_item.status
-            for version_item in product_item.version_items.values()
-        }
         if model_item is None:
-            product_id = product_item.product_id
             model_item = QtGui.QStandardItem(product_item.product_name)
             model_item.setEditable(False)
             icon = get_qt_icon(product_item.product_icon)
@@ -433,10 +512,12 @@ class ProductsModel(QtGui.QStandardItemModel):
             model_item.setData(product_item.product_type, PRODUCT_TYPE_ROLE)
             model_item.setData(product_type_icon, PRODUCT_TYPE_ICON_ROLE)
             model_item.setData(product_item.folder_id, FOLDER_ID_ROLE)
-
-            self._product_items_by_id[product_id] = product_item
             self._items_by_id[product_id] = model_item
 
+        self._product_items_by_id[product_id] = product_item
+        self._sorted_version_items_by_product_id.pop(product_id, None)
+
+        statuses = self._statuses_by_product_id[product_id]
         model_item.setData("|".join(statuses), STATUS_NAME_FILTER_ROLE)
         model_item.setData(product_item.folder_label, FOLDER_LABEL_ROLE)
         in_scene = 1 if product_item.product_in_scene else 0
@@ -447,17 +528,82 @@ class ProductsModel(QtGui.QStandardItemModel):
 
         self._set_version_data_to_product_item(
             model_item,
-            last_version,
+            last_version_by_product_id[product_id],
             repre_count_by_version_id,
             sync_availability_by_version_id,
         )
         return model_item
 
+    def _get_sorted_version_items(self, product_id):
+        version_items = self._sorted_version_items_by_product_id.get(
+            product_id
+        )
+        if version_items is None:
+            product_item = self._product_items_by_id.get(product_id)
+            if product_item is None:
+                return None
+            version_items = list(product_item.version_items.values())
+            version_items.sort(reverse=True)
+            self._sorted_version_items_by_product_id[product_id] = (
+                version_items
+            )
+        return list(version_items)
+
+    @staticmethod
+    def _root_item_sort_key(item):
+        # Groups first, then merged items and products at the end to match
+        #   default sorting of the view for lazily fetched rows
+        group_type = item.data(GROUP_TYPE_ROLE)
+        if group_type is not None:
+            return (group_type, "", "")
+        return (
+            2,
+            item.data(PRODUCT_TYPE_ROLE) or "",
+            item.data(PRODUCT_NAME_ROLE) or "",
+        )
+
     def get_last_project_name(self):
         return self._last_project_name
 
+    def get_last_refresh_info(self):
+        """Information about last refresh.
+
+        Returns:
+            dict[str, Any]: Duration of refresh in seconds and counts of
+                added, updated, removed and not yet fetched items.
+
+        """
+        return dict(self._last_refresh_info)
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() and self._pending_root_items:
+            return True
+        return super().canFetchMore(parent)
+
+    def fetchMore(self, parent):
+        if parent.isValid() or not self._pending_root_items:
+            super().fetchMore(parent)
+            return
+
+        batch_size = self.fetch_batch_size
+        new_items = self._pending_root_items[:batch_size]
+        self._pending_root_items = self._pending_root_items[batch_size:]
+        self.invisibleRootItem().appendRows(new_items)
+
+    def fetch_all(self):
+        """Add all lazily populated rows to the model."""
+        if not self._pending_root_items:
+            return
+        new_items = self._pending_root_items
+        self._pending_root_items = []
+        self.invisibleRootItem().appendRows(new_items)
+
     def refresh(self, project_name, folder_ids):
-        self._clear()
+        start_time = time.perf_counter()
+        if project_name != self._last_project_name:
+            self._clear()
+        # Not fetched rows from previous refresh are handled as new items
+        self._pending_root_items = []
 
         self._last_project_name = project_name
         self._last_folder_ids = folder_ids
@@ -486,29 +632,57 @@ class ProductsModel(QtGui.QStandardItemModel):
             product_item.product_id: product_item
             for product_item in product_items
         }
+
+        # Remove product items that are not available
+        product_ids_to_remove = (
+            set(self._items_by_id.keys()) - set(product_items_by_id.keys())
+        )
+        removed_count = len(product_ids_to_remove)
+        # Removing rows one by one is slower than clearing the model
+        #   when most of the items are not used anymore
+        if removed_count * 2 > len(self._items_by_id):
+            self._clear()
+        else:
+            self._remove_product_items(product_ids_to_remove)
+
+        changed_product_items = [
+            product_item
+            for product_id, product_item in product_items_by_id.items()
+            if self._product_items_by_id.get(product_id) is not product_item
+        ]
+        added_count = sum(
+            1
+            for product_item in changed_product_items
+            if product_item.product_id not in self._items_by_id
+        )
+
         last_version_by_product_id = {}
-        for product_item in product_items:
-            versions = list(product_item.version_items.values())
-            versions.sort()
-            last_version = versions[-1]
-            last_version_by_product_id[product_item.product_id] = (
-                last_version
-            )
+        for product_item in changed_product_items:
+            product_id = product_item.product_id
+            version_items = product_item.version_items.values()
+            last_version_by_product_id[product_id] = max(version_items)
+            self._statuses_by_product_id[product_id] = {
+                version_item.status
+                for version_item in version_items
+            }
 
         version_ids = {
             version_item.version_id
             for version_item in last_version_by_product_id.values()
         }
-        repre_count_by_version_id = (
-            self._controller.get_versions_representation_count(
-                project_name, version_ids
+        repre_count_by_version_id = {}
+        sync_availability_by_version_id = {}
+        if version_ids:
+            repre_count_by_version_id = (
+                self._controller.get_versions_representation_count(
+                    project_name, version_ids
+                )
             )
-        )
-        sync_availability_by_version_id = (
-            self._controller.get_version_sync_availability(
-                project_name, version_ids
+            sync_availability_by_version_id = (
+                self._controller.get_version_sync_availability(
+                    project_name, version_ids
+                )
             )
-        )
 
         # Prepare product groups
         product_name_matches_by_group = collections.defaultdict(dict)
@@ -523,7 +697,6 @@ class ProductsModel(QtGui.QStandardItemModel):
 
         group_names = set(product_name_matches_by_group.keys())
 
-        root_item = self.invisibleRootItem()
         new_root_items = []
         merged_paths = set()
         for group_name in group_names:
@@ -537,12 +710,10 @@ class ProductsModel(QtGui.QStandardItemModel):
             group_product_types = set()
             group_status_names = set()
             for product_name, product_items in groups.items():
-                group_product_types |= {p.product_type for p in product_items}
                 for product_item in product_items:
-                    group_status_names |= {
-                        version_item.status
-                        for version_item in product_item.version_items.values()
-                    }
+                    group_status_names |= self._statuses_by_product_id[
+                        product_item.product_id
+                    ]
                     group_product_types.add(product_item.product_type)
 
                 if len(product_items) == 1:
@@ -580,18 +751,14 @@ class ProductsModel(QtGui.QStandardItemModel):
                     sync_availability_by_version_id,
                     last_version_by_product_id,
                 )
-                new_items.append(item)
+                self._add_to_new_items(item, parent_item, new_items)
 
-            for path_info in merged_product_items.values():
+            for path, path_info in merged_product_items.items():
                 product_name, product_items = path_info
-                (merged_color_hex, merged_color_qt) = self._get_next_color()
-                merged_color = qtawesome.icon(
-                    "fa.circle", color=merged_color_qt
-                )
                 merged_item = self._get_merged_model_item(
-                    product_name, len(product_items), merged_color_hex)
-                merged_item.setData(merged_color, QtCore.Qt.DecorationRole)
-                new_items.append(merged_item)
+                    path, product_name, len(product_items)
+                )
+                self._add_to_new_items(merged_item, parent_item, new_items)
 
                 merged_product_types = set()
                 merged_status_names = set()
@@ -605,14 +772,13 @@ class ProductsModel(QtGui.QStandardItemModel):
                         sync_availability_by_version_id,
                         last_version_by_product_id,
                     )
-                    new_merged_items.append(item)
+                    self._add_to_new_items(
+                        item, merged_item, new_merged_items
+                    )
                     merged_product_types.add(product_item.product_type)
-                    merged_status_names |= {
-                        version_item.status
-                        for version_item in (
-                            product_item.version_items.values()
-                        )
-                    }
+                    merged_status_names |= self._statuses_by_product_id[
+                        product_item.product_id
+                    ]
 
                 merged_item.setData(
                     "|".join(merged_product_types),
@@ -634,155 +800,39 @@ class ProductsModel(QtGui.QStandardItemModel):
                 parent_item.appendRows(new_items)
 
         if new_root_items:
-            root_item.appendRows(new_root_items)
-
+            new_root_items.sort(key=self._root_item_sort_key)
+            # Populate rows lazily when there is too many of them
+            if len(new_root_items) > self.lazy_population_threshold:
+                batch_size = self.fetch_batch_size
+                self._pending_root_items = new_root_items[batch_size:]
+                new_root_items = new_root_items[:batch_size]
+            self.invisibleRootItem().appendRows(new_root_items)
+
+        merged_item_ids_to_remove = (
+            set(self._merged_items_by_id.keys()) - merged_paths
+        )
+        group_names_to_remove = (
+            set(self._group_items_by_name.keys()) - set(group_names)
+        )
+        self._remove_merged_items(merged_item_ids_to_remove)
+        self._remove_group_items(group_names_to_remove)
+
+        self._last_refresh_info = {
+            "duration": time.perf_counter() - start_time,
+            "products_count": len(product_items_by_id),
+            "added": added_count,
+            "updated": len(changed_product_items) - added_count,
+            "removed": removed_count,
+            "pending": len(self._pending_root_items),
+        }
         self.refreshed.emit()
-    # ---------------------------------
-    #   This implementation does not call '_clear' at the start
-    #       but is more complex and probably slower
-    # ---------------------------------
-    # def _remove_items(self, items):
-    #     if not items:
-    #         return
-    #     root_item = self.invisibleRootItem()
-    #     for item in items:
-    #         row = item.row()
-    #         if row < 0:
-    #             continue
-    #         parent = item.parent()
-    #         if parent is None:
-    #             parent = root_item
-    #         parent.removeRow(row)
-    #
-    # def _remove_group_items(self, group_names):
-    #     group_items = [
-    #         self._group_items_by_name.pop(group_name)
-    #         for group_name in group_names
-    #     ]
-    #     self._remove_items(group_items)
-    #
-    # def _remove_merged_items(self, paths):
-    #     merged_items = [
-    #         self._merged_items_by_id.pop(path)
-    #         for path in paths
-    #     ]
-    #     self._remove_items(merged_items)
-    #
-    # def _remove_product_items(self, product_ids):
-    #     product_items = []
-    #     for product_id in product_ids:
-    #         self._product_items_by_id.pop(product_id)
-    #         product_items.append(self._items_by_id.pop(product_id))
-    #     self._remove_items(product_items)
-    #
-    # def _add_to_new_items(self, item, parent_item, new_items, root_item):
-    #     if item.row() < 0:
-    #         new_items.append(item)
-    #     else:
-    #         item_parent = item.parent()
-    #         if item_parent is not parent_item:
-    #             if item_parent is None:
-    #                 item_parent = root_item
-    #             item_parent.takeRow(item.row())
-    #             new_items.append(item)
-
-    # def refresh(self, project_name, folder_ids):
-    #     product_items = self._controller.get_product_items(
-    #         project_name,
-    #         folder_ids,
-    #         sender=PRODUCTS_MODEL_SENDER_NAME
-    #     )
-    #     product_items_by_id = {
-    #         product_item.product_id: product_item
-    #         for product_item in product_items
-    #     }
-    #     # Remove product items that are not available
-    #     product_ids_to_remove = (
-    #         set(self._items_by_id.keys()) - set(product_items_by_id.keys())
-    #     )
-    #     self._remove_product_items(product_ids_to_remove)
-    #
-    #     # Prepare product groups
-    #     product_name_matches_by_group = collections.defaultdict(dict)
-    #     for product_item in product_items_by_id.values():
-    #         group_name = None
-    #         if self._grouping_enabled:
-    #             group_name = product_item.group_name
-    #
-    #         product_name = product_item.product_name
-    #         group = product_name_matches_by_group[group_name]
-    #         if product_name not in group:
-    #             group[product_name] = [product_item]
-    #             continue
-    #         group[product_name].append(product_item)
-    #
-    #     group_names = set(product_name_matches_by_group.keys())
-    #
-    #     root_item = self.invisibleRootItem()
-    #     new_root_items = []
-    #     merged_paths = set()
-    #     for group_name in group_names:
-    #         key_parts = []
-    #         if group_name:
-    #             key_parts.append(group_name)
-    #
-    #         groups = product_name_matches_by_group[group_name]
-    #         merged_product_items = {}
-    #         top_items = []
-    #         for product_name, product_items in groups.items():
-    #             if len(product_items) == 1:
-    #                 top_items.append(product_items[0])
-    #             else:
-    #                 path = "/".join(key_parts + [product_name])
-    #                 merged_paths.add(path)
-    #                 merged_product_items[path] = product_items
-    #
-    #         parent_item = None
-    #         if group_name:
-    #             parent_item = self._get_group_model_item(group_name)
-    #
-    #         new_items = []
-    #         if parent_item is not None and parent_item.row() < 0:
-    #             new_root_items.append(parent_item)
-    #
-    #         for product_item in top_items:
-    #             item = self._get_product_model_item(product_item)
-    #             self._add_to_new_items(
-    #                 item, parent_item, new_items, root_item
-    #             )
-    #
-    #         for path, product_items in merged_product_items.items():
-    #             merged_item = self._get_merged_model_item(path)
-    #             self._add_to_new_items(
-    #                 merged_item, parent_item, new_items, root_item
-    #             )
-    #
-    #             new_merged_items = []
-    #             for product_item in product_items:
-    #                 item = self._get_product_model_item(product_item)
-    #                 self._add_to_new_items(
-    #                     item, merged_item, new_merged_items, root_item
-    #                 )
-    #
-    #             if new_merged_items:
-    #                 merged_item.appendRows(new_merged_items)
-    #
-    #         if not new_items:
-    #             continue
-    #
-    #         if parent_item is not None:
-    #             parent_item.appendRows(new_items)
-    #             continue
-    #
-    #         new_root_items.extend(new_items)
-    #
-    #     root_item.appendRows(new_root_items)
-    #
-    #     merged_item_ids_to_remove = (
-    #         set(self._merged_items_by_id.keys()) - merged_paths
-    #     )
-    #     group_names_to_remove = (
-    #         set(self._group_items_by_name.keys()) - set(group_names)
-    #     )
-    #     self._remove_merged_items(merged_item_ids_to_remove)
-    #     self._remove_group_items(group_names_to_remove)
+        self._controller.emit_event(
+            "products.view.refresh.finished",
+            {
+                "project_name": project_name,
+                "folder_ids": folder_ids,
+                "sender": PRODUCTS_MODEL_SENDER_NAME,
+                **self._last_refresh_info,
+            },
+            PRODUCTS_MODEL_SENDER_NAME
+        )
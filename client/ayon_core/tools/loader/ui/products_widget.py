@@ -38,7 +38,9 @@ class ProductsProxyModel(RecursiveSortFilterProxyModel):
 
         self._product_type_filters = {}
         self._statuses_filter = None
+        self._fixed_string_filter = ""
         self._ascending_sort = True
+        self._sort_column = ProductsModel.product_type_col
 
     def get_statuses_filter(self):
         if self._statuses_filter is None:
@@ -47,14 +49,47 @@ class ProductsProxyModel(RecursiveSortFilterProxyModel):
 
     def set_product_type_filters(self, product_type_filters):
         self._product_type_filters = product_type_filters
+        self.fetch_all_if_needed()
         self.invalidateFilter()
 
     def set_statuses_filter(self, statuses_filter):
         if self._statuses_filter == statuses_filter:
             return
         self._statuses_filter = statuses_filter
+        self.fetch_all_if_needed()
         self.invalidateFilter()
 
+    def setFilterFixedString(self, pattern):
+        self._fixed_string_filter = pattern
+        self.fetch_all_if_needed()
+        super().setFilterFixedString(pattern)
+
+    def needs_all_rows(self):
+        """Filtering or sorting can't work only with fetched rows.
+
+        Lazily populated rows of source model are in default sort order,
+        any filter or other sort order has to know all rows.
+
+        Returns:
+            bool: All rows of source model have to be fetched.
+
+        """
+        if self._fixed_string_filter:
+            return True
+        if self._statuses_filter is not None:
+            return True
+        if not all(self._product_type_filters.values()):
+            return True
+        return (
+            self._sort_column != ProductsModel.product_type_col
+            or not self._ascending_sort
+        )
+
+    def fetch_all_if_needed(self):
+        source_model = self.sourceModel()
+        if source_model is not None and self.needs_all_rows():
+            source_model.fetch_all()
+
     def filterAcceptsRow(self, source_row, source_parent):
         source_model = self.sourceModel()
         index = source_model.index(source_row, 0, source_parent)
@@ -108,6 +143,8 @@ class ProductsProxyModel(RecursiveSortFilterProxyModel):
         if order is None:
             order = QtCore.Qt.AscendingOrder
         self._ascending_sort = order == QtCore.Qt.AscendingOrder
+        self._sort_column = column
+        self.fetch_all_if_needed()
         super().sort(column, order)
 
 
@@ -324,6 +361,8 @@ class ProductsWidget(QtWidgets.QWidget):
             self._selected_project_name,
             self._selected_folder_ids
         )
+        # Active filters and sorting need all rows
+        self._products_proxy_model.fetch_all_if_needed()
 
     def _on_context_menu(self, point):
         selection_model = self._products_view.selectionModel()
@@ -1,5 +1,6 @@
 from .create import CreateModel, CreatorItem, InstanceItem
 from .publish import PublishModel, PublishErrorInfo
+from .report_store import PublishReportStore
 
 
 __all__ = (
@@ -9,4 +10,6 @@ __all__ = (
 
     "PublishModel",
     "PublishErrorInfo",
+
+    "PublishReportStore",
 )
@@ -1,12 +1,17 @@
+import os
 import uuid
-import copy
+import heapq
 import inspect
 import logging
+import operator
+import itertools
 import traceback
 import collections
 from contextlib import contextmanager
 from functools import partial
-from typing import Optional, Dict, List, Union, Any, Iterable
+from typing import (
+    Optional, Dict, List, Union, Any, Iterable, NamedTuple
+)
 
 import arrow
 import pyblish.plugin
@@ -27,25 +32,221 @@ from ayon_core.tools.publisher.abstract import AbstractPublisherBackend
 PUBLISH_EVENT_SOURCE = "publisher.publish.model"
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
+# Default maximum number of kept log records (lower than warning) per plugin
+DEFAULT_MAX_LOG_RECORDS = 10000
+
+
+class PublishLogItem(NamedTuple):
+    """Compact representation of captured log record.
+
+    Message and traceback are formatted only when log item is converted
+    to report data. Message arguments are kept only if they are simple
+    values, otherwise message is formatted right away so the item does
+    not keep references to (possibly big or mutable) objects.
+    """
+
+    name: str
+    levelno: int
+    levelname: str
+    msg: str
+    args: Any
+    lineno: int
+    thread_name: Optional[str]
+    filename: str
+    pathname: str
+    msecs: float
+    exc_info: Union[str, traceback.TracebackException, None]
+
+    @classmethod
+    def from_record(cls, record: logging.LogRecord) -> "PublishLogItem":
+        msg = record.msg
+        args = record.args
+        if not isinstance(msg, str) or (
+            args and not _is_simple_log_args(args)
+        ):
+            msg = _get_record_message(record)
+            args = None
+        elif isinstance(args, dict):
+            # Single mapping argument is passed to record as is
+            args = dict(args)
+
+        exc_info = record.exc_text
+        if not exc_info and record.exc_info and record.exc_info[0]:
+            # Does not keep references to frames of the traceback
+            exc_info = traceback.TracebackException(
+                *record.exc_info, lookup_lines=False
+            )
+
+        return cls(
+            record.name,
+            record.levelno,
+            record.levelname,
+            msg,
+            args or None,
+            record.lineno,
+            record.threadName,
+            record.filename,
+            record.pathname,
+            record.msecs,
+            exc_info,
+        )
+
+    def get_message(self) -> str:
+        if not self.args:
+            return self.msg
+        try:
+            return self.msg % self.args
+        except Exception:
+            return str(self.msg)
+
+    def get_exc_info(self) -> Optional[str]:
+        if isinstance(self.exc_info, traceback.TracebackException):
+            return "".join(self.exc_info.format())
+        return self.exc_info
+
+    def to_data(self) -> Dict[str, Any]:
+        return {
+            "type": "record",
+            "msg": self.get_message(),
+            "name": self.name,
+            "lineno": self.lineno,
+            "levelno": self.levelno,
+            "levelname": self.levelname,
+            "threadName": self.thread_name,
+            "filename": self.filename,
+            "pathname": self.pathname,
+            "msecs": self.msecs,
+            "exc_info": self.get_exc_info(),
+        }
+
+
+_SIMPLE_LOG_ARG_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_simple_log_args(args: Any) -> bool:
+    if isinstance(args, dict):
+        args = args.values()
+    return all(isinstance(arg, _SIMPLE_LOG_ARG_TYPES) for arg in args)
+
+
+def _get_record_message(record: logging.LogRecord) -> str:
+    try:
+        return record.getMessage()
+    except Exception:
+        return str(record.msg)
+
+
+class LogRecordBuffer:
+    """Bounded buffer of log items with level based retention.
+
+    Items with level lower than 'retain_levelno' are stored in a ring
+    buffer, so only the newest 'max_records' of them are kept and older
+    are dropped. Items with the level or higher (warnings and errors by
+    default) are always kept. Order in which items were added is kept.
+
+    Args:
+        max_records (Optional[int]): Maximum number of kept items with
+            lower level. Unlimited if not set.
+        retain_levelno (int): Items with this or higher level are
+            always kept.
+    """
+
+    def __init__(
+        self,
+        max_records: Optional[int] = None,
+        retain_levelno: int = logging.WARNING,
+    ):
+        self._retain_levelno = retain_levelno
+        self._counter = itertools.count()
+        self._retained = []
+        self._ring = collections.deque(maxlen=max_records)
+        self._dropped_count = 0
+
+    def __len__(self) -> int:
+        return len(self._retained) + len(self._ring)
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    def add(self, levelno: int, item: Any):
+        entry = (next(self._counter), item)
+        if levelno >= self._retain_levelno:
+            self._retained.append(entry)
+            return
+
+        if len(self._ring) == self._ring.maxlen:
+            self._dropped_count += 1
+        self._ring.append(entry)
+
+    def add_dropped(self, count: int):
+        """Add count of items which were dropped before reaching buffer."""
+        self._dropped_count += count
+
+    def get_items(self) -> List[Any]:
+        if not self._retained:
+            entries = self._ring
+        elif not self._ring:
+            entries = self._retained
+        else:
+            entries = heapq.merge(
+                self._retained, self._ring, key=operator.itemgetter(0)
+            )
+        return [item for _, item in entries]
 
 
 class MessageHandler(logging.Handler):
-    def __init__(self, *args, **kwargs):
+    """Capture log records of processed plugin.
+
+    Records are stored as 'PublishLogItem' in bounded 'LogRecordBuffer'.
+
+    Args:
+        max_records (Optional[int]): Maximum number of kept records with
+            lower level than warning. Unlimited if not set.
+    """
+
+    def __init__(self, *args, max_records=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self._records = []
+        self._max_records = max_records
+        self._buffer = LogRecordBuffer(max_records)
+
+    def set_max_records(self, max_records: Optional[int]):
+        self._max_records = max_records
+        self.clear_records()
 
     def clear_records(self):
-        self._records = []
+        self._buffer = LogRecordBuffer(self._max_records)
 
     def emit(self, record):
-        try:
-            record.msg = record.getMessage()
-        except Exception:
-            record.msg = str(record.msg)
-        self._records.append(record)
+        self._buffer.add(record.levelno, PublishLogItem.from_record(record))
+
+    def get_records(self) -> List[PublishLogItem]:
+        return self._buffer.get_items()
+
+    def get_dropped_count(self) -> int:
+        return self._buffer.dropped_count
+
+
+def get_max_log_records() -> Optional[int]:
+    """Maximum number of kept log records per plugin.
+
+    Value can be changed with 'AYON_PUBLISHER_MAX_LOG_RECORDS' environment
+    variable, value '0' or lower disables the limit. The limit does not
+    apply to warnings and errors.
 
-    def get_records(self):
-        return self._records
+    Returns:
+        Optional[int]: Maximum number of records, or None if unlimited.
+    """
+    value = os.environ.get("AYON_PUBLISHER_MAX_LOG_RECORDS")
+    if not value:
+        return DEFAULT_MAX_LOG_RECORDS
+    try:
+        value = int(value)
+    except ValueError:
+        return DEFAULT_MAX_LOG_RECORDS
+    if value <= 0:
+        return None
+    return value
 
 
 class PublishErrorInfo:
@@ -114,7 +315,9 @@ class PublishReportMaker:
 
         self._all_instances_by_id: Dict[str, pyblish.api.Instance] = {}
         self._plugin_data_by_id: Dict[str, Any] = {}
+        self._plugin_logs_by_id: Dict[str, LogRecordBuffer] = {}
         self._current_plugin_id: Optional[str] = None
+        self._max_log_records: Optional[int] = None
 
         self.reset(
             creator_discover_result,
@@ -136,6 +339,7 @@ class PublishReportMaker:
 
         self._all_instances_by_id = {}
         self._plugin_data_by_id = {}
+        self._plugin_logs_by_id = {}
         self._current_plugin_id = None
 
         publish_plugins = []
@@ -145,6 +349,17 @@ class PublishReportMaker:
         for plugin in publish_plugins:
             self._add_plugin_data_item(plugin)
 
+    def set_max_log_records(self, max_records: Optional[int]):
+        """Change maximum number of kept log records per plugin.
+
+        Change is applied on next reset.
+
+        Args:
+            max_records (Optional[int]): Maximum number of kept records
+                with lower level than warning. Unlimited if not set.
+        """
+        self._max_log_records = max_records
+
     def add_plugin_iter(self, plugin_id: str, context: pyblish.api.Context):
         """Add report about single iteration of plugin."""
         for instance in context:
@@ -169,9 +384,32 @@ class PublishReportMaker:
         if instance is not None:
             instance_id = instance.id
         plugin_data = self._plugin_data_by_id[plugin_id]
-        plugin_data["instances_data"].append({
+        instances_data = plugin_data["instances_data"]
+
+        # Records are stored in per plugin buffer with index of instance
+        #   data item and are formatted when report is created
+        log_buffer = self._plugin_logs_by_id.get(plugin_id)
+        if log_buffer is None:
+            log_buffer = LogRecordBuffer(self._max_log_records)
+            self._plugin_logs_by_id[plugin_id] = log_buffer
+
+        item_index = len(instances_data)
+        for record in result.get("records") or []:
+            if isinstance(record, logging.LogRecord):
+                record = PublishLogItem.from_record(record)
+            log_buffer.add(record.levelno, (item_index, record))
+        log_buffer.add_dropped(result.get("dropped_records", 0))
+
+        # Only error item is stored with instance data
+        logs = []
+        error_item = self._extract_error_log_item(result)
+        if error_item is not None:
+            error_item["instance_id"] = instance_id
+            logs.append(error_item)
+
+        instances_data.append({
             "id": instance_id,
-            "logs": self._extract_instance_log_items(result),
+            "logs": logs,
             "process_time": result["duration"]
         })
 
@@ -206,9 +444,10 @@ class PublishReportMaker:
             for instance in self._all_instances_by_id.values()
         }
 
-        plugins_data_by_id = copy.deepcopy(
-            self._plugin_data_by_id
-        )
+        plugins_data_by_id = {
+            plugin_id: self._copy_plugin_data(plugin_id, plugin_data)
+            for plugin_id, plugin_data in self._plugin_data_by_id.items()
+        }
 
         # Ensure the current plug-in is marked as `passed` in the result
         # so that it shows on reports for paused publishes
@@ -247,6 +486,50 @@ class PublishReportMaker:
             "report_version": "1.1.0",
         }
 
+    def _copy_plugin_data(
+        self, plugin_id: str, plugin_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Copy plugin data without using 'copy.deepcopy'.
+
+        Log items contain only primitive values so copy of each item is
+        enough and is much faster than deep copy of the whole structure.
+        Captured log records are formatted here.
+        """
+        records_by_index = collections.defaultdict(list)
+        dropped_logs = 0
+        log_buffer = self._plugin_logs_by_id.get(plugin_id)
+        if log_buffer is not None:
+            dropped_logs = log_buffer.dropped_count
+            for item_index, record in log_buffer.get_items():
+                records_by_index[item_index].append(record)
+
+        instances_data = []
+        for item_index, instance_data in enumerate(
+            plugin_data["instances_data"]
+        ):
+            instance_id = instance_data["id"]
+            logs = []
+            for record in records_by_index[item_index]:
+                log_item = record.to_data()
+                log_item["instance_id"] = instance_id
+                logs.append(log_item)
+            logs.extend(dict(log) for log in instance_data["logs"])
+            instances_data.append({**instance_data, "logs": logs})
+
+        output = dict(plugin_data)
+        output["families"] = list(plugin_data["families"])
+        output["targets"] = list(plugin_data["targets"])
+        output["instances_data"] = instances_data
+        output["dropped_logs"] = dropped_logs
+        output["actions_data"] = [
+            {
+                **action_data,
+                "logs": [dict(log) for log in action_data["logs"]],
+            }
+            for action_data in plugin_data["actions_data"]
+        ]
+        return output
+
     def _add_plugin_data_item(self, plugin: pyblish.api.Plugin):
         if plugin.id in self._plugin_data_by_id:
             # A plugin would be processed more than once. What can cause it:
@@ -286,6 +569,7 @@ class PublishReportMaker:
             "targets": list(plugin.targets),
             "instances_data": [],
             "actions_data": [],
+            "dropped_logs": 0,
             "skipped": False,
             "passed": False
         }
@@ -314,74 +598,48 @@ class PublishReportMaker:
             "instance_id": instance.data.get("instance_id"),
         }
 
-    def _extract_instance_log_items(
-        self, result: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        instance = result["instance"]
-        instance_id = None
-        if instance:
-            instance_id = instance.id
-
-        log_items = self._extract_log_items(result)
-        for item in log_items:
-            item["instance_id"] = instance_id
-        return log_items
-
     def _extract_log_items(self, result):
         output = []
         records = result.get("records") or []
         for record in records:
-            record_exc_info = record.exc_info
-            if record_exc_info is not None:
-                record_exc_info = "".join(
-                    traceback.format_exception(*record_exc_info)
-                )
+            if isinstance(record, logging.LogRecord):
+                record = PublishLogItem.from_record(record)
+            output.append(record.to_data())
 
-            try:
-                msg = record.getMessage()
-            except Exception:
-                msg = str(record.msg)
-
-            output.append({
-                "type": "record",
-                "msg": msg,
-                "name": record.name,
-                "lineno": record.lineno,
-                "levelno": record.levelno,
-                "levelname": record.levelname,
-                "threadName": record.threadName,
-                "filename": record.filename,
-                "pathname": record.pathname,
-                "msecs": record.msecs,
-                "exc_info": record_exc_info
-            })
+        error_item = self._extract_error_log_item(result)
+        if error_item is not None:
+            output.append(error_item)
+        return output
 
+    def _extract_error_log_item(
+        self, result: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
         exception = result.get("error")
-        if exception:
-            fname, line_no, func, exc = exception.traceback
-
-            # Conversion of exception into string may crash
-            try:
-                msg = str(exception)
-            except BaseException:
-                msg = (
-                    "Publisher Controller: ERROR"
-                    " - Failed to get exception message"
-                )
+        if not exception:
+            return None
 
-            # Action result does not have 'is_validation_error'
-            is_validation_error = result.get("is_validation_error", False)
-            output.append({
-                "type": "error",
-                "is_validation_error": is_validation_error,
-                "msg": msg,
-                "filename": str(fname),
-                "lineno": str(line_no),
-                "func": str(func),
-                "traceback": exception.formatted_traceback
-            })
+        fname, line_no, func, exc = exception.traceback
 
-        return output
+        # Conversion of exception into string may crash
+        try:
+            msg = str(exception)
+        except BaseException:
+            msg = (
+                "Publisher Controller: ERROR"
+                " - Failed to get exception message"
+            )
+
+        # Action result does not have 'is_validation_error'
+        is_validation_error = result.get("is_validation_error", False)
+        return {
+            "type": "error",
+            "is_validation_error": is_validation_error,
+            "msg": msg,
+            "filename": str(fname),
+            "lineno": str(line_no),
+            "func": str(func),
+            "traceback": exception.formatted_traceback
+        }
 
 
 class PublishPluginActionItem:
@@ -960,6 +1218,9 @@ class PublishModel:
             publish_plugins
         )
 
+        max_log_records = get_max_log_records()
+        self._log_handler.set_max_records(max_log_records)
+        self._publish_report.set_max_log_records(max_log_records)
         self._publish_report.reset(
             create_context.creator_discover_result,
             create_context.convertor_discover_result,
@@ -1342,7 +1603,11 @@ class PublishModel:
                         # Remove last record made by pyblish
                         # - `log.exception(formatted_traceback)`
                         records.pop(-1)
+                # Replace records captured by pyblish
                 result["records"] = records
+                result["dropped_records"] = (
+                    log_handler.get_dropped_count()
+                )
 
         exception = result.get("error")
         if exception:
@@ -0,0 +1,523 @@
+"""Storage of publish reports for publish report viewer.
+
+Reports are stored as gzip compressed JSON lines where each line is one
+row of the report. First row contains report information and summary,
+other rows contain data of single instance or single plugin. Rows can be
+read as a stream without loading whole report at once.
+
+Lightweight index file keeps information needed to list reports, so
+report bodies are loaded only when report is opened.
+
+Row types:
+    - 'report': Report information, e.g. id, created at and summary.
+    - 'instance': Data of single instance.
+    - 'plugin': Data of single plugin with logs.
+"""
+import os
+import copy
+import gzip
+import json
+import uuid
+import threading
+from typing import Optional, Dict, Any, Iterable, Iterator, List
+
+import arrow
+
+from ayon_core.lib import Logger
+
+INDEX_VERSION = 1
+REPORT_ROWS_EXT = ".jsonl.gz"
+
+
+def _fix_report_content(
+    content: Dict[str, Any], file_modified: Optional[float] = None
+) -> bool:
+    """Fix content for backward compatibility of older reports.
+
+    Args:
+        content (dict[str, Any]): Report content.
+        file_modified (Optional[float]): File modification time used as
+            created time if report does not have it.
+
+    Returns:
+        bool: True if content was changed.
+    """
+    changed = False
+    # Key 'create_at' was added in report version 1.0.1
+    if not content.get("created_at"):
+        # Auto fix 'created_at', use file modification time if it is not
+        #   set or current time if modification could not be received.
+        if file_modified is not None:
+            created_at_obj = arrow.Arrow.fromtimestamp(file_modified)
+        else:
+            created_at_obj = arrow.utcnow()
+        content["created_at"] = created_at_obj.to("local").isoformat()
+        changed = True
+
+    # NOTE backward compatibility for 'id' and 'report_version' is from
+    #    28.10.2022 https://github.com/ynput/OpenPype/pull/4040
+    if not content.get("id"):
+        content["id"] = str(uuid.uuid4())
+        changed = True
+
+    if not content.get("report_version"):
+        content["report_version"] = "0.0.1"
+        changed = True
+    return changed
+
+
+def get_report_summary(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary of errors in report.
+
+    Args:
+        content (dict[str, Any]): Report content.
+
+    Returns:
+        dict[str, Any]: Count of errors, crashed files and message of
+            first error.
+    """
+    errors_count = 0
+    error_message = None
+    plugins_data = content.get("plugins_data") or []
+    for plugin_data in plugins_data:
+        for instance_data in plugin_data.get("instances_data") or []:
+            for log_item in instance_data.get("logs") or []:
+                if log_item.get("type") != "error":
+                    continue
+                errors_count += 1
+                if error_message is None:
+                    error_message = log_item.get("msg")
+
+    return {
+        "plugins_count": len(plugins_data),
+        "instances_count": len(content.get("instances") or {}),
+        "errors_count": errors_count,
+        "crashed_files_count": len(content.get("crashed_file_paths") or {}),
+        "error_message": error_message,
+    }
+
+
+def iter_report_rows(content: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Split report content into rows.
+
+    Args:
+        content (dict[str, Any]): Report content.
+
+    Returns:
+        Iterator[dict[str, Any]]: Report rows.
+    """
+    report_data = {
+        key: value
+        for key, value in content.items()
+        if key not in ("plugins_data", "instances")
+    }
+    report_data["summary"] = get_report_summary(content)
+    yield {"type": "report", "data": report_data}
+
+    for instance_id, instance_data in (
+        content.get("instances") or {}
+    ).items():
+        yield {"type": "instance", "id": instance_id, "data": instance_data}
+
+    for plugin_data in content.get("plugins_data") or []:
+        yield {"type": "plugin", "data": plugin_data}
+
+
+def report_from_rows(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create report content from report rows.
+
+    Args:
+        rows (Iterable[dict[str, Any]]): Report rows.
+
+    Returns:
+        dict[str, Any]: Report content.
+    """
+    content = {}
+    instances = {}
+    plugins_data = []
+    for row in rows:
+        row_type = row["type"]
+        if row_type == "report":
+            content.update(row["data"])
+            content.pop("summary", None)
+        elif row_type == "instance":
+            instances[row["id"]] = row["data"]
+        elif row_type == "plugin":
+            plugins_data.append(row["data"])
+    content["instances"] = instances
+    content["plugins_data"] = plugins_data
+    return content
+
+
+def write_report_rows(filepath: str, rows: Iterable[Dict[str, Any]]):
+    """Write report rows to compressed JSON lines file.
+
+    Rows are written one by one, so the whole report is never serialized
+    into single string.
+
+    Args:
+        filepath (str): Output path.
+        rows (Iterable[dict[str, Any]]): Report rows.
+    """
+    tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+    try:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as stream:
+            for row in rows:
+                stream.write(json.dumps(row))
+                stream.write("\n")
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def read_report_rows(filepath: str) -> Iterator[Dict[str, Any]]:
+    """Read report rows from compressed JSON lines file.
+
+    Args:
+        filepath (str): Path to report rows file.
+
+    Returns:
+        Iterator[dict[str, Any]]: Report rows.
+    """
+    with gzip.open(filepath, "rt", encoding="utf-8") as stream:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class PublishReportStore:
+    """Publish reports stored in a directory.
+
+    Index of reports is kept in a json file next to reports. Index
+    items contain 'id', 'label', 'created_at', 'report_version', 'size',
+    'filename' and 'summary' of the report.
+
+    Reports stored by older versions of publish report viewer, a json file
+    named by report id without extension, are converted on first listing.
+    Original legacy files are moved to 'legacy' subfolder as backup.
+
+    Args:
+        root_dir (str): Directory where reports are stored.
+    """
+    index_filename = "index.json"
+    legacy_dirname = "legacy"
+
+    def __init__(self, root_dir: str):
+        self._root_dir = root_dir
+        self._index = None
+        self._lock = threading.Lock()
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    @property
+    def root_dir(self) -> str:
+        return self._root_dir
+
+    def reset(self):
+        """Force to load index from file on next access."""
+        self._index = None
+
+    def get_items(self) -> List[Dict[str, Any]]:
+        """Index items of all stored reports.
+
+        Returns:
+            list[dict[str, Any]]: Index items.
+        """
+        return [
+            copy.deepcopy(item)
+            for item in self._get_index().values()
+        ]
+
+    def get_item(self, report_id: str) -> Optional[Dict[str, Any]]:
+        item = self._get_index().get(report_id)
+        if item is not None:
+            item = copy.deepcopy(item)
+        return item
+
+    def add_report(
+        self, content: Dict[str, Any], label: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Store report.
+
+        Args:
+            content (dict[str, Any]): Report content.
+            label (Optional[str]): Label of report. Label from report
+                content is used if not passed.
+
+        Returns:
+            dict[str, Any]: Index item of stored report.
+        """
+        _fix_report_content(content)
+        return self._add_report_rows(iter_report_rows(content), label)
+
+    def import_file(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """Import report from file.
+
+        File can be json file exported from publisher or compressed report
+        rows. Report with same id which is already stored is not imported.
+
+        Args:
+            filepath (str): Path to report file.
+
+        Returns:
+            Optional[dict[str, Any]]: Index item of report or None if file
+                could not be imported.
+        """
+        try:
+            if filepath.endswith(REPORT_ROWS_EXT):
+                rows = read_report_rows(filepath)
+                header = next(rows)
+                report_id = header["data"]["id"]
+                item = self.get_item(report_id)
+                if item is not None:
+                    return item
+                return self._add_report_rows(
+                    _chain_rows(header, rows), None
+                )
+
+            with open(filepath, "r") as stream:
+                content = json.load(stream)
+            _fix_report_content(content, os.path.getmtime(filepath))
+            item = self.get_item(content["id"])
+            if item is not None:
+                return item
+            return self.add_report(content)
+
+        except Exception:
+            self.log.warning(
+                f"Failed to import report '{filepath}'", exc_info=True
+            )
+            return None
+
+    def iter_report_rows(self, report_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream rows of stored report.
+
+        Args:
+            report_id (str): Report id.
+
+        Returns:
+            Iterator[dict[str, Any]]: Report rows.
+        """
+        item = self._get_index().get(report_id)
+        if item is None:
+            return iter(())
+        return read_report_rows(
+            os.path.join(self._root_dir, item["filename"])
+        )
+
+    def load_report(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Load full content of stored report.
+
+        Args:
+            report_id (str): Report id.
+
+        Returns:
+            Optional[dict[str, Any]]: Report content or None if report
+                is not stored.
+        """
+        item = self.get_item(report_id)
+        if item is None:
+            return None
+        content = report_from_rows(self.iter_report_rows(report_id))
+        if item["label"]:
+            content["label"] = item["label"]
+        return content
+
+    def set_label(self, report_id: str, label: Optional[str]):
+        """Change label of report.
+
+        Only index is changed, report body is not rewritten.
+
+        Args:
+            report_id (str): Report id.
+            label (Optional[str]): New label.
+        """
+        with self._lock:
+            index = self._get_index()
+            item = index.get(report_id)
+            if item is None or item["label"] == label:
+                return
+            item["label"] = label
+            self._save_index()
+
+    def remove_report(self, report_id: str):
+        """Remove report from index and its file.
+
+        Args:
+            report_id (str): Report id.
+        """
+        with self._lock:
+            index = self._get_index()
+            item = index.pop(report_id, None)
+            if item is None:
+                return
+            self._save_index()
+        filepath = os.path.join(self._root_dir, item["filename"])
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+    def _get_index_path(self):
+        return os.path.join(self._root_dir, self.index_filename)
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _load_index(self):
+        os.makedirs(self._root_dir, exist_ok=True)
+        index = {}
+        index_path = self._get_index_path()
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, "r") as stream:
+                    data = json.load(stream)
+                if data.get("version") == INDEX_VERSION:
+                    index = {
+                        item["id"]: item
+                        for item in data["reports"]
+                    }
+            except Exception:
+                self.log.warning(
+                    "Failed to load publish reports index", exc_info=True
+                )
+
+        changed = False
+        filenames = set(os.listdir(self._root_dir))
+        # Remove reports which were removed from disk
+        for report_id, item in tuple(index.items()):
+            if item["filename"] not in filenames:
+                index.pop(report_id)
+                changed = True
+
+        indexed_filenames = {item["filename"] for item in index.values()}
+        for filename in sorted(filenames - indexed_filenames):
+            filepath = os.path.join(self._root_dir, filename)
+            item = None
+            if filename.endswith(REPORT_ROWS_EXT):
+                # Index was lost, only first row of report is read
+                item = self._create_index_item_from_file(filepath)
+            elif (
+                not os.path.splitext(filename)[-1]
+                and os.path.isfile(filepath)
+            ):
+                # Legacy file is named by report id, conversion is skipped
+                #   if report is already indexed
+                if filename not in index:
+                    item = self._convert_legacy_report(filepath)
+                # Keep file which failed to convert where it is
+                if filename in index or item is not None:
+                    self._backup_legacy_report(filepath)
+
+            if item is not None and item["id"] not in index:
+                index[item["id"]] = item
+                changed = True
+
+        self._index = index
+        if changed:
+            self._save_index()
+        return index
+
+    def _save_index(self):
+        index_path = self._get_index_path()
+        tmp_path = "{}.{}.tmp".format(index_path, os.getpid())
+        data = {
+            "version": INDEX_VERSION,
+            "reports": list(self._get_index().values()),
+        }
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+        os.replace(tmp_path, index_path)
+
+    def _create_index_item(self, report_data, filename, label):
+        if label is None:
+            label = report_data.get("label")
+        return {
+            "id": report_data["id"],
+            "label": label,
+            "created_at": report_data["created_at"],
+            "report_version": report_data["report_version"],
+            "filename": filename,
+            "size": os.path.getsize(os.path.join(self._root_dir, filename)),
+            "summary": report_data.get("summary") or {},
+        }
+
+    def _create_index_item_from_file(self, filepath):
+        try:
+            header = next(read_report_rows(filepath))
+            return self._create_index_item(
+                header["data"], os.path.basename(filepath), None
+            )
+        except Exception:
+            self.log.warning(
+                f"Failed to read report '{filepath}'", exc_info=True
+            )
+            return None
+
+    def _convert_legacy_report(self, filepath):
+        try:
+            with open(filepath, "r") as stream:
+                content = json.load(stream)
+            _fix_report_content(content, os.path.getmtime(filepath))
+            filename = self._write_rows(iter_report_rows(content))
+            item = self._create_index_item(
+                _get_report_data(content), filename, None
+            )
+        except Exception:
+            self.log.warning(
+                f"Failed to convert report '{filepath}'", exc_info=True
+            )
+            return None
+        return item
+
+    def _backup_legacy_report(self, filepath):
+        backup_dir = os.path.join(self._root_dir, self.legacy_dirname)
+        try:
+            os.makedirs(backup_dir, exist_ok=True)
+            os.replace(
+                filepath,
+                os.path.join(backup_dir, os.path.basename(filepath))
+            )
+        except Exception:
+            self.log.warning(
+                f"Failed to move legacy report '{filepath}' to backup",
+                exc_info=True
+            )
+
+    def _write_rows(self, rows):
+        header = next(rows)
+        report_id = header["data"]["id"]
+        filename = f"{report_id}{REPORT_ROWS_EXT}"
+        write_report_rows(
+            os.path.join(self._root_dir, filename),
+            _chain_rows(header, rows)
+        )
+        return filename
+
+    def _add_report_rows(self, rows, label):
+        # Make sure index is loaded before new file is written
+        self._get_index()
+        rows = iter(rows)
+        header = next(rows)
+        filename = self._write_rows(_chain_rows(header, rows))
+        item = self._create_index_item(header["data"], filename, label)
+        with self._lock:
+            self._get_index()[item["id"]] = item
+            self._save_index()
+        return copy.deepcopy(item)
+
+
+def _get_report_data(content):
+    return next(iter_report_rows(content))["data"]
+
+
+def _chain_rows(header, rows):
+    yield header
+    yield from rows
@@ -1,6 +1,4 @@
 import os
-import json
-import uuid
 
 import arrow
 from qtpy import QtWidgets, QtCore, QtGui
@@ -15,6 +13,8 @@ from ayon_core.tools.utils import (
 )
 
 from ayon_core.tools.utils.delegates import PrettyTimeDelegate
+from ayon_core.tools.publisher.models import PublishReportStore
+from ayon_core.tools.publisher.models.report_store import REPORT_ROWS_EXT
 
 if __package__:
     from .widgets import PublishReportViewerWidget
@@ -41,26 +41,22 @@ def get_reports_dir():
 
 
 class PublishReportItem:
-    """Report item representing one file in report directory."""
+    """Report item representing one report in reports store.
 
-    def __init__(self, content):
-        changed = self._fix_content(content)
+    Report content is loaded from store on first access.
 
-        report_path = os.path.join(get_reports_dir(), content["id"])
-        file_modified = None
-        if os.path.exists(report_path):
-            file_modified = os.path.getmtime(report_path)
+    Args:
+        index_item (dict[str, Any]): Index item of report in store.
+        store (PublishReportStore): Store of reports.
+    """
 
-        created_at_obj = arrow.get(content["created_at"]).to("local")
-        created_at = created_at_obj.float_timestamp
+    def __init__(self, index_item, store):
+        created_at_obj = arrow.get(index_item["created_at"]).to("local")
 
-        self.content = content
-        self.report_path = report_path
-        self.file_modified = file_modified
-        self.created_at = float(created_at)
-        self._loaded_label = content.get("label")
-        self._changed = changed
-        self.publish_report = PublishReport(content)
+        self._index_item = index_item
+        self._store = store
+        self.created_at = float(created_at_obj.float_timestamp)
+        self._publish_report = None
 
     @property
     def version(self):
@@ -69,7 +65,7 @@ class PublishReportItem:
         Returns:
             str: Publish report version.
         """
-        return self.content["report_version"]
+        return self._index_item["report_version"]
 
     @property
     def id(self):
@@ -79,7 +75,16 @@ class PublishReportItem:
             str: Publish report id.
         """
 
-        return self.content["id"]
+        return self._index_item["id"]
+
+    @property
+    def summary(self):
+        """Summary of errors in report.
+
+        Returns:
+            dict[str, Any]: Report summary.
+        """
+        return self._index_item["summary"]
 
     def get_label(self):
         """Publish report label.
@@ -88,7 +93,7 @@ class PublishReportItem:
             str: Publish report label showed in UI.
         """
 
-        return self.content.get("label") or "Unfilled label"
+        return self._index_item.get("label") or "Unfilled label"
 
     def set_label(self, label):
         """Set publish report label.
@@ -97,160 +102,41 @@ class PublishReportItem:
             label (str): New publish report label.
         """
 
-        if not label:
-            self.content.pop("label", None)
-        self.content["label"] = label
+        label = label or None
+        self._index_item["label"] = label
+        self._store.set_label(self.id, label)
 
     label = property(get_label, set_label)
 
     @property
     def loaded_label(self):
-        return self._loaded_label
-
-    def mark_as_changed(self):
-        """Mark report as changed."""
-
-        self._changed = True
-
-    def save(self):
-        """Save publish report to file."""
-
-        save = False
-        if (
-            self._changed
-            or self._loaded_label != self.label
-            or not os.path.exists(self.report_path)
-            or self.file_modified != os.path.getmtime(self.report_path)
-        ):
-            save = True
-
-        if not save:
-            return
-
-        with open(self.report_path, "w") as stream:
-            json.dump(self.content, stream)
-
-        self._loaded_label = self.content.get("label")
-        self._changed = False
-        self.file_modified = os.path.getmtime(self.report_path)
-
-    @classmethod
-    def from_filepath(cls, filepath):
-        """Create report item from file.
-
-        Args:
-            filepath (str): Path to report file. Content must be json.
-
-        Returns:
-            PublishReportItem: Report item.
-        """
-
-        if not os.path.exists(filepath):
-            return None
-
-        try:
-            with open(filepath, "r") as stream:
-                content = json.load(stream)
-
-            file_modified = os.path.getmtime(filepath)
-            changed = cls._fix_content(content, file_modified=file_modified)
-            obj = cls(content)
-            if changed:
-                obj.mark_as_changed()
-            return obj
-
-        except Exception:
-            return None
+        return self._index_item.get("label")
 
-    def remove_file(self):
-        """Remove report file."""
-
-        if os.path.exists(self.report_path):
-            os.remove(self.report_path)
-
-    def update_file_content(self):
-        """Update report content in file."""
-
-        if not os.path.exists(self.report_path):
-            return
-
-        file_modified = os.path.getmtime(self.report_path)
-        if file_modified == self.file_modified:
-            return
-
-        with open(self.report_path, "r") as stream:
-            content = json.load(self.content, stream)
-
-        item_id = content.get("id")
-        version = content.get("report_version")
-        if not item_id:
-            item_id = str(uuid.uuid4())
-            content["id"] = item_id
-
-        if not version:
-            version = "0.0.1"
-            content["report_version"] = version
-
-        self.content = content
-        self.file_modified = file_modified
-
-    @classmethod
-    def _fix_content(cls, content, file_modified=None):
-        """Fix content for backward compatibility of older report items.
-
-        Args:
-            content (dict[str, Any]): Report content.
-            file_modified (Optional[float]): File modification time.
+    @property
+    def publish_report(self):
+        """Publish report loaded from store.
 
         Returns:
-            bool: True if content was changed, False otherwise.
+            Union[PublishReport, None]: Publish report or None if report
+                could not be loaded.
         """
-
-        # Fix created_at key
-        changed = cls._fix_created_at(content, file_modified)
-
-        # NOTE backward compatibility for 'id' and 'report_version' is from
-        #    28.10.2022 https://github.com/ynput/OpenPype/pull/4040
-        # We can probably safely remove it
-
-        # Fix missing 'id'
-        item_id = content.get("id")
-        if not item_id:
-            item_id = str(uuid.uuid4())
-            changed = True
-            content["id"] = item_id
-
-        # Fix missing 'report_version'
-        if not content.get("report_version"):
-            changed = True
-            content["report_version"] = "0.0.1"
-        return changed
-
-    @classmethod
-    def _fix_created_at(cls, content, file_modified):
-        # Key 'create_at' was added in report version 1.0.1
-        created_at = content.get("created_at")
-        if created_at:
-            return False
-
-        # Auto fix 'created_at', use file modification time if it is not set
-        #   or current time if modification could not be received.
-        if file_modified is not None:
-            created_at_obj = arrow.Arrow.fromtimestamp(file_modified)
-        else:
-            created_at_obj = arrow.utcnow()
-        content["created_at"] = created_at_obj.to("local").isoformat()
-        return True
+        if self._publish_report is None:
+            content = self._store.load_report(self.id)
+            if content is not None:
+                self._publish_report = PublishReport(content)
+        return self._publish_report
 
 
 class PublisherReportHandler:
     """Class handling storing publish report items."""
 
     def __init__(self):
+        self._store = PublishReportStore(get_reports_dir())
         self._reports = None
         self._reports_by_id = {}
 
     def reset(self):
+        self._store.reset()
         self._reports = None
         self._reports_by_id = {}
 
@@ -258,23 +144,39 @@ class PublisherReportHandler:
         if self._reports is not None:
             return self._reports
 
+        # Only index is loaded, report content is loaded on demand
         reports = []
         reports_by_id = {}
-        report_dir = get_reports_dir()
-        for filename in os.listdir(report_dir):
-            ext = os.path.splitext(filename)[-1]
-            if ext == ".json":
-                continue
-            filepath = os.path.join(report_dir, filename)
-            item = PublishReportItem.from_filepath(filepath)
-            if item is not None:
-                reports.append(item)
-                reports_by_id[item.id] = item
+        for index_item in self._store.get_items():
+            item = PublishReportItem(index_item, self._store)
+            reports.append(item)
+            reports_by_id[item.id] = item
 
         self._reports = reports
         self._reports_by_id = reports_by_id
         return reports
 
+    def add_filepath(self, filepath):
+        """Add report from file to store.
+
+        Args:
+            filepath (str): Path to exported report.
+
+        Returns:
+            Union[PublishReportItem, None]: Report item or None if file
+                does not contain valid report.
+        """
+        index_item = self._store.import_file(filepath)
+        if index_item is None:
+            return None
+        item = self._reports_by_id.get(index_item["id"])
+        if item is None:
+            item = PublishReportItem(index_item, self._store)
+            self._reports_by_id[item.id] = item
+            if self._reports is not None:
+                self._reports.append(item)
+        return item
+
     def remove_report_item(self, item_id):
         """Remove report item by id.
 
@@ -284,13 +186,15 @@ class PublisherReportHandler:
             item_id (str): Report item id.
         """
 
-        item = self._reports_by_id.get(item_id)
-        if item:
-            try:
-                item.remove_file()
-                self._reports_by_id.get(item_id)
-            except Exception:
-                pass
+        item = self._reports_by_id.pop(item_id, None)
+        if item is None:
+            return
+        if self._reports is not None:
+            self._reports.remove(item)
+        try:
+            self._store.remove_report(item_id)
+        except Exception:
+            pass
 
 
 class LoadedFilesModel(QtGui.QStandardItemModel):
@@ -356,7 +260,6 @@ class LoadedFilesModel(QtGui.QStandardItemModel):
             report_item = self._report_items_by_id.get(item_id)
             if report_item is not None:
                 report_item.label = value
-                report_item.save()
                 value = report_item.label
 
         return super().setData(index, value, role)
@@ -375,6 +278,14 @@ class LoadedFilesModel(QtGui.QStandardItemModel):
         item.setColumnCount(self.columnCount())
         item.setData(report_item.id, ITEM_ID_ROLE)
         item.setData(report_item.created_at, ITEM_CREATED_AT_ROLE)
+        summary = report_item.summary
+        if summary.get("errors_count"):
+            item.setData(
+                "Errors: {}\n{}".format(
+                    summary["errors_count"], summary.get("error_message")
+                ),
+                QtCore.Qt.ToolTipRole
+            )
 
         return item
 
@@ -399,7 +310,7 @@ class LoadedFilesModel(QtGui.QStandardItemModel):
 
         new_items = []
         for normalized_path in filtered_paths:
-            report_item = PublishReportItem.from_filepath(normalized_path)
+            report_item = self._handler.add_filepath(normalized_path)
             if report_item is None:
                 continue
 
@@ -409,16 +320,18 @@ class LoadedFilesModel(QtGui.QStandardItemModel):
                 continue
 
             if not report_item.loaded_label:
-                report_item.label = (
-                    os.path.splitext(os.path.basename(filepath))[0]
-                )
+                filename = os.path.basename(normalized_path)
+                if filename.endswith(REPORT_ROWS_EXT):
+                    label = filename[:-len(REPORT_ROWS_EXT)]
+                else:
+                    label = os.path.splitext(filename)[0]
+                report_item.label = label
 
             item = self._create_item(report_item)
             if item is None:
                 continue
 
             new_items.append(item)
-            report_item.save()
             self._items_by_id[report_item.id] = item
             self._report_items_by_id[report_item.id] = report_item
 
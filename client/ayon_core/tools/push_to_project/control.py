@@ -1,4 +1,5 @@
 import threading
+import collections
 
 import ayon_api
 
@@ -28,6 +29,7 @@ class PushToContextController:
 
         self._src_project_name = None
         self._src_version_id = None
+        self._src_version_ids = []
         self._src_folder_entity = None
         self._src_folder_task_entities = {}
         self._src_product_entity = None
@@ -36,7 +38,7 @@ class PushToContextController:
 
         self._submission_enabled = False
         self._process_thread = None
-        self._process_item_id = None
+        self._process_batch_id = None
 
         self.set_source(project_name, version_id)
 
@@ -59,14 +61,37 @@ class PushToContextController:
             version_id (Union[str, None]): Source version id.
         """
 
+        version_ids = []
+        if version_id:
+            version_ids.append(version_id)
+        self.set_source_versions(project_name, version_ids)
+
+    def set_source_versions(self, project_name, version_ids):
+        """Set source project and versions.
+
+        All versions are pushed to the same destination. User values are
+            filled based on the first version.
+
+        Args:
+            project_name (Union[str, None]): Source project name.
+            version_ids (Iterable[str]): Source version ids.
+        """
+
+        # Remove duplicates and keep order
+        version_ids = list(dict.fromkeys(version_ids))
         if (
             project_name == self._src_project_name
-            and version_id == self._src_version_id
+            and version_ids == self._src_version_ids
         ):
             return
 
+        version_id = None
+        if version_ids:
+            version_id = version_ids[0]
+
         self._src_project_name = project_name
         self._src_version_id = version_id
+        self._src_version_ids = version_ids
         self._src_label = None
         folder_entity = None
         task_entities = {}
@@ -101,7 +126,9 @@ class PushToContextController:
         self._src_version_entity = version_entity
         if folder_entity:
             self._user_values.set_new_folder_name(folder_entity["name"])
-            variant = self._get_src_variant()
+            variant = self._get_variant(
+                project_name, version_entity, product_entity, task_entities
+            )
             if variant:
                 self._user_values.set_variant(variant)
 
@@ -113,7 +140,8 @@ class PushToContextController:
             "source.changed",
             {
                 "project_name": project_name,
-                "version_id": version_id
+                "version_id": version_id,
+                "version_ids": list(version_ids),
             }
         )
 
@@ -168,6 +196,9 @@ class PushToContextController:
     def get_process_item_status(self, item_id):
         return self._integrate_model.get_item_status(item_id)
 
+    def get_batch_status(self, batch_id):
+        return self._integrate_model.get_batch_status(batch_id)
+
     # Processing methods
     def submit(self, wait=True):
         if not self._submission_enabled:
@@ -176,29 +207,21 @@ class PushToContextController:
         if self._process_thread is not None:
             return
 
-        item_id = self._integrate_model.create_process_item(
-            self._src_project_name,
-            self._src_version_id,
-            self._selection_model.get_selected_project_name(),
-            self._selection_model.get_selected_folder_id(),
-            self._selection_model.get_selected_task_name(),
-            self._user_values.variant,
-            comment=self._user_values.comment,
-            new_folder_name=self._user_values.new_folder_name,
-            dst_version=1
+        batch_id = self._integrate_model.create_batch_process(
+            self._get_push_items_data()
         )
 
-        self._process_item_id = item_id
+        self._process_batch_id = batch_id
         self._emit_event("submit.started")
         if wait:
             self._submit_callback()
-            self._process_item_id = None
-            return item_id
+            self._process_batch_id = None
+            return batch_id
 
         thread = threading.Thread(target=self._submit_callback)
         self._process_thread = thread
         thread.start()
-        return item_id
+        return batch_id
 
     def wait_for_process_thread(self):
         if self._process_thread is None:
@@ -217,12 +240,99 @@ class PushToContextController:
         folder_path = folder_entity["path"]
         product_entity = self._src_product_entity
         version_entity = self._src_version_entity
-        return "Source: {}{}/{}/v{:0>3}".format(
+        label = "Source: {}{}/{}/v{:0>3}".format(
             self._src_project_name,
             folder_path,
             product_entity["name"],
             version_entity["version"]
         )
+        other_count = len(self._src_version_ids) - 1
+        if other_count:
+            label += " (+{} more versions)".format(other_count)
+        return label
+
+    def _get_push_items_data(self):
+        """Data of items to push for each source version.
+
+        First version uses variant from user values. Other versions use
+            variant of their source product and are integrated as next
+            version of destination product.
+
+        Returns:
+            list[dict[str, Any]]: Data for 'create_batch_process'.
+        """
+        project_name = self._src_project_name
+        base_data = {
+            "src_project_name": project_name,
+            "dst_project_name": (
+                self._selection_model.get_selected_project_name()
+            ),
+            "dst_folder_id": self._selection_model.get_selected_folder_id(),
+            "dst_task_name": self._selection_model.get_selected_task_name(),
+            "comment": self._user_values.comment,
+            "new_folder_name": self._user_values.new_folder_name,
+        }
+        items_data = [{
+            **base_data,
+            "src_version_id": self._src_version_id,
+            "variant": self._user_values.variant,
+            "dst_version": 1 if len(self._src_version_ids) == 1 else None,
+        }]
+        other_version_ids = self._src_version_ids[1:]
+        if not other_version_ids:
+            return items_data
+
+        version_entities_by_id = {
+            version_entity["id"]: version_entity
+            for version_entity in ayon_api.get_versions(
+                project_name, version_ids=other_version_ids
+            )
+        }
+        product_entities_by_id = {
+            product_entity["id"]: product_entity
+            for product_entity in ayon_api.get_products(
+                project_name,
+                product_ids={
+                    version_entity["productId"]
+                    for version_entity in version_entities_by_id.values()
+                }
+            )
+        }
+        task_entities_by_folder_id = collections.defaultdict(dict)
+        for task_entity in ayon_api.get_tasks(
+            project_name,
+            folder_ids={
+                product_entity["folderId"]
+                for product_entity in product_entities_by_id.values()
+            }
+        ):
+            task_entities_by_folder_id[task_entity["folderId"]][
+                task_entity["name"]
+            ] = task_entity
+
+        for version_id in other_version_ids:
+            # Missing version is not skipped so the push item fails
+            version_entity = version_entities_by_id.get(version_id)
+            product_entity = None
+            if version_entity:
+                product_entity = product_entities_by_id.get(
+                    version_entity["productId"]
+                )
+            variant = None
+            if product_entity:
+                variant = self._get_variant(
+                    project_name,
+                    version_entity,
+                    product_entity,
+                    task_entities_by_folder_id[product_entity["folderId"]],
+                )
+            items_data.append({
+                **base_data,
+                "src_version_id": version_id,
+                "variant": variant or self._user_values.variant,
+                "dst_version": None,
+            })
+        return items_data
 
     def _get_task_info_from_repre_entities(
         self, task_entities, repre_entities
@@ -254,10 +364,9 @@ class PushToContextController:
             return task_name, task_type
         return None, None
 
-    def _get_src_variant(self):
-        project_name = self._src_project_name
-        version_entity = self._src_version_entity
-        task_entities = self._src_folder_task_entities
+    def _get_variant(
+        self, project_name, version_entity, product_entity, task_entities
+    ):
         repre_entities = ayon_api.get_representations(
             project_name, version_ids={version_entity["id"]}
         )
@@ -266,9 +375,9 @@ class PushToContextController:
         )
 
         project_settings = get_project_settings(project_name)
-        product_type = self._src_product_entity["productType"]
+        product_type = product_entity["productType"]
         template = get_product_name_template(
-            self._src_project_name,
+            project_name,
             product_type,
             task_name,
             task_type,
@@ -300,7 +409,7 @@ class PushToContextController:
             print("Failed format", exc)
             return ""
 
-        product_name = self._src_product_entity["name"]
+        product_name = product_entity["name"]
         if (
             (product_s and not product_name.startswith(product_s))
             or (product_e and not product_name.endswith(product_e))
@@ -338,13 +447,13 @@ class PushToContextController:
         )
 
     def _submit_callback(self):
-        process_item_id = self._process_item_id
-        if process_item_id is None:
+        process_batch_id = self._process_batch_id
+        if process_batch_id is None:
             return
-        self._integrate_model.integrate_item(process_item_id)
+        self._integrate_model.integrate_batch(process_batch_id)
         self._emit_event("submit.finished", {})
-        if process_item_id == self._process_item_id:
-            self._process_item_id = None
+        if process_batch_id == self._process_batch_id:
+            self._process_batch_id = None
 
     def _emit_event(self, topic, data=None):
         if data is None:
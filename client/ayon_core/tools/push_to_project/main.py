@@ -4,25 +4,31 @@ from ayon_core.tools.utils import get_ayon_qt_app
 from ayon_core.tools.push_to_project.ui import PushToContextSelectWindow
 
 
-def main_show(project_name, version_id):
+def main_show(project_name, version_ids):
     app = get_ayon_qt_app()
 
     window = PushToContextSelectWindow()
     window.show()
-    window.set_source(project_name, version_id)
+    if isinstance(version_ids, str):
+        version_ids = [version_ids]
+    window.set_source_versions(project_name, version_ids or [])
 
     app.exec_()
 
 
 @click.command()
 @click.option("--project", help="Source project name")
-@click.option("--version", help="Source version id")
+@click.option(
+    "--version",
+    multiple=True,
+    help="Source version id, can be used multiple times",
+)
 def main(project, version):
-    """Run PushToProject tool to integrate version in different project.
+    """Run PushToProject tool to integrate versions in different project.
 
     Args:
         project (str): Source project name.
-        version (str): Version id.
+        version (tuple[str, ...]): Version ids.
     """
 
     main_show(project, version)
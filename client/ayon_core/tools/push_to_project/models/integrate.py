@@ -3,8 +3,11 @@ import re
 import copy
 import itertools
 import sys
+import threading
 import traceback
 import uuid
+import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import ayon_api
 from ayon_api.utils import create_entity_id
@@ -17,6 +20,7 @@ from ayon_api.operations import (
 )
 
 from ayon_core.lib import (
+    FormatObject,
     StringTemplate,
     source_hash,
 )
@@ -29,12 +33,27 @@ from ayon_core.pipeline.publish import get_publish_template_name
 from ayon_core.pipeline.create import get_product_name, TaskNotSetError
 
 UNKNOWN = object()
+# Default number of threads used to transfer files
+DEFAULT_MAX_TRANSFER_WORKERS = 8
 
 
 class PushToProjectError(Exception):
     pass
 
 
+def _get_path_device(path):
+    """Device of path or of its closest existing parent directory."""
+    while path:
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+    return None
+
+
 class FileItem(object):
     def __init__(self, path):
         self.path = path
@@ -371,7 +390,6 @@ class ProjectPushRepreItem:
                 resource_files.append(ResourceFile(filepath, relative_path))
                 continue
 
-            filepath = os.path.join(src_dirpath, basename)
             frame = None
             udim = None
             for item in src_basename_regex.finditer(basename):
@@ -418,19 +436,474 @@ class ProjectPushRepreItem:
         return src_files, resource_files
 
 
+class _FilePlaceholder(FormatObject):
+    """Placeholder of per-file value in pre-formatted file template.
+
+    Each used format specification gets own token so the value can be
+    formatted the same way as template would do it.
+    """
+
+    def __init__(self, key):
+        super(_FilePlaceholder, self).__init__()
+        self.key = key
+        self.value = "__{}_{}__".format(key, uuid.uuid4().hex)
+        self._tokens_by_spec = {}
+
+    def __format__(self, format_spec):
+        token = self._tokens_by_spec.get(format_spec)
+        if token is None:
+            token = "{}{}__".format(self.value, len(self._tokens_by_spec))
+            self._tokens_by_spec[format_spec] = token
+        return token
+
+    def fill(self, text, value):
+        for format_spec, token in self._tokens_by_spec.items():
+            text = text.replace(token, format(value, format_spec))
+        return text
+
+
+class _FilenameTemplate:
+    """File template of representation formatted once for all files.
+
+    Template is formatted with placeholders for 'frame' and 'udim' and
+    the placeholders are replaced for each file. Full formatting is used
+    if output with placeholders does not match output of full formatting.
+
+    Args:
+        template (AnatomyStringTemplate): File template.
+        format_data (dict[str, Any]): Formatting data of representation.
+    """
+
+    def __init__(self, template, format_data):
+        self._template = template
+        self._format_data = format_data
+        self._compiled_by_key = {}
+
+    def format_strict(self, frame=None, udim=None):
+        """Full formatting of template.
+
+        Returns:
+            AnatomyTemplateResult: Formatted filename.
+        """
+        data = dict(self._format_data)
+        if frame is not None:
+            data["frame"] = frame
+        if udim is not None:
+            data["udim"] = udim
+        return self._template.format_strict(data)
+
+    def format(self, frame=None, udim=None):
+        """Filename of file with frame and udim.
+
+        Returns:
+            str: Formatted filename.
+        """
+        key = (frame is not None, udim is not None)
+        compiled = self._compiled_by_key.get(key, UNKNOWN)
+        if compiled is UNKNOWN:
+            compiled = self._compile(frame, udim)
+            self._compiled_by_key[key] = compiled
+
+        if compiled is None:
+            return str(self.format_strict(frame, udim))
+        return self._fill(compiled, frame, udim)
+
+    def _fill(self, compiled, frame, udim):
+        filename, placeholders = compiled
+        values = {"frame": frame, "udim": udim}
+        for placeholder in placeholders:
+            filename = placeholder.fill(filename, values[placeholder.key])
+        return filename
+
+    def _compile(self, frame, udim):
+        data = dict(self._format_data)
+        placeholders = []
+        for key, value in (("frame", frame), ("udim", udim)):
+            if value is not None:
+                placeholder = _FilePlaceholder(key)
+                data[key] = placeholder
+                placeholders.append(placeholder)
+
+        try:
+            result = self._template.format_strict(data)
+        except Exception:
+            return None
+
+        compiled = (str(result), placeholders)
+        expected = str(self.format_strict(frame, udim))
+        if self._fill(compiled, frame, udim) != expected:
+            return None
+        return compiled
+
+
+class ProjectPushEntitiesCache:
+    """Cache of entities used during push.
+
+    Entities are queried one by one on demand, or in bulk for multiple
+    push items with 'prefetch'. Entities created during push are added to
+    the cache so following items can use them before they're committed.
+    Id of item which created the entity is stored, so items using it can
+    be skipped when the item fails.
+    """
+
+    def __init__(self):
+        self._projects = {}
+        self._anatomies = {}
+        self._project_settings = {}
+        self._folders = collections.defaultdict(dict)
+        self._child_folders = collections.defaultdict(dict)
+        self._tasks = collections.defaultdict(dict)
+        self._products = collections.defaultdict(dict)
+        self._products_by_name = collections.defaultdict(dict)
+        self._product_folder_ids = collections.defaultdict(set)
+        self._versions = collections.defaultdict(dict)
+        self._last_versions = collections.defaultdict(dict)
+        self._created_versions = collections.defaultdict(dict)
+        self._repre_entities = collections.defaultdict(dict)
+        self._created_ids = {}
+
+    def prefetch(self, items):
+        """Query entities of push items in bulk.
+
+        Args:
+            items (Iterable[ProjectPushItem]): Items which will be pushed.
+        """
+        src_version_ids = collections.defaultdict(set)
+        dst_folder_ids = collections.defaultdict(set)
+        for item in items:
+            src_version_ids[item.src_project_name].add(item.src_version_id)
+            if item.dst_folder_id:
+                dst_folder_ids[item.dst_project_name].add(
+                    item.dst_folder_id
+                )
+
+        for project_name, version_ids in src_version_ids.items():
+            if self.get_project(project_name):
+                self._prefetch_source(project_name, version_ids)
+
+        for project_name, folder_ids in dst_folder_ids.items():
+            if self.get_project(project_name):
+                self._prefetch_destination(project_name, folder_ids)
+
+    def get_project(self, project_name):
+        if project_name not in self._projects:
+            self._projects[project_name] = ayon_api.get_project(project_name)
+        return self._projects[project_name]
+
+    def get_anatomy(self, project_name):
+        anatomy = self._anatomies.get(project_name)
+        if anatomy is None:
+            anatomy = Anatomy(
+                project_name,
+                project_entity=self.get_project(project_name)
+            )
+            self._anatomies[project_name] = anatomy
+        return anatomy
+
+    def get_project_settings(self, project_name):
+        project_settings = self._project_settings.get(project_name)
+        if project_settings is None:
+            project_settings = get_project_settings(project_name)
+            self._project_settings[project_name] = project_settings
+        return project_settings
+
+    def get_folder(self, project_name, folder_id):
+        folders = self._folders[project_name]
+        if folder_id not in folders:
+            folders[folder_id] = ayon_api.get_folder_by_id(
+                project_name, folder_id, own_attributes=True
+            )
+        return folders[folder_id]
+
+    def get_child_folders(self, project_name, parent_id):
+        child_folders = self._child_folders[project_name]
+        if parent_id not in child_folders:
+            child_folders[parent_id] = list(ayon_api.get_folders(
+                project_name,
+                parent_ids=[parent_id],
+                fields={"id", "name", "parentId"}
+            ))
+        return child_folders[parent_id]
+
+    def get_creator_item_id(self, entity_id):
+        """Id of push item which created entity.
+
+        Args:
+            entity_id (str): Entity id.
+
+        Returns:
+            Union[str, None]: Item id or None if entity was not created
+                during push.
+        """
+        return self._created_ids.get(entity_id)
+
+    def add_folder(self, project_name, folder_entity, item_id=None):
+        """Add created folder entity."""
+        folder_id = folder_entity["id"]
+        self._created_ids[folder_id] = item_id
+        self._folders[project_name][folder_id] = folder_entity
+        self._tasks[project_name][folder_id] = []
+        self._product_folder_ids[project_name].add(folder_id)
+        self.get_child_folders(
+            project_name, folder_entity["parentId"]
+        ).append(folder_entity)
+
+    def get_tasks(self, project_name, folder_id):
+        tasks = self._tasks[project_name]
+        if folder_id not in tasks:
+            tasks[folder_id] = list(ayon_api.get_tasks(
+                project_name, folder_ids=[folder_id]
+            ))
+        return tasks[folder_id]
+
+    def get_product(self, project_name, product_id):
+        products = self._products[project_name]
+        if product_id not in products:
+            products[product_id] = ayon_api.get_product_by_id(
+                project_name, product_id
+            )
+        return products[product_id]
+
+    def get_product_by_name(self, project_name, product_name, folder_id):
+        key = (folder_id, product_name.lower())
+        products_by_name = self._products_by_name[project_name]
+        if (
+            key not in products_by_name
+            and folder_id not in self._product_folder_ids[project_name]
+        ):
+            products_by_name[key] = ayon_api.get_product_by_name(
+                project_name, product_name, folder_id
+            )
+        return products_by_name.get(key)
+
+    def add_product(self, project_name, product_entity, item_id=None):
+        """Add created product entity."""
+        product_id = product_entity["id"]
+        self._created_ids[product_id] = item_id
+        self._products[project_name][product_id] = product_entity
+        self._last_versions[project_name][product_id] = None
+        key = (product_entity["folderId"], product_entity["name"].lower())
+        self._products_by_name[project_name][key] = product_entity
+
+    def get_version(self, project_name, version_id):
+        versions = self._versions[project_name]
+        if version_id not in versions:
+            versions[version_id] = ayon_api.get_version_by_id(
+                project_name, version_id
+            )
+        return versions[version_id]
+
+    def get_last_version(self, project_name, product_id):
+        last_versions = self._last_versions[project_name]
+        if product_id not in last_versions:
+            last_versions[product_id] = (
+                ayon_api.get_last_version_by_product_id(
+                    project_name, product_id
+                )
+            )
+        last_version = last_versions[product_id]
+        for version_entity in self._created_versions[project_name].get(
+            product_id, {}
+        ).values():
+            if (
+                last_version is None
+                or version_entity["version"] > last_version["version"]
+            ):
+                last_version = version_entity
+        return last_version
+
+    def get_version_by_name(self, project_name, version, product_id):
+        created_versions = self._created_versions[project_name].get(
+            product_id, {}
+        )
+        if version in created_versions:
+            return created_versions[version]
+        if product_id in self._created_ids:
+            return None
+        return ayon_api.get_version_by_name(
+            project_name, version, product_id
+        )
+
+    def add_version(self, project_name, version_entity, item_id=None):
+        """Add created version entity."""
+        version_id = version_entity["id"]
+        self._created_ids[version_id] = item_id
+        self._versions[project_name][version_id] = version_entity
+        self._repre_entities[project_name][version_id] = []
+        self._created_versions[project_name].setdefault(
+            version_entity["productId"], {}
+        )[version_entity["version"]] = version_entity
+
+    def get_representations(self, project_name, version_id):
+        repre_entities = self._repre_entities[project_name]
+        if version_id not in repre_entities:
+            repre_entities[version_id] = list(ayon_api.get_representations(
+                project_name, version_ids={version_id}
+            ))
+        return repre_entities[version_id]
+
+    def discard_created(self, project_name, entities):
+        """Remove created entities which won't be committed.
+
+        Args:
+            project_name (str): Project name.
+            entities (Iterable[tuple[str, dict[str, Any]]]): Entity type and
+                entity created by failed push item.
+        """
+        for entity_type, entity in entities:
+            entity_id = entity["id"]
+            self._created_ids.pop(entity_id, None)
+            if entity_type == "folder":
+                self._folders[project_name].pop(entity_id, None)
+                child_folders = self._child_folders[project_name].get(
+                    entity["parentId"], []
+                )
+                if entity in child_folders:
+                    child_folders.remove(entity)
+
+            elif entity_type == "product":
+                self._products[project_name].pop(entity_id, None)
+                key = (entity["folderId"], entity["name"].lower())
+                self._products_by_name[project_name].pop(key, None)
+
+            elif entity_type == "version":
+                self._versions[project_name].pop(entity_id, None)
+                self._created_versions[project_name].get(
+                    entity["productId"], {}
+                ).pop(entity["version"], None)
+
+    def _prefetch_source(self, project_name, version_ids):
+        versions = self._versions[project_name]
+        for version_id in version_ids:
+            versions[version_id] = None
+        for version_entity in ayon_api.get_versions(
+            project_name, version_ids=version_ids
+        ):
+            versions[version_entity["id"]] = version_entity
+
+        product_ids = {
+            version_entity["productId"]
+            for version_entity in versions.values()
+            if version_entity
+        }
+        products = self._products[project_name]
+        for product_id in product_ids:
+            products[product_id] = None
+        if product_ids:
+            for product_entity in ayon_api.get_products(
+                project_name, product_ids=product_ids, active=None
+            ):
+                products[product_entity["id"]] = product_entity
+
+        folder_ids = {
+            products[product_id]["folderId"]
+            for product_id in product_ids
+            if products[product_id]
+        }
+        folders = self._folders[project_name]
+        for folder_id in folder_ids:
+            folders[folder_id] = None
+        if folder_ids:
+            for folder_entity in ayon_api.get_folders(
+                project_name,
+                folder_ids=folder_ids,
+                active=None,
+                own_attributes=True,
+            ):
+                folders[folder_entity["id"]] = folder_entity
+
+        repre_entities = self._repre_entities[project_name]
+        for version_id in version_ids:
+            repre_entities[version_id] = []
+        for repre_entity in ayon_api.get_representations(
+            project_name, version_ids=version_ids
+        ):
+            repre_entities[repre_entity["versionId"]].append(repre_entity)
+
+    def _prefetch_destination(self, project_name, folder_ids):
+        folders = self._folders[project_name]
+        tasks = self._tasks[project_name]
+        child_folders = self._child_folders[project_name]
+        for folder_id in folder_ids:
+            folders.setdefault(folder_id, None)
+            tasks[folder_id] = []
+            child_folders[folder_id] = []
+
+        for folder_entity in ayon_api.get_folders(
+            project_name,
+            folder_ids=folder_ids,
+            active=None,
+            own_attributes=True,
+        ):
+            folders[folder_entity["id"]] = folder_entity
+
+        for folder_entity in ayon_api.get_folders(
+            project_name,
+            parent_ids=folder_ids,
+            fields={"id", "name", "parentId"},
+        ):
+            child_folders[folder_entity["parentId"]].append(folder_entity)
+
+        for task_entity in ayon_api.get_tasks(
+            project_name, folder_ids=folder_ids
+        ):
+            tasks[task_entity["folderId"]].append(task_entity)
+
+        products = self._products[project_name]
+        products_by_name = self._products_by_name[project_name]
+        for product_entity in ayon_api.get_products(
+            project_name, folder_ids=folder_ids, active=None
+        ):
+            products[product_entity["id"]] = product_entity
+            key = (product_entity["folderId"], product_entity["name"].lower())
+            products_by_name[key] = product_entity
+        self._product_folder_ids[project_name] |= set(folder_ids)
+
+        product_ids = [
+            product_entity["id"]
+            for (folder_id, _), product_entity in products_by_name.items()
+            if folder_id in folder_ids
+        ]
+        if not product_ids:
+            return
+        last_versions = self._last_versions[project_name]
+        last_versions.update(
+            ayon_api.get_last_versions(project_name, product_ids)
+        )
+
+
 class ProjectPushItemProcess:
     """
     Args:
         model (IntegrateModel): Model which is processing item.
         item (ProjectPushItem): Item which is being processed.
+        entities_cache (Optional[ProjectPushEntitiesCache]): Cache of
+            entities shared with other items.
+        max_transfer_workers (Optional[int]): Number of threads used to
+            transfer files.
+        use_hardlinks (bool): Hardlink files instead of copying them when
+            source and destination are on the same device.
     """
 
     # TODO where to get host?!!!
     host_name = "republisher"
 
-    def __init__(self, model, item):
+    def __init__(
+        self,
+        model,
+        item,
+        entities_cache=None,
+        max_transfer_workers=None,
+        use_hardlinks=False,
+    ):
+        if entities_cache is None:
+            entities_cache = ProjectPushEntitiesCache()
+        if max_transfer_workers is None:
+            max_transfer_workers = DEFAULT_MAX_TRANSFER_WORKERS
         self._model = model
         self._item = item
+        self._entities_cache = entities_cache
+        self._use_hardlinks = use_hardlinks
 
         self._src_folder_entity = None
         self._src_product_entity = None
@@ -452,10 +925,22 @@ class ProjectPushItemProcess:
 
         self._status = ProjectPushItemStatus()
         self._operations = OperationsSession()
-        self._file_transaction = FileTransaction()
+        self._file_transaction = FileTransaction(
+            max_workers=max_transfer_workers
+        )
+        self._transfers_count = 0
+        self._created_entities = []
+        self._dependency_item_ids = set()
+        self._processed_repre_items = None
+        self._path_template = None
+        self._existing_repres_by_low_name = None
 
         self._messages = []
 
+    @property
+    def item(self):
+        return self._item
+
     @property
     def item_id(self):
         return self._item.item_id
@@ -464,48 +949,175 @@ class ProjectPushItemProcess:
     def started(self):
         return self._status.started
 
+    @property
+    def finished(self):
+        return self._status.finished
+
+    @property
+    def failed(self):
+        return self._status.failed
+
+    @property
+    def transfers_count(self):
+        return self._transfers_count
+
+    @property
+    def dependency_item_ids(self):
+        """Ids of items which created entities used by this item.
+
+        Returns:
+            set[str]: Item ids.
+        """
+        return set(self._dependency_item_ids)
+
     def get_status_data(self):
         return self._status.to_data()
 
     def integrate(self):
+        if self.prepare() and self.transfer_files():
+            self.commit()
+
+    def prepare(self):
+        """Find or create destination entities and prepare file transfers.
+
+        Returns:
+            bool: Item is ready to transfer files.
+        """
         self._status.started = True
-        try:
-            self._log_info("Process started")
-            self._fill_source_variables()
-            self._log_info("Source entities were found")
-            self._fill_destination_project()
-            self._log_info("Destination project was found")
-            self._fill_or_create_destination_folder()
-            self._log_info("Destination folder was determined")
-            self._determine_product_type()
-            self._determine_publish_template_name()
-            self._determine_product_name()
-            self._make_sure_product_exists()
-            self._make_sure_version_exists()
-            self._log_info("Prerequirements were prepared")
-            self._integrate_representations()
-            self._log_info("Integration finished")
-
-        except PushToProjectError as exc:
+        return self._run_step(self._prepare)
+
+    def transfer_files(self, progress_callback=None):
+        """Transfer files to destination.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                with number of transferred and all files.
+
+        Returns:
+            bool: Files were transferred.
+        """
+        return self._run_step(self._transfer_files, progress_callback)
+
+    def transfer_files_silent(self, progress_callback=None):
+        """Transfer files without emitting events on failure.
+
+        Can be called from other threads. Returned error must be passed to
+        'handle_error' in thread which emits events.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                with number of transferred and all files.
+
+        Returns:
+            Union[tuple, None]: Exception info if transfer failed.
+        """
+        return self._call_step(self._transfer_files, progress_callback)
+
+    def handle_error(self, exc_info):
+        """Mark item as failed and discard created entities.
+
+        Args:
+            exc_info (tuple): Exception info of failed step.
+        """
+        exc = exc_info[1]
+        if isinstance(exc, PushToProjectError):
             if not self._status.failed:
                 self._status.set_failed(str(exc))
-
-        except Exception as exc:
-            _exc, _value, _tb = sys.exc_info()
+        else:
             self._status.set_failed(
                 "Unhandled error happened: {}".format(str(exc)),
-                (_exc, _value, _tb)
+                exc_info
             )
 
-        finally:
-            self._status.finished = True
-            self._emit_event(
-                "push.finished.changed",
-                {
-                    "finished": True,
-                    "item_id": self.item_id,
-                }
+        self._entities_cache.discard_created(
+            self._item.dst_project_name, self._created_entities
+        )
+        self._finish()
+
+    def cancel(self, reason):
+        """Cancel prepared item which won't be committed.
+
+        Transferred files are removed and created entities are discarded.
+
+        Args:
+            reason (str): Reason why item was canceled.
+        """
+        if self._status.finished:
+            return
+        self._status.set_failed(reason)
+        self._log_error(reason)
+        exc_info = self._call_step(self._rollback)
+        if exc_info is not None:
+            self.handle_error(exc_info)
+            return
+        self._entities_cache.discard_created(
+            self._item.dst_project_name, self._created_entities
+        )
+        self._finish()
+
+    def commit(self):
+        """Commit database changes and remove backup files.
+
+        Returns:
+            bool: Item was integrated.
+        """
+        success = self._run_step(self._commit)
+        if success:
+            self._finish()
+        return success
+
+    def _run_step(self, func, *args):
+        exc_info = self._call_step(func, *args)
+        if exc_info is None:
+            return True
+        self.handle_error(exc_info)
+        return False
+
+    def _call_step(self, func, *args):
+        try:
+            func(*args)
+        except Exception:
+            return sys.exc_info()
+        return None
+
+    def _finish(self):
+        self._status.finished = True
+        self._emit_event(
+            "push.finished.changed",
+            {
+                "finished": True,
+                "item_id": self.item_id,
+            }
+        )
+
+    def _prepare(self):
+        self._log_info("Process started")
+        self._fill_source_variables()
+        self._log_info("Source entities were found")
+        self._fill_destination_project()
+        self._log_info("Destination project was found")
+        self._fill_or_create_destination_folder()
+        self._log_info("Destination folder was determined")
+        self._determine_product_type()
+        self._determine_publish_template_name()
+        self._determine_product_name()
+        self._make_sure_product_exists()
+        self._make_sure_version_exists()
+        self._collect_dependencies()
+        self._log_info("Prerequirements were prepared")
+        self._prepare_representations()
+
+    def _collect_dependencies(self):
+        for entity in (
+            self._folder_entity,
+            self._product_entity,
+            self._version_entity,
+        ):
+            creator_id = self._entities_cache.get_creator_item_id(
+                entity["id"]
             )
+            if creator_id and creator_id != self.item_id:
+                self._dependency_item_ids.add(creator_id)
 
     def _emit_event(self, topic, data):
         self._model.emit_event(topic, data)
@@ -545,7 +1157,8 @@ class ProjectPushItemProcess:
         src_project_name = self._item.src_project_name
         src_version_id = self._item.src_version_id
 
-        project_entity = ayon_api.get_project(src_project_name)
+        entities_cache = self._entities_cache
+        project_entity = entities_cache.get_project(src_project_name)
         if not project_entity:
             self._status.set_failed(
                 f"Source project \"{src_project_name}\" was not found"
@@ -559,7 +1172,7 @@ class ProjectPushItemProcess:
 
         self._log_debug(f"Project '{src_project_name}' found")
 
-        version_entity = ayon_api.get_version_by_id(
+        version_entity = entities_cache.get_version(
             src_project_name, src_version_id
         )
         if not version_entity:
@@ -570,7 +1183,7 @@ class ProjectPushItemProcess:
             raise PushToProjectError(self._status.fail_reason)
 
         product_id = version_entity["productId"]
-        product_entity = ayon_api.get_product_by_id(
+        product_entity = entities_cache.get_product(
             src_project_name, product_id
         )
         if not product_entity:
@@ -581,8 +1194,8 @@ class ProjectPushItemProcess:
             raise PushToProjectError(self._status.fail_reason)
 
         folder_id = product_entity["folderId"]
-        folder_entity = ayon_api.get_folder_by_id(
-            src_project_name, folder_id, own_attributes=True
+        folder_entity = entities_cache.get_folder(
+            src_project_name, folder_id
         )
         if not folder_entity:
             self._status.set_failed((
@@ -591,11 +1204,10 @@ class ProjectPushItemProcess:
             ))
             raise PushToProjectError(self._status.fail_reason)
 
-        anatomy = Anatomy(src_project_name)
+        anatomy = entities_cache.get_anatomy(src_project_name)
 
-        repre_entities = ayon_api.get_representations(
-            src_project_name,
-            version_ids={src_version_id}
+        repre_entities = entities_cache.get_representations(
+            src_project_name, src_version_id
         )
         repre_items = [
             ProjectPushRepreItem(repre_entity, anatomy.roots)
@@ -621,7 +1233,9 @@ class ProjectPushItemProcess:
         # --- Destination entities ---
         dst_project_name = self._item.dst_project_name
         # Validate project existence
-        dst_project_entity = ayon_api.get_project(dst_project_name)
+        dst_project_entity = self._entities_cache.get_project(
+            dst_project_name
+        )
         if not dst_project_entity:
             self._status.set_failed(
                 f"Destination project '{dst_project_name}' was not found"
@@ -632,12 +1246,9 @@ class ProjectPushItemProcess:
             f"Destination project '{dst_project_name}' found"
         )
         self._project_entity = dst_project_entity
-        self._anatomy = Anatomy(
-            dst_project_name,
-            project_entity=dst_project_entity
-        )
-        self._project_settings = get_project_settings(
-            self._item.dst_project_name
+        self._anatomy = self._entities_cache.get_anatomy(dst_project_name)
+        self._project_settings = self._entities_cache.get_project_settings(
+            dst_project_name
         )
 
     def _create_folder(
@@ -652,10 +1263,8 @@ class ProjectPushItemProcess:
             parent_id = parent_folder_entity["id"]
 
         folder_name_low = folder_name.lower()
-        other_folder_entities = ayon_api.get_folders(
-            project_entity["name"],
-            parent_ids=[parent_id],
-            fields={"id", "name"}
+        other_folder_entities = self._entities_cache.get_child_folders(
+            project_entity["name"], parent_id
         )
         for other_folder_entity in other_folder_entities:
             other_name = other_folder_entity["name"]
@@ -666,7 +1275,7 @@ class ProjectPushItemProcess:
                 f"Found already existing folder with name \"{other_name}\""
                 f" which match requested name \"{folder_name}\""
             ))
-            return ayon_api.get_folder_by_id(
+            return self._entities_cache.get_folder(
                 project_entity["name"], other_folder_entity["id"]
             )
 
@@ -717,6 +1326,10 @@ class ProjectPushItemProcess:
         if parent_folder_entity:
             parent_path = parent_folder_entity["path"]
         folder_entity["path"] = "/".join([parent_path, folder_name])
+        self._entities_cache.add_folder(
+            project_entity["name"], folder_entity, self.item_id
+        )
+        self._created_entities.append(("folder", folder_entity))
         return folder_entity
 
     def _fill_or_create_destination_folder(self):
@@ -733,8 +1346,8 @@ class ProjectPushItemProcess:
         # Get folder entity
         parent_folder_entity = None
         if dst_folder_id:
-            parent_folder_entity = ayon_api.get_folder_by_id(
-                self._item.dst_project_name, self._item.dst_folder_id
+            parent_folder_entity = self._entities_cache.get_folder(
+                dst_project_name, dst_folder_id
             )
             if not parent_folder_entity:
                 self._status.set_failed(
@@ -760,8 +1373,8 @@ class ProjectPushItemProcess:
         folder_path = folder_entity["path"]
         folder_tasks = {
             task_entity["name"].lower(): task_entity
-            for task_entity in ayon_api.get_tasks(
-                dst_project_name, folder_ids=[folder_entity["id"]]
+            for task_entity in self._entities_cache.get_tasks(
+                dst_project_name, folder_entity["id"]
             )
         }
         task_info = folder_tasks.get(dst_task_name.lower())
@@ -852,7 +1465,7 @@ class ProjectPushItemProcess:
         folder_id = self._folder_entity["id"]
         product_name = self._product_name
         product_type = self._product_type
-        product_entity = ayon_api.get_product_by_name(
+        product_entity = self._entities_cache.get_product_by_name(
             project_name, product_name, folder_id
         )
         if product_entity:
@@ -867,6 +1480,10 @@ class ProjectPushItemProcess:
         self._operations.create_entity(
             project_name, "product", product_entity
         )
+        self._entities_cache.add_product(
+            project_name, product_entity, self.item_id
+        )
+        self._created_entities.append(("product", product_entity))
         self._product_entity = product_entity
 
     def _make_sure_version_exists(self):
@@ -905,7 +1522,7 @@ class ProjectPushItemProcess:
                 dst_attrib[key] = src_attrib[key]
 
         if version is None:
-            last_version_entity = ayon_api.get_last_version_by_product_id(
+            last_version_entity = self._entities_cache.get_last_version(
                 project_name, product_id
             )
             if last_version_entity:
@@ -920,7 +1537,7 @@ class ProjectPushItemProcess:
                     product_name=product_entity["name"]
                 )
 
-        existing_version_entity = ayon_api.get_version_by_name(
+        existing_version_entity = self._entities_cache.get_version_by_name(
             project_name, version, product_id
         )
         # Update existing version
@@ -943,22 +1560,17 @@ class ProjectPushItemProcess:
         self._operations.create_entity(
             project_name, "version", version_entity
         )
+        self._entities_cache.add_version(
+            project_name, version_entity, self.item_id
+        )
+        self._created_entities.append(("version", version_entity))
         self._version_entity = version_entity
 
-    def _integrate_representations(self):
-        try:
-            self._real_integrate_representations()
-        except Exception:
-            self._operations.clear()
-            self._file_transaction.rollback()
-            raise
-
-    def _real_integrate_representations(self):
+    def _prepare_representations(self):
         version_entity = self._version_entity
         version_id = version_entity["id"]
-        existing_repres = ayon_api.get_representations(
-            self._item.dst_project_name,
-            version_ids={version_id}
+        existing_repres = self._entities_cache.get_representations(
+            self._item.dst_project_name, version_id
         )
         existing_repres_by_low_name = {
             repre_entity["name"].lower(): repre_entity
@@ -979,7 +1591,9 @@ class ProjectPushItemProcess:
                 "name": self._product_name,
                 "type": self._product_type,
             },
-            "version": version_entity["version"]
+            "version": version_entity["version"],
+            # Roots are filled to avoid copy of data on each formatting
+            "root": anatomy.roots,
         })
 
         publish_template = anatomy.get_template_item("publish", template_name)
@@ -989,28 +1603,70 @@ class ProjectPushItemProcess:
         processed_repre_items = self._prepare_file_transactions(
             anatomy, template_name, formatting_data, file_template
         )
-        self._file_transaction.process()
-        self._log_info("Preparing database changes")
-        self._prepare_database_operations(
-            version_id,
-            processed_repre_items,
-            path_template,
-            existing_repres_by_low_name
-        )
-        self._log_info("Finalization")
-        self._operations.commit()
+        self._processed_repre_items = processed_repre_items
+        self._path_template = path_template
+        self._existing_repres_by_low_name = existing_repres_by_low_name
+
+    def _transfer_files(self, progress_callback=None):
+        try:
+            self._file_transaction.process(progress_callback)
+        except Exception:
+            self._rollback()
+            raise
+
+    def _rollback(self):
+        self._operations.clear()
+        self._file_transaction.rollback()
+
+    def _commit(self):
+        try:
+            self._log_info("Preparing database changes")
+            self._prepare_database_operations(
+                self._version_entity["id"],
+                self._processed_repre_items,
+                self._path_template,
+                self._existing_repres_by_low_name
+            )
+            self._log_info("Finalization")
+            self._operations.commit()
+        except Exception:
+            self._rollback()
+            raise
         self._file_transaction.finalize()
+        self._log_info("Integration finished")
+
+    def _get_transfer_mode(self, src_path, dst_dirpath, devices_cache):
+        if not self._use_hardlinks:
+            return FileTransaction.MODE_COPY
+
+        src_dirpath = os.path.dirname(src_path)
+        for path in (src_dirpath, dst_dirpath):
+            if path not in devices_cache:
+                devices_cache[path] = _get_path_device(path)
+
+        src_device = devices_cache[src_dirpath]
+        if src_device is not None and src_device == devices_cache[dst_dirpath]:
+            return FileTransaction.MODE_HARDLINK
+        return FileTransaction.MODE_COPY
 
     def _prepare_file_transactions(
         self, anatomy, template_name, formatting_data, file_template
     ):
+        template_obj = anatomy.get_template_item(
+            "publish", template_name, "directory"
+        )
+        folder_path = template_obj.format_strict(formatting_data)
+        folder_path_rootless = folder_path.rootless
+        devices_cache = {}
+        transfers = []
         processed_repre_items = []
         for repre_item in self._src_repre_items:
             repre_entity = repre_item.repre_entity
             repre_name = repre_entity["name"]
-            repre_format_data = copy.deepcopy(formatting_data)
+            repre_format_data = dict(formatting_data)
             repre_format_data["representation"] = repre_name
-            for src_file in repre_item.src_files:
+            src_files = repre_item.src_files
+            for src_file in src_files:
                 ext = os.path.splitext(src_file.path)[-1]
                 repre_format_data["ext"] = ext[1:]
                 break
@@ -1020,37 +1676,45 @@ class ProjectPushItemProcess:
             if repre_output_name is not None:
                 repre_format_data["output"] = repre_output_name
 
-            template_obj = anatomy.get_template_item(
-                "publish", template_name, "directory"
+            repre_context = copy.deepcopy(folder_path.used_values)
+
+            # Published path is last file matching first frame
+            published_idx = 0
+            for idx, src_file in enumerate(src_files):
+                if src_file.frame == repre_item.frame:
+                    published_idx = idx
+
+            # Template is formatted once and filled with frame and udim
+            #   of each file
+            filename_template = _FilenameTemplate(
+                file_template, repre_format_data
+            )
+            published_src_file = src_files[published_idx]
+            published_filename = filename_template.format_strict(
+                published_src_file.frame, published_src_file.udim
             )
-            folder_path = template_obj.format_strict(formatting_data)
-            repre_context = folder_path.used_values
-            folder_path_rootless = folder_path.rootless
+            repre_context.update(published_filename.used_values)
+
             repre_filepaths = []
             published_path = None
-            for src_file in repre_item.src_files:
-                file_data = copy.deepcopy(repre_format_data)
-                frame = src_file.frame
-                if frame is not None:
-                    file_data["frame"] = frame
-
-                udim = src_file.udim
-                if udim is not None:
-                    file_data["udim"] = udim
-
-                filename = file_template.format_strict(file_data)
+            for idx, src_file in enumerate(src_files):
+                if idx == published_idx:
+                    filename = published_filename
+                else:
+                    filename = filename_template.format(
+                        src_file.frame, src_file.udim
+                    )
                 dst_filepath = os.path.normpath(
                     os.path.join(folder_path, filename)
                 )
                 dst_rootless_path = os.path.normpath(
                     os.path.join(folder_path_rootless, filename)
                 )
-                if published_path is None or frame == repre_item.frame:
+                if idx == published_idx:
                     published_path = dst_filepath
-                    repre_context.update(filename.used_values)
 
                 repre_filepaths.append((dst_filepath, dst_rootless_path))
-                self._file_transaction.add(src_file.path, dst_filepath)
+                transfers.append((src_file.path, dst_filepath))
 
             for resource_file in repre_item.resource_files:
                 dst_filepath = os.path.normpath(
@@ -1062,10 +1726,17 @@ class ProjectPushItemProcess:
                     )
                 )
                 repre_filepaths.append((dst_filepath, dst_rootless_path))
-                self._file_transaction.add(resource_file.path, dst_filepath)
+                transfers.append((resource_file.path, dst_filepath))
             processed_repre_items.append(
                 (repre_item, repre_filepaths, repre_context, published_path)
             )
+
+        for src_path, dst_filepath in transfers:
+            mode = self._get_transfer_mode(
+                src_path, os.path.dirname(dst_filepath), devices_cache
+            )
+            self._file_transaction.add(src_path, dst_filepath, mode)
+        self._transfers_count = len(transfers)
         return processed_repre_items
 
     def _prepare_database_operations(
@@ -1148,13 +1819,213 @@ class ProjectPushItemProcess:
             )
 
 
+class ProjectPushBatchProcess:
+    """Push multiple versions at once.
+
+    Entities of all items are queried in bulk, files of all items are
+    transferred in parallel and database changes are committed per item
+    in order of items, so items can use folders and products created by
+    previous items. Items using entities created by an item which failed
+    are canceled.
+
+    Args:
+        model (IntegrateModel): Model which is processing items.
+        items (list[ProjectPushItem]): Items to process.
+        max_workers (Optional[int]): Number of threads used to transfer
+            files.
+        use_hardlinks (bool): Hardlink files instead of copying them when
+            source and destination are on the same device.
+        batch_id (Optional[str]): Batch id.
+    """
+
+    def __init__(
+        self,
+        model,
+        items,
+        max_workers=None,
+        use_hardlinks=False,
+        batch_id=None,
+    ):
+        if not batch_id:
+            batch_id = uuid.uuid4().hex
+        if max_workers is None:
+            max_workers = DEFAULT_MAX_TRANSFER_WORKERS
+        max_workers = max(1, max_workers)
+        items_workers = max(1, min(max_workers, len(items)))
+
+        entities_cache = ProjectPushEntitiesCache()
+        self._model = model
+        self._batch_id = batch_id
+        self._entities_cache = entities_cache
+        self._items_workers = items_workers
+        self._processes = [
+            ProjectPushItemProcess(
+                model,
+                item,
+                entities_cache=entities_cache,
+                # Threads not used by items are used inside of items
+                max_transfer_workers=max_workers // items_workers,
+                use_hardlinks=use_hardlinks,
+            )
+            for item in items
+        ]
+        self._stage = None
+        self._started = False
+        self._finished = False
+        self._transferred_by_id = {}
+        self._lock = threading.Lock()
+
+    @property
+    def batch_id(self):
+        return self._batch_id
+
+    @property
+    def started(self):
+        return self._started
+
+    @property
+    def processes(self):
+        return list(self._processes)
+
+    def get_status_data(self):
+        """Aggregated status of all items in batch.
+
+        Returns:
+            dict[str, Any]: Batch status data with status of each item.
+        """
+        with self._lock:
+            files_transferred = sum(self._transferred_by_id.values())
+        items_status = {
+            process.item_id: process.get_status_data()
+            for process in self._processes
+        }
+        return {
+            "batch_id": self._batch_id,
+            "stage": self._stage,
+            "started": self._started,
+            "finished": self._finished,
+            "items_count": len(self._processes),
+            "finished_count": sum(
+                1
+                for process in self._processes
+                if process.finished and not process.failed
+            ),
+            "failed_count": sum(
+                1 for process in self._processes if process.failed
+            ),
+            "files_count": sum(
+                process.transfers_count for process in self._processes
+            ),
+            "files_transferred": files_transferred,
+            "items": items_status,
+        }
+
+    def integrate(self):
+        self._started = True
+        try:
+            self._set_stage("prefetch")
+            self._entities_cache.prefetch(
+                [process.item for process in self._processes]
+            )
+
+            self._set_stage("prepare")
+            prepared_processes = []
+            for process in self._processes:
+                if process.prepare():
+                    prepared_processes.append(process)
+                self._emit_progress()
+
+            self._set_stage("transfer")
+            transferred_processes = self._transfer_files(prepared_processes)
+
+            self._set_stage("commit")
+            failed_ids = {
+                process.item_id
+                for process in self._processes
+                if process.failed
+            }
+            for process in transferred_processes:
+                failed_dependencies = (
+                    process.dependency_item_ids & failed_ids
+                )
+                if failed_dependencies:
+                    process.cancel(
+                        "Depends on entities of failed item {}".format(
+                            ", ".join(sorted(failed_dependencies))
+                        )
+                    )
+                elif process.commit():
+                    self._emit_progress()
+                    continue
+                failed_ids.add(process.item_id)
+                self._emit_progress()
+
+        finally:
+            self._finished = True
+            self._set_stage("finished")
+
+    def _transfer_files(self, processes):
+        transferred_processes = set()
+        if self._items_workers < 2 or len(processes) < 2:
+            for process in processes:
+                if process.transfer_files(
+                    self._get_progress_callback(process)
+                ):
+                    transferred_processes.add(process)
+                self._emit_progress()
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self._items_workers
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        process.transfer_files_silent,
+                        self._get_progress_callback(process),
+                    ): process
+                    for process in processes
+                }
+                # Failures are handled in this thread so events are not
+                #   emitted from transfer threads
+                for future in as_completed(futures):
+                    process = futures[future]
+                    exc_info = future.result()
+                    if exc_info is None:
+                        transferred_processes.add(process)
+                    else:
+                        process.handle_error(exc_info)
+                    self._emit_progress()
+
+        return [
+            process
+            for process in processes
+            if process in transferred_processes
+        ]
+
+    def _get_progress_callback(self, process):
+        def _progress_callback(transferred, _total):
+            with self._lock:
+                self._transferred_by_id[process.item_id] = transferred
+        return _progress_callback
+
+    def _set_stage(self, stage):
+        self._stage = stage
+        self._emit_progress()
+
+    def _emit_progress(self):
+        status_data = self.get_status_data()
+        status_data.pop("items")
+        self._model.emit_event("push.batch.progress.changed", status_data)
+
+
 class IntegrateModel:
     def __init__(self, controller):
         self._controller = controller
         self._process_items = {}
+        self._batch_processes = {}
 
     def reset(self):
         self._process_items = {}
+        self._batch_processes = {}
 
     def emit_event(self, topic, data=None, source=None):
         self._controller.emit_event(topic, data, source)
@@ -1216,6 +2087,60 @@ class IntegrateModel:
             return
         item.integrate()
 
+    def create_batch_process(
+        self, items_data, max_workers=None, use_hardlinks=False
+    ):
+        """Create batch of items for integration.
+
+        Args:
+            items_data (Iterable[dict[str, Any]]): Data of items, keys match
+                arguments of 'create_process_item'.
+            max_workers (Optional[int]): Number of threads used to transfer
+                files.
+            use_hardlinks (bool): Hardlink files instead of copying them
+                when source and destination are on the same device.
+
+        Returns:
+            str: Batch id. The id can be used to trigger integration or get
+                status information.
+        """
+        items = [ProjectPushItem(**item_data) for item_data in items_data]
+        batch_process = ProjectPushBatchProcess(
+            self,
+            items,
+            max_workers=max_workers,
+            use_hardlinks=use_hardlinks,
+        )
+        self._batch_processes[batch_process.batch_id] = batch_process
+        for process in batch_process.processes:
+            self._process_items[process.item_id] = process
+        return batch_process.batch_id
+
+    def integrate_batch(self, batch_id):
+        """Start integration of batch.
+
+        Args:
+            batch_id (str): Batch id which should be integrated.
+        """
+        batch_process = self._batch_processes.get(batch_id)
+        if batch_process is None or batch_process.started:
+            return
+        batch_process.integrate()
+
+    def get_batch_status(self, batch_id):
+        """Aggregated status of batch.
+
+        Args:
+            batch_id (str): Batch id for which status should be returned.
+
+        Returns:
+            Union[dict[str, Any], None]: Status data.
+        """
+        batch_process = self._batch_processes.get(batch_id)
+        if batch_process is not None:
+            return batch_process.get_status_data()
+        return None
+
     def get_item_status(self, item_id):
         """Status of an item.
 
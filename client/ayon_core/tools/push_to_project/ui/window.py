@@ -272,6 +272,9 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
         controller.register_event_callback(
             "push.message.added", self._on_push_message
         )
+        controller.register_event_callback(
+            "push.batch.progress.changed", self._on_push_progress
+        )
 
         self._main_layout = main_layout
 
@@ -316,7 +319,7 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
         self._main_thread_timer = main_thread_timer
         self._main_thread_timer_can_stop = True
         self._last_submit_message = None
-        self._process_item_id = None
+        self._process_batch_id = None
 
         self._variant_is_valid = None
         self._folder_is_valid = None
@@ -339,6 +342,18 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
 
         self._controller.set_source(project_name, version_id)
 
+    def set_source_versions(self, project_name, version_ids):
+        """Set source project and multiple versions.
+
+        Call the method on controller.
+
+        Args:
+            project_name (Union[str, None]): Name of project.
+            version_ids (Iterable[str]): Version ids.
+        """
+
+        self._controller.set_source_versions(project_name, version_ids)
+
     def showEvent(self, event):
         super(PushToContextSelectWindow, self).showEvent(event)
         if self._first_show:
@@ -477,10 +492,10 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
         self.close()
 
     def _on_select_click(self):
-        self._process_item_id = self._controller.submit(wait=False)
+        self._process_batch_id = self._controller.submit(wait=False)
 
     def _on_try_again_click(self):
-        self._process_item_id = None
+        self._process_batch_id = None
         self._last_submit_message = None
 
         self._error_detail_dialog.close()
@@ -495,11 +510,18 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
             self._overlay_label.setText(self._last_submit_message)
             self._last_submit_message = None
 
-        process_status = self._controller.get_process_item_status(
-            self._process_item_id
+        batch_status = self._controller.get_batch_status(
+            self._process_batch_id
         )
-        push_failed = process_status["failed"]
-        fail_traceback = process_status["full_traceback"]
+        failed_statuses = [
+            item_status
+            for item_status in batch_status["items"].values()
+            if item_status["failed"]
+        ]
+        push_failed = bool(failed_statuses)
+        fail_traceback = None
+        if push_failed:
+            fail_traceback = failed_statuses[0]["full_traceback"]
         if self._main_thread_timer_can_stop:
             self._main_thread_timer.stop()
             self._overlay_close_btn.setVisible(True)
@@ -509,7 +531,11 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
                     self._show_detail_btn.setVisible(True)
 
         if push_failed:
-            reason = process_status["fail_reason"]
+            reason = failed_statuses[0]["fail_reason"]
+            if batch_status["items_count"] > 1:
+                reason = "{}/{} versions failed. {}".format(
+                    len(failed_statuses), batch_status["items_count"], reason
+                )
             if fail_traceback:
                 message = (
                     "Unhandled error happened."
@@ -527,8 +553,8 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
         if self._main_thread_timer_can_stop:
             # Join thread in controller
             self._controller.wait_for_process_thread()
-            # Reset process item to None
-            self._process_item_id = None
+            # Reset process batch to None
+            self._process_batch_id = None
 
     def _on_controller_submit_start(self):
         self._main_thread_timer_can_stop = False
@@ -541,3 +567,9 @@ class PushToContextSelectWindow(QtWidgets.QWidget):
 
     def _on_push_message(self, event):
         self._last_submit_message = event["message"]
+
+    def _on_push_progress(self, event):
+        if event["stage"] == "transfer" and event["files_count"]:
+            self._last_submit_message = "Transferring files {}/{}".format(
+                event["files_transferred"], event["files_count"]
+            )
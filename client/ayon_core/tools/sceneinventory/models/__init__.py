@@ -1,8 +1,10 @@
 from .containers import ContainersModel
 from .sitesync import SiteSyncModel
+from .switch_entities import SwitchEntitiesIndex
 
 
 __all__ = (
     "ContainersModel",
     "SiteSyncModel",
+    "SwitchEntitiesIndex",
 )
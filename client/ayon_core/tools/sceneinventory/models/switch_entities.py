@@ -0,0 +1,192 @@
+import ayon_api
+
+
+class SwitchEntitiesIndex:
+    """In-memory index of switch candidates for 'SwitchAssetDialog'.
+
+    Products of folders, their last versions and representations of the
+    last versions are queried in bulk once per folder. Representations of
+    loaded versions are queried once per version. All changes of dialog
+    selection are then answered from the index without server queries
+    until 'reset' is called.
+
+    Hero versions are not indexed, it is expected that hero version has
+    same representations as latest version.
+
+    Args:
+        project_name (str): Project name.
+    """
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        self._products_by_folder_id = {}
+        self._last_version_by_product_id = {}
+        self._repres_by_version_id = {}
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    def reset(self):
+        """Clear indexed entities so they're queried again."""
+        self._products_by_folder_id = {}
+        self._last_version_by_product_id = {}
+        self._repres_by_version_id = {}
+
+    def prefetch_folders(self, folder_ids):
+        """Index products of folders with their last versions.
+
+        Args:
+            folder_ids (Iterable[str]): Folder ids.
+        """
+        folder_ids = {
+            folder_id
+            for folder_id in folder_ids
+            if folder_id and folder_id not in self._products_by_folder_id
+        }
+        if not folder_ids:
+            return
+
+        products_by_folder_id = {
+            folder_id: {}
+            for folder_id in folder_ids
+        }
+        product_entities = ayon_api.get_products(
+            self._project_name,
+            folder_ids=folder_ids,
+            fields={"id", "name", "folderId"}
+        )
+        for product_entity in product_entities:
+            folder_id = product_entity["folderId"]
+            products_by_folder_id[folder_id][product_entity["name"]] = (
+                product_entity
+            )
+
+        product_ids = {
+            product_entity["id"]
+            for products_by_name in products_by_folder_id.values()
+            for product_entity in products_by_name.values()
+        }
+        last_versions_by_product_id = {}
+        if product_ids:
+            last_versions_by_product_id = ayon_api.get_last_versions(
+                self._project_name,
+                product_ids,
+                fields={"id", "productId", "version"}
+            )
+
+        for product_id in product_ids:
+            self._last_version_by_product_id[product_id] = (
+                last_versions_by_product_id.get(product_id)
+            )
+        self._products_by_folder_id.update(products_by_folder_id)
+
+        self.prefetch_versions(
+            version_entity["id"]
+            for version_entity in last_versions_by_product_id.values()
+            if version_entity
+        )
+
+    def prefetch_versions(self, version_ids):
+        """Index representations of versions.
+
+        Args:
+            version_ids (Iterable[str]): Version ids.
+        """
+        version_ids = {
+            version_id
+            for version_id in version_ids
+            if version_id not in self._repres_by_version_id
+        }
+        if not version_ids:
+            return
+
+        repres_by_version_id = {
+            version_id: {}
+            for version_id in version_ids
+        }
+        repre_entities = ayon_api.get_representations(
+            self._project_name,
+            version_ids=version_ids,
+            fields={"id", "name", "versionId"}
+        )
+        for repre_entity in repre_entities:
+            version_id = repre_entity["versionId"]
+            repres_by_version_id[version_id][repre_entity["name"]] = (
+                repre_entity
+            )
+        self._repres_by_version_id.update(repres_by_version_id)
+
+    def get_products_by_name(self, folder_id):
+        """Products of folder.
+
+        Args:
+            folder_id (str): Folder id.
+
+        Returns:
+            dict[str, dict[str, Any]]: Product entities by name.
+        """
+        self.prefetch_folders([folder_id])
+        return self._products_by_folder_id[folder_id]
+
+    def get_product(self, folder_id, product_name):
+        return self.get_products_by_name(folder_id).get(product_name)
+
+    def get_last_version(self, folder_id, product_name):
+        """Last version of product by folder id and product name.
+
+        Returns:
+            Union[dict[str, Any], None]: Version entity.
+        """
+        product_entity = self.get_product(folder_id, product_name)
+        if product_entity is None:
+            return None
+        return self._last_version_by_product_id.get(product_entity["id"])
+
+    def get_version_repres_by_name(self, version_id):
+        """Representations of version.
+
+        Args:
+            version_id (str): Version id.
+
+        Returns:
+            dict[str, dict[str, Any]]: Representation entities by name.
+        """
+        self.prefetch_versions([version_id])
+        return self._repres_by_version_id[version_id]
+
+    def get_last_version_repres_by_name(self, folder_id, product_name):
+        """Representations of last version of product.
+
+        Returns:
+            Union[dict[str, dict[str, Any]], None]: Representation entities
+                by name or None if product or version does not exist.
+        """
+        version_entity = self.get_last_version(folder_id, product_name)
+        if version_entity is None:
+            return None
+        return self.get_version_repres_by_name(version_entity["id"])
+
+    def get_last_versions_repre_names(self, folder_id, product_names=None):
+        """Representation names of last versions of products in folder.
+
+        Args:
+            folder_id (str): Folder id.
+            product_names (Optional[Iterable[str]]): Filter product names.
+
+        Returns:
+            dict[str, set[str]]: Representation names by product name. Only
+                products with a version are returned.
+        """
+        products_by_name = self.get_products_by_name(folder_id)
+        if product_names is None:
+            product_names = products_by_name.keys()
+
+        output = {}
+        for product_name in product_names:
+            repres_by_name = self.get_last_version_repres_by_name(
+                folder_id, product_name
+            )
+            if repres_by_name is not None:
+                output[product_name] = set(repres_by_name)
+        return output
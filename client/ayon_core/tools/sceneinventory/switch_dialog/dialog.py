@@ -14,6 +14,7 @@ from ayon_core.pipeline.load import (
     IncompatibleLoaderError,
     LoaderNotFoundError
 )
+from ayon_core.tools.sceneinventory.models import SwitchEntitiesIndex
 
 from .widgets import (
     ButtonWithMenu,
@@ -72,6 +73,11 @@ class SwitchAssetDialog(QtWidgets.QDialog):
 
         current_folder_btn = QtWidgets.QPushButton("Use current folder", self)
 
+        refresh_icon = qtawesome.icon("fa.refresh", color="white")
+        refresh_btn = QtWidgets.QPushButton(self)
+        refresh_btn.setIcon(refresh_icon)
+        refresh_btn.setToolTip("Refresh products and representations")
+
         accept_icon = qtawesome.icon("fa.check", color="white")
         accept_btn = ButtonWithMenu(self)
         accept_btn.setIcon(accept_icon)
@@ -79,6 +85,7 @@ class SwitchAssetDialog(QtWidgets.QDialog):
         main_layout = QtWidgets.QGridLayout(self)
         # Folder column
         main_layout.addWidget(current_folder_btn, 0, 0)
+        main_layout.addWidget(refresh_btn, 0, 3)
         main_layout.addWidget(folders_field, 1, 0)
         main_layout.addWidget(folder_label, 2, 0)
         # Product column
@@ -110,11 +117,13 @@ class SwitchAssetDialog(QtWidgets.QDialog):
         )
         accept_btn.clicked.connect(self._on_accept)
         current_folder_btn.clicked.connect(self._on_current_folder)
+        refresh_btn.clicked.connect(self._on_refresh_clicked)
 
         self._show_timer = show_timer
         self._show_counter = 0
 
         self._current_folder_btn = current_folder_btn
+        self._refresh_btn = refresh_btn
 
         self._folders_field = folders_field
         self._products_combox = products_combox
@@ -159,6 +168,9 @@ class SwitchAssetDialog(QtWidgets.QDialog):
 
         self._controller = controller
 
+        # Products, versions and representations used to fill comboboxes
+        self._entities_index = SwitchEntitiesIndex(project_name)
+
         self._items = items
         self._prepare_content_data()
 
@@ -384,9 +396,22 @@ class SwitchAssetDialog(QtWidgets.QDialog):
         self._inactive_product_ids = inactive_product_ids
         self._inactive_repre_ids = inactive_repre_ids
 
+        # Prefetch switch candidates of loaded content at once
+        self._entities_index.prefetch_folders(
+            content_folder_entities_by_id.keys()
+        )
+        self._entities_index.prefetch_versions(
+            content_version_entities_by_id.keys()
+        )
+
     def _combobox_value_changed(self, *args, **kwargs):
         self.refresh()
 
+    def _on_refresh_clicked(self):
+        self._entities_index.reset()
+        self._prepare_content_data()
+        self.refresh()
+
     def _build_loaders_menu(self):
         repre_ids = self._get_current_output_repre_ids()
         loaders = self._get_loaders(repre_ids)
@@ -558,316 +583,181 @@ class SwitchAssetDialog(QtWidgets.QDialog):
         # [ ] [ ] [x]
         return self._get_current_output_repre_ids_oox(selected_repre)
 
+    def _iter_content_repres(self):
+        """Loaded representations with their product entities."""
+        for repre_entity in self._repre_entities_by_id.values():
+            version_id = repre_entity["versionId"]
+            version_entity = self._version_entities_by_id[version_id]
+            product_id = version_entity["productId"]
+            product_entity = self._product_entities_by_id[product_id]
+            yield repre_entity, product_entity
+
     def _get_current_output_repre_ids_xxx(
         self, folder_id, selected_product_name, selected_repre
     ):
-        project_name = self._project_name
-        product_entity = ayon_api.get_product_by_name(
-            project_name,
-            selected_product_name,
-            folder_id,
-            fields={"id"}
+        repres_by_name = (
+            self._entities_index.get_last_version_repres_by_name(
+                folder_id, selected_product_name
+            )
         )
-
-        product_id = product_entity["id"]
-        last_versions_by_product_id = self.find_last_versions([product_id])
-        version_entity = last_versions_by_product_id.get(product_id)
-        if not version_entity:
+        if not repres_by_name:
             return []
 
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            version_ids={version_entity["id"]},
-            representation_names={selected_repre},
-            fields={"id"}
-        )
-        return {repre_entity["id"] for repre_entity in repre_entities}
+        repre_entity = repres_by_name.get(selected_repre)
+        if repre_entity is None:
+            return []
+        return {repre_entity["id"]}
 
     def _get_current_output_repre_ids_xxo(self, folder_id, product_name):
-        project_name = self._project_name
-        product_entity = ayon_api.get_product_by_name(
-            project_name,
-            product_name,
-            folder_id,
-            fields={"id"}
+        repres_by_name = (
+            self._entities_index.get_last_version_repres_by_name(
+                folder_id, product_name
+            )
         )
-        if not product_entity:
+        if not repres_by_name:
             return []
 
-        repre_names = set()
-        for repre_entity in self._repre_entities_by_id.values():
-            repre_names.add(repre_entity["name"])
-
-        # TODO where to take version ids?
-        version_ids = []
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            representation_names=repre_names,
-            version_ids=version_ids,
-            fields={"id"}
-        )
-        return {repre_entity["id"] for repre_entity in repre_entities}
+        repre_names = {
+            repre_entity["name"]
+            for repre_entity in self._repre_entities_by_id.values()
+        }
+        return {
+            repre_entity["id"]
+            for repre_name, repre_entity in repres_by_name.items()
+            if repre_name in repre_names
+        }
 
     def _get_current_output_repre_ids_xox(self, folder_id, selected_repre):
         product_names = {
             product_entity["name"]
             for product_entity in self._product_entities_by_id.values()
         }
-
-        project_name = self._project_name
-        product_entities = ayon_api.get_products(
-            project_name,
-            folder_ids=[folder_id],
-            product_names=product_names,
-            fields={"id", "name"}
-        )
-        product_name_by_id = {
-            product_entity["id"]: product_entity["name"]
-            for product_entity in product_entities
-        }
-        product_ids = list(product_name_by_id.keys())
-        last_versions_by_product_id = self.find_last_versions(product_ids)
-        last_version_id_by_product_name = {}
-        for product_id, last_version in last_versions_by_product_id.items():
-            product_name = product_name_by_id[product_id]
-            last_version_id_by_product_name[product_name] = (
-                last_version["id"]
-            )
-
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            version_ids=last_version_id_by_product_name.values(),
-            representation_names={selected_repre},
-            fields={"id"}
-        )
-        return {repre_entity["id"] for repre_entity in repre_entities}
+        output = set()
+        for product_name in product_names:
+            repres_by_name = (
+                self._entities_index.get_last_version_repres_by_name(
+                    folder_id, product_name
+                )
+            ) or {}
+            repre_entity = repres_by_name.get(selected_repre)
+            if repre_entity is not None:
+                output.add(repre_entity["id"])
+        return output
 
     def _get_current_output_repre_ids_xoo(self, folder_id):
-        project_name = self._project_name
         repres_by_product_name = collections.defaultdict(set)
-        for repre_entity in self._repre_entities_by_id.values():
-            version_id = repre_entity["versionId"]
-            version_entity = self._version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = self._product_entities_by_id[product_id]
+        for repre_entity, product_entity in self._iter_content_repres():
             product_name = product_entity["name"]
             repres_by_product_name[product_name].add(repre_entity["name"])
 
-        product_entities = list(ayon_api.get_products(
-            project_name,
-            folder_ids=[folder_id],
-            product_names=repres_by_product_name.keys(),
-            fields={"id", "name"}
-        ))
-        product_name_by_id = {
-            product_entity["id"]: product_entity["name"]
-            for product_entity in product_entities
-        }
-        product_ids = list(product_name_by_id.keys())
-        last_versions_by_product_id = self.find_last_versions(product_ids)
-        last_version_id_by_product_name = {}
-        for product_id, last_version in last_versions_by_product_id.items():
-            product_name = product_name_by_id[product_id]
-            last_version_id_by_product_name[product_name] = (
-                last_version["id"]
-            )
-
-        repre_names_by_version_id = {}
+        output = set()
         for product_name, repre_names in repres_by_product_name.items():
-            version_id = last_version_id_by_product_name.get(product_name)
-            # This should not happen but why to crash?
-            if version_id is not None:
-                repre_names_by_version_id[version_id] = list(repre_names)
-
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            names_by_version_ids=repre_names_by_version_id,
-            fields={"id"}
-        )
-        return {repre_entity["id"] for repre_entity in repre_entities}
+            repres_by_name = (
+                self._entities_index.get_last_version_repres_by_name(
+                    folder_id, product_name
+                )
+            ) or {}
+            for repre_name in repre_names:
+                repre_entity = repres_by_name.get(repre_name)
+                if repre_entity is not None:
+                    output.add(repre_entity["id"])
+        return output
 
     def _get_current_output_repre_ids_oxx(
         self, product_name, selected_repre
     ):
-        project_name = self._project_name
-        product_entities = ayon_api.get_products(
-            project_name,
-            folder_ids=self._folder_entities_by_id.keys(),
-            product_names=[product_name],
-            fields={"id"}
-        )
-        product_ids = {
-            product_entity["id"] for product_entity in product_entities
-        }
-        last_versions_by_product_id = self.find_last_versions(product_ids)
-        last_version_ids = {
-            last_version["id"]
-            for last_version in last_versions_by_product_id.values()
-        }
-
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            version_ids=last_version_ids,
-            representation_names={selected_repre},
-            fields={"id"}
-        )
-        return {repre_entity["id"] for repre_entity in repre_entities}
+        output = set()
+        for folder_id in self._folder_entities_by_id:
+            repres_by_name = (
+                self._entities_index.get_last_version_repres_by_name(
+                    folder_id, product_name
+                )
+            ) or {}
+            repre_entity = repres_by_name.get(selected_repre)
+            if repre_entity is not None:
+                output.add(repre_entity["id"])
+        return output
 
     def _get_current_output_repre_ids_oxo(self, product_name):
-        project_name = self._project_name
-        product_entities = ayon_api.get_products(
-            project_name,
-            folder_ids=self._folder_entities_by_id.keys(),
-            product_names={product_name},
-            fields={"id", "folderId"}
-        )
-        product_entities_by_id = {
-            product_entity["id"]: product_entity
-            for product_entity in product_entities
-        }
-        if not product_entities_by_id:
-            return list()
-
-        last_versions_by_product_id = self.find_last_versions(
-            product_entities_by_id.keys()
-        )
-
-        product_id_by_version_id = {}
-        for product_id, last_version in last_versions_by_product_id.items():
-            version_id = last_version["id"]
-            product_id_by_version_id[version_id] = product_id
-
-        if not product_id_by_version_id:
-            return list()
-
         repre_names_by_folder_id = collections.defaultdict(set)
-        for repre_entity in self._repre_entities_by_id.values():
-            version_id = repre_entity["versionId"]
-            version_entity = self._version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = self._product_entities_by_id[product_id]
+        for repre_entity, product_entity in self._iter_content_repres():
             folder_id = product_entity["folderId"]
-            folder_entity = self._folder_entities_by_id[folder_id]
-            folder_id = folder_entity["id"]
             repre_names_by_folder_id[folder_id].add(repre_entity["name"])
 
-        repre_names_by_version_id = {}
-        for last_version_id, product_id in product_id_by_version_id.items():
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            repre_names = repre_names_by_folder_id.get(folder_id)
-            if not repre_names:
-                continue
-            repre_names_by_version_id[last_version_id] = repre_names
-
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            names_by_version_ids=repre_names_by_version_id,
-            fields={"id"}
-        )
-        return {repre_entity["id"] for repre_entity in repre_entities}
+        output = set()
+        for folder_id, repre_names in repre_names_by_folder_id.items():
+            repres_by_name = (
+                self._entities_index.get_last_version_repres_by_name(
+                    folder_id, product_name
+                )
+            ) or {}
+            for repre_name in repre_names:
+                repre_entity = repres_by_name.get(repre_name)
+                if repre_entity is not None:
+                    output.add(repre_entity["id"])
+        return output
 
     def _get_current_output_repre_ids_oox(self, selected_repre):
-        project_name = self._project_name
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            representation_names=[selected_repre],
-            version_ids=self._version_entities_by_id.keys(),
-            fields={"id"}
-        )
-        return {repre_entity["id"] for repre_entity in repre_entities}
+        output = set()
+        for version_id in self._version_entities_by_id:
+            repre_entity = self._entities_index.get_version_repres_by_name(
+                version_id
+            ).get(selected_repre)
+            if repre_entity is not None:
+                output.add(repre_entity["id"])
+        return output
+
+    @staticmethod
+    def _intersect_names(names_sets):
+        """Intersection of names, empty sets are skipped."""
+        output = None
+        for names in names_sets:
+            if not names:
+                continue
+            if output is None:
+                output = set(names)
+            else:
+                output &= names
+
+            if not output:
+                break
+        return list(output or [])
 
     def _get_product_box_values(self):
-        project_name = self._project_name
         selected_folder_id = self._folders_field.get_selected_folder_id()
         if selected_folder_id:
             folder_ids = [selected_folder_id]
         else:
             folder_ids = list(self._folder_entities_by_id.keys())
 
-        product_entities = ayon_api.get_products(
-            project_name,
-            folder_ids=folder_ids,
-            fields={"folderId", "name"}
+        self._entities_index.prefetch_folders(folder_ids)
+        return self._intersect_names(
+            set(self._entities_index.get_products_by_name(folder_id))
+            for folder_id in folder_ids
         )
 
-        product_names_by_parent_id = collections.defaultdict(set)
-        for product_entity in product_entities:
-            product_names_by_parent_id[product_entity["folderId"]].add(
-                product_entity["name"]
-            )
-
-        possible_product_names = None
-        for product_names in product_names_by_parent_id.values():
-            if possible_product_names is None:
-                possible_product_names = product_names
-            else:
-                possible_product_names = possible_product_names.intersection(
-                    product_names)
-
-            if not possible_product_names:
-                break
-
-        if not possible_product_names:
-            return []
-        return list(possible_product_names)
-
     def _representations_box_values(self):
         # NOTE hero versions are not used because it is expected that
         # hero version has same representations as latests
-        project_name = self._project_name
         selected_folder_id = self._folders_field.get_selected_folder_id()
         selected_product_name = self._products_combox.currentText()
+        entities_index = self._entities_index
 
         # If nothing is selected
         # [ ] [ ] [?]
         if not selected_folder_id and not selected_product_name:
             # Find all representations of selection's products
-            possible_repres = ayon_api.get_representations(
-                project_name,
-                version_ids=self._version_entities_by_id.keys(),
-                fields={"versionId", "name"}
+            return self._intersect_names(
+                set(entities_index.get_version_repres_by_name(version_id))
+                for version_id in self._version_entities_by_id
             )
 
-            possible_repres_by_parent = collections.defaultdict(set)
-            for repre in possible_repres:
-                possible_repres_by_parent[repre["versionId"]].add(
-                    repre["name"]
-                )
-
-            output_repres = None
-            for repre_names in possible_repres_by_parent.values():
-                if output_repres is None:
-                    output_repres = repre_names
-                else:
-                    output_repres = (output_repres & repre_names)
-
-                if not output_repres:
-                    break
-
-            return list(output_repres or list())
-
         # [x] [x] [?]
         if selected_folder_id and selected_product_name:
-            product_entity = ayon_api.get_product_by_name(
-                project_name,
-                selected_product_name,
-                selected_folder_id,
-                fields={"id"}
+            repres_by_name = entities_index.get_last_version_repres_by_name(
+                selected_folder_id, selected_product_name
             )
-
-            product_id = product_entity["id"]
-            last_versions_by_product_id = self.find_last_versions([product_id])
-            version_entity = last_versions_by_product_id.get(product_id)
-            repre_entities = ayon_api.get_representations(
-                project_name,
-                version_ids={version_entity["id"]},
-                fields={"name"}
-            )
-            return {
-                repre_entity["name"]
-                for repre_entity in repre_entities
-            }
+            return set(repres_by_name or [])
 
         # [x] [ ] [?]
         # If only folder is selected
@@ -877,106 +767,24 @@ class SwitchAssetDialog(QtWidgets.QDialog):
                 product_entity["name"]
                 for product_entity in self._product_entities_by_id.values()
             }
-
-            product_entities = ayon_api.get_products(
-                project_name,
-                folder_ids={selected_folder_id},
-                product_names=product_names,
-                fields={"id"}
-            )
-            product_ids = {
-                product_entity["id"]
-                for product_entity in product_entities
-            }
-            if not product_ids:
-                return list()
-
-            last_versions_by_product_id = self.find_last_versions(product_ids)
-            product_id_by_version_id = {}
-            for product_id, last_version in (
-                last_versions_by_product_id.items()
-            ):
-                version_id = last_version["id"]
-                product_id_by_version_id[version_id] = product_id
-
-            if not product_id_by_version_id:
-                return list()
-
-            repre_entities = list(ayon_api.get_representations(
-                project_name,
-                version_ids=product_id_by_version_id.keys(),
-                fields={"name", "versionId"}
-            ))
-            if not repre_entities:
-                return list()
-
-            repre_names_by_parent = collections.defaultdict(set)
-            for repre_entity in repre_entities:
-                repre_names_by_parent[repre_entity["versionId"]].add(
-                    repre_entity["name"]
+            repre_names_by_product_name = (
+                entities_index.get_last_versions_repre_names(
+                    selected_folder_id, product_names
                 )
-
-            available_repres = None
-            for repre_names in repre_names_by_parent.values():
-                if available_repres is None:
-                    available_repres = repre_names
-                    continue
-
-                available_repres = available_repres.intersection(repre_names)
-
-            return list(available_repres)
+            )
+            return self._intersect_names(
+                repre_names_by_product_name.values()
+            )
 
         # [ ] [x] [?]
-        product_entities = list(ayon_api.get_products(
-            project_name,
-            folder_ids=self._folder_entities_by_id.keys(),
-            product_names=[selected_product_name],
-            fields={"id", "folderId"}
-        ))
-        if not product_entities:
-            return list()
-
-        product_entities_by_id = {
-            product_entity["id"]: product_entity
-            for product_entity in product_entities
-        }
-        last_versions_by_product_id = self.find_last_versions(
-            product_entities_by_id.keys()
-        )
-
-        product_id_by_version_id = {}
-        for product_id, last_version in last_versions_by_product_id.items():
-            version_id = last_version["id"]
-            product_id_by_version_id[version_id] = product_id
-
-        if not product_id_by_version_id:
-            return list()
-
-        repre_entities = list(
-            ayon_api.get_representations(
-                project_name,
-                version_ids=product_id_by_version_id.keys(),
-                fields={"name", "versionId"}
+        return self._intersect_names(
+            set(
+                entities_index.get_last_version_repres_by_name(
+                    folder_id, selected_product_name
+                ) or []
             )
+            for folder_id in self._folder_entities_by_id
         )
-        if not repre_entities:
-            return list()
-
-        repre_names_by_folder_id = collections.defaultdict(set)
-        for repre_entity in repre_entities:
-            product_id = product_id_by_version_id[repre_entity["versionId"]]
-            folder_id = product_entities_by_id[product_id]["folderId"]
-            repre_names_by_folder_id[folder_id].add(repre_entity["name"])
-
-        available_repres = None
-        for repre_names in repre_names_by_folder_id.values():
-            if available_repres is None:
-                available_repres = repre_names
-                continue
-
-            available_repres = available_repres.intersection(repre_names)
-
-        return list(available_repres)
 
     def _is_folder_ok(self, validation_state):
         selected_folder_id = self._folders_field.get_selected_folder_id()
@@ -1003,16 +811,9 @@ class SwitchAssetDialog(QtWidgets.QDialog):
             return
 
         # [x] [ ] [?]
-        project_name = self._project_name
-        product_entities = ayon_api.get_products(
-            project_name, folder_ids=[selected_folder_id], fields={"name"}
-        )
-
         product_names = set(
-            product_entity["name"]
-            for product_entity in product_entities
+            self._entities_index.get_products_by_name(selected_folder_id)
         )
-
         for product_entity in self._product_entities_by_id.values():
             if product_entity["name"] not in product_names:
                 validation_state.product_ok = False
@@ -1022,6 +823,7 @@ class SwitchAssetDialog(QtWidgets.QDialog):
         selected_folder_id = self._folders_field.get_selected_folder_id()
         selected_product_name = self._products_combox.get_valid_value()
         selected_repre = self._representations_box.get_valid_value()
+        entities_index = self._entities_index
 
         # [?] [?] [x]
         # If product is selected then must be ok
@@ -1039,125 +841,48 @@ class SwitchAssetDialog(QtWidgets.QDialog):
             return
 
         # [x] [x] [ ]
-        project_name = self._project_name
         if (
             selected_folder_id is not None
             and selected_product_name is not None
         ):
-            product_entity = ayon_api.get_product_by_name(
-                project_name,
-                selected_product_name,
-                selected_folder_id,
-                fields={"id"}
+            repres_by_name = entities_index.get_last_version_repres_by_name(
+                selected_folder_id, selected_product_name
             )
-            product_id = product_entity["id"]
-            last_versions_by_product_id = self.find_last_versions([product_id])
-            last_version = last_versions_by_product_id.get(product_id)
-            if not last_version:
+            if repres_by_name is None:
                 validation_state.repre_ok = False
                 return
 
-            repre_entities = ayon_api.get_representations(
-                project_name,
-                version_ids={last_version["id"]},
-                fields={"name"}
-            )
-
-            repre_names = set(
-                repre_entity["name"]
-                for repre_entity in repre_entities
-            )
             for repre_entity in self._repre_entities_by_id.values():
-                if repre_entity["name"] not in repre_names:
+                if repre_entity["name"] not in repres_by_name:
                     validation_state.repre_ok = False
                     break
             return
 
         # [x] [ ] [ ]
         if selected_folder_id is not None:
-            product_entities = list(ayon_api.get_products(
-                project_name,
-                folder_ids={selected_folder_id},
-                fields={"id", "name"}
-            ))
-
-            product_name_by_id = {}
-            product_ids = set()
-            for product_entity in product_entities:
-                product_id = product_entity["id"]
-                product_ids.add(product_id)
-                product_name_by_id[product_id] = product_entity["name"]
-
-            last_versions_by_product_id = self.find_last_versions(product_ids)
-
-            product_id_by_version_id = {}
-            for product_id, last_version in (
-                last_versions_by_product_id.items()
-            ):
-                version_id = last_version["id"]
-                product_id_by_version_id[version_id] = product_id
-
-            repre_entities = ayon_api.get_representations(
-                project_name,
-                version_ids=product_id_by_version_id.keys(),
-                fields={"name", "versionId"}
+            repres_by_product_name = (
+                entities_index.get_last_versions_repre_names(
+                    selected_folder_id
+                )
             )
-            repres_by_product_name = collections.defaultdict(set)
-            for repre_entity in repre_entities:
-                version_id = repre_entity["versionId"]
-                product_id = product_id_by_version_id[version_id]
-                product_name = product_name_by_id[product_id]
-                repres_by_product_name[product_name].add(repre_entity["name"])
-
-            for repre_entity in self._repre_entities_by_id.values():
-                version_id = repre_entity["versionId"]
-                version_entity = self._version_entities_by_id[version_id]
-                product_id = version_entity["productId"]
-                product_entity = self._product_entities_by_id[product_id]
-                repre_names = repres_by_product_name[product_entity["name"]]
+            for repre_entity, product_entity in self._iter_content_repres():
+                repre_names = repres_by_product_name.get(
+                    product_entity["name"], set()
+                )
                 if repre_entity["name"] not in repre_names:
                     validation_state.repre_ok = False
                     break
             return
 
         # [ ] [x] [ ]
-        # Product entities
-        product_entities = ayon_api.get_products(
-            project_name,
-            folder_ids=self._folder_entities_by_id.keys(),
-            product_names={selected_product_name},
-            fields={"id", "name", "folderId"}
-        )
-        product_entities_by_id = {}
-        for product_entity in product_entities:
-            product_entities_by_id[product_entity["id"]] = product_entity
-
-        last_versions_by_product_id = self.find_last_versions(
-            product_entities_by_id.keys()
-        )
-        product_id_by_version_id = {}
-        for product_id, last_version in last_versions_by_product_id.items():
-            version_id = last_version["id"]
-            product_id_by_version_id[version_id] = product_id
-
-        repre_entities = ayon_api.get_representations(
-            project_name,
-            version_ids=product_id_by_version_id.keys(),
-            fields={"name", "versionId"}
-        )
-        repres_by_folder_id = collections.defaultdict(set)
-        for repre_entity in repre_entities:
-            product_id = product_id_by_version_id[repre_entity["versionId"]]
-            folder_id = product_entities_by_id[product_id]["folderId"]
-            repres_by_folder_id[folder_id].add(repre_entity["name"])
-
-        for repre_entity in self._repre_entities_by_id.values():
-            version_id = repre_entity["versionId"]
-            version_entity = self._version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = self._product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            repre_names = repres_by_folder_id[folder_id]
+        repres_by_folder_id = {
+            folder_id: entities_index.get_last_version_repres_by_name(
+                folder_id, selected_product_name
+            ) or {}
+            for folder_id in self._folder_entities_by_id
+        }
+        for repre_entity, product_entity in self._iter_content_repres():
+            repre_names = repres_by_folder_id[product_entity["folderId"]]
             if repre_entity["name"] not in repre_names:
                 validation_state.repre_ok = False
                 break
@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import threading
 import collections
 import json
@@ -17,9 +18,22 @@ class StdOutBroker:
     """
     Application showing console in Services tray for non python hosts
     instead of cmd window.
+
+    Outputs are only appended to a bounded queue in the writing thread.
+    Single sender thread sends them to tray in batches, the batch is sent
+    after 'TIMER_TIMEOUT' or when 'MAX_BATCH_SIZE' characters are queued.
+    The sender thread also takes care of (re)connection to tray so writes
+    to stdout and stderr never wait for tray. Oldest lines are dropped when
+    more than 'MAX_LINES' lines are queued, e.g. when tray is not
+    available.
     """
     MAX_LINES = 10000
+    MAX_BATCH_SIZE = 64 * 1024
     TIMER_TIMEOUT = 0.200
+    CONNECT_TIMEOUT = 5
+    RECONNECT_MIN_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 30
+    STOP_TIMEOUT = 5
 
     def __init__(self, host_name):
         self.host_name = host_name
@@ -32,32 +46,60 @@ class StdOutBroker:
         date_str = datetime.now().strftime("%d%m%Y%H%M%S")
         self.host_id = "{}_{}".format(self.host_name, date_str)
 
+        self._condition = threading.Condition()
+        self._payloads_queue = collections.deque()
+        self._queue_size = 0
+        self._dropped_lines = 0
+        self._dropped_lines_total = 0
+        self._reconnect_delay = 0
+        self._next_connect_time = 0
+        self._connection_failed = False
+
         self._std_available = False
         self._is_running = False
         self._catch_std_outputs()
 
-        self._timer = None
+        self._sender_thread = None
 
     @property
     def send_to_tray(self):
         """Checks if connected to tray and have access to logs."""
-        return self.webserver_client and self._std_available
+        return bool(self.webserver_client and self._std_available)
+
+    @property
+    def dropped_lines(self):
+        """Number of lines that were dropped because queue was full."""
+        return self._dropped_lines_total
 
     def start(self):
-        """Start app, create and start timer"""
+        """Start app, connection to tray is made in sender thread"""
         if not self._std_available or self._is_running:
             return
         self._is_running = True
-        self._create_timer()
-        self._connect_to_tray()
+        self._connection_failed = False
+        self._next_connect_time = 0
+        self._reconnect_delay = 0
+        thread = threading.Thread(
+            target=self._sender_loop,
+            name="StdOutBrokerSender",
+            daemon=True,
+        )
+        self._sender_thread = thread
+        thread.start()
 
     def stop(self):
         """Disconnect from Tray, process last logs"""
         if not self._is_running:
             return
-        self._is_running = False
-        self._process_queue()
-        self._disconnect_from_tray()
+        with self._condition:
+            self._is_running = False
+            self._condition.notify_all()
+
+        thread = self._sender_thread
+        self._sender_thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.STOP_TIMEOUT)
+        self._restore_std_outputs()
 
     def host_connected(self):
         """Send to Tray console that host is ready - icon change. """
@@ -71,43 +113,170 @@ class StdOutBroker:
         }
         self._send(payload)
 
-    def _create_timer(self):
-        timer = threading.Timer(self.TIMER_TIMEOUT, self._timer_callback)
-        timer.start()
-        self._timer = timer
-
-    def _timer_callback(self):
+    def _send(self, payload):
+        """Queue payload that is sent by sender thread before next lines."""
+        with self._condition:
+            self._payloads_queue.append(payload)
+            self._condition.notify_all()
+
+    def _sender_loop(self):
+        while True:
+            with self._condition:
+                ready = self._wait_for_batch()
+                is_running = self._is_running
+
+            if ready and self._connect_to_tray():
+                with self._condition:
+                    payloads = tuple(self._payloads_queue)
+                    self._payloads_queue.clear()
+                    lines = tuple(self.log_queue)
+                    self.log_queue.clear()
+                    self._queue_size = 0
+                    dropped_lines = self._dropped_lines
+                    self._dropped_lines = 0
+
+                if dropped_lines:
+                    lines = (
+                        "... ({} lines dropped)".format(dropped_lines),
+                    ) + lines
+                self._send_batch(payloads, lines)
+
+            if not is_running:
+                self._disconnect_from_tray()
+                return
+
+    def _wait_for_batch(self):
+        """Wait until queued data should be sent.
+
+        Is called with acquired condition. Does not wait when broker is
+            stopping.
+
+        Returns:
+            bool: Queued data should be processed.
+        """
         if not self._is_running:
-            return
-        self._process_queue()
-        self._create_timer()
+            return True
+
+        # Tray can't be connected - nothing will be sent
+        if self._connection_failed:
+            self._payloads_queue.clear()
+            self.log_queue.clear()
+            self._queue_size = 0
+            self._condition.wait()
+            return False
+
+        # Nothing to send - sleep until something is queued
+        if not self.log_queue and not self._payloads_queue:
+            self._condition.wait()
+            return False
+
+        # Tray is not available - wait for next connection attempt
+        if self.webserver_client is None:
+            remaining = self._next_connect_time - time.time()
+            if remaining > 0:
+                self._condition.wait(remaining)
+                return False
+
+        # Give writers time to fill the batch
+        if not self._payloads_queue and self._queue_size < self.MAX_BATCH_SIZE:
+            self._condition.wait(self.TIMER_TIMEOUT)
+        return True
+
+    def _send_batch(self, payloads, lines):
+        messages = [json.dumps(payload) for payload in payloads]
+        if lines:
+            messages.append(json.dumps({
+                "host": self.host_id,
+                "action": HostMsgAction.ADD,
+                "text": "\n".join(lines)
+            }))
+
+        for idx, message in enumerate(messages):
+            try:
+                self.webserver_client.send(message)
+
+            except (OSError, websocket.WebSocketException):  # Tray closed
+                log.debug("Connection to tray was lost", exc_info=True)
+                self._close_connection()
+                self._requeue(payloads[idx:], lines)
+                return
+
+    def _requeue(self, payloads, lines):
+        """Put back data that were not sent to tray."""
+        with self._condition:
+            self._payloads_queue.extendleft(reversed(payloads))
+            for line in reversed(lines):
+                if len(self.log_queue) >= self.MAX_LINES:
+                    self._drop_line()
+                    continue
+                self.log_queue.appendleft(line)
+                self._queue_size += len(line)
 
     def _connect_to_tray(self):
-        """Connect to Tray webserver to pass console output. """
-        if not self._std_available:  # not content to log
-            return
-        ws = websocket.WebSocket()
-        webserver_url = os.environ.get("AYON_WEBSERVER_URL")
+        """Connect to Tray webserver to pass console output.
+
+        Returns:
+            bool: Broker is connected to tray.
+        """
+        if self.webserver_client is not None:
+            return True
 
+        if (
+            self._connection_failed
+            or not self._std_available  # not content to log
+            or time.time() < self._next_connect_time
+        ):
+            return False
+
+        webserver_url = os.environ.get("AYON_WEBSERVER_URL")
         if not webserver_url:
-            print("Unknown webserver url, cannot connect to pass log")
-            return
+            self._write_original(
+                "Unknown webserver url, cannot connect to pass log\n"
+            )
+            self._connection_failed = True
+            return False
 
         webserver_url = webserver_url.replace("http", "ws")
-        ws.connect("{}/ws/host_listener".format(webserver_url))
+        ws = websocket.WebSocket()
+        try:
+            ws.connect(
+                "{}/ws/host_listener".format(webserver_url),
+                timeout=self.CONNECT_TIMEOUT,
+            )
+            ws.send(json.dumps({
+                "host": self.host_id,
+                "action": HostMsgAction.CONNECTING,
+                "text": "Integration with {}".format(
+                    str.capitalize(self.host_name))
+            }))
+
+        except (OSError, websocket.WebSocketException):
+            log.debug("Failed to connect to tray", exc_info=True)
+            self._reconnect_delay = min(
+                max(self._reconnect_delay * 2, self.RECONNECT_MIN_DELAY),
+                self.RECONNECT_MAX_DELAY
+            )
+            self._next_connect_time = time.time() + self._reconnect_delay
+            return False
+
+        self._reconnect_delay = 0
         self.webserver_client = ws
+        return True
 
-        payload = {
-            "host": self.host_id,
-            "action": HostMsgAction.CONNECTING,
-            "text": "Integration with {}".format(
-                str.capitalize(self.host_name))
-        }
-        self._send(payload)
+    def _close_connection(self):
+        ws = self.webserver_client
+        self.webserver_client = None
+        self._next_connect_time = time.time() + self.RECONNECT_MIN_DELAY
+        if ws is None:
+            return
+        try:
+            ws.close()
+        except (OSError, websocket.WebSocketException):
+            pass
 
     def _disconnect_from_tray(self):
         """Send to Tray that host is closing - remove from Services. """
-        print("Host {} closing".format(self.host_name))
+        self._write_original("Host {} closing\n".format(self.host_name))
         if not self.webserver_client:
             return
 
@@ -117,9 +286,11 @@ class StdOutBroker:
             "text": "Integration with {}".format(
                 str.capitalize(self.host_name))
         }
-
-        self._send(payload)
-        self.webserver_client.close()
+        try:
+            self.webserver_client.send(json.dumps(payload))
+        except (OSError, websocket.WebSocketException):
+            pass
+        self._close_connection()
 
     def _catch_std_outputs(self):
         """Redirects standard out and error to own functions"""
@@ -133,42 +304,58 @@ class StdOutBroker:
             sys.stderr.write = self._my_stderr_write
             self._std_available = True
 
+    def _restore_std_outputs(self):
+        """Set back original write functions of standard out and error"""
+        if (
+            self.original_stdout_write is not None
+            and sys.stdout
+            and sys.stdout.write == self._my_stdout_write
+        ):
+            sys.stdout.write = self.original_stdout_write
+
+        if (
+            self.original_stderr_write is not None
+            and sys.stderr
+            and sys.stderr.write == self._my_stderr_write
+        ):
+            sys.stderr.write = self.original_stderr_write
+
+    def _write_original(self, text):
+        if self.original_stdout_write is not None:
+            self.original_stdout_write(text)
+
     def _my_stdout_write(self, text):
         """Appends outputted text to queue, keep writing to original stdout"""
         if self.original_stdout_write is not None:
             self.original_stdout_write(text)
-        if self.send_to_tray:
-            self.log_queue.append(text)
+        self._add_to_queue(text)
 
     def _my_stderr_write(self, text):
         """Appends outputted text to queue, keep writing to original stderr"""
         if self.original_stderr_write is not None:
             self.original_stderr_write(text)
-        if self.send_to_tray:
-            self.log_queue.append(text)
+        self._add_to_queue(text)
 
-    def _process_queue(self):
-        """Sends lines and purges queue"""
-        if not self.send_to_tray:
+    def _add_to_queue(self, text):
+        if not self._is_running or self._connection_failed:
             return
 
-        lines = tuple(self.log_queue)
-        self.log_queue.clear()
-        if lines:
-            payload = {
-                "host": self.host_id,
-                "action": HostMsgAction.ADD,
-                "text": "\n".join(lines)
-            }
-
-            self._send(payload)
+        with self._condition:
+            if len(self.log_queue) >= self.MAX_LINES:
+                self._queue_size -= len(self.log_queue.popleft())
+                self._drop_line()
 
-    def _send(self, payload):
-        """Worker method to send to existing websocket connection."""
-        if not self.send_to_tray:
-            return
-
-        try:
-            self.webserver_client.send(json.dumps(payload))
-        except ConnectionResetError:  # Tray closed
-            self._connect_to_tray()
+            was_empty = not self.log_queue
+            was_full = self._queue_size >= self.MAX_BATCH_SIZE
+            self.log_queue.append(text)
+            self._queue_size += len(text)
+            # Wake up sender only when it is waiting for data or the batch
+            #   became full
+            if was_empty or (
+                not was_full and self._queue_size >= self.MAX_BATCH_SIZE
+            ):
+                self._condition.notify_all()
+
+    def _drop_line(self):
+        self._dropped_lines += 1
+        self._dropped_lines_total += 1
@@ -33,6 +33,7 @@ from ayon_core.tools.tray.lib import (
     remove_tray_server_url,
     TrayIsRunningError,
 )
+from ayon_core.tools.tray.webserver import EntityCacheService
 from ayon_core.tools.launcher.ui import LauncherWindow
 from ayon_core.tools.loader.ui import LoaderWindow
 from ayon_core.tools.console_interpreter.ui import ConsoleInterpreterWindow
@@ -84,6 +85,7 @@ class TrayManager:
 
         self._addons_manager = TrayAddonsManager(self)
         self._host_listener = HostListener(self._addons_manager, self)
+        self._entity_cache = EntityCacheService()
 
         self.errors = []
 
@@ -193,6 +195,7 @@ class TrayManager:
         self._addons_manager.add_route(
             "POST", "/tray/message", self._web_show_tray_message
         )
+        self._entity_cache.register(self._addons_manager)
 
         admin_submenu = ITrayAddon.admin_submenu(tray_menu)
         tray_menu.addMenu(admin_submenu)
@@ -1,9 +1,11 @@
 from .base_routes import RestApiEndpoint
 from .server import find_free_port, WebServerManager
+from .entity_cache import EntityCacheService
 
 
 __all__ = (
     "RestApiEndpoint",
     "find_free_port",
     "WebServerManager",
+    "EntityCacheService",
 )
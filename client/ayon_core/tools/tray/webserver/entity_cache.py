@@ -0,0 +1,359 @@
+"""Read-through entity cache shared by processes using the tray.
+
+Processes on the workstation (DCCs, tools) ask tray for commonly used
+entities instead of querying AYON server on their own. Values are cached
+with lifetime and are invalidated by server events that are checked
+during requests, so the cache does not need own timer.
+"""
+import time
+import asyncio
+import threading
+import collections
+from datetime import datetime, timezone
+
+import ayon_api
+from aiohttp.web import Request, Response, json_response
+
+from ayon_core.lib import Logger
+from ayon_core.tools.common_models.tray_cache import (
+    TRAY_CACHE_ROUTE,
+    PROJECT_ITEM_FIELDS,
+    TASK_ITEM_FIELDS,
+)
+
+# Events that invalidate cached data of project
+PROJECT_EVENT_TOPICS = (
+    "entity.project.*",
+    "entity.folder.*",
+    "entity.task.*",
+    "entity.product.created",
+)
+SETTINGS_EVENT_TOPIC = "settings.changed"
+# Categories invalidated by project events (settings are not affected)
+ENTITY_CATEGORIES = (
+    "project",
+    "hierarchy",
+    "tasks",
+    "product_types",
+)
+
+
+class _CacheEntry:
+    def __init__(self, value, lifetime):
+        self.value = value
+        self.outdate_time = time.time() + lifetime
+
+    @property
+    def is_valid(self):
+        return time.time() < self.outdate_time
+
+
+class EntityCacheService:
+    """Tray side of entity cache.
+
+    Cache keys are tuples where first item is category and second item is
+    project name (or None).
+
+    Args:
+        lifetime (Optional[int]): Lifetime of cached entities in seconds.
+        settings_lifetime (Optional[int]): Lifetime of cached settings.
+        events_interval (Optional[int]): Minimum interval between checks
+            of server events. Events are not checked if is '0'.
+    """
+    lifetime = 300
+    settings_lifetime = 60
+    events_interval = 5
+
+    def __init__(
+        self, lifetime=None, settings_lifetime=None, events_interval=None
+    ):
+        if lifetime is not None:
+            self.lifetime = lifetime
+        if settings_lifetime is not None:
+            self.settings_lifetime = settings_lifetime
+        if events_interval is not None:
+            self.events_interval = events_interval
+
+        self._log = None
+        self._lock = threading.Lock()
+        self._events_lock = threading.Lock()
+        self._key_locks = {}
+        self._entries = {}
+        self._hits = collections.Counter()
+        self._misses = collections.Counter()
+        self._invalidations = 0
+        self._started_at = time.time()
+        self._events_newer_than = datetime.now(timezone.utc).isoformat()
+        self._next_events_check = 0
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def register(self, webserver_manager):
+        """Register routes to webserver manager.
+
+        Args:
+            webserver_manager (WebServerManager): Object with 'add_route'.
+        """
+        routes = (
+            ("GET", "/projects", self._web_get_projects),
+            ("GET", "/projects/{project_name}", self._web_get_project),
+            (
+                "GET",
+                "/projects/{project_name}/hierarchy",
+                self._web_get_hierarchy,
+            ),
+            (
+                "GET",
+                "/projects/{project_name}/folders/{folder_id}/tasks",
+                self._web_get_tasks,
+            ),
+            (
+                "GET",
+                "/projects/{project_name}/product_types",
+                self._web_get_product_types,
+            ),
+            ("GET", "/settings", self._web_get_settings),
+            ("GET", "/stats", self._web_get_stats),
+            ("POST", "/invalidate", self._web_invalidate),
+        )
+        for request_method, path, handler in routes:
+            webserver_manager.add_route(
+                request_method, f"{TRAY_CACHE_ROUTE}{path}", handler
+            )
+
+    def get_value(self, key, getter, lifetime=None, refresh=False):
+        """Get cached value or query it using getter.
+
+        Concurrent requests of the same key wait for single query.
+
+        Args:
+            key (tuple): Cache key.
+            getter (Callable[[], Any]): Function that queries the value.
+            lifetime (Optional[int]): Lifetime of value.
+            refresh (Optional[bool]): Query value even if is cached.
+
+        Returns:
+            Any: Cached value.
+        """
+        self.check_events()
+        category = key[0]
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry = self._entries.get(key)
+            if not refresh and entry is not None and entry.is_valid:
+                with self._lock:
+                    self._hits[category] += 1
+                return entry.value
+
+            with self._lock:
+                self._misses[category] += 1
+            if lifetime is None:
+                lifetime = self.lifetime
+            value = getter()
+            with self._lock:
+                self._entries[key] = _CacheEntry(value, lifetime)
+            return value
+
+    def invalidate(self, project_name=None, category=None):
+        """Invalidate cached values.
+
+        Args:
+            project_name (Optional[str]): Invalidate only values related
+                to project.
+            category (Optional[str]): Invalidate only values of category.
+        """
+        with self._lock:
+            for key in tuple(self._entries):
+                if category is not None and key[0] != category:
+                    continue
+                if project_name is not None and key[1] != project_name:
+                    continue
+                self._entries.pop(key)
+                self._invalidations += 1
+
+    def check_events(self):
+        """Invalidate values based on server events.
+
+        Events are checked at most once per 'events_interval'.
+        """
+        if not self.events_interval:
+            return
+
+        # Other thread is already checking events
+        if not self._events_lock.acquire(blocking=False):
+            return
+
+        try:
+            now = time.time()
+            if now < self._next_events_check:
+                return
+            self._next_events_check = now + self.events_interval
+            self._process_events()
+
+        except Exception:
+            self.log.warning(
+                "Failed to check server events.", exc_info=True
+            )
+
+        finally:
+            self._events_lock.release()
+
+    def get_stats(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, Any]: Hits, misses and hit rate per category.
+        """
+        with self._lock:
+            categories = {}
+            for category in set(self._hits) | set(self._misses):
+                hits = self._hits[category]
+                misses = self._misses[category]
+                categories[category] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses),
+                }
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "entries": len(self._entries),
+                "invalidations": self._invalidations,
+                "uptime": time.time() - self._started_at,
+                "categories": categories,
+            }
+
+    def _process_events(self):
+        topics = list(PROJECT_EVENT_TOPICS)
+        topics.append(SETTINGS_EVENT_TOPIC)
+        events = ayon_api.get_events(
+            topics=topics,
+            newer_than=self._events_newer_than,
+            fields={"topic", "project", "createdAt"},
+        )
+        for event in events:
+            created_at = event["createdAt"]
+            if created_at > self._events_newer_than:
+                self._events_newer_than = created_at
+
+            if event["topic"] == SETTINGS_EVENT_TOPIC:
+                self.invalidate(category="settings")
+                continue
+
+            if event["topic"].startswith("entity.project."):
+                self.invalidate(category="projects")
+
+            project_name = event.get("project")
+            if project_name:
+                for category in ENTITY_CATEGORIES:
+                    self.invalidate(project_name, category)
+
+    async def _get_value_async(
+        self, key, getter, lifetime=None, refresh=False
+    ):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.get_value, key, getter, lifetime, refresh
+        )
+
+    async def _value_response(
+        self, key, getter, lifetime=None, refresh=False
+    ) -> Response:
+        try:
+            value = await self._get_value_async(
+                key, getter, lifetime, refresh
+            )
+        except Exception as exc:
+            self.log.warning(
+                f"Failed to query cache value {key}.", exc_info=True
+            )
+            return json_response({"error": str(exc)}, status=500)
+        return json_response(value)
+
+    @staticmethod
+    def _is_refresh(request: Request) -> bool:
+        return request.query.get("refresh") in {"1", "true"}
+
+    async def _web_get_projects(self, request: Request) -> Response:
+        return await self._value_response(
+            ("projects", None),
+            lambda: list(ayon_api.get_projects(fields=PROJECT_ITEM_FIELDS)),
+            refresh=self._is_refresh(request),
+        )
+
+    async def _web_get_project(self, request: Request) -> Response:
+        project_name = request.match_info["project_name"]
+        return await self._value_response(
+            ("project", project_name),
+            lambda: ayon_api.get_project(project_name),
+            refresh=self._is_refresh(request),
+        )
+
+    async def _web_get_hierarchy(self, request: Request) -> Response:
+        project_name = request.match_info["project_name"]
+        return await self._value_response(
+            ("hierarchy", project_name),
+            lambda: ayon_api.get_folders_hierarchy(project_name),
+            refresh=self._is_refresh(request),
+        )
+
+    async def _web_get_tasks(self, request: Request) -> Response:
+        project_name = request.match_info["project_name"]
+        folder_id = request.match_info["folder_id"]
+        return await self._value_response(
+            ("tasks", project_name, folder_id),
+            lambda: list(ayon_api.get_tasks(
+                project_name,
+                folder_ids=[folder_id],
+                fields=TASK_ITEM_FIELDS
+            )),
+            refresh=self._is_refresh(request),
+        )
+
+    async def _web_get_product_types(self, request: Request) -> Response:
+        project_name = request.match_info["project_name"]
+        return await self._value_response(
+            ("product_types", project_name),
+            lambda: ayon_api.get_project_product_types(project_name),
+            refresh=self._is_refresh(request),
+        )
+
+    async def _web_get_settings(self, request: Request) -> Response:
+        bundle_name = request.query.get("bundle")
+        variant = request.query.get("variant")
+        project_name = request.query.get("project") or None
+        if not bundle_name or not variant:
+            return json_response(
+                {"error": "Missing 'bundle' or 'variant'."}, status=400
+            )
+        return await self._value_response(
+            ("settings", project_name, bundle_name, variant),
+            lambda: ayon_api.get_addons_settings(
+                bundle_name=bundle_name,
+                project_name=project_name,
+                variant=variant,
+            ),
+            lifetime=self.settings_lifetime,
+            refresh=self._is_refresh(request),
+        )
+
+    async def _web_get_stats(self, _request: Request) -> Response:
+        return json_response(self.get_stats())
+
+    async def _web_invalidate(self, request: Request) -> Response:
+        data = {}
+        if request.can_read_body:
+            data = await request.json()
+        self.invalidate(
+            data.get("project_name"), data.get("category")
+        )
+        return json_response({"success": True})
@@ -509,6 +509,7 @@ class BaseWorkfileController(
 
         self._projects_model.reset()
         self._hierarchy_model.reset()
+        self._workfiles_model.reset()
 
         if not expected_folder_id:
             expected_folder_id = folder_id
@@ -615,6 +616,7 @@ class BaseWorkfileController(
         try:
             dst_filepath = os.path.join(workdir, filename)
             shutil.copy(src_filepath, dst_filepath)
+            self._workfiles_model.invalidate_workarea_dir(workdir)
         except Exception:
             failed = True
             self.log.warning("Duplication of workfile failed", exc_info=True)
@@ -638,6 +640,9 @@ class BaseWorkfileController(
             host.save_workfile(filepath)
         else:
             host.save_file(filepath)
+        self._workfiles_model.invalidate_workarea_dir(
+            os.path.dirname(filepath)
+        )
 
     def _emit_event(self, topic, data=None):
         self.emit_event(topic, data, "controller")
@@ -743,6 +748,7 @@ class BaseWorkfileController(
         dst_filepath = os.path.join(workdir, filename)
         if src_filepath:
             shutil.copyfile(src_filepath, dst_filepath)
+            self._workfiles_model.invalidate_workarea_dir(workdir)
             self._host_open_workfile(dst_filepath)
         else:
             self._host_save_workfile(dst_filepath)
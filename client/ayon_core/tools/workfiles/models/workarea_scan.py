@@ -0,0 +1,183 @@
+import os
+import time
+import threading
+import collections
+
+# Filesystems may store modification time with low resolution, listing
+#   which was made shortly after last change of directory is not trusted.
+_RACY_MTIME_WINDOW = 2.0
+
+
+class ScannedFile:
+    """File found in scanned directory.
+
+    Stat information is gathered during directory scan, so no other
+    filesystem calls are needed.
+
+    Args:
+        dirpath (str): Directory path.
+        filename (str): Filename.
+        size (int): File size in bytes.
+        creation_time (float): Creation time (timestamp).
+        modification_time (float): Modification time (timestamp).
+    """
+
+    def __init__(
+        self, dirpath, filename, size, creation_time, modification_time
+    ):
+        self.dirpath = dirpath
+        self.filename = filename
+        self.size = size
+        self.creation_time = creation_time
+        self.modification_time = modification_time
+
+    @property
+    def filepath(self):
+        return os.path.join(self.dirpath, self.filename)
+
+    @property
+    def ext(self):
+        return os.path.splitext(self.filename)[1].lower()
+
+
+class _DirScan:
+    def __init__(self, mtime, files):
+        self.mtime = mtime
+        self.scanned_at = time.time()
+        self.files = files
+        self.files_by_name = {
+            scanned_file.filename: scanned_file
+            for scanned_file in files
+        }
+
+    def is_valid(self, mtime):
+        if mtime != self.mtime:
+            return False
+        return (self.scanned_at - self.mtime) > _RACY_MTIME_WINDOW
+
+
+class WorkareaFileScanner:
+    """Cached scanner of files in workarea directories.
+
+    Directory is scanned with single 'os.scandir' pass which also collects
+    stat information of files. Scan of directory is cached and is valid
+    until modification time of the directory changes. Overwriting of
+    existing file does not change modification time of the directory,
+    so directory should be invalidated when a file is saved.
+
+    Scanner can be used from multiple threads, so directories can be
+    scanned in background threads and UI is not blocked by slow storage.
+
+    Args:
+        max_dirs (int): Maximum number of cached directories.
+    """
+
+    def __init__(self, max_dirs=256):
+        self._max_dirs = max_dirs
+        self._lock = threading.Lock()
+        self._scans = collections.OrderedDict()
+
+    def reset(self):
+        with self._lock:
+            self._scans.clear()
+
+    def invalidate(self, dirpath=None):
+        """Invalidate cached scan.
+
+        Args:
+            dirpath (Optional[str]): Directory to invalidate. All
+                directories are invalidated if not passed.
+        """
+        with self._lock:
+            if dirpath is None:
+                self._scans.clear()
+            else:
+                self._scans.pop(os.path.normpath(dirpath), None)
+
+    def get_files(self, dirpath, extensions=None):
+        """Files in directory.
+
+        Args:
+            dirpath (str): Directory path.
+            extensions (Optional[Iterable[str]]): Filter files by
+                extensions. Extensions are expected lowercase with dot.
+
+        Returns:
+            list[ScannedFile]: Files in directory. Empty list if directory
+                does not exist.
+        """
+        if not dirpath:
+            return []
+        dir_scan = self._scan(os.path.normpath(dirpath))
+        if dir_scan is None:
+            return []
+        if extensions is None:
+            return list(dir_scan.files)
+        extensions = set(extensions)
+        return [
+            scanned_file
+            for scanned_file in dir_scan.files
+            if scanned_file.ext in extensions
+        ]
+
+    def get_file(self, filepath):
+        """Scanned file from cache.
+
+        Directory is not scanned if is not cached, to avoid scan of whole
+        directory when information about single file is needed.
+
+        Args:
+            filepath (str): Path to file.
+
+        Returns:
+            Union[ScannedFile, None]: Scanned file or None if directory
+                scan is not cached or file is not in the scan.
+        """
+        dirpath, filename = os.path.split(os.path.normpath(filepath))
+        with self._lock:
+            dir_scan = self._scans.get(dirpath)
+        if dir_scan is None:
+            return None
+        return dir_scan.files_by_name.get(filename)
+
+    def _scan(self, dirpath):
+        try:
+            mtime = os.stat(dirpath).st_mtime
+        except OSError:
+            self.invalidate(dirpath)
+            return None
+
+        with self._lock:
+            dir_scan = self._scans.get(dirpath)
+            if dir_scan is not None and dir_scan.is_valid(mtime):
+                self._scans.move_to_end(dirpath)
+                return dir_scan
+
+        files = []
+        try:
+            with os.scandir(dirpath) as scan:
+                for entry in scan:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files.append(ScannedFile(
+                        dirpath,
+                        entry.name,
+                        stat.st_size,
+                        stat.st_ctime,
+                        stat.st_mtime,
+                    ))
+        except OSError:
+            self.invalidate(dirpath)
+            return None
+
+        dir_scan = _DirScan(mtime, files)
+        with self._lock:
+            self._scans[dirpath] = dir_scan
+            self._scans.move_to_end(dirpath)
+            while len(self._scans) > self._max_dirs:
+                self._scans.popitem(last=False)
+        return dir_scan
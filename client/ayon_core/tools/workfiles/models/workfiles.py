@@ -25,6 +25,8 @@ from ayon_core.tools.workfiles.abstract import (
     WorkfileInfo,
 )
 
+from .workarea_scan import WorkareaFileScanner
+
 _NOT_SET = object()
 
 
@@ -89,10 +91,15 @@ class WorkareaModel:
     Workarea folder is usually task and host specific, defined by
     anatomy templates. Is looking for files with extensions defined
     by host integration.
+
+    Args:
+        controller (AbstractWorkfilesBackend): The control object.
+        file_scanner (WorkareaFileScanner): Scanner of workarea directories.
     """
 
-    def __init__(self, controller):
+    def __init__(self, controller, file_scanner):
         self._controller = controller
+        self._file_scanner = file_scanner
         extensions = None
         if controller.is_host_valid():
             extensions = controller.get_workfile_extensions()
@@ -114,7 +121,7 @@ class WorkareaModel:
     def _get_base_data(self):
         if self._base_data is None:
             base_data = get_template_data(
-                ayon_api.get_project(self.project_name)
+                self._controller.get_project_entity(self.project_name)
             )
             base_data["app"] = self._controller.get_host_name()
             self._base_data = base_data
@@ -180,26 +187,21 @@ class WorkareaModel:
             return items
 
         workdir = self.get_workarea_dir_by_context(folder_id, task_id)
-        if not os.path.exists(workdir):
+        if not self._extensions:
             return items
 
-        for filename in os.listdir(workdir):
-            filepath = os.path.join(workdir, filename)
-            if not os.path.isfile(filepath):
-                continue
-
-            ext = os.path.splitext(filename)[1].lower()
-            if ext not in self._extensions:
-                continue
-
+        # Stat information is collected by the scan and is used also
+        #   for workfile info
+        for scanned_file in self._file_scanner.get_files(
+            workdir, self._extensions
+        ):
             workfile_info = self._controller.get_workfile_info(
-                folder_id, task_name, filepath
+                folder_id, task_name, scanned_file.filepath
             )
-            modified = os.path.getmtime(filepath)
             items.append(FileItem(
                 workdir,
-                filename,
-                modified,
+                scanned_file.filename,
+                scanned_file.modification_time,
                 workfile_info.created_by,
                 workfile_info.updated_by,
             ))
@@ -274,16 +276,12 @@ class WorkareaModel:
 
         """
         current_comment = None
-        filenames = []
-        if root and os.path.exists(root):
-            for filename in os.listdir(root):
-                path = os.path.join(root, filename)
-                if not os.path.isfile(path):
-                    continue
-
-                ext = os.path.splitext(filename)[-1].lower()
-                if ext in extensions:
-                    filenames.append(filename)
+        filenames = [
+            scanned_file.filename
+            for scanned_file in self._file_scanner.get_files(
+                root, extensions
+            )
+        ]
 
         if not filenames:
             return [], current_comment
@@ -444,10 +442,12 @@ class WorkfileEntitiesModel:
 
     Args:
         control (AbstractWorkfileController): Controller object.
+        file_scanner (WorkareaFileScanner): Scanner of workarea directories.
     """
 
-    def __init__(self, controller):
+    def __init__(self, controller, file_scanner):
         self._controller = controller
+        self._file_scanner = file_scanner
         self._cache = {}
         self._items = {}
         self._current_username = _NOT_SET
@@ -478,14 +478,25 @@ class WorkfileEntitiesModel:
             created_by = workfile_info.get("createdBy")
             updated_by = workfile_info.get("updatedBy")
 
-        filestat = os.stat(filepath)
+        # Use stat information from workarea scan if is available
+        scanned_file = self._file_scanner.get_file(filepath)
+        if scanned_file is not None:
+            filesize = scanned_file.size
+            creation_time = scanned_file.creation_time
+            modification_time = scanned_file.modification_time
+        else:
+            filestat = os.stat(filepath)
+            filesize = filestat.st_size
+            creation_time = filestat.st_ctime
+            modification_time = filestat.st_mtime
+
         return WorkfileInfo(
             folder_id,
             task_id,
             filepath,
-            filesize=filestat.st_size,
-            creation_time=filestat.st_ctime,
-            modification_time=filestat.st_mtime,
+            filesize=filesize,
+            creation_time=creation_time,
+            modification_time=modification_time,
             created_by=created_by,
             updated_by=updated_by,
             note=note
@@ -742,10 +753,28 @@ class WorkfilesModel:
     def __init__(self, controller):
         self._controller = controller
 
-        self._entities_model = WorkfileEntitiesModel(controller)
-        self._workarea_model = WorkareaModel(controller)
+        self._file_scanner = WorkareaFileScanner()
+        self._entities_model = WorkfileEntitiesModel(
+            controller, self._file_scanner
+        )
+        self._workarea_model = WorkareaModel(controller, self._file_scanner)
         self._published_model = PublishWorkfilesModel(controller)
 
+    def reset(self):
+        self._file_scanner.reset()
+        self._workarea_model.reset()
+
+    def invalidate_workarea_dir(self, workdir):
+        """Make sure workarea directory is scanned again.
+
+        Should be called when a file in the directory was created or
+        overwritten.
+
+        Args:
+            workdir (str): Workarea directory path.
+        """
+        self._file_scanner.invalidate(workdir)
+
     def get_workfile_info(self, folder_id, task_id, filepath):
         return self._entities_model.get_workfile_info(
             folder_id, task_id, filepath
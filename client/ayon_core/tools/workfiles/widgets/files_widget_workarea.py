@@ -1,11 +1,15 @@
+import uuid
+
 import qtawesome
 from qtpy import QtWidgets, QtCore, QtGui
 
+from ayon_core.lib import Logger
 from ayon_core.style import (
     get_default_entity_icon_color,
     get_disabled_entity_icon_color,
 )
 from ayon_core.tools.utils import TreeView
+from ayon_core.tools.utils.lib import RefreshThread
 from ayon_core.tools.utils.delegates import PrettyTimeDelegate
 
 FILENAME_ROLE = QtCore.Qt.UserRole + 1
@@ -13,6 +17,8 @@ FILEPATH_ROLE = QtCore.Qt.UserRole + 2
 AUTHOR_ROLE = QtCore.Qt.UserRole + 3
 DATE_MODIFIED_ROLE = QtCore.Qt.UserRole + 4
 
+log = Logger.get_logger(__name__)
+
 
 class WorkAreaFilesModel(QtGui.QStandardItemModel):
     """A model for workare workfiles.
@@ -67,6 +73,8 @@ class WorkAreaFilesModel(QtGui.QStandardItemModel):
         self._published_mode = False
         self._selected_folder_id = None
         self._selected_task_name = None
+        self._refresh_threads = {}
+        self._current_refresh_thread = None
 
         self._add_missing_context_item()
 
@@ -172,21 +180,59 @@ class WorkAreaFilesModel(QtGui.QStandardItemModel):
             self._fill_items()
 
     def _fill_items(self):
-        try:
-            self._fill_items_impl()
-        finally:
-            self.refreshed.emit()
-
-    def _fill_items_impl(self):
         folder_id = self._selected_folder_id
         task_name = self._selected_task_name
         if not folder_id or not task_name:
+            self._current_refresh_thread = None
             self._add_missing_context_item()
+            self.refreshed.emit()
             return
 
-        file_items = self._controller.get_workarea_file_items(
-            folder_id, task_name
+        # Workarea is scanned in thread so slow storage does not block UI
+        thread = RefreshThread(
+            uuid.uuid4().hex,
+            self._controller.get_workarea_file_items,
+            folder_id,
+            task_name,
         )
+        self._current_refresh_thread = thread
+        self._refresh_threads[thread.id] = thread
+        thread.refresh_finished.connect(self._on_refresh_thread)
+        thread.start()
+
+    def _on_refresh_thread(self, thread_id):
+        """Callback when refresh thread is finished.
+
+        Result is used only from last started thread, results of previous
+        threads and results finished in published mode are ignored.
+
+        Args:
+            thread_id (str): Thread id.
+        """
+        thread = self._refresh_threads.pop(thread_id)
+        if (
+            self._published_mode
+            or self._current_refresh_thread is None
+            or thread_id != self._current_refresh_thread.id
+        ):
+            return
+        self._current_refresh_thread = None
+        if thread.failed:
+            log.warning(
+                "Failed to get workarea files.\n{}".format(
+                    thread.get_traceback()
+                )
+            )
+            file_items = []
+        else:
+            file_items = thread.get_result()
+
+        try:
+            self._fill_file_items(file_items)
+        finally:
+            self.refreshed.emit()
+
+    def _fill_file_items(self, file_items):
         root_item = self.invisibleRootItem()
         if not file_items:
             self._add_empty_item()
@@ -267,7 +313,10 @@ class WorkAreaFilesModel(QtGui.QStandardItemModel):
         if self._published_mode == published_mode:
             return
         self._published_mode = published_mode
-        if not published_mode:
+        if published_mode:
+            # Ignore result of running refresh
+            self._current_refresh_thread = None
+        else:
             self._fill_items()
 
 
@@ -329,7 +378,8 @@ class WorkAreaFilesWidget(QtWidgets.QWidget):
         self._controller = controller
 
         self._published_mode = False
-        self._change_selection_on_refresh = True
+        # Expected workfile selected when model is refreshed
+        self._expected_selection = None
 
     def set_published_mode(self, published_mode):
         """Set the published mode.
@@ -342,6 +392,9 @@ class WorkAreaFilesWidget(QtWidgets.QWidget):
 
         self._model.set_published_mode(published_mode)
         self._published_mode = published_mode
+        if published_mode and self._expected_selection is not None:
+            # Refresh result won't be used in published mode
+            self._apply_expected_selection()
 
     def set_text_filter(self, text_filter):
         """Set the text filter.
@@ -411,11 +464,20 @@ class WorkAreaFilesWidget(QtWidgets.QWidget):
         if not workfile_info["current"]:
             return
 
-        self._change_selection_on_refresh = False
+        self._expected_selection = (
+            event["folder"]["id"],
+            event["task"]["name"],
+            workfile_info["name"],
+        )
+        if self._published_mode:
+            self._apply_expected_selection()
+            return
+        # Selection is applied when refreshed items are filled
         self._model.refresh()
-        self._change_selection_on_refresh = True
 
-        workfile_name = workfile_info["name"]
+    def _apply_expected_selection(self):
+        folder_id, task_name, workfile_name = self._expected_selection
+        self._expected_selection = None
         if (
             workfile_name is not None
             and workfile_name != self._get_selected_info()["filename"]
@@ -426,14 +488,15 @@ class WorkAreaFilesWidget(QtWidgets.QWidget):
                 self._view.setCurrentIndex(proxy_index)
 
         self._controller.expected_workfile_selected(
-            event["folder"]["id"], event["task"]["name"], workfile_name
+            folder_id, task_name, workfile_name
         )
 
     def _on_model_refresh(self):
-        if (
-            not self._change_selection_on_refresh
-            or self._proxy_model.rowCount() < 1
-        ):
+        if self._expected_selection is not None:
+            self._apply_expected_selection()
+            return
+
+        if self._proxy_model.rowCount() < 1:
             return
 
         # Find the row with latest date modified
@@ -263,6 +263,16 @@ class ExtractThumbnailModel(BaseSettingsModel):
     ffmpeg_args: ExtractThumbnailFFmpegModel = SettingsField(
         default_factory=ExtractThumbnailFFmpegModel
     )
+    max_concurrent_jobs: int = SettingsField(
+        0,
+        ge=0,
+        title="Max concurrent instances",
+        description=(
+            "Maximum number of instances for which thumbnails are"
+            " extracted at the same time. Value 0 is based on number"
+            " of CPU cores, value 1 disables concurrent extraction."
+        )
+    )
 
 
 def _extract_oiio_transcoding_type():
@@ -452,6 +462,23 @@ def extract_review_filter_enum():
     ]
 
 
+def extract_review_fill_gaps_enum():
+    return [
+        {
+            "value": "link",
+            "label": "Hardlink or symlink (copy as fallback)"
+        },
+        {
+            "value": "concat",
+            "label": "FFmpeg concat manifest (no files created)"
+        },
+        {
+            "value": "copy",
+            "label": "Copy files"
+        }
+    ]
+
+
 class ExtractReviewFilterModel(BaseSettingsModel):
     families: list[str] = SettingsField(default_factory=list, title="Families")
     product_names: list[str] = SettingsField(
@@ -598,6 +625,32 @@ class ExtractReviewProfileModel(BaseSettingsModel):
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    concurrent_outputs: bool = SettingsField(
+        True,
+        title="Render outputs concurrently",
+        description=(
+            "Run ffmpeg for all output definitions of one representation"
+            " at the same time."
+        )
+    )
+    max_concurrent_outputs: int = SettingsField(
+        0,
+        ge=0,
+        title="Max concurrent outputs",
+        description=(
+            "Maximum number of ffmpeg processes running at the same time."
+            " Value 0 is based on number of CPU cores."
+        )
+    )
+    fill_gaps_mode: str = SettingsField(
+        "link",
+        title="Fill sequence gaps",
+        description=(
+            "How missing frames of image sequences are filled with nearest"
+            " existing frame."
+        ),
+        enum_resolver=extract_review_fill_gaps_enum
+    )
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -706,6 +759,37 @@ class ExtractBurninModel(BaseSettingsModel):
 # --- [END] Extract Burnin ---
 
 
+class ExtractReviewSlateModel(BaseSettingsModel):
+    _isGroup = True
+    enabled: bool = SettingsField(True)
+    stream_copy_concat: bool = SettingsField(
+        False,
+        title="Join slate without re-encoding",
+        description=(
+            "Prepend slate clip with stream copy when its streams match"
+            " the review. Used only for intra-only codecs (ProRes, DNxHD,"
+            " MJPEG), review is re-encoded otherwise."
+        )
+    )
+    concurrent_representations: bool = SettingsField(
+        True,
+        title="Process representations concurrently",
+        description=(
+            "Add slate to all review representations of one instance"
+            " at the same time."
+        )
+    )
+    max_concurrent_representations: int = SettingsField(
+        0,
+        ge=0,
+        title="Max concurrent representations",
+        description=(
+            "Maximum number of representations processed at the same time."
+            " Value 0 is based on number of CPU cores."
+        )
+    )
+
+
 class PreIntegrateThumbnailsProfile(BaseSettingsModel):
     _isGroup = True
     product_types: list[str] = SettingsField(
@@ -937,6 +1021,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=ExtractBurninModel,
         title="Extract Burnin"
     )
+    ExtractReviewSlate: ExtractReviewSlateModel = SettingsField(
+        default_factory=ExtractReviewSlateModel,
+        title="Extract Review Slate"
+    )
     ExtractUSDAssetContribution: AyonEntityURIModel = SettingsField(
         default_factory=AyonEntityURIModel,
         title="Extract USD Asset Contribution",
@@ -1082,7 +1170,8 @@ DEFAULT_PUBLISH_VALUES = {
                 "-apply_trc gamma22"
             ],
             "output": []
-        }
+        },
+        "max_concurrent_jobs": 0
     },
     "ExtractOIIOTranscode": {
         "enabled": True,
@@ -1090,6 +1179,9 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractReview": {
         "enabled": True,
+        "concurrent_outputs": True,
+        "max_concurrent_outputs": 0,
+        "fill_gaps_mode": "link",
         "profiles": [
             {
                 "product_types": [],
@@ -1259,6 +1351,12 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "ExtractReviewSlate": {
+        "enabled": True,
+        "stream_copy_concat": False,
+        "concurrent_representations": True,
+        "max_concurrent_representations": 0,
+    },
     "ExtractUSDAssetContribution": {
         "use_ayon_entity_uri": False,
     },
@@ -0,0 +1,439 @@
+"""Benchmarks of code paths used on every publish.
+
+Benchmarks are using 'benchmark' fixture of 'pytest-benchmark' when the
+plugin is installed. Minimal compatible fixture defined here is used
+otherwise, so benchmarks can run in any development environment. Both
+variants run offline without AYON server.
+
+Run benchmarks and store results for comparison between releases:
+
+    pytest tests/benchmarks --benchmark-json=benchmarks.json
+
+Fallback runner also supports comparison with previously stored results:
+
+    pytest tests/benchmarks --benchmark-compare-json=benchmarks.json
+
+All benchmarks have 'benchmark' marker, use '-m "not benchmark"' to skip
+them when running the whole test suite. Benchmark options are available
+only when benchmarks directory is passed to pytest.
+"""
+import os
+import gc
+import json
+import time
+import platform
+import subprocess
+import statistics
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+
+    HAS_PYTEST_BENCHMARK = True
+except ImportError:
+    HAS_PYTEST_BENCHMARK = False
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+class BenchmarkRunner:
+    """Minimal replacement of 'pytest-benchmark' fixture.
+
+    Callable is called in rounds until 'max_time' is reached, but at least
+    'min_rounds' times. Fast callables are called multiple times in one
+    round, so each round takes at least 'min_time'.
+
+    Args:
+        name (str): Name of benchmark test.
+        fullname (str): Node id of benchmark test.
+        max_time (float): Maximum time spent on the benchmark.
+        min_rounds (int): Minimum number of rounds.
+        min_time (float): Minimum time of one round.
+    """
+    def __init__(
+        self, name, fullname, max_time=1.0, min_rounds=5, min_time=0.0001
+    ):
+        self.name = name
+        self.fullname = fullname
+        self.max_time = max_time
+        self.min_rounds = min_rounds
+        self.min_time = min_time
+        self.stats = None
+
+    def __call__(self, func, *args, **kwargs):
+        iterations = self._calibrate(func, args, kwargs)
+        durations = []
+        result = None
+        started = time.perf_counter()
+        while (
+            len(durations) < self.min_rounds
+            or time.perf_counter() - started < self.max_time
+        ):
+            duration, result = self._run_round(func, args, kwargs, iterations)
+            durations.append(duration / iterations)
+        self._set_stats(durations, iterations)
+        return result
+
+    def pedantic(
+        self,
+        target,
+        args=(),
+        kwargs=None,
+        setup=None,
+        rounds=1,
+        iterations=1,
+        warmup_rounds=0,
+    ):
+        """Run callable exact number of rounds.
+
+        Args:
+            target (Callable): Benchmarked callable.
+            args (Iterable[Any]): Positional arguments of callable.
+            kwargs (Optional[dict[str, Any]]): Keyword arguments of callable.
+            setup (Optional[Callable]): Called before each round, can return
+                tuple of args and kwargs for the round.
+            rounds (int): Number of rounds.
+            iterations (int): Number of calls in one round. Must be 1 if
+                'setup' is used.
+            warmup_rounds (int): Number of rounds which are not measured.
+        """
+        if setup is not None and iterations != 1:
+            raise ValueError("Can't use 'setup' with multiple iterations.")
+
+        if kwargs is None:
+            kwargs = {}
+        durations = []
+        result = None
+        for idx in range(warmup_rounds + rounds):
+            round_args, round_kwargs = args, kwargs
+            if setup is not None:
+                setup_result = setup()
+                if setup_result is not None:
+                    round_args, round_kwargs = setup_result
+            duration, result = self._run_round(
+                target, round_args, round_kwargs, iterations
+            )
+            if idx >= warmup_rounds:
+                durations.append(duration / iterations)
+        self._set_stats(durations, iterations)
+        return result
+
+    def to_data(self):
+        return {
+            "name": self.name,
+            "fullname": self.fullname,
+            "stats": self.stats,
+        }
+
+    def _calibrate(self, func, args, kwargs):
+        iterations = 1
+        while True:
+            duration, _ = self._run_round(func, args, kwargs, iterations)
+            if duration >= self.min_time or iterations >= 1000000:
+                return iterations
+            iterations *= 10
+
+    @staticmethod
+    def _run_round(func, args, kwargs, iterations):
+        # Garbage collection is disabled to reduce noise
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                result = func(*args, **kwargs)
+            duration = time.perf_counter() - started
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return duration, result
+
+    def _set_stats(self, durations, iterations):
+        mean = statistics.mean(durations)
+        stddev = 0.0
+        if len(durations) > 1:
+            stddev = statistics.stdev(durations)
+        self.stats = {
+            "min": min(durations),
+            "max": max(durations),
+            "mean": mean,
+            "median": statistics.median(durations),
+            "stddev": stddev,
+            "rounds": len(durations),
+            "iterations": iterations,
+            "ops": 1.0 / mean if mean else 0.0,
+        }
+
+
+def pytest_addoption(parser):
+    if HAS_PYTEST_BENCHMARK:
+        return
+
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Store benchmark results to JSON file.",
+    )
+    group.addoption(
+        "--benchmark-compare-json",
+        default=None,
+        help="Compare benchmark results with results in JSON file.",
+    )
+    group.addoption(
+        "--benchmark-max-time",
+        type=float,
+        default=1.0,
+        help="Maximum time in seconds spent on one benchmark.",
+    )
+    group.addoption(
+        "--benchmark-skip",
+        action="store_true",
+        default=False,
+        help="Skip benchmarks.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: performance benchmark of core code paths"
+    )
+
+
+def pytest_collection_modifyitems(items):
+    benchmarks_dir = Path(__file__).resolve().parent
+    for item in items:
+        if benchmarks_dir in Path(str(item.fspath)).resolve().parents:
+            item.add_marker(pytest.mark.benchmark)
+
+
+def _get_option(config, name, default=None):
+    try:
+        return config.getoption(name)
+    except ValueError:
+        # Options are not available when conftest was not loaded initially
+        return default
+
+
+if not HAS_PYTEST_BENCHMARK:
+    _RESULTS = []
+
+    @pytest.fixture
+    def benchmark(request):
+        if _get_option(request.config, "benchmark_skip", False):
+            pytest.skip("Benchmarks are skipped (--benchmark-skip).")
+
+        runner = BenchmarkRunner(
+            request.node.name,
+            request.node.nodeid,
+            max_time=_get_option(request.config, "benchmark_max_time", 1.0),
+        )
+        yield runner
+        if runner.stats is not None:
+            _RESULTS.append(runner)
+
+    def pytest_sessionfinish(session):
+        output_path = _get_option(session.config, "benchmark_json")
+        if not output_path or not _RESULTS:
+            return
+
+        output = {
+            "machine_info": {
+                "node": platform.node(),
+                "processor": platform.processor(),
+                "machine": platform.machine(),
+                "python_implementation": platform.python_implementation(),
+                "python_version": platform.python_version(),
+                "system": platform.system(),
+                "release": platform.release(),
+                "cpu_count": os.cpu_count(),
+            },
+            "commit_info": _get_commit_info(),
+            "benchmarks": [runner.to_data() for runner in _RESULTS],
+            "datetime": datetime.now(timezone.utc).isoformat(),
+            "version": "ayon-core",
+        }
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_path, "w") as stream:
+            json.dump(output, stream, indent=4)
+
+    def pytest_terminal_summary(terminalreporter, config):
+        if not _RESULTS:
+            return
+
+        compare_path = _get_option(config, "benchmark_compare_json")
+        previous_by_name = {}
+        if compare_path:
+            with open(compare_path, "r") as stream:
+                previous_data = json.load(stream)
+            previous_by_name = {
+                item["fullname"]: item["stats"]
+                for item in previous_data["benchmarks"]
+            }
+
+        terminalreporter.section("benchmarks")
+        for runner in sorted(_RESULTS, key=lambda item: item.fullname):
+            stats = runner.stats
+            line = "{:<60} median {:>12} mean {:>12} rounds {:>6}".format(
+                runner.name,
+                _format_duration(stats["median"]),
+                _format_duration(stats["mean"]),
+                stats["rounds"],
+            )
+            previous_stats = previous_by_name.get(runner.fullname)
+            if previous_stats and previous_stats["median"]:
+                ratio = stats["median"] / previous_stats["median"]
+                line += " ({:+.1f}%)".format((ratio - 1) * 100)
+            terminalreporter.write_line(line)
+
+
+def _get_commit_info():
+    try:
+        commit_id = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=str(ROOT_DIR),
+            stderr=subprocess.DEVNULL,
+        ).decode("utf-8").strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit_id = None
+    return {"id": commit_id}
+
+
+def _format_duration(value):
+    for unit, multiplier in (
+        ("s", 1),
+        ("ms", 1000),
+        ("us", 1000000),
+    ):
+        if value * multiplier >= 1:
+            return "{:.3f} {}".format(value * multiplier, unit)
+    return "{:.1f} ns".format(value * 1000000000)
+
+
+@pytest.fixture(scope="session")
+def default_settings():
+    """Default settings of core addon.
+
+    Defaults are defined in server part of the addon which requires server
+    environment, so values are read from the source code.
+    """
+    import ast
+
+    settings_dir = ROOT_DIR / "server" / "settings"
+    output = {}
+    for filename, key in (
+        ("publish_plugins.py", "DEFAULT_PUBLISH_VALUES"),
+        ("tools.py", "DEFAULT_TOOLS_VALUES"),
+    ):
+        tree = ast.parse((settings_dir / filename).read_text("utf-8"))
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == key
+            ):
+                output[key] = ast.literal_eval(node.value)
+    return output
+
+
+@pytest.fixture(scope="session")
+def project_entity():
+    """Project entity with templates similar to server defaults."""
+    return {
+        "name": "bench_project",
+        "code": "bench",
+        "attrib": {"fps": 25.0, "resolutionWidth": 1920},
+        "taskTypes": [
+            {"name": "Compositing", "shortName": "comp"},
+            {"name": "Animation", "shortName": "anim"},
+        ],
+        "config": {
+            "roots": {
+                "work": {
+                    "windows": "C:/projects",
+                    "linux": "/mnt/projects",
+                    "darwin": "/Volumes/projects",
+                },
+            },
+            "templates": {
+                "common": {
+                    "version_padding": 3,
+                    "version": "v{version:0>{@version_padding}}",
+                    "frame_padding": 4,
+                    "frame": "{frame:0>{@frame_padding}}",
+                },
+                "work": {
+                    "default": {
+                        "directory": (
+                            "{root[work]}/{project[name]}/{hierarchy}"
+                            "/{folder[name]}/work/{task[name]}"
+                        ),
+                        "file": (
+                            "{project[code]}_{folder[name]}_{task[name]}"
+                            "_{@version}<_{comment}>.{ext}"
+                        ),
+                    },
+                },
+                "publish": {
+                    "default": {
+                        "directory": (
+                            "{root[work]}/{project[name]}/{hierarchy}"
+                            "/{folder[name]}/publish/{product[type]}"
+                            "/{product[name]}/{@version}"
+                        ),
+                        "file": (
+                            "{project[code]}_{folder[name]}_{product[name]}"
+                            "_{@version}<_{output}><.{@frame}><_{udim}>"
+                            ".{ext}"
+                        ),
+                    },
+                },
+                "hero": {
+                    "default": {
+                        "directory": (
+                            "{root[work]}/{project[name]}/{hierarchy}"
+                            "/{folder[name]}/publish/{product[type]}"
+                            "/{product[name]}/hero"
+                        ),
+                        "file": (
+                            "{project[code]}_{folder[name]}_{product[name]}"
+                            "_hero<_{output}><.{frame}>.{ext}"
+                        ),
+                    },
+                },
+            },
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def anatomy(project_entity):
+    from ayon_core.pipeline.anatomy.anatomy import BaseAnatomy
+
+    return BaseAnatomy(project_entity)
+
+
+@pytest.fixture
+def template_data(project_entity):
+    """Fill data of publish templates."""
+    return {
+        "project": {
+            "name": project_entity["name"],
+            "code": project_entity["code"],
+        },
+        "hierarchy": "shots/sq010",
+        "folder": {"name": "sh0100", "type": "Shot"},
+        "task": {"name": "comp", "type": "Compositing", "short": "comp"},
+        "product": {"name": "renderCompMain", "type": "render"},
+        "version": 12,
+        "output": "exr",
+        "frame": 1001,
+        "ext": "exr",
+        "representation": "exr",
+        "username": "artist",
+        "user": "artist",
+    }
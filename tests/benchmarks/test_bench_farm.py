@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+from ayon_core.pipeline.farm import pyblish_functions
+
+AOV_FILTER = {"maya": [".*([Bb]eauty).*", ".*(preview).*"]}
+AOV_COUNT = 40
+FRAMES_COUNT = 1000
+
+
+class _Anatomy:
+    """Anatomy which can't remap any path to rootless."""
+    def find_root_template_from_path(self, path):
+        return False, path
+
+
+def _create_payload():
+    """Create synthetic multi-camera, multi-AOV render payload."""
+    cameras = ["camA", "camB"]
+    expected_files = {}
+    products = []
+    for camera in cameras:
+        for idx in range(AOV_COUNT):
+            aov = f"{camera}_aov{idx:03d}"
+            if idx == 0:
+                aov = f"{camera}_beauty"
+            expected_files[aov] = [
+                f"/renders/sh010/{camera}/{aov}/sh010_{aov}.{frame:04d}.exr"
+                for frame in range(1001, 1001 + FRAMES_COUNT)
+            ]
+            products.append(
+                SimpleNamespace(productName=aov, colorspace="ACEScg")
+            )
+
+    render_products = SimpleNamespace(
+        layer_data=SimpleNamespace(products=products)
+    )
+    instance = SimpleNamespace(
+        data={
+            "cameras": cameras,
+            "expectedFiles": [expected_files],
+            "renderlayer": "Main",
+            "task": "lighting",
+            "renderProducts": render_products,
+        },
+        context=SimpleNamespace(data={
+            "anatomy": _Anatomy(),
+            "project_settings": {
+                "core": {
+                    "tools": {
+                        "creator": {
+                            "use_legacy_product_names_for_renders": True
+                        }
+                    }
+                }
+            },
+        }),
+    )
+    skeleton = {
+        "productName": "renderMain",
+        "productType": "render",
+        "families": ["render"],
+        "frameStartHandle": 1001,
+        "frameEndHandle": 1000 + FRAMES_COUNT,
+        "fps": 25.0,
+        "extendFrames": False,
+    }
+    additional_data = {
+        "renderProducts": render_products,
+        "colorspaceConfig": "/configs/config.ocio",
+        "colorspaceTemplate": "{root[work]}/configs/config.ocio",
+        "display": "ACES",
+        "view": "sRGB",
+    }
+    return instance, skeleton, additional_data
+
+
+def test_create_instances_for_aov(benchmark, monkeypatch):
+    monkeypatch.setenv("AYON_HOST_NAME", "maya")
+    instance, skeleton, additional_data = _create_payload()
+
+    instances = benchmark.pedantic(
+        pyblish_functions._create_instances_for_aov,
+        args=(instance, skeleton, AOV_FILTER, additional_data, [], False),
+        rounds=3,
+    )
+    assert len(instances) == AOV_COUNT * 2
@@ -0,0 +1,144 @@
+import os
+import shutil
+from unittest import mock
+
+from ayon_core.lib import transcoding
+from ayon_core.lib.events import EventSystem
+from ayon_core.lib.file_transaction import FileTransaction
+
+FILES_COUNT = 2000
+
+OIIO_ATTRIBS = "\n".join(
+    (
+        '<attrib name="compression" type="string">zip</attrib>',
+        '<attrib name="PixelAspectRatio" type="float">1</attrib>',
+        '<attrib name="screenWindowWidth" type="float">1</attrib>',
+        '<attrib name="smpte:TimeCode" type="timecode">01:00:00:01</attrib>',
+        '<attrib name="FramesPerSecond" type="rational2i">25/1</attrib>',
+        '<attrib name="worldToCamera" type="matrix">'
+        "1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1</attrib>",
+        '<attrib name="oiio:ColorSpace" type="string">Linear</attrib>',
+        '<attrib name="renderer" type="string">Arnold &#01;</attrib>',
+    )
+    + tuple(
+        '<attrib name="custom/attr{0}" type="int">{0}</attrib>'.format(idx)
+        for idx in range(40)
+    )
+)
+OIIO_SUBIMAGE = """<ImageSpec version="26">
+<x>0</x>
+<y>0</y>
+<width>4096</width>
+<height>2160</height>
+<nchannels>{channels_count}</nchannels>
+<format>half</format>
+<channelnames>
+{channels}
+</channelnames>
+{attribs}
+</ImageSpec>"""
+
+
+def _oiio_output(subimages_count=4):
+    channels = ["R", "G", "B", "A"] + [
+        "aov{}.{}".format(idx, channel)
+        for idx in range(8)
+        for channel in ("R", "G", "B")
+    ]
+    subimage = OIIO_SUBIMAGE.format(
+        channels_count=len(channels),
+        channels="\n".join(
+            "<channelname>{}</channelname>".format(channel)
+            for channel in channels
+        ),
+        attribs=OIIO_ATTRIBS,
+    )
+    return "Reading /renders/beauty.1001.exr\n" + "\n".join(
+        [subimage] * subimages_count
+    )
+
+
+class _Listener:
+    def __init__(self):
+        self.calls = 0
+
+    def on_topic(self):
+        self.calls += 1
+
+    def on_event(self, event):
+        self.calls += 1
+
+
+def test_event_system_emit(benchmark):
+    event_system = EventSystem()
+    # Callbacks are stored as weak references
+    listeners = [_Listener() for _ in range(50)]
+    for idx, listener in enumerate(listeners):
+        event_system.add_callback(
+            "publish.plugin.{}".format(idx % 5), listener.on_topic
+        )
+        event_system.add_callback("publish.*", listener.on_event)
+
+    def _emit():
+        for idx in range(5):
+            event_system.emit(
+                "publish.plugin.{}".format(idx),
+                {"plugin": idx},
+                "benchmark"
+            )
+
+    benchmark(_emit)
+    # 50 wildcard and 10 topic callbacks per event
+    calls = sum(listener.calls for listener in listeners)
+    assert calls and calls % 300 == 0
+
+
+def test_file_transaction(benchmark, tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    src_paths = []
+    for idx in range(FILES_COUNT):
+        path = src_dir / "file.{:04d}.txt".format(idx)
+        path.write_text("frame {}".format(idx))
+        src_paths.append(str(path))
+
+    dst_dir = tmp_path / "dst"
+
+    def _setup():
+        # Existing files are backed up by transaction
+        if os.path.exists(dst_dir):
+            shutil.rmtree(dst_dir)
+        os.makedirs(dst_dir)
+        return (), {}
+
+    def _transfer():
+        transaction = FileTransaction()
+        for src_path in src_paths:
+            transaction.add(
+                src_path,
+                os.path.join(str(dst_dir), os.path.basename(src_path)),
+            )
+        transaction.process()
+        transaction.finalize()
+        return transaction
+
+    transaction = benchmark.pedantic(_transfer, setup=_setup, rounds=3)
+    assert len(transaction.transferred) == FILES_COUNT
+
+
+def test_oiio_info_parsing(benchmark):
+    output = _oiio_output()
+    with mock.patch.object(
+        transcoding, "get_oiio_tool_args", return_value=["oiiotool"]
+    ), mock.patch.object(
+        transcoding, "run_subprocess", return_value=output
+    ):
+        result = benchmark(
+            transcoding.get_oiio_info_for_input, "/renders/beauty.1001.exr",
+            subimages=True
+        )
+
+    assert len(result) == 4
+    assert result[0]["width"] == 4096
+    assert len(result[0]["channelnames"]) == 28
+    assert result[0]["attribs"]["compression"] == "zip"
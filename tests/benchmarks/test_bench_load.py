@@ -0,0 +1,71 @@
+from ayon_core.pipeline.load import LoaderPlugin, LoaderCompatibilityIndex
+
+LOADERS_COUNT = 80
+CONTEXTS_COUNT = 5000
+PRODUCT_TYPES = [
+    "model", "rig", "animation", "pointcache", "camera", "look",
+    "render", "plate", "review", "workfile", "layout", "fx",
+]
+REPRESENTATIONS = [
+    ("abc", "abc"),
+    ("ma", "ma"),
+    ("fbx", "fbx"),
+    ("usd", "usd"),
+    ("exr", "exr"),
+    ("mov", "mov"),
+    ("h264", "mp4"),
+]
+
+
+def _create_loaders():
+    loaders = []
+    for idx in range(LOADERS_COUNT):
+        repre_name, ext = REPRESENTATIONS[idx % len(REPRESENTATIONS)]
+        attrs = {
+            "product_types": {
+                PRODUCT_TYPES[idx % len(PRODUCT_TYPES)],
+                PRODUCT_TYPES[(idx * 7) % len(PRODUCT_TYPES)],
+            },
+            "representations": {repre_name},
+            "extensions": {ext},
+        }
+        if idx % 10 == 0:
+            attrs["product_types"] = {"*"}
+        if idx % 11 == 0:
+            attrs["extensions"] = {"*"}
+        loaders.append(type(f"Loader{idx:03d}", (LoaderPlugin, ), attrs))
+    return loaders
+
+
+def _create_repre_contexts():
+    contexts = []
+    for idx in range(CONTEXTS_COUNT):
+        repre_name, ext = REPRESENTATIONS[idx % len(REPRESENTATIONS)]
+        contexts.append({
+            "project": {"name": "bench_project"},
+            "folder": {"id": f"folder{idx % 20}"},
+            "product": {
+                "id": f"product{idx % 300}",
+                "productType": PRODUCT_TYPES[idx % len(PRODUCT_TYPES)],
+            },
+            "version": {"id": f"version{idx}", "version": idx % 4},
+            "representation": {
+                "id": f"repre{idx}",
+                "name": repre_name,
+                "context": {"ext": ext},
+                "attrib": {},
+            },
+        })
+    return contexts
+
+
+def test_loader_compatibility_index(benchmark):
+    loaders = _create_loaders()
+    repre_contexts = _create_repre_contexts()
+
+    def _get_compatible_contexts():
+        index = LoaderCompatibilityIndex(loaders)
+        return index.get_compatible_contexts(repre_contexts)
+
+    result = benchmark(_get_compatible_contexts)
+    assert len(result) == LOADERS_COUNT
@@ -0,0 +1,108 @@
+import copy
+import uuid
+
+import pyblish.api
+import pytest
+
+from ayon_core.pipeline.create.changes import TrackChangesItem
+from ayon_core.plugins.publish.integrate import IntegrateAsset
+
+FRAMES_COUNT = 250
+
+
+def _instance_data(idx):
+    return {
+        "id": "pyblish.avalon.instance",
+        "instance_id": "instance-{}".format(idx),
+        "productType": "render",
+        "productName": "renderCompMain{}".format(idx),
+        "folderPath": "/shots/sq010/sh{:04d}".format(idx),
+        "task": "comp",
+        "variant": "Main{}".format(idx),
+        "active": True,
+        "creator_identifier": "render",
+        "creator_attributes": {
+            "render_target": "local",
+            "frameStart": 1001,
+            "frameEnd": 1100,
+        },
+        "publish_attributes": {
+            "ValidateFrameRange": {"active": True},
+            "ExtractReviewSlate": {"active": True},
+            "CollectRendersLayers": {"layers": ["beauty", "crypto"]},
+        },
+    }
+
+
+def test_track_changes_diff(benchmark):
+    old_data = [_instance_data(idx) for idx in range(100)]
+    new_data = copy.deepcopy(old_data)
+    for idx, data in enumerate(new_data):
+        if idx % 4 == 0:
+            data["active"] = False
+        if idx % 3 == 0:
+            data["creator_attributes"]["frameEnd"] = 1200
+        if idx % 10 == 0:
+            data.pop("task")
+
+    def _diff():
+        output = []
+        for old_value, new_value in zip(old_data, new_data):
+            changes = TrackChangesItem(old_value, new_value)
+            # Access changes the same way as creators do
+            changes.changes
+            changes["creator_attributes"].changed_keys
+            output.append(changes)
+        return output
+
+    result = benchmark(_diff)
+    changes = result[0]
+    assert changes.changed_keys == {"active", "creator_attributes", "task"}
+    assert changes["creator_attributes"]["frameEnd"].new_value == 1200
+
+
+@pytest.fixture
+def integrate_instance(anatomy, template_data):
+    context = pyblish.api.Context()
+    context.data["anatomy"] = anatomy
+    # Attributes are cached on context, so server is not queried
+    context.data["ayonAttributes"] = {
+        "representation": {"path": {}, "template": {}},
+    }
+    instance = context.create_instance("renderCompMain")
+    instance.data["anatomyData"] = template_data
+    instance.data["publishDir"] = "/mnt/projects/publish"
+    return instance
+
+
+def test_integrate_sequence_representation(benchmark, integrate_instance):
+    plugin = IntegrateAsset()
+    files = [
+        "renderCompMain.{:04d}.exr".format(frame)
+        for frame in range(1001, 1001 + FRAMES_COUNT)
+    ]
+    version_entity = {"id": uuid.uuid4().hex, "version": 12}
+
+    def _prepare():
+        repre = {
+            "name": "exr",
+            "ext": "exr",
+            "files": files,
+            "frameStart": 1001,
+            "stagingDir": "/tmp/staging",
+        }
+        return plugin.prepare_representation(
+            repre,
+            "default",
+            {},
+            version_entity,
+            "/tmp/staging",
+            integrate_instance,
+        )
+
+    result = benchmark(_prepare)
+    transfers = result["transfers"]
+    assert len(transfers) == FRAMES_COUNT
+    assert transfers[-1][1].endswith(
+        "bench_sh0100_renderCompMain_v012_exr.1250.exr"
+    )
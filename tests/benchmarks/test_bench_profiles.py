@@ -0,0 +1,88 @@
+import logging
+
+import pytest
+
+from ayon_core.lib import filter_profiles
+
+KEY_VALUES = {
+    "hosts": "nuke",
+    "host_names": "nuke",
+    "product_types": "render",
+    "families": "render",
+    "task_types": "Compositing",
+    "task_names": "comp",
+    "product_names": "renderCompMain",
+}
+
+# Filtering logs debug messages which are not part of the benchmark
+LOGGER = logging.getLogger("bench_profiles")
+LOGGER.setLevel(logging.WARNING)
+
+
+def _collect_profiles(data, output):
+    """Find all lists of profiles in settings."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if (
+                key.endswith("profiles")
+                and isinstance(value, list)
+                and all(isinstance(item, dict) for item in value)
+            ):
+                output.append(value)
+            else:
+                _collect_profiles(value, output)
+
+    elif isinstance(data, list):
+        for item in data:
+            _collect_profiles(item, output)
+    return output
+
+
+@pytest.fixture(scope="module")
+def settings_profiles(default_settings):
+    profiles = _collect_profiles(default_settings, [])
+    assert profiles
+    return profiles
+
+
+def test_filter_default_settings_profiles(benchmark, settings_profiles):
+    def _filter_all():
+        return [
+            filter_profiles(
+                profiles,
+                {
+                    key: value
+                    for key, value in KEY_VALUES.items()
+                    # Use only keys available in profiles
+                    if any(key in profile for profile in profiles)
+                },
+                logger=LOGGER,
+            )
+            for profiles in settings_profiles
+        ]
+
+    result = benchmark(_filter_all)
+    assert len(result) == len(settings_profiles)
+
+
+def test_filter_many_profiles(benchmark):
+    profiles = []
+    for idx in range(1000):
+        profiles.append({
+            "hosts": [] if idx % 3 == 1 else ["maya", "houdini"],
+            "product_types": ["render", "review", "model{}".format(idx)],
+            "task_types": ["Compositing"] if idx % 2 else [],
+            "task_names": ["comp{}".format(idx)] if idx % 5 else [],
+            "template_name": "template{}".format(idx),
+        })
+
+    key_values = {
+        "hosts": "maya",
+        "product_types": "render",
+        "task_types": "Compositing",
+        "task_names": "comp999",
+    }
+    result = benchmark(
+        filter_profiles, profiles, key_values, logger=LOGGER
+    )
+    assert result["template_name"] == "template999"
@@ -0,0 +1,52 @@
+import os
+import json
+import collections
+
+import pytest
+
+from ayon_core import style
+
+
+def _per_key_replace_stylesheet():
+    """Previous implementation replacing each key over whole stylesheet."""
+    with open(os.path.join(style.current_dir, "style.css"), "r") as stream:
+        stylesheet = stream.read()
+    with open(os.path.join(style.current_dir, "data.json"), "r") as stream:
+        data = json.load(stream)
+
+    data_deque = collections.deque(data.items())
+    fill_data = {}
+    while data_deque:
+        key, value = data_deque.popleft()
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                data_deque.append((f"{key}:{sub_key}", sub_value))
+            continue
+        fill_data[key] = value
+
+    for key, value in fill_data.items():
+        stylesheet = stylesheet.replace("{" + key + "}", value)
+    return stylesheet
+
+
+@pytest.fixture
+def local_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AYON_LAUNCHER_LOCAL_DIR", str(tmp_path))
+    monkeypatch.setattr(style._Cache, "stylesheet", None)
+    return tmp_path
+
+
+def test_stylesheet_per_key_replace(benchmark):
+    stylesheet = benchmark(_per_key_replace_stylesheet)
+    assert stylesheet
+
+
+def test_stylesheet_build(benchmark, local_dir):
+    stylesheet = benchmark(style._build_stylesheet)
+    assert stylesheet == _per_key_replace_stylesheet()
+
+
+def test_stylesheet_disk_cache(benchmark, local_dir):
+    stylesheet = style._load_stylesheet()
+
+    assert benchmark(style._load_stylesheet) == stylesheet
@@ -0,0 +1,46 @@
+from ayon_core.lib import StringTemplate
+
+WORKFILE_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{folder[name]}/work"
+    "/{task[name]}/{project[code]}_{folder[name]}_{task[name]}"
+    "<_{comment}>_v{version:0>3}<.{ext}>"
+)
+
+
+def test_string_template_parse(benchmark):
+    template = benchmark(StringTemplate, WORKFILE_TEMPLATE)
+    assert template.template == WORKFILE_TEMPLATE
+
+
+def test_string_template_format(benchmark, template_data):
+    template = StringTemplate(WORKFILE_TEMPLATE)
+    data = dict(template_data, root={"work": "/mnt/projects"})
+
+    result = benchmark(template.format_strict, data)
+    assert result == (
+        "/mnt/projects/bench_project/shots/sq010/sh0100/work/comp"
+        "/bench_sh0100_comp_v012.exr"
+    )
+
+
+def test_anatomy_publish_path_format(benchmark, anatomy, template_data):
+    path_template = anatomy.get_template_item("publish", "default", "path")
+
+    result = benchmark(path_template.format_strict, template_data)
+    assert result.endswith("bench_sh0100_renderCompMain_v012_exr.1001.exr")
+
+
+def test_anatomy_format_all(benchmark, anatomy, template_data):
+    result = benchmark(anatomy.format, template_data, strict=False)
+    assert result["work"]["default"]["file"]
+
+
+def test_anatomy_templates_discovery(benchmark, anatomy):
+    templates_obj = anatomy.templates_obj
+
+    def _discover():
+        templates_obj.reset()
+        return templates_obj.templates
+
+    templates = benchmark(_discover)
+    assert templates["publish"]["default"]["version"] == "v{version:0>3}"
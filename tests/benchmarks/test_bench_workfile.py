@@ -0,0 +1,53 @@
+import os
+import time
+
+import pytest
+
+from ayon_core.pipeline.workfile import WorkdirIndex
+
+FILE_TEMPLATE = (
+    "{folder[name]}_{task[name]}<_{comment}>_v{version:0>3}<_{app}>.{ext}"
+)
+EXTENSIONS = {".ma", ".mb"}
+
+
+@pytest.fixture
+def lookup_args(tmp_path):
+    """Directory with workfiles of multiple tasks and many autosaves."""
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    filenames = [
+        f"sh010_{task_name}_v{version:03d}.ma"
+        for task_name in ("anim", "layout", "fx", "light")
+        for version in range(1, 500)
+    ]
+    filenames.extend(
+        f"sh010_anim_v001.ma.autosave{idx}"
+        for idx in range(2000)
+    )
+    for filename in filenames:
+        (workdir / filename).write_text("")
+    # Make sure the listing is not considered as racy
+    dir_mtime = time.time() - 10
+    os.utime(workdir, (dir_mtime, dir_mtime))
+
+    fill_data = {
+        "folder": {"name": "sh010"},
+        "task": {"name": "anim"},
+        "app": "maya",
+    }
+    return str(workdir), FILE_TEMPLATE, fill_data, EXTENSIONS
+
+
+def test_last_workfile_first_lookup(benchmark, lookup_args):
+    def _lookup():
+        return WorkdirIndex().get_last_workfile_with_version(*lookup_args)
+
+    result = benchmark(_lookup)
+    assert result == ("sh010_anim_v499.ma", 499)
+
+
+def test_last_workfile_repeated_lookup(benchmark, lookup_args):
+    index = WorkdirIndex()
+    result = benchmark(index.get_last_workfile_with_version, *lookup_args)
+    assert result == ("sh010_anim_v499.ma", 499)
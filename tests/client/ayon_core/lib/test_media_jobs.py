@@ -0,0 +1,108 @@
+import sys
+import time
+import asyncio
+import textwrap
+
+import pytest
+
+from ayon_core.lib import MediaJobOrchestrator
+
+
+def _python_args(script):
+    return [sys.executable, "-c", textwrap.dedent(script)]
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = MediaJobOrchestrator(max_jobs=2)
+    yield orchestrator
+    orchestrator.stop()
+
+
+def test_concurrency_is_limited(orchestrator):
+    jobs = orchestrator.submit_batch(
+        _python_args("import time; time.sleep(0.3)")
+        for _ in range(4)
+    )
+    max_running = 0
+    while not all(job.done() for job in jobs):
+        max_running = max(max_running, len(orchestrator.get_running_jobs()))
+        time.sleep(0.01)
+
+    assert max_running == 2
+    for job in jobs:
+        assert job.result().returncode == 0
+        assert job.duration >= 0.3
+    # Last jobs waited for first jobs to finish
+    assert max(job.wait_time for job in jobs) >= 0.25
+    assert len(orchestrator.get_finished_jobs()) == 4
+
+
+def test_output_and_failure(orchestrator):
+    job = orchestrator.submit(_python_args("""
+        import sys
+        print("out")
+        sys.stderr.write("err")
+    """))
+    result = job.result()
+    assert result.stdout.strip() == "out"
+    assert result.output == "out\n\nerr"
+
+    job = orchestrator.submit(_python_args("""
+        import sys
+        print("out")
+        sys.stderr.write("err")
+        sys.exit(3)
+    """))
+    with pytest.raises(RuntimeError) as exc_info:
+        job.result()
+    assert str(exc_info.value).endswith("Output:\nout\n\n\nError:\nerr")
+
+    job = orchestrator.submit(
+        _python_args("import sys; sys.exit(3)"), check=False
+    )
+    assert job.result().returncode == 3
+
+
+def test_cancel_kills_process(orchestrator):
+    job = orchestrator.submit(_python_args("import time; time.sleep(30)"))
+    while not orchestrator.get_running_jobs():
+        time.sleep(0.01)
+    # Give the process a moment to start
+    time.sleep(0.1)
+    start = time.time()
+    job.cancel()
+    while not orchestrator.get_finished_jobs():
+        time.sleep(0.01)
+    assert time.time() - start < 5
+    assert job.cancelled()
+    assert not orchestrator.get_running_jobs()
+
+
+def test_run_coroutines_from_sync_code(orchestrator):
+    async def _echo(value):
+        result = await orchestrator.run(
+            _python_args(f"print({value})")
+        )
+        return int(result.stdout)
+
+    assert orchestrator.run_coroutines(
+        [_echo(idx) for idx in range(5)]
+    ) == list(range(5))
+
+    async def _fail():
+        await orchestrator.run(_python_args("import sys; sys.exit(1)"))
+
+    with pytest.raises(RuntimeError):
+        orchestrator.run_coroutines([_echo(1), _fail()])
+
+
+def test_run_from_other_event_loop(orchestrator):
+    async def _main():
+        results = await asyncio.gather(*(
+            orchestrator.run(_python_args(f"print({idx})"))
+            for idx in range(3)
+        ))
+        return [result.stdout.strip() for result in results]
+
+    assert asyncio.run(_main()) == ["0", "1", "2"]
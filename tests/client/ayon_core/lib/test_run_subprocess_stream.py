@@ -0,0 +1,102 @@
+import sys
+import textwrap
+
+import pytest
+
+from ayon_core.lib import run_subprocess
+
+
+def _python_args(script):
+    return [sys.executable, "-c", textwrap.dedent(script)]
+
+
+def test_output_without_streaming():
+    output = run_subprocess(_python_args("""
+        import sys
+        print("out")
+        sys.stderr.write("err")
+    """))
+    assert output == "out\n\nerr"
+
+
+def test_streamed_output_keeps_tail():
+    lines = []
+    output = run_subprocess(
+        _python_args("""
+            import sys
+            for idx in range(5000):
+                print("line {}".format(idx))
+            # Progress rewritten with carriage return
+            for idx in range(3):
+                sys.stderr.write("stats {}\\r".format(idx))
+            sys.stderr.write("done\\n")
+        """),
+        line_callback=lambda line, stream_name: lines.append(
+            (stream_name, line)
+        ),
+        max_output_lines=3,
+    )
+    assert output == (
+        "... (4997 lines skipped)\nline 4997\nline 4998\nline 4999"
+        "\n... (1 lines skipped)\nstats 1\nstats 2\ndone"
+    )
+    assert len(lines) == 5004
+    assert ("stderr", "stats 0") in lines
+    assert lines.index(("stdout", "line 0")) < lines.index(
+        ("stdout", "line 1")
+    )
+
+
+def test_ffmpeg_progress_is_parsed():
+    events = []
+    output = run_subprocess(
+        _python_args("""
+            for frame, status in ((10, "continue"), (20, "end")):
+                print("frame={}".format(frame))
+                print("fps=24.5")
+                print("out_time_us={}".format(frame * 40000))
+                print("speed=1.5x")
+                print("progress={}".format(status))
+            print("other output")
+        """),
+        progress_callback=events.append,
+    )
+    assert output == "other output"
+    assert events == [
+        {
+            "frame": 10,
+            "fps": 24.5,
+            "speed": 1.5,
+            "out_time": 0.4,
+            "finished": False,
+        },
+        {
+            "frame": 20,
+            "fps": 24.5,
+            "speed": 1.5,
+            "out_time": 0.8,
+            "finished": True,
+        },
+    ]
+
+
+def test_streamed_failure():
+    def _failing_callback(line, stream_name):
+        raise ValueError("Callback failed")
+
+    with pytest.raises(RuntimeError) as exc_info:
+        run_subprocess(
+            _python_args("""
+                import sys
+                for idx in range(100000):
+                    print(idx)
+                sys.stderr.write("Failed")
+                sys.exit(1)
+            """),
+            line_callback=_failing_callback,
+            max_output_lines=2,
+        )
+    message = str(exc_info.value)
+    assert "99999" in message
+    assert "Failed" in message
+    assert "\n5\n" not in message
@@ -0,0 +1,149 @@
+import os
+import time
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ayon_core.lib import slate_cache as slate_cache_lib
+from ayon_core.lib.slate_cache import (
+    SlateCache,
+    get_file_hash,
+    get_slate_cache_dir,
+    get_slate_cache_key,
+)
+
+
+@pytest.fixture
+def slate_cache(tmp_path):
+    return SlateCache(str(tmp_path / "cache"))
+
+
+def _create_file(content):
+    def _create(path):
+        with open(path, "w") as stream:
+            stream.write(content)
+    return mock.Mock(side_effect=_create)
+
+
+def test_cache_key():
+    key = get_slate_cache_key({"a": 1, "b": [1, 2]}, "-c:v", 25)
+    assert key == get_slate_cache_key({"b": [1, 2], "a": 1}, "-c:v", 25)
+    assert key != get_slate_cache_key({"a": 1, "b": [1, 2]}, "-c:v", 24)
+
+
+def test_file_hash(tmp_path):
+    path_a = tmp_path / "a.png"
+    path_b = tmp_path / "b.png"
+    path_a.write_bytes(b"slate")
+    path_b.write_bytes(b"slate")
+    assert get_file_hash(str(path_a)) == get_file_hash(str(path_b))
+
+    path_b.write_bytes(b"other slate")
+    assert get_file_hash(str(path_a)) != get_file_hash(str(path_b))
+
+
+def test_file_is_created_once(slate_cache):
+    create = _create_file("slate")
+    key = get_slate_cache_key("slate")
+
+    path = slate_cache.get_or_create(key, ".mov", create)
+    assert path == slate_cache.get_or_create(key, ".mov", create)
+    assert create.call_count == 1
+    assert path.endswith(".mov")
+    # Temp path used for creation has the same extension
+    assert create.call_args[0][0].endswith(".mov")
+    with open(path) as stream:
+        assert stream.read() == "slate"
+
+    # Different extension is a different file
+    slate_cache.get_or_create(key, ".mp4", create)
+    assert create.call_count == 2
+
+
+def test_failed_creation_is_not_cached(slate_cache):
+    key = get_slate_cache_key("slate")
+
+    with pytest.raises(RuntimeError):
+        slate_cache.get_or_create(key, ".mov", mock.Mock())
+
+    def _fail(path):
+        with open(path, "w") as stream:
+            stream.write("partial")
+        raise ValueError("Encoding failed")
+
+    with pytest.raises(ValueError):
+        slate_cache.get_or_create(key, ".mov", _fail)
+
+    assert slate_cache.get_cached(key, ".mov") is None
+    assert os.listdir(os.path.dirname(slate_cache.get_path(key, ".mov"))) == []
+
+
+def test_old_files_are_pruned(tmp_path):
+    cache_dir = str(tmp_path / "pruned_cache")
+    cache = SlateCache(cache_dir)
+    old_key = get_slate_cache_key("old")
+    new_key = get_slate_cache_key("new")
+    old_path = cache.get_or_create(old_key, ".png", _create_file("old"))
+    new_path = cache.get_or_create(new_key, ".png", _create_file("new"))
+
+    outdated = time.time() - SlateCache.lifetime - 10
+    os.utime(old_path, (outdated, outdated))
+
+    SlateCache._pruned_dirs.discard(cache_dir)
+    cache.get_or_create(new_key, ".png", _create_file("new"))
+    assert not os.path.exists(old_path)
+    assert os.path.exists(new_path)
+
+
+def test_file_is_created_once_from_threads(slate_cache):
+    key = get_slate_cache_key("threads")
+
+    def _create(path):
+        time.sleep(0.05)
+        with open(path, "w") as stream:
+            stream.write("slate")
+
+    create = mock.Mock(side_effect=_create)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = list(executor.map(
+            lambda _: slate_cache.get_or_create(key, ".mov", create),
+            range(4)
+        ))
+    assert create.call_count == 1
+    assert len(set(paths)) == 1
+
+
+def test_default_cache_dir_is_per_user(monkeypatch):
+    monkeypatch.delenv(slate_cache_lib.SLATE_CACHE_DIR_ENV, raising=False)
+    with mock.patch.object(
+        slate_cache_lib.getpass, "getuser", return_value="DOMAIN\\artist"
+    ):
+        cache_dir = get_slate_cache_dir()
+    assert os.path.basename(cache_dir) == "ayon_slate_cache_DOMAIN_artist"
+
+    monkeypatch.setenv(slate_cache_lib.SLATE_CACHE_DIR_ENV, "/slate/cache")
+    assert get_slate_cache_dir() == os.path.normpath("/slate/cache")
+
+
+def test_fallback_when_cache_is_not_writable(slate_cache, tmp_path):
+    create = _create_file("slate")
+    key = get_slate_cache_key("fallback")
+    fallback_path = str(tmp_path / "slate.mov")
+
+    with mock.patch.object(
+        slate_cache_lib.os, "makedirs", side_effect=PermissionError
+    ):
+        path = slate_cache.get_or_create(
+            key, ".mov", create, fallback_path=fallback_path
+        )
+        assert path == fallback_path
+        create.assert_called_once_with(fallback_path)
+        with open(path) as stream:
+            assert stream.read() == "slate"
+
+        # Error is raised without fallback path
+        with pytest.raises(PermissionError):
+            slate_cache.get_or_create(key, ".mov", create)
+
+    assert slate_cache.get_cached(key, ".mov") is None
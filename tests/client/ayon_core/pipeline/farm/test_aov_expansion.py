@@ -0,0 +1,144 @@
+from types import SimpleNamespace
+
+import pytest  # noqa
+
+from ayon_core.pipeline.farm import pyblish_functions
+from ayon_core.pipeline.farm.patterning import (
+    get_aov_pattern_matcher,
+    match_aov_pattern,
+)
+
+
+class MockAnatomy():
+    """ Mock anatomy which can't remap any path to rootless.
+    """
+    def find_root_template_from_path(self, path):
+        return False, path
+
+
+class MockInstance():
+    """ Mock pyblish instance for testing purpose.
+    """
+    def __init__(self, data: dict, context_data: dict):
+        self.data = data
+        self.context = SimpleNamespace(data=context_data)
+
+
+AOV_FILTER = {"maya": [".*([Bb]eauty).*", ".*(preview).*"]}
+
+
+def _create_payload(aov_count: int, frame_count: int):
+    """Create synthetic multi-camera, multi-AOV render payload."""
+    cameras = ["camA", "camB"]
+    expected_files = {}
+    products = []
+    for camera in cameras:
+        for idx in range(aov_count):
+            aov = f"{camera}_aov{idx:03d}"
+            if idx == 0:
+                aov = f"{camera}_beauty"
+            expected_files[aov] = [
+                f"/renders/sh010/{camera}/{aov}/sh010_{aov}.{frame:04d}.exr"
+                for frame in range(1001, 1001 + frame_count)
+            ]
+            products.append(
+                SimpleNamespace(productName=aov, colorspace="ACEScg")
+            )
+
+    render_products = SimpleNamespace(
+        layer_data=SimpleNamespace(products=products)
+    )
+    instance = MockInstance(
+        {
+            "cameras": cameras,
+            "expectedFiles": [expected_files],
+            "renderlayer": "Main",
+            "task": "lighting",
+            "renderProducts": render_products,
+        },
+        {
+            "anatomy": MockAnatomy(),
+            "project_settings": {
+                "core": {
+                    "tools": {
+                        "creator": {
+                            "use_legacy_product_names_for_renders": True
+                        }
+                    }
+                }
+            },
+        },
+    )
+    skeleton = {
+        "productName": "renderMain",
+        "productType": "render",
+        "families": ["render"],
+        "frameStartHandle": 1001,
+        "frameEndHandle": 1000 + frame_count,
+        "fps": 25.0,
+        "extendFrames": False,
+    }
+    additional_data = {
+        "renderProducts": render_products,
+        "colorspaceConfig": "/configs/config.ocio",
+        "colorspaceTemplate": "{root[work]}/configs/config.ocio",
+        "display": "ACES",
+        "view": "sRGB",
+    }
+    return instance, skeleton, additional_data
+
+
+def test_aov_pattern_matcher_matches_legacy_function():
+    matcher = get_aov_pattern_matcher("maya", AOV_FILTER)
+    for file_name in (
+        "sh010_beauty.1001.exr",
+        "sh010_Beauty.1001.exr",
+        "sh010_diffuse.1001.exr",
+        "sh010_preview.1001.exr",
+    ):
+        assert matcher(file_name) == match_aov_pattern(
+            "maya", AOV_FILTER, file_name
+        )
+
+    assert not get_aov_pattern_matcher("nuke", AOV_FILTER)("beauty.exr")
+
+
+def test_create_instances_for_aov(monkeypatch):
+    monkeypatch.setenv("AYON_HOST_NAME", "maya")
+    instance, skeleton, additional_data = _create_payload(3, 10)
+
+    instances = pyblish_functions._create_instances_for_aov(
+        instance, skeleton, AOV_FILTER, additional_data, [], False
+    )
+
+    assert len(instances) == 6
+    by_aov = {new_instance["aov"]: new_instance for new_instance in instances}
+    beauty = by_aov["camA_beauty"]
+    assert beauty["productName"] == "renderMain_camA_beauty"
+    assert beauty["review"] is True
+    repre = beauty["representations"][0]
+    assert repre["tags"] == ["review"]
+    assert len(repre["files"]) == 10
+    assert repre["files"][0] == "sh010_camA_beauty.1001.exr"
+    assert repre["colorspaceData"]["colorspace"] == "ACEScg"
+
+    other = by_aov["camB_aov001"]
+    assert "review" not in other
+    assert other["representations"][0]["tags"] == []
+
+
+@pytest.mark.parametrize("files", [
+    [f"/renders/sh010_v001/beauty.{frame:04d}.exr" for frame in range(1, 50)],
+    [f"/renders/sh010_v001/beauty.{frame}.exr" for frame in range(998, 1003)],
+    [f"/renders/sh010_v001/beauty_{frame:04d}.exr" for frame in range(1, 5)],
+    ["/renders/sh010_v001/beauty.exr"],
+])
+def test_assemble_expected_files_matches_clique(files):
+    import clique
+
+    cols, rem = pyblish_functions._assemble_expected_files(files)
+    expected_cols, expected_rem = clique.assemble(files)
+    assert [list(col) for col in cols] == [
+        list(col) for col in expected_cols
+    ]
+    assert rem == expected_rem
@@ -0,0 +1,104 @@
+import os
+from unittest import mock
+
+import clique
+import pytest  # noqa
+
+from ayon_core.pipeline.farm import pyblish_functions
+
+
+def _create_published_frames(dirpath, frames):
+    os.makedirs(dirpath, exist_ok=True)
+    paths = []
+    for frame in frames:
+        path = os.path.join(dirpath, f"sh010_beauty_v001.{frame:04d}.exr")
+        with open(path, "w") as stream:
+            stream.write("x" * frame)
+        paths.append(path)
+    collections, _ = clique.assemble(paths)
+    return collections[0]
+
+
+def test_plan_skips_rendered_and_existing_frames(tmp_path):
+    src_col = _create_published_frames(
+        str(tmp_path / "publish"), range(1001, 1011)
+    )
+    render_dir = tmp_path / "render"
+    render_dir.mkdir()
+    # Frame already present in render directory
+    (render_dir / "beauty.1010.exr").write_text("y")
+
+    transfers = pyblish_functions.plan_extend_frames_transfers(
+        src_col,
+        str(render_dir),
+        "beauty.",
+        ".exr",
+        rendered_frames={1003, 1004, 1005},
+        skip_rendered_frames=True,
+    )
+
+    assert [transfer.frame for transfer in transfers] == [
+        1001, 1002, 1006, 1007, 1008, 1009
+    ]
+    assert transfers[0].dst == str(render_dir / "beauty.1001.exr")
+    assert transfers[0].size == 1001
+    assert all(transfer.hardlink for transfer in transfers)
+
+
+def test_rendered_frames_are_never_hardlinked(tmp_path):
+    src_col = _create_published_frames(
+        str(tmp_path / "publish"), range(1001, 1004)
+    )
+    render_dir = tmp_path / "render"
+
+    transfers = pyblish_functions.plan_extend_frames_transfers(
+        src_col,
+        str(render_dir),
+        "beauty.",
+        ".exr",
+        rendered_frames={1002},
+        skip_rendered_frames=False,
+    )
+    assert [
+        (transfer.frame, transfer.hardlink) for transfer in transfers
+    ] == [(1001, True), (1002, False), (1003, True)]
+
+    render_dir.mkdir()
+    pyblish_functions.execute_extend_frames_transfers(transfers)
+    assert sorted(os.listdir(render_dir)) == [
+        "beauty.1001.exr", "beauty.1002.exr", "beauty.1003.exr"
+    ]
+    # Rendered frame must not share inode with published file
+    assert not os.path.samefile(
+        transfers[1].src, str(render_dir / "beauty.1002.exr")
+    )
+
+
+def test_dry_run_plans_same_transfers(tmp_path):
+    src_col = _create_published_frames(
+        str(tmp_path / "publish"), range(1001, 1004)
+    )
+    render_dir = tmp_path / "render"
+    render_dir.mkdir()
+    anatomy = mock.Mock()
+    anatomy.fill_root.side_effect = lambda path: path
+    representation = {
+        "ext": "exr",
+        "files": ["beauty.1001.exr"],
+        "stagingDir": str(render_dir),
+    }
+    instance_data = {"frameStart": 1002, "frameEnd": 1002}
+
+    with mock.patch.object(
+        pyblish_functions, "get_resources", return_value=list(src_col)
+    ):
+        transfers = pyblish_functions._copy_extend_frames(
+            "project", anatomy, instance_data, representation, {},
+            dry_run=True,
+        )
+
+    # Hardlinks are planned same as for real transfer
+    assert [
+        (transfer.frame, transfer.hardlink) for transfer in transfers
+    ] == [(1001, True), (1002, False), (1003, True)]
+    assert os.listdir(render_dir) == []
@@ -0,0 +1,128 @@
+import pytest  # noqa
+
+from ayon_core.pipeline.load import (
+    LoaderPlugin,
+    LoaderCompatibilityIndex,
+    filter_repre_contexts_by_loader,
+)
+
+PRODUCT_TYPES = [
+    "model", "rig", "animation", "pointcache", "camera", "look",
+    "render", "plate", "review", "workfile", "layout", "fx",
+]
+REPRESENTATIONS = [
+    ("abc", "abc"),
+    ("ma", "ma"),
+    ("mb", "mb"),
+    ("fbx", "fbx"),
+    ("usd", "usd"),
+    ("exr", "exr"),
+    ("jpg", "jpg"),
+    ("mov", "mov"),
+    ("h264", "mp4"),
+    ("vdb", "vdb"),
+]
+
+
+class CustomCompatibilityLoader(LoaderPlugin):
+    """Loader with own compatibility check which can't be indexed."""
+
+    product_types = {"*"}
+    representations = {"*"}
+
+    @classmethod
+    def is_compatible_loader(cls, context):
+        return context["version"]["version"] % 2 == 0
+
+
+def _create_loaders(count):
+    loaders = []
+    for idx in range(count):
+        product_types = {
+            PRODUCT_TYPES[idx % len(PRODUCT_TYPES)],
+            PRODUCT_TYPES[(idx * 7) % len(PRODUCT_TYPES)],
+        }
+        repre_name, ext = REPRESENTATIONS[idx % len(REPRESENTATIONS)]
+        attrs = {
+            "product_types": product_types,
+            "representations": {repre_name},
+            "extensions": {ext.upper() if idx % 3 else ext},
+        }
+        if idx % 10 == 0:
+            attrs["product_types"] = {"*"}
+        if idx % 13 == 0:
+            attrs["representations"] = {"*"}
+        if idx % 11 == 0:
+            attrs["extensions"] = {"*"}
+        if idx % 17 == 0:
+            attrs["representations"] = set()
+        loaders.append(type(f"Loader{idx:03d}", (LoaderPlugin, ), attrs))
+    loaders.append(CustomCompatibilityLoader)
+    return loaders
+
+
+def _create_repre_contexts(count):
+    contexts = []
+    for idx in range(count):
+        repre_name, ext = REPRESENTATIONS[idx % len(REPRESENTATIONS)]
+        repre_entity = {
+            "id": f"repre{idx}",
+            "name": repre_name,
+            "context": {"ext": ext},
+            "attrib": {},
+        }
+        # Legacy representations without extension in context
+        if idx % 5 == 0:
+            repre_entity["context"] = {}
+            repre_entity["attrib"]["path"] = f"/publish/file{idx}.{ext}"
+        contexts.append({
+            "project": {"name": "test_project"},
+            "folder": {"id": f"folder{idx % 20}"},
+            "product": {
+                "id": f"product{idx % 300}",
+                "productType": PRODUCT_TYPES[idx % len(PRODUCT_TYPES)],
+            },
+            "version": {"id": f"version{idx}", "version": idx % 4},
+            "representation": repre_entity,
+        })
+    return contexts
+
+
+def _filter_contexts_by_loaders(loaders, repre_contexts):
+    output = {}
+    for loader in loaders:
+        filtered_contexts = filter_repre_contexts_by_loader(
+            repre_contexts, loader
+        )
+        if filtered_contexts:
+            output[loader] = filtered_contexts
+    return output
+
+
+def test_index_matches_loader_compatibility():
+    loaders = _create_loaders(40)
+    repre_contexts = _create_repre_contexts(500)
+
+    index = LoaderCompatibilityIndex(loaders)
+    result = index.get_compatible_contexts(repre_contexts)
+    expected = _filter_contexts_by_loaders(loaders, repre_contexts)
+
+    assert list(result) == list(expected)
+    for loader, contexts in expected.items():
+        assert result[loader] == contexts
+
+
+def test_index_candidates():
+    loaders = _create_loaders(20)
+    index = LoaderCompatibilityIndex(loaders)
+
+    candidates = index.get_candidate_loaders("model", "abc", "abc")
+    for loader in candidates:
+        assert loader.is_compatible_loader({
+            "product": {"productType": "model"},
+            "representation": {"name": "abc", "context": {"ext": "abc"}},
+        })
+    # Custom compatibility loaders are never index candidates
+    assert CustomCompatibilityLoader not in candidates
+    assert not index.get_candidate_loaders("unknown", "unknown", None)
+
@@ -0,0 +1,177 @@
+import os
+import json
+import time
+import uuid
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import ayon_api
+import pytest
+
+from ayon_core.pipeline.publish import PublishUploadQueue
+from ayon_core.plugins.publish import integrate_review, integrate_thumbnail
+
+PROJECT_NAME = "test_project"
+
+
+class StandInServer:
+    """ Local HTTP server standing in for AYON server upload endpoints.
+    """
+    def __init__(self):
+        self.uploads = []
+        self.failures_by_filename = {}
+        self.upload_delay = 0.0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._create_handler()
+        )
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _create_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status, data):
+                content = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_POST(self):
+                size = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(size)
+                filename = self.headers.get("x-file-name")
+                with server.lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    failures = server.failures_by_filename.get(filename)
+                    if failures:
+                        server.failures_by_filename[filename] = (
+                            failures[1:]
+                        )
+                try:
+                    time.sleep(server.upload_delay)
+                    if failures:
+                        self._send_json(failures[0], {"detail": "error"})
+                        return
+
+                    with server.lock:
+                        server.uploads.append((self.path, filename, body))
+                    self._send_json(201, {"id": uuid.uuid4().hex})
+                finally:
+                    with server.lock:
+                        server.active -= 1
+
+        return Handler
+
+
+@pytest.fixture
+def server():
+    server = StandInServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def ayon_con(server):
+    return ayon_api.ServerAPI(server.url, token="token", create_session=False)
+
+
+def _create_files(dirpath, contents):
+    paths = []
+    for idx, content in enumerate(contents):
+        path = dirpath / f"file{idx}.jpg"
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths
+
+
+def test_thumbnails_are_deduplicated(server, ayon_con, tmp_path):
+    paths = _create_files(tmp_path, [b"a" * 100, b"b" * 100, b"a" * 100])
+    queue = PublishUploadQueue(max_workers=2, backoff=0.01)
+    with mock.patch.object(integrate_thumbnail, "ayon_api", ayon_con):
+        futures = [
+            queue.submit(
+                integrate_thumbnail._create_thumbnail,
+                path,
+                deduplicate=True,
+                project_name=PROJECT_NAME,
+            )
+            for path in paths
+        ]
+        assert futures[0] is futures[2]
+        results = queue.wait()
+
+    assert len(results) == 2
+    assert len(server.uploads) == 2
+    assert queue.deduplicated_count == 1
+    assert futures[0].result().output == futures[2].result().output
+    report = queue.get_report(results)
+    assert report["uploaded"] == 2
+    assert report["size"] == 200
+    assert report["files"][0]["bytes_per_second"] > 0
+
+
+def test_upload_is_retried_with_backoff(server, ayon_con, tmp_path):
+    paths = _create_files(tmp_path, [b"a" * 10, b"b" * 10])
+    server.failures_by_filename = {"file0.jpg": [503, 503], "file1.jpg": [400]}
+    queue = PublishUploadQueue(max_workers=2, max_retries=3, backoff=0.01)
+    for path in paths:
+        queue.submit(
+            integrate_review._upload_reviewable_file,
+            path,
+            ayon_con=ayon_con,
+            endpoint=f"/projects/{PROJECT_NAME}/versions/v1/reviewables",
+            headers={"x-file-name": os.path.basename(path)},
+        )
+    retried, failed = queue.wait()
+
+    assert retried.success
+    assert retried.attempts == 3
+    # Client errors are not retried
+    assert not failed.success
+    assert failed.attempts == 1
+    assert len(server.uploads) == 1
+    assert server.uploads[0][0].endswith("/reviewables")
+
+
+def test_uploads_are_bounded(server, ayon_con, tmp_path):
+    paths = _create_files(tmp_path, [bytes([idx]) * 10 for idx in range(8)])
+    server.upload_delay = 0.05
+    queue = PublishUploadQueue(max_workers=3)
+    for path in paths:
+        queue.submit(
+            integrate_review._upload_reviewable_file,
+            path,
+            ayon_con=ayon_con,
+            endpoint=f"/projects/{PROJECT_NAME}/versions/v1/reviewables",
+            headers={"x-file-name": os.path.basename(path)},
+        )
+    results = queue.wait()
+
+    assert all(result.success for result in results)
+    assert len(server.uploads) == 8
+    assert 1 < server.max_active <= 3
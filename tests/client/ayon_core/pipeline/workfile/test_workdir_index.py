@@ -0,0 +1,202 @@
+import os
+import re
+import time
+
+import pytest
+
+from ayon_core.lib import StringTemplate
+from ayon_core.pipeline.workfile import (
+    WorkdirIndex,
+    get_last_workfile_with_version,
+    get_last_workfiles_with_version,
+)
+
+FILE_TEMPLATE = (
+    "{folder[name]}_{task[name]}<_{comment}>_v{version:0>3}<_{app}>.{ext}"
+)
+EXTENSIONS = {".ma", ".mb"}
+
+
+def _fill_data(folder_name="sh010", task_name="anim"):
+    return {
+        "folder": {"name": folder_name},
+        "task": {"name": task_name},
+        "app": "maya",
+    }
+
+
+def _naive_last_workfile_with_version(
+    workdir, file_template, fill_data, extensions
+):
+    """Previous implementation listing the directory on each call."""
+    dotted_extensions = {
+        ext if ext.startswith(".") else f".{ext}"
+        for ext in extensions
+    }
+    filenames = [
+        filename
+        for filename in os.listdir(workdir)
+        if os.path.splitext(filename)[-1] in dotted_extensions
+    ]
+    ext_expression = "(?:" + "|".join(
+        "\\" + ext for ext in dotted_extensions
+    ) + ")"
+    file_template = re.sub(r"\.?{ext}", ext_expression, file_template)
+    file_template = re.sub(r"<.*?>", r".*?", file_template)
+    file_template = re.sub(r"{version.*?}", r"([0-9]+)", file_template)
+    file_template = re.sub(r"{comment.*?}", r".+?", file_template)
+    file_template = StringTemplate.format_strict_template(
+        file_template, fill_data
+    )
+    version = None
+    output_filenames = []
+    for filename in sorted(filenames):
+        match = re.match(file_template, filename)
+        if not match:
+            continue
+        file_version = int(match.group(1))
+        if version is None or file_version > version:
+            output_filenames[:] = []
+            version = file_version
+        if file_version == version:
+            output_filenames.append(filename)
+
+    if not output_filenames:
+        return None, version
+    output_filename = max(
+        output_filenames,
+        key=lambda filename: os.path.getmtime(
+            os.path.join(workdir, filename)
+        )
+    )
+    return output_filename, version
+
+
+def _create_files(workdir, filenames, mtime=None):
+    workdir.mkdir(parents=True, exist_ok=True)
+    for filename in filenames:
+        path = workdir / filename
+        path.write_text("")
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+    # Make sure the listing is not considered as racy
+    dir_mtime = time.time() - 10
+    os.utime(workdir, (dir_mtime, dir_mtime))
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    workdir = tmp_path / "work"
+    _create_files(workdir, [
+        "sh010_anim_v001.ma",
+        "sh010_anim_v002.ma",
+        "sh010_anim_blocking_v003.mb",
+        "sh010_anim_v003_maya.ma",
+        "sh010_anim_v010.abc",
+        "sh010_layout_v020.ma",
+        "sh020_anim_v030.ma",
+    ])
+    old_mtime = time.time() - 100
+    os.utime(workdir / "sh010_anim_v003_maya.ma", (old_mtime, old_mtime))
+    _create_files(workdir, [])
+    return workdir
+
+
+def test_last_workfile_matches_listing(workdir):
+    index = WorkdirIndex()
+    for folder_name, task_name in (
+        ("sh010", "anim"),
+        ("sh010", "layout"),
+        ("sh020", "anim"),
+        ("sh030", "anim"),
+    ):
+        fill_data = _fill_data(folder_name, task_name)
+        expected = _naive_last_workfile_with_version(
+            str(workdir), FILE_TEMPLATE, fill_data, EXTENSIONS
+        )
+        result = index.get_last_workfile_with_version(
+            str(workdir), FILE_TEMPLATE, fill_data, EXTENSIONS
+        )
+        assert result == expected
+
+    assert index.get_last_workfile_with_version(
+        str(workdir), FILE_TEMPLATE, _fill_data(), EXTENSIONS
+    ) == ("sh010_anim_blocking_v003.mb", 3)
+
+
+def test_workfile_entries_are_parsed(workdir):
+    index = WorkdirIndex()
+    entries = index.get_workfile_entries(
+        str(workdir), FILE_TEMPLATE, _fill_data(), ["ma", "mb"]
+    )
+    assert [
+        (entry.version, entry.comment)
+        for entry in entries
+    ] == [(3, "blocking"), (1, None), (2, None), (3, None)]
+
+
+def test_index_is_invalidated_by_workdir_change(workdir):
+    index = WorkdirIndex()
+    args = (str(workdir), FILE_TEMPLATE, _fill_data(), EXTENSIONS)
+    assert index.get_last_workfile_with_version(*args)[1] == 3
+
+    # File added without change of directory modification time is not
+    #   visible until the directory is invalidated
+    dir_mtime = os.stat(workdir).st_mtime
+    (workdir / "sh010_anim_v004.ma").write_text("")
+    os.utime(workdir, (dir_mtime, dir_mtime))
+    assert index.get_last_workfile_with_version(*args)[1] == 3
+    index.invalidate(str(workdir))
+    assert index.get_last_workfile_with_version(*args)[1] == 4
+
+    _create_files(workdir, ["sh010_anim_v005.ma"])
+    assert index.get_last_workfile_with_version(*args) == (
+        "sh010_anim_v005.ma", 5
+    )
+
+
+def test_recent_listing_is_not_trusted(workdir):
+    index = WorkdirIndex()
+    args = (str(workdir), FILE_TEMPLATE, _fill_data(), EXTENSIONS)
+    now = time.time()
+    os.utime(workdir, (now, now))
+    assert index.get_last_workfile_with_version(*args)[1] == 3
+
+    # Directory modification time may not change in low resolution
+    #   filesystems so recently modified directory is listed again
+    (workdir / "sh010_anim_v004.ma").write_text("")
+    os.utime(workdir, (now, now))
+    assert index.get_last_workfile_with_version(*args)[1] == 4
+
+
+def test_missing_workdir(tmp_path):
+    assert get_last_workfile_with_version(
+        str(tmp_path / "missing"), FILE_TEMPLATE, _fill_data(), EXTENSIONS
+    ) == (None, None)
+
+
+def test_batch_last_workfiles(tmp_path):
+    items = []
+    expected = []
+    for idx in range(20):
+        workdir = tmp_path / f"sh{idx:03d}" / "work"
+        folder_name = f"sh{idx:03d}"
+        filenames = [
+            f"{folder_name}_anim_v{version:03d}.ma"
+            for version in range(1, idx + 1)
+        ]
+        _create_files(workdir, filenames)
+        items.append(
+            (str(workdir), FILE_TEMPLATE, _fill_data(folder_name), EXTENSIONS)
+        )
+        if filenames:
+            expected.append((filenames[-1], idx))
+        else:
+            expected.append((None, None))
+
+    items.append(
+        (str(tmp_path / "missing"), FILE_TEMPLATE, _fill_data(), EXTENSIONS)
+    )
+    expected.append((None, None))
+    assert get_last_workfiles_with_version(items) == expected
+
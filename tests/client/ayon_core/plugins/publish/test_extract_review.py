@@ -0,0 +1,270 @@
+import os
+import time
+import threading
+from unittest import mock
+
+import pyblish.api
+import pytest
+
+from ayon_core.plugins.publish import extract_review
+
+OUTPUT_NAMES = ["h264", "prores", "dnxhd", "mjpeg"]
+
+
+@pytest.fixture
+def plugin():
+    plugin = extract_review.ExtractReview()
+    plugin.max_concurrent_outputs = len(OUTPUT_NAMES)
+    return plugin
+
+
+def _create_instance():
+    context = pyblish.api.Context()
+    context.data["cleanupFullPaths"] = []
+    instance = context.create_instance("reviewMain")
+    instance.data.update({
+        "anatomyData": {},
+        "fps": 25.0,
+        "representations": [],
+    })
+    return instance
+
+
+def _temp_data(instance, repre, output_def):
+    return {
+        "fps": 25.0,
+        "frame_start_handle": 1001,
+        "output_frame_start": 1001,
+        "output_frame_end": 1010,
+        "without_handles": False,
+        "input_is_sequence": False,
+    }
+
+
+def _ffmpeg_arguments(output_def, *args):
+    return ["ffmpeg", output_def["filename_suffix"]]
+
+
+def _run_subprocess_in_reversed_order(finished):
+    """Later outputs finish sooner than earlier outputs."""
+    def _run_subprocess(args, **kwargs):
+        output_name = args.split(" ")[-1]
+        time.sleep(
+            0.05 * (len(OUTPUT_NAMES) - OUTPUT_NAMES.index(output_name))
+        )
+        finished.append(output_name)
+    return _run_subprocess
+
+
+def test_output_representations_keep_definitions_order(plugin, tmp_path):
+    instance = _create_instance()
+    repre = {
+        "name": "mov",
+        "ext": "mov",
+        "files": "review.mov",
+        "stagingDir": str(tmp_path),
+        "tags": ["review"],
+    }
+    output_defs = [
+        {"filename_suffix": output_name} for output_name in OUTPUT_NAMES
+    ]
+    finished = []
+    with mock.patch.object(
+        plugin, "prepare_temp_data", side_effect=_temp_data
+    ), mock.patch.object(
+        plugin, "_ffmpeg_arguments", side_effect=_ffmpeg_arguments
+    ), mock.patch.object(
+        extract_review, "run_subprocess",
+        side_effect=_run_subprocess_in_reversed_order(finished)
+    ):
+        plugin._render_output_definitions(
+            instance, repre, str(tmp_path), output_defs, None
+        )
+
+    # Outputs ran concurrently and finished in different order
+    assert finished == list(reversed(OUTPUT_NAMES))
+    new_repres = instance.data["representations"]
+    assert [
+        new_repre["outputName"] for new_repre in new_repres
+    ] == OUTPUT_NAMES
+    assert [
+        new_repre["ffmpeg_cmd"] for new_repre in new_repres
+    ] == [f"ffmpeg {output_name}" for output_name in OUTPUT_NAMES]
+
+
+def test_first_error_is_raised_after_all_outputs_finished(plugin):
+    output_jobs = [
+        {
+            "output_name": output_name,
+            "ffmpeg_cmd": output_name,
+            "temp_data": {"output_frame_start": 1, "output_frame_end": 1},
+        }
+        for output_name in OUTPUT_NAMES
+    ]
+    finished = []
+    lock = threading.Lock()
+
+    def _run_subprocess(args, **kwargs):
+        # First output fails last, third output fails first
+        if args == "h264":
+            time.sleep(0.05)
+            raise RuntimeError("h264 failed")
+        if args == "dnxhd":
+            raise RuntimeError("dnxhd failed")
+        time.sleep(0.1)
+        with lock:
+            finished.append(args)
+
+    with mock.patch.object(
+        extract_review, "run_subprocess", side_effect=_run_subprocess
+    ):
+        with pytest.raises(RuntimeError, match="h264 failed"):
+            plugin._run_output_jobs(output_jobs)
+
+    assert sorted(finished) == ["mjpeg", "prores"]
+    assert "duration" in output_jobs[1]
+    assert "duration" not in output_jobs[0]
+
+
+def test_max_concurrent_outputs(plugin):
+    assert plugin._get_max_concurrent_outputs(1) == 1
+    assert plugin._get_max_concurrent_outputs(8) == len(OUTPUT_NAMES)
+    plugin.max_concurrent_outputs = 0
+    assert 1 <= plugin._get_max_concurrent_outputs(8) <= 4
+    plugin.concurrent_outputs = False
+    assert plugin._get_max_concurrent_outputs(8) == 1
+
+
+def _read_manifest(plugin, tmp_path, frames, frame_end):
+    temp_data = {
+        "origin_repre": {
+            "files": [f"render.{frame}.exr" for frame in frames],
+            "stagingDir": str(tmp_path),
+        },
+        "frame_end_handle": frame_end,
+        "fps": 25.0,
+    }
+    manifest_path = plugin._create_concat_manifest(temp_data, 1001)
+    try:
+        with open(manifest_path, "r") as stream:
+            lines = stream.read().splitlines()
+    finally:
+        os.remove(manifest_path)
+
+    assert lines[0] == "ffconcat version 1.0"
+    # Last entry is repeated so its duration is respected
+    assert lines[-1] == lines[-3]
+    entries = []
+    for file_line, duration_line in zip(lines[1:-1:2], lines[2:-1:2]):
+        filename = file_line.rsplit("/", 1)[-1].rstrip("'")
+        duration = float(duration_line.split(" ")[1])
+        entries.append((filename, round(duration * 25.0)))
+    return entries
+
+
+def test_concat_manifest_single_gap(plugin, tmp_path):
+    frames = [1001, 1002, 1005, 1006]
+    assert _read_manifest(plugin, tmp_path, frames, 1006) == [
+        ("render.1001.exr", 1),
+        ("render.1002.exr", 3),
+        ("render.1005.exr", 1),
+        ("render.1006.exr", 1),
+    ]
+
+
+def test_concat_manifest_multiple_gaps(plugin, tmp_path):
+    frames = [1001, 1003, 1004, 1008, 1010]
+    # Missing frames at the end are held by last existing frame
+    assert _read_manifest(plugin, tmp_path, frames, 1012) == [
+        ("render.1001.exr", 2),
+        ("render.1003.exr", 1),
+        ("render.1004.exr", 4),
+        ("render.1008.exr", 2),
+        ("render.1010.exr", 3),
+    ]
+
+
+def _sequence_repre(tmp_path, frames):
+    return {
+        "name": "exr",
+        "ext": "exr",
+        "files": [f"render.{frame}.exr" for frame in frames],
+        "stagingDir": str(tmp_path),
+        "tags": ["review"],
+    }
+
+
+def test_concat_gaps_detected_in_handles(plugin, tmp_path):
+    plugin.fill_gaps_mode = "concat"
+    instance = _create_instance()
+    instance.data.update({
+        "frameStart": 1001,
+        "frameEnd": 1004,
+        "handleStart": 2,
+        "handleEnd": 2,
+    })
+    # Only frame in start handle is missing
+    repre = _sequence_repre(
+        tmp_path, [999, 1001, 1002, 1003, 1004, 1005, 1006]
+    )
+    fill_gaps = []
+
+    def _ffmpeg_arguments_fill_gaps(output_def, instance, new_repre,
+                                    temp_data, *args):
+        fill_gaps.append(temp_data["fill_gaps_with_concat"])
+        return _ffmpeg_arguments(output_def)
+
+    with mock.patch.object(
+        plugin, "prepare_temp_data", side_effect=_temp_data
+    ), mock.patch.object(
+        plugin, "_ffmpeg_arguments", side_effect=_ffmpeg_arguments_fill_gaps
+    ), mock.patch.object(extract_review, "run_subprocess"):
+        plugin._render_output_definitions(
+            instance, repre, str(tmp_path), [{"filename_suffix": "h264"}],
+            None
+        )
+
+    assert fill_gaps == [True]
+
+
+def test_concat_manifest_removed_on_preparation_error(plugin, tmp_path):
+    instance = _create_instance()
+    repre = {
+        "name": "mov",
+        "ext": "mov",
+        "files": "review.mov",
+        "stagingDir": str(tmp_path),
+        "tags": ["review"],
+    }
+    manifest_path = tmp_path / "review.ffconcat"
+
+    def _ffmpeg_arguments_failing(output_def, instance, new_repre,
+                                  temp_data, *args):
+        if output_def["filename_suffix"] == "prores":
+            raise RuntimeError("prores failed")
+        manifest_path.write_text("ffconcat version 1.0")
+        temp_data["concat_manifest_path"] = str(manifest_path)
+        return _ffmpeg_arguments(output_def)
+
+    with mock.patch.object(
+        plugin, "prepare_temp_data", side_effect=_temp_data
+    ), mock.patch.object(
+        plugin, "_ffmpeg_arguments", side_effect=_ffmpeg_arguments_failing
+    ), mock.patch.object(extract_review, "run_subprocess") as run_mock:
+        with pytest.raises(RuntimeError, match="prores failed"):
+            plugin._render_output_definitions(
+                instance, repre, str(tmp_path),
+                [{"filename_suffix": "h264"}, {"filename_suffix": "prores"}],
+                None
+            )
+
+    run_mock.assert_not_called()
+    assert not manifest_path.exists()
+
+
+def test_output_args_have_frame_rate(plugin):
+    assert not plugin._output_args_have_frame_rate(
+        ["-c:v libx264", "-pix_fmt yuv420p", "-rc-lookahead 10"]
+    )
+    assert plugin._output_args_have_frame_rate(["-c:v libx264 -r 24"])
+    assert plugin._output_args_have_frame_rate(["-r", "24"])
@@ -0,0 +1,197 @@
+import copy
+from unittest import mock
+
+import pytest
+
+from ayon_core.plugins.publish import extract_review_slate
+
+VIDEO_STREAM = {
+    "codec_type": "video",
+    "codec_name": "prores",
+    "profile": "HQ",
+    "width": 1920,
+    "height": 1080,
+    "level": -99,
+    "pix_fmt": "yuv422p10le",
+    "has_b_frames": 0,
+    "r_frame_rate": "25/1",
+    "time_base": "1/12800",
+    "sample_aspect_ratio": "1:1",
+}
+AUDIO_STREAM = {
+    "codec_type": "audio",
+    "codec_name": "aac",
+    "sample_rate": "48000",
+    "channels": 2,
+    "channel_layout": "stereo",
+}
+
+
+def _ffprobe_data(**video_changes):
+    video_stream = dict(VIDEO_STREAM, **video_changes)
+    return {"streams": [video_stream, dict(AUDIO_STREAM)], "format": {}}
+
+
+@pytest.fixture
+def plugin():
+    with mock.patch.object(
+        extract_review_slate,
+        "get_ffmpeg_tool_args",
+        side_effect=lambda tool_name, *args: [tool_name, *args]
+    ):
+        yield extract_review_slate.ExtractReviewSlate()
+
+
+def test_stream_copy_mismatches(plugin):
+    input_data = _ffprobe_data()
+    assert plugin._get_stream_copy_mismatches(
+        _ffprobe_data(), input_data, True
+    ) == []
+    # Undefined aspect ratio is square pixels
+    assert plugin._get_stream_copy_mismatches(
+        _ffprobe_data(sample_aspect_ratio="0:1"), input_data, True
+    ) == []
+    assert plugin._get_stream_copy_mismatches(
+        _ffprobe_data(pix_fmt="yuv444p", width=1280), input_data, True
+    ) == ["video:width", "video:pix_fmt"]
+    # Decoder parameters and timing must match too
+    assert plugin._get_stream_copy_mismatches(
+        _ffprobe_data(level=41, has_b_frames=2, time_base="1/25"),
+        input_data,
+        True
+    ) == ["video:level", "video:has_b_frames", "video:time_base"]
+    # Long-GOP codecs are never joined by stream copy
+    h264_data = _ffprobe_data(codec_name="h264", profile="High")
+    assert plugin._get_stream_copy_mismatches(
+        h264_data, h264_data, True
+    ) == ["video:not_intra_only"]
+
+    # Slate without audio can't be joined with review with audio
+    slate_data = _ffprobe_data()
+    slate_data["streams"].pop(1)
+    assert plugin._get_stream_copy_mismatches(
+        slate_data, input_data, True
+    ) == ["audio"]
+    assert plugin._get_stream_copy_mismatches(
+        slate_data, input_data, False
+    ) == []
+
+
+def _concat(plugin, tmp_path):
+    input_path = str(tmp_path / "review.mov")
+    plugin._concat_slate(
+        {"ffmpeg_cmd": "ffmpeg -metadata title=shot -b:v 10M"},
+        str(tmp_path / "slate.mov"),
+        input_path,
+        str(tmp_path / "review_slate.mov"),
+        False,
+        "00:59:59:24",
+        [],
+        ["-codec:v", "h264"],
+        _ffprobe_data(),
+    )
+
+
+def test_concat_reencodes_by_default(plugin, tmp_path):
+    with mock.patch.object(
+        extract_review_slate, "get_ffprobe_data",
+        return_value=_ffprobe_data()
+    ) as get_ffprobe_data, mock.patch.object(
+        extract_review_slate, "run_subprocess"
+    ) as run_subprocess:
+        _concat(plugin, tmp_path)
+
+    get_ffprobe_data.assert_not_called()
+    assert "-filter_complex" in run_subprocess.call_args[0][0]
+
+
+def test_concat_uses_stream_copy(plugin, tmp_path):
+    plugin.stream_copy_concat = True
+    concat_lists = []
+
+    def _run_subprocess(args, logger=None):
+        concat_path = args[args.index("-i") + 1]
+        with open(concat_path) as stream:
+            concat_lists.append(stream.read())
+
+    with mock.patch.object(
+        extract_review_slate, "get_ffprobe_data",
+        return_value=_ffprobe_data()
+    ), mock.patch.object(
+        extract_review_slate, "run_subprocess", side_effect=_run_subprocess
+    ) as run_subprocess:
+        _concat(plugin, tmp_path)
+
+    assert run_subprocess.call_count == 1
+    args = run_subprocess.call_args[0][0]
+    assert args[args.index("-c") + 1] == "copy"
+    assert "-filter_complex" not in args
+    assert "-b:v" not in args
+    assert args[args.index("-metadata") + 1] == "title=shot"
+    assert args[args.index("-timecode") + 1] == "00:59:59:24"
+    assert concat_lists == ["file '{}'\nfile '{}'\n".format(
+        (tmp_path / "slate.mov").as_posix(),
+        (tmp_path / "review.mov").as_posix(),
+    )]
+    # Concat list is removed
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_concat_fallback_to_reencode(plugin, tmp_path):
+    plugin.stream_copy_concat = True
+    slate_data = _ffprobe_data(profile="Main")
+    with mock.patch.object(
+        extract_review_slate, "get_ffprobe_data", return_value=slate_data
+    ), mock.patch.object(
+        extract_review_slate, "run_subprocess"
+    ) as run_subprocess:
+        _concat(plugin, tmp_path)
+
+    assert run_subprocess.call_count == 1
+    args = run_subprocess.call_args[0][0]
+    assert "-filter_complex" in args
+    assert args[args.index("-codec:v") + 1] == "h264"
+    assert args[args.index("-b:v") + 1] == "10M"
+
+    # Failed stream copy is re-encoded
+    with mock.patch.object(
+        extract_review_slate, "get_ffprobe_data",
+        return_value=_ffprobe_data()
+    ), mock.patch.object(
+        extract_review_slate, "run_subprocess",
+        side_effect=[RuntimeError("Concat failed"), None]
+    ) as run_subprocess:
+        _concat(plugin, tmp_path)
+
+    assert run_subprocess.call_count == 2
+    assert "-filter_complex" in run_subprocess.call_args[0][0]
+
+
+def test_representations_processed_concurrently(plugin):
+    repres = [
+        {"name": "h264", "tags": ["slate-frame", "review"]},
+        {"name": "thumbnail", "tags": []},
+        {"name": "prores", "tags": ["slate-frame"]},
+    ]
+    instance = mock.Mock()
+    instance.data = {
+        "representations": copy.deepcopy(repres),
+        "slateFrame": "/slate.png",
+    }
+
+    def _process(inst_data, repre, *args):
+        return {"files": "{}_slate.mov".format(repre["name"])}
+
+    with mock.patch.object(
+        plugin, "_process_representation", side_effect=_process
+    ) as process_repre:
+        plugin.process(instance)
+
+    assert process_repre.call_count == 2
+    output = instance.data["representations"]
+    assert output[0]["files"] == "h264_slate.mov"
+    assert "files" not in output[1]
+    assert output[2]["files"] == "prores_slate.mov"
+    assert plugin._get_max_concurrent_representations(1) == 1
+    plugin.concurrent_representations = False
+    assert plugin._get_max_concurrent_representations(3) == 1
@@ -0,0 +1,198 @@
+import sys
+import json
+import struct
+import textwrap
+from unittest import mock
+
+import pyblish.api
+import pytest
+
+from ayon_core.lib import MediaJobOrchestrator, is_tiled_exr
+from ayon_core.plugins.publish import extract_scanline_exr
+
+SCANLINE_HEADER = b"\x76\x2f\x31\x01" + struct.pack("<i", 2)
+TILED_HEADER = b"\x76\x2f\x31\x01" + struct.pack("<i", 2 | 0x200)
+
+# Fake 'oiiotool' writing scanline header to outputs and logging arguments
+FAKE_OIIOTOOL = textwrap.dedent("""
+    import sys
+    import json
+
+    args = sys.argv[1:]
+    with open(args.pop(0), "a") as stream:
+        stream.write(json.dumps(args) + "\\n")
+
+    frames = [None]
+    if args[0] == "--frames":
+        start, end = args[1].split("-")
+        frames = range(int(start), int(end) + 1)
+        args = args[2:]
+    input_path, _, _, output_path = args
+    for frame in frames:
+        src_path, dst_path = input_path, output_path
+        if frame is not None:
+            src_path, dst_path = input_path % frame, output_path % frame
+        with open(src_path, "rb") as stream:
+            assert stream.read() == {tiled!r}
+        with open(dst_path, "wb") as stream:
+            stream.write({scanline!r})
+""").format(tiled=TILED_HEADER, scanline=SCANLINE_HEADER)
+
+
+def _write(path, content):
+    with open(path, "wb") as stream:
+        stream.write(content)
+
+
+@pytest.fixture
+def oiiotool(tmp_path):
+    script_path = tmp_path / "oiiotool.py"
+    script_path.write_text(FAKE_OIIOTOOL)
+    calls_path = tmp_path / "calls.jsonl"
+    orchestrator = MediaJobOrchestrator(max_jobs=2)
+    with mock.patch.object(
+        extract_scanline_exr,
+        "get_oiio_tool_args",
+        return_value=[sys.executable, str(script_path), str(calls_path)],
+    ), mock.patch.object(
+        extract_scanline_exr,
+        "get_media_job_orchestrator",
+        return_value=orchestrator,
+    ):
+        yield calls_path
+    orchestrator.stop()
+
+
+def _get_calls(calls_path):
+    with open(calls_path, "r") as stream:
+        return [json.loads(line) for line in stream]
+
+
+def test_sequence_is_converted_in_chunks(tmp_path, oiiotool):
+    staging_dir = tmp_path / "render"
+    staging_dir.mkdir()
+    files = []
+    for frame in list(range(1001, 1011)) + [1015, 1016]:
+        filename = "render.{}.exr".format(frame)
+        files.append(filename)
+        header = TILED_HEADER
+        # Already converted frame is skipped
+        if frame == 1005:
+            header = SCANLINE_HEADER
+        _write(staging_dir / filename, header)
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("render")
+    instance.data["representations"] = [{
+        "name": "exr_tiled",
+        "ext": "exr",
+        "files": files,
+        "stagingDir": str(staging_dir),
+        "tags": ["toScanline"],
+    }]
+    extract_scanline_exr.ExtractScanlineExr().process(instance)
+
+    frames_args = sorted(
+        call[1] for call in _get_calls(oiiotool) if call[0] == "--frames"
+    )
+    assert frames_args == [
+        "1001-1004", "1006-1010", "1015-1016"
+    ]
+    for filename in files:
+        assert not is_tiled_exr(str(staging_dir / filename))
+    assert sorted(path.name for path in staging_dir.iterdir()) == sorted(
+        files
+    )
+    repre = instance.data["representations"][0]
+    assert repre["name"] == "exr"
+    assert repre["tags"] == []
+
+
+def test_single_file_and_failure(tmp_path, oiiotool):
+    _write(tmp_path / "still.exr", TILED_HEADER)
+    _write(tmp_path / "broken.exr", TILED_HEADER + b"broken")
+    plugin = extract_scanline_exr.ExtractScanlineExr()
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("still")
+    instance.data["representations"] = [{
+        "name": "exr",
+        "ext": "exr",
+        "files": "still.exr",
+        "stagingDir": str(tmp_path),
+        "tags": ["toScanline"],
+    }]
+    plugin.process(instance)
+    assert _get_calls(oiiotool)[0][-1] == str(tmp_path / "still.exr")
+    assert not is_tiled_exr(str(tmp_path / "still.exr"))
+
+    instance.data["representations"][0].update({
+        "files": "broken.exr",
+        "tags": ["toScanline"],
+    })
+    with pytest.raises(RuntimeError):
+        plugin.process(instance)
+    # Original file is kept when conversion failed
+    assert (tmp_path / "broken.exr").read_bytes() == TILED_HEADER + b"broken"
+    assert not (tmp_path / "__broken.exr").exists()
+
+
+def _attr(name, type_name, value):
+    return (
+        name + b"\0" + type_name + b"\0"
+        + struct.pack("<i", len(value)) + value
+    )
+
+
+def test_multipart_header(tmp_path):
+    header = b"\x76\x2f\x31\x01" + struct.pack("<i", 2 | 0x1000)
+    scanline_part = (
+        _attr(b"name", b"string", b"beauty")
+        + _attr(b"type", b"string", b"scanlineimage")
+        + b"\0"
+    )
+    tiled_part = (
+        _attr(b"name", b"string", b"depth")
+        + _attr(b"type", b"string", b"tiledimage")
+        + b"\0"
+    )
+    _write(tmp_path / "scanline.exr", header + scanline_part + b"\0")
+    _write(
+        tmp_path / "tiled.exr", header + scanline_part + tiled_part + b"\0"
+    )
+
+    assert not is_tiled_exr(str(tmp_path / "scanline.exr"))
+    assert is_tiled_exr(str(tmp_path / "tiled.exr"))
+
+
+def test_single_part_deep_header(tmp_path):
+    # Deep file does not set tiled flag
+    header = b"\x76\x2f\x31\x01" + struct.pack("<i", 2 | 0x800)
+    # Offset table follows the header
+    offsets = struct.pack("<q", 1024) * 2
+    for type_name, filename in (
+        (b"deepscanline", "deep_scanline.exr"),
+        (b"deeptile", "deep_tiled.exr"),
+    ):
+        part = (
+            _attr(b"name", b"string", b"depth")
+            + _attr(b"type", b"string", type_name)
+            + b"\0"
+        )
+        _write(tmp_path / filename, header + part + offsets)
+
+    assert not is_tiled_exr(str(tmp_path / "deep_scanline.exr"))
+    assert is_tiled_exr(str(tmp_path / "deep_tiled.exr"))
+
+
+@pytest.mark.parametrize("content", [
+    b"something",
+    b"\x76\x2f\x31\x01\x02",
+    b"\x76\x2f\x31\x01" + struct.pack("<i", 2 | 0x1000) + b"name\0str",
+])
+def test_invalid_exr_is_not_tiled(tmp_path, caplog, content):
+    filepath = tmp_path / "invalid.exr"
+    _write(filepath, content)
+
+    assert not is_tiled_exr(str(filepath))
+    assert "Failed to read EXR header" in caplog.text
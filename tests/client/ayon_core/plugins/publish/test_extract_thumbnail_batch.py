@@ -0,0 +1,161 @@
+import os
+import tempfile
+import threading
+from unittest import mock
+
+import pyblish.api
+import pytest
+
+from ayon_core.plugins.publish import extract_thumbnail
+
+
+class CaptureSubprocess:
+    """Mock ffmpeg subprocess which creates output file."""
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def run_subprocess(self, args, **kwargs):
+        assert isinstance(args, list)
+        assert not kwargs.get("shell")
+        with self._lock:
+            self.calls.append(args)
+        with open(args[-1], "w") as stream:
+            stream.write("")
+
+
+def _create_context(tmp_path, instances_count=3):
+    context = pyblish.api.Context()
+    context.data["cleanupFullPaths"] = []
+    for idx in range(instances_count):
+        staging_dir = tmp_path / f"render{idx}"
+        staging_dir.mkdir()
+        instance = context.create_instance(f"render{idx}")
+        instance.data.update({
+            "family": "render",
+            "productName": f"renderMain{idx}",
+            "representations": [
+                {
+                    "name": "exr",
+                    "ext": "exr",
+                    "files": [
+                        f"render.{frame}.exr" for frame in range(1001, 1011)
+                    ],
+                    "stagingDir": str(staging_dir),
+                    "tags": ["review"],
+                },
+            ],
+        })
+    return context
+
+
+@pytest.fixture
+def capture(tmp_path, monkeypatch):
+    # Temporary staging directories are created in test directory
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    capture = CaptureSubprocess()
+    with mock.patch.object(
+        extract_thumbnail, "run_subprocess", capture.run_subprocess
+    ), mock.patch.object(
+        extract_thumbnail, "is_oiio_supported", return_value=False
+    ), mock.patch.object(
+        extract_thumbnail,
+        "get_ffmpeg_tool_args",
+        side_effect=lambda tool, *args: [tool, *args],
+    ):
+        yield capture
+
+
+def _create_plugin(max_concurrent_jobs=0):
+    plugin = extract_thumbnail.ExtractThumbnail()
+    plugin.max_concurrent_jobs = max_concurrent_jobs
+    plugin.ffmpeg_args = {"input": ["-apply_trc gamma22"], "output": []}
+    return plugin
+
+
+@pytest.mark.parametrize("max_concurrent_jobs", [1, 3])
+def test_thumbnails_of_all_instances(tmp_path, capture, max_concurrent_jobs):
+    context = _create_context(tmp_path)
+    plugin = _create_plugin(max_concurrent_jobs)
+
+    with mock.patch.object(
+        plugin, "_prepare_job", wraps=plugin._prepare_job
+    ) as prepare_job:
+        plugin.process(context[0])
+        if max_concurrent_jobs > 1:
+            # Jobs of all instances are prepared on first instance
+            assert prepare_job.call_count == 3
+        for instance in list(context)[1:]:
+            plugin.process(instance)
+        assert prepare_job.call_count == 3
+
+    assert len(capture.calls) == 3
+    for instance in context:
+        thumbnail_repre = instance.data["representations"][-1]
+        assert thumbnail_repre["name"] == "thumbnail"
+        assert thumbnail_repre["files"] == "render.1006_thumb.jpg"
+        assert os.path.exists(instance.data["thumbnailPath"])
+
+    # Arguments from settings are split
+    assert "-apply_trc" in capture.calls[0]
+    assert "gamma22" in capture.calls[0]
+    assert not context.data["extractThumbnailJobs"]
+
+
+def test_review_video_without_ffprobe(tmp_path, capture):
+    context = _create_context(tmp_path, instances_count=1)
+    instance = context[0]
+    instance.data["representations"] = [{
+        "name": "h264",
+        "ext": "mov",
+        "files": "renderMain_h264.mov",
+        "stagingDir": str(tmp_path),
+        "tags": ["review"],
+        "fps": 25.0,
+        "frameStartFtrack": 1001,
+        "frameEndFtrack": 1100,
+    }]
+    plugin = _create_plugin()
+    with mock.patch.object(
+        extract_thumbnail, "get_ffprobe_data", side_effect=AssertionError
+    ):
+        plugin.process(instance)
+
+    # Frame is extracted and converted with single ffmpeg process
+    assert len(capture.calls) == 1
+    args = capture.calls[0]
+    assert args[args.index("-ss") + 1] == "2.0"
+    assert args[-1].endswith("renderMain_h264_thumb.jpg")
+    assert instance.data["representations"][-1]["name"] == "thumbnail"
+
+
+def test_video_fallback_when_frame_extraction_fails(tmp_path, capture):
+    context = _create_context(tmp_path, instances_count=1)
+    instance = context[0]
+    instance.data["representations"] = [{
+        "name": "h264",
+        "ext": "mov",
+        "files": "renderMain_h264.mov",
+        "stagingDir": str(tmp_path),
+        "tags": ["review"],
+        "colorspaceData": {"colorspace": "ACEScg"},
+        "fps": 25.0,
+        "frameStartFtrack": 1001,
+        "frameEndFtrack": 1100,
+    }]
+    plugin = _create_plugin()
+    with mock.patch.object(
+        extract_thumbnail, "is_oiio_supported", return_value=True
+    ), mock.patch.object(
+        plugin, "_create_frame_from_video", return_value=None
+    ), mock.patch.object(
+        plugin, "_create_thumbnail_oiio", side_effect=AssertionError
+    ):
+        plugin.process(instance)
+
+    # Video is passed to ffmpeg directly
+    assert len(capture.calls) == 1
+    args = capture.calls[0]
+    assert args[args.index("-i") + 1].endswith("renderMain_h264.mov")
+    assert args[-1].endswith("renderMain_h264_thumb.jpg")
+    assert instance.data["representations"][-1]["name"] == "thumbnail"
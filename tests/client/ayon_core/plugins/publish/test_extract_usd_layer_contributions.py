@@ -0,0 +1,81 @@
+import copy
+from unittest import mock
+
+import pytest
+
+from ayon_core.plugins.publish import extract_usd_layer_contributions
+from ayon_core.plugins.publish.extract_usd_layer_contributions import (
+    USDLayerCache,
+)
+
+
+class _Layer:
+    """Minimal 'Sdf.Layer' replacement storing specs in a dictionary."""
+    opened_paths = []
+
+    def __init__(self, specs=None):
+        self.specs = specs or {}
+        self.exported = []
+
+    @classmethod
+    def OpenAsAnonymous(cls, path):
+        cls.opened_paths.append(path)
+        return cls({"/root": path})
+
+    @classmethod
+    def CreateAnonymous(cls):
+        return cls()
+
+    def TransferContent(self, layer):
+        self.specs = copy.deepcopy(layer.specs)
+
+    def Export(self, filepath, args=None):
+        self.exported.append(filepath)
+
+
+@pytest.fixture
+def layer_cache():
+    _Layer.opened_paths = []
+    sdf = mock.Mock(Layer=_Layer)
+    with mock.patch.object(extract_usd_layer_contributions, "Sdf", sdf):
+        yield USDLayerCache()
+
+
+def test_open_layer_returns_copies(layer_cache):
+    first = layer_cache.open_layer("/publish/asset_v001.usd")
+    first.specs["/root/model"] = "instance A"
+
+    second = layer_cache.open_layer("/publish/asset_v001.usd")
+    assert second is not first
+    assert second.specs == {"/root": "/publish/asset_v001.usd"}
+
+    # File is read only once
+    assert _Layer.opened_paths == ["/publish/asset_v001.usd"]
+    assert layer_cache.counters["opened"] == 1
+    assert layer_cache.counters["open_hits"] == 1
+
+
+def test_resolve_path_is_cached(layer_cache):
+    func = mock.Mock(return_value="/publish/asset_v001.usd")
+    for _ in range(3):
+        path = layer_cache.resolve_path(("latest", "asset"), func, "asset")
+        assert path == "/publish/asset_v001.usd"
+
+    func.assert_called_once_with("asset")
+    assert layer_cache.counters["resolved"] == 1
+    assert layer_cache.counters["resolve_hits"] == 2
+
+
+def test_export_all_writes_each_path_once(layer_cache):
+    first = layer_cache.open_layer("/publish/asset_v001.usd")
+    second = layer_cache.open_layer("/publish/asset_v001.usd")
+    layer_cache.add_export(first, "/staging/a/asset.usd")
+    layer_cache.add_export(second, "/staging/b/asset.usd")
+    # Latest layer scheduled for the same path is exported
+    layer_cache.add_export(second, "/staging/a/../a/asset.usd")
+
+    exported = layer_cache.export_all()
+    assert len(exported) == 2
+    assert first.exported == []
+    assert len(second.exported) == 2
+    assert layer_cache.export_all() == []
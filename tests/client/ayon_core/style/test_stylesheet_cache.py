@@ -0,0 +1,59 @@
+import os
+import json
+import collections
+
+import pytest
+
+from ayon_core import style
+
+
+def _naive_stylesheet():
+    """Previous implementation replacing each key over whole stylesheet."""
+    with open(os.path.join(style.current_dir, "style.css"), "r") as stream:
+        stylesheet = stream.read()
+    with open(os.path.join(style.current_dir, "data.json"), "r") as stream:
+        data = json.load(stream)
+
+    data_deque = collections.deque(data.items())
+    fill_data = {}
+    while data_deque:
+        key, value = data_deque.popleft()
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                data_deque.append((f"{key}:{sub_key}", sub_value))
+            continue
+        fill_data[key] = value
+
+    for key, value in fill_data.items():
+        stylesheet = stylesheet.replace("{" + key + "}", value)
+    return stylesheet
+
+
+@pytest.fixture
+def local_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AYON_LAUNCHER_LOCAL_DIR", str(tmp_path))
+    monkeypatch.setattr(style._Cache, "stylesheet", None)
+    return tmp_path
+
+
+def test_stylesheet_matches_per_key_replace(local_dir):
+    assert style._build_stylesheet() == _naive_stylesheet()
+
+
+def test_stylesheet_disk_cache(local_dir, monkeypatch):
+    stylesheet = style._load_stylesheet()
+    cache_dir = local_dir / "stylesheets"
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1
+
+    # Cached stylesheet is used without building
+    def _build_stylesheet():
+        raise AssertionError("Stylesheet should be loaded from cache")
+
+    monkeypatch.setattr(style, "_build_stylesheet", _build_stylesheet)
+    assert style._load_stylesheet() == stylesheet
+
+    # Different colors data use different cache file
+    monkeypatch.setattr(style._Cache, "colors_raw_data_hash", "changed")
+    assert style._get_stylesheet_cache_key() != cache_files[0][:-4]
+
@@ -0,0 +1,154 @@
+import collections
+from unittest import mock
+
+import pytest  # noqa
+
+from ayon_core.tools.loader.models import contexts
+
+
+PROJECT_NAME = "test_project"
+
+
+class MockServer():
+    """ Mock of 'ayon_api' entity queries counting server calls.
+    """
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.project = {"name": PROJECT_NAME}
+        self.folders = {
+            "folder1": {"id": "folder1", "name": "sh010"},
+        }
+        self.products = {
+            "product1": {
+                "id": "product1", "folderId": "folder1", "name": "modelMain"
+            },
+            "product2": {
+                "id": "product2", "folderId": "folder1", "name": "rigMain"
+            },
+        }
+        self.versions = {
+            "version1": {"id": "version1", "productId": "product1"},
+            "version2": {"id": "version2", "productId": "product2"},
+        }
+        self.representations = {
+            "repre1": {"id": "repre1", "versionId": "version1", "name": "abc"},
+            "repre2": {"id": "repre2", "versionId": "version1", "name": "ma"},
+            "repre3": {"id": "repre3", "versionId": "version2", "name": "ma"},
+        }
+
+    def get_project(self, project_name):
+        self.calls["project"] += 1
+        return self.project
+
+    def get_folders(self, project_name, folder_ids):
+        self.calls["folder"] += 1
+        return [
+            self.folders[folder_id]
+            for folder_id in folder_ids
+            if folder_id in self.folders
+        ]
+
+    def get_products(self, project_name, product_ids):
+        self.calls["product"] += 1
+        return [
+            self.products[product_id]
+            for product_id in product_ids
+            if product_id in self.products
+        ]
+
+    def get_versions(self, project_name, version_ids):
+        self.calls["version"] += 1
+        return [
+            self.versions[version_id]
+            for version_id in version_ids
+            if version_id in self.versions
+        ]
+
+    def get_representations(
+        self, project_name, representation_ids=None, version_ids=None
+    ):
+        self.calls["representation"] += 1
+        return [
+            repre
+            for repre in self.representations.values()
+            if (
+                (representation_ids and repre["id"] in representation_ids)
+                or (version_ids and repre["versionId"] in version_ids)
+            )
+        ]
+
+
+@pytest.fixture
+def server():
+    server = MockServer()
+    with mock.patch.object(contexts, "ayon_api", server):
+        yield server
+
+
+def test_version_repre_contexts(server):
+    resolver = contexts.LoaderContextResolver(contexts.LoaderEntitiesCache())
+    version_contexts, repre_contexts = resolver.get_version_repre_contexts(
+        PROJECT_NAME, ["version1", "version2"]
+    )
+
+    assert set(version_contexts) == {"version1", "version2"}
+    assert set(repre_contexts) == {"repre1", "repre2", "repre3"}
+    repre_context = repre_contexts["repre3"]
+    assert repre_context["project"] is server.project
+    assert repre_context["folder"]["id"] == "folder1"
+    assert repre_context["product"]["id"] == "product2"
+    assert repre_context["version"]["id"] == "version2"
+    assert repre_context["representation"]["name"] == "ma"
+
+
+def test_repeated_resolve_does_not_query_server(server):
+    entities_cache = contexts.LoaderEntitiesCache()
+    resolver = contexts.LoaderContextResolver(entities_cache)
+
+    # Listing actions of selected versions
+    resolver.get_version_repre_contexts(PROJECT_NAME, ["version1"])
+    calls = dict(server.calls)
+    assert calls == {
+        "project": 1,
+        "folder": 1,
+        "product": 1,
+        "version": 1,
+        "representation": 1,
+    }
+
+    # Same selection listed again and triggered
+    resolver.get_version_repre_contexts(PROJECT_NAME, ["version1"])
+    resolver.get_version_contexts(PROJECT_NAME, ["version1"])
+    repre_contexts = resolver.get_representation_contexts(
+        PROJECT_NAME, ["repre1", "repre2"]
+    )
+    assert set(repre_contexts) == {"repre1", "repre2"}
+    assert dict(server.calls) == calls
+
+    stats = entities_cache.get_stats()
+    assert stats["version"]["queries"] == 1
+    assert stats["version"]["hits"] == 3
+    assert stats["representation"]["hit_ratio"] > 0.5
+
+    entities_cache.reset()
+    resolver.get_version_contexts(PROJECT_NAME, ["version1"])
+    assert server.calls["version"] == 2
+
+
+def test_entities_stored_by_other_models_are_used(server):
+    entities_cache = contexts.LoaderEntitiesCache()
+    entities_cache.update_entities(
+        PROJECT_NAME, "product", server.products.values()
+    )
+    entities_cache.update_entities(
+        PROJECT_NAME, "version", server.versions.values()
+    )
+    resolver = contexts.LoaderContextResolver(entities_cache)
+
+    version_contexts = resolver.get_version_contexts(
+        PROJECT_NAME, ["version1", "version2", "missing"]
+    )
+    assert set(version_contexts) == {"version1", "version2"}
+    assert "product" not in server.calls
+    # Missing version is queried only once
+    assert server.calls["version"] == 1
@@ -0,0 +1,124 @@
+import os
+from unittest import mock
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+try:
+    from qtpy import QtWidgets, QtCore, QtGui
+
+    from ayon_core.tools.loader.ui.products_model import (
+        ProductsModel,
+        PRODUCT_NAME_ROLE,
+        PRODUCT_TYPE_ROLE,
+        STATUS_NAME_FILTER_ROLE,
+    )
+    from ayon_core.tools.loader.ui.products_widget import ProductsProxyModel
+except ImportError:
+    pytest.skip(
+        "Qt bindings or UI dependencies are not available",
+        allow_module_level=True
+    )
+
+ROOT_ITEMS_COUNT = 10
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
+
+def _create_item(idx):
+    product_type = "model" if idx % 2 else "render"
+    product_name = f"{product_type}Main{idx:02d}"
+    item = QtGui.QStandardItem(product_name)
+    item.setData(product_type, PRODUCT_TYPE_ROLE)
+    item.setData(product_name, PRODUCT_NAME_ROLE)
+    item.setData("Approved" if idx == 9 else "In progress",
+                 STATUS_NAME_FILTER_ROLE)
+    return item
+
+
+@pytest.fixture
+def models(qt_app):
+    """Products model with lazily populated rows and proxy model."""
+    model = ProductsModel(mock.Mock())
+    model.fetch_batch_size = 2
+    items = [_create_item(idx) for idx in range(ROOT_ITEMS_COUNT)]
+    items.sort(key=model._root_item_sort_key)
+    model.invisibleRootItem().appendRows(items[:2])
+    model._pending_root_items = items[2:]
+
+    proxy_model = ProductsProxyModel()
+    proxy_model.setSourceModel(model)
+    return model, proxy_model
+
+
+def test_fetch_more(models):
+    model, proxy_model = models
+    root_index = QtCore.QModelIndex()
+    assert model.canFetchMore(root_index)
+
+    model.fetchMore(root_index)
+    assert model.rowCount() == 4
+
+    # Default sorting does not need all rows
+    proxy_model.sort(model.product_type_col, QtCore.Qt.AscendingOrder)
+    assert model.rowCount() == 4
+
+    model.fetch_all()
+    assert model.rowCount() == ROOT_ITEMS_COUNT
+    assert not model.canFetchMore(root_index)
+
+
+def test_statuses_filter_fetches_all_rows(models):
+    model, proxy_model = models
+    proxy_model.set_statuses_filter(["Approved"])
+
+    assert model.rowCount() == ROOT_ITEMS_COUNT
+    assert proxy_model.rowCount() == 1
+    index = proxy_model.index(0, 0)
+    assert index.data(PRODUCT_NAME_ROLE) == "modelMain09"
+
+
+def test_product_type_filter_fetches_all_rows(models):
+    model, proxy_model = models
+    # All product types enabled is not a filter
+    proxy_model.set_product_type_filters({"model": True, "render": True})
+    assert model.rowCount() == 2
+
+    proxy_model.set_product_type_filters({"model": True, "render": False})
+    assert model.rowCount() == ROOT_ITEMS_COUNT
+    assert proxy_model.rowCount() == ROOT_ITEMS_COUNT // 2
+
+
+def test_name_filter_fetches_all_rows(models):
+    model, proxy_model = models
+    proxy_model.setFilterFixedString("Main07")
+
+    assert model.rowCount() == ROOT_ITEMS_COUNT
+    assert proxy_model.rowCount() == 1
+
+
+def test_sort_change_fetches_all_rows(models):
+    model, proxy_model = models
+    proxy_model.sort(model.product_name_col, QtCore.Qt.DescendingOrder)
+
+    assert model.rowCount() == ROOT_ITEMS_COUNT
+    index = proxy_model.index(0, model.product_name_col)
+    assert index.data(PRODUCT_NAME_ROLE) == "renderMain08"
+
+
+def test_refresh_with_filter_fetches_new_rows(models):
+    model, proxy_model = models
+    proxy_model.set_statuses_filter(["In progress"])
+    assert model.rowCount() == ROOT_ITEMS_COUNT
+
+    # New lazily populated rows after refresh
+    items = [_create_item(idx) for idx in range(10, 14)]
+    model._pending_root_items = items
+    proxy_model.fetch_all_if_needed()
+    assert model.rowCount() == ROOT_ITEMS_COUNT + len(items)
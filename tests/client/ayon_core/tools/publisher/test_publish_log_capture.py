@@ -0,0 +1,161 @@
+import sys
+import logging
+from unittest import mock
+
+import pyblish.api
+
+from ayon_core.tools.publisher.models import publish
+from ayon_core.tools.publisher.models.publish import (
+    LogRecordBuffer,
+    MessageHandler,
+    PublishLogItem,
+    PublishReportMaker,
+)
+
+
+class CollectSomething(pyblish.api.InstancePlugin):
+    order = pyblish.api.CollectorOrder
+    label = "Collect Something"
+
+
+def _create_logger(handler):
+    log = logging.getLogger("test_publish_log_capture")
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    log.handlers = [handler]
+    return log
+
+
+def test_buffer_keeps_newest_and_retained_items():
+    log_buffer = LogRecordBuffer(max_records=3)
+    for idx in range(10):
+        levelno = logging.INFO
+        if idx in (1, 4):
+            levelno = logging.WARNING
+        log_buffer.add(levelno, idx)
+
+    assert log_buffer.get_items() == [1, 4, 7, 8, 9]
+    assert log_buffer.dropped_count == 5
+    assert len(log_buffer) == 5
+
+    log_buffer.add_dropped(2)
+    assert log_buffer.dropped_count == 7
+
+    unlimited_buffer = LogRecordBuffer()
+    for idx in range(10):
+        unlimited_buffer.add(logging.DEBUG, idx)
+    assert unlimited_buffer.get_items() == list(range(10))
+    assert unlimited_buffer.dropped_count == 0
+
+
+def test_handler_formats_lazily():
+    handler = MessageHandler(max_records=3)
+    log = _create_logger(handler)
+
+    data = {"key": "value"}
+    log.info("Value %s of %d", "text", 1)
+    log.info("Data %s", data)
+    log.info("List %s", [1])
+    # Changes after logging do not affect the message
+    data["key"] = "changed"
+    try:
+        raise ValueError("Failed")
+    except ValueError:
+        log.error("Error happened", exc_info=True)
+    log.debug("Last")
+
+    records = handler.get_records()
+    assert all(isinstance(record, PublishLogItem) for record in records)
+    assert [record.levelno for record in records] == [
+        logging.INFO, logging.INFO, logging.ERROR, logging.DEBUG
+    ]
+    assert handler.get_dropped_count() == 1
+
+    data_record, list_record, error_record, _ = records
+    assert data_record.get_message() == "Data {'key': 'value'}"
+    # Message with object arguments is formatted right away
+    assert list_record.args is None
+    assert list_record.msg == "List [1]"
+
+    exc_info = error_record.to_data()["exc_info"]
+    assert exc_info.startswith("Traceback (most recent call last)")
+    assert "ValueError: Failed" in exc_info
+
+    handler.clear_records()
+    log.info("Value %s of %d", "text", 1)
+    record = handler.get_records()[0]
+    # Simple arguments are kept and message is formatted on demand
+    assert record.args == ("text", 1)
+    assert record.to_data()["msg"] == "Value text of 1"
+
+
+def test_report_limits_records_per_plugin():
+    maker = PublishReportMaker()
+    maker.set_max_log_records(5)
+    discover_result = mock.Mock(
+        plugins=[CollectSomething], crashed_file_paths={}
+    )
+    maker.reset(None, None, discover_result)
+
+    handler = MessageHandler(max_records=5)
+    log = _create_logger(handler)
+    context = pyblish.api.Context()
+    instances = [context.create_instance(f"inst{idx}") for idx in range(3)]
+    maker.add_plugin_iter(CollectSomething.id, context)
+    for instance in instances:
+        handler.clear_records()
+        for idx in range(4):
+            log.info("%s info %d", instance.name, idx)
+        log.warning("%s warning", instance.name)
+        maker.add_result(CollectSomething.id, {
+            "instance": instance,
+            "records": handler.get_records(),
+            "dropped_records": handler.get_dropped_count(),
+            "duration": 0.1,
+        })
+
+    report = maker.get_report(context)
+    plugin_data = report["plugins_data"][0]
+    logs_by_instance = {
+        instance_data["id"]: [log["msg"] for log in instance_data["logs"]]
+        for instance_data in plugin_data["instances_data"]
+    }
+    assert logs_by_instance == {
+        instances[0].id: ["inst0 warning"],
+        instances[1].id: ["inst1 info 3", "inst1 warning"],
+        instances[2].id: [
+            "inst2 info 0",
+            "inst2 info 1",
+            "inst2 info 2",
+            "inst2 info 3",
+            "inst2 warning",
+        ],
+    }
+    assert plugin_data["dropped_logs"] == 7
+    assert all(
+        log["instance_id"] == instance_data["id"]
+        for instance_data in plugin_data["instances_data"]
+        for log in instance_data["logs"]
+    )
+
+
+def test_max_log_records_env(monkeypatch):
+    monkeypatch.delenv("AYON_PUBLISHER_MAX_LOG_RECORDS", raising=False)
+    assert publish.get_max_log_records() == publish.DEFAULT_MAX_LOG_RECORDS
+    monkeypatch.setenv("AYON_PUBLISHER_MAX_LOG_RECORDS", "20")
+    assert publish.get_max_log_records() == 20
+    monkeypatch.setenv("AYON_PUBLISHER_MAX_LOG_RECORDS", "0")
+    assert publish.get_max_log_records() is None
+
+
+def test_record_item_does_not_keep_traceback_frames():
+    try:
+        raise RuntimeError("Crash")
+    except RuntimeError:
+        record = logging.LogRecord(
+            "name", logging.ERROR, __file__, 1, "msg", None, sys.exc_info()
+        )
+    item = PublishLogItem.from_record(record)
+    assert item.exc_info is not record.exc_info
+    assert not hasattr(item.exc_info, "exc_traceback")
+    assert "RuntimeError: Crash" in item.get_exc_info()
@@ -0,0 +1,174 @@
+import os
+import json
+from unittest import mock
+
+import pytest
+
+from ayon_core.tools.publisher.models import PublishReportStore
+from ayon_core.tools.publisher.models import report_store
+
+
+def _create_report(report_id, plugins_count=20, logs_count=50):
+    plugins_data = []
+    for plugin_idx in range(plugins_count):
+        logs = [
+            {
+                "type": "record",
+                "msg": f"Processing item {log_idx} of plugin {plugin_idx}",
+                "levelno": 20,
+                "levelname": "INFO",
+            }
+            for log_idx in range(logs_count)
+        ]
+        if plugin_idx == 3:
+            logs.append({"type": "error", "msg": "Validation failed"})
+        plugins_data.append({
+            "id": f"plugin{plugin_idx}",
+            "name": f"Plugin{plugin_idx}",
+            "label": None,
+            "order": plugin_idx,
+            "skipped": False,
+            "passed": True,
+            "instances_data": [
+                {"id": "instance1", "logs": logs, "process_time": 0.1}
+            ],
+            "actions_data": [],
+        })
+    return {
+        "plugins_data": plugins_data,
+        "instances": {"instance1": {"name": "modelMain", "exists": True}},
+        "context": {"label": "Context"},
+        "crashed_file_paths": {},
+        "id": report_id,
+        "created_at": "2024-01-01T10:00:00+00:00",
+        "report_version": "1.1.0",
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PublishReportStore(str(tmp_path / "reports"))
+
+
+def test_report_roundtrip(store):
+    report = _create_report("report1")
+    item = store.add_report(report, label="First")
+
+    assert item["label"] == "First"
+    assert item["summary"]["errors_count"] == 1
+    assert item["summary"]["error_message"] == "Validation failed"
+    assert item["filename"].endswith(report_store.REPORT_ROWS_EXT)
+    # Compressed rows are smaller than json content
+    assert item["size"] < len(json.dumps(report)) / 5
+
+    content = store.load_report("report1")
+    assert content["label"] == "First"
+    content.pop("label")
+    assert content == report
+
+
+def test_listing_reads_only_index(store):
+    for idx in range(5):
+        store.add_report(_create_report(f"report{idx}"))
+
+    new_store = PublishReportStore(store.root_dir)
+    with mock.patch.object(
+        report_store, "read_report_rows", side_effect=AssertionError
+    ):
+        items = new_store.get_items()
+    assert {item["id"] for item in items} == {
+        f"report{idx}" for idx in range(5)
+    }
+
+    # Label change does not rewrite report body
+    filepath = os.path.join(store.root_dir, items[0]["filename"])
+    mtime = os.path.getmtime(filepath)
+    new_store.set_label(items[0]["id"], "Renamed")
+    assert os.path.getmtime(filepath) == mtime
+    assert PublishReportStore(store.root_dir).get_item(
+        items[0]["id"]
+    )["label"] == "Renamed"
+
+    new_store.remove_report(items[1]["id"])
+    assert not os.path.exists(
+        os.path.join(store.root_dir, items[1]["filename"])
+    )
+    assert len(PublishReportStore(store.root_dir).get_items()) == 4
+
+
+def test_legacy_reports_are_converted(store):
+    os.makedirs(store.root_dir)
+    legacy_report = _create_report("report1", plugins_count=2)
+    legacy_report["label"] = "Legacy"
+    legacy_report.pop("created_at")
+    with open(os.path.join(store.root_dir, "report1"), "w") as stream:
+        json.dump(legacy_report, stream)
+
+    items = store.get_items()
+    assert len(items) == 1
+    assert items[0]["label"] == "Legacy"
+    assert items[0]["created_at"]
+    assert len(store.load_report("report1")["plugins_data"]) == 2
+    # Original file is kept as backup
+    assert not os.path.isfile(os.path.join(store.root_dir, "report1"))
+    backup_path = os.path.join(
+        store.root_dir, store.legacy_dirname, "report1"
+    )
+    with open(backup_path, "r") as stream:
+        assert json.load(stream) == legacy_report
+
+
+def test_indexed_legacy_reports_are_not_converted(store):
+    store.add_report(_create_report("report1"), label="Label")
+    legacy_path = os.path.join(store.root_dir, "report1")
+    with open(legacy_path, "w") as stream:
+        json.dump(_create_report("report1", plugins_count=2), stream)
+
+    store.reset()
+    with mock.patch.object(store, "_convert_legacy_report") as convert_mock:
+        items = store.get_items()
+    convert_mock.assert_not_called()
+    assert [item["label"] for item in items] == ["Label"]
+    assert os.path.isfile(
+        os.path.join(store.root_dir, store.legacy_dirname, "report1")
+    )
+
+
+def test_invalid_legacy_report_is_kept(store):
+    os.makedirs(store.root_dir)
+    legacy_path = os.path.join(store.root_dir, "invalid")
+    with open(legacy_path, "w") as stream:
+        stream.write("{")
+
+    assert store.get_items() == []
+    assert os.path.isfile(legacy_path)
+
+
+def test_index_is_rebuilt(store):
+    store.add_report(_create_report("report1"), label="Label")
+    os.remove(os.path.join(store.root_dir, store.index_filename))
+
+    items = PublishReportStore(store.root_dir).get_items()
+    assert [item["id"] for item in items] == ["report1"]
+    assert items[0]["summary"]["errors_count"] == 1
+
+
+def test_import_exported_files(store, tmp_path):
+    json_path = tmp_path / "exported.json"
+    json_path.write_text(json.dumps(_create_report("exported")))
+    item = store.import_file(str(json_path))
+    assert item["id"] == "exported"
+    # Same report is not imported twice
+    assert store.import_file(str(json_path)) == item
+
+    rows_path = tmp_path / f"copied{report_store.REPORT_ROWS_EXT}"
+    report_store.write_report_rows(
+        str(rows_path),
+        report_store.iter_report_rows(_create_report("copied"))
+    )
+    assert store.import_file(str(rows_path))["id"] == "copied"
+
+    invalid_path = tmp_path / "invalid.json"
+    invalid_path.write_text("{")
+    assert store.import_file(str(invalid_path)) is None
+    assert len(store.get_items()) == 2
@@ -0,0 +1,506 @@
+import os
+import uuid
+import threading
+import collections
+from unittest import mock
+
+import pytest
+
+from ayon_core.lib import StringTemplate
+from ayon_core.lib.file_transaction import FileTransaction
+from ayon_core.pipeline.anatomy.templates import AnatomyTemplateResult
+from ayon_core.tools.push_to_project.control import PushToContextController
+from ayon_core.tools.push_to_project.models import integrate
+
+
+SRC_PROJECT = "src_project"
+DST_PROJECT = "dst_project"
+
+
+def _entity_id(name):
+    return uuid.uuid5(uuid.NAMESPACE_OID, name).hex
+
+
+class RootedTemplate(StringTemplate):
+    """Template which fills rootless path like anatomy templates do."""
+    def __init__(self, template, root):
+        super().__init__(template)
+        self._root = root
+
+    def format(self, data):
+        result = super().format(data)
+        rootless = str(result).replace(self._root, "{root[work]}")
+        return AnatomyTemplateResult(result, rootless)
+
+
+class FakeAnatomy:
+    def __init__(self, root):
+        self.roots = {"work": root}
+        directory = (
+            "{root[work]}/{project[name]}/{folder[name]}"
+            "/{product[name]}/v{version:0>3}"
+        )
+        file_template = "{product[name]}_v{version:0>3}<.{frame:0>4}>.{ext}"
+        self._templates = {
+            "directory": RootedTemplate(directory, root),
+            "file": RootedTemplate(file_template, root),
+            "path": RootedTemplate(
+                "/".join([directory, file_template]), root
+            ),
+        }
+
+    def get_template_item(self, category, name, key=None):
+        if key is None:
+            return self._templates
+        return self._templates[key]
+
+
+class FakeOperationsSession:
+    committed = []
+
+    def __init__(self):
+        self._operations = []
+
+    def create_entity(self, project_name, entity_type, entity):
+        self._operations.append(("create", entity_type, entity))
+
+    def update_entity(self, project_name, entity_type, entity_id, changes):
+        self._operations.append(("update", entity_type, entity_id))
+
+    def clear(self):
+        self._operations = []
+
+    def commit(self):
+        self.committed.extend(self._operations)
+        self._operations = []
+
+
+class MockServer:
+    """Mock of 'ayon_api' entity queries counting server calls."""
+    def __init__(self, root):
+        self.calls = collections.Counter()
+        self.folders = {
+            SRC_PROJECT: {
+                _entity_id("srcfolder"): {
+                    "id": _entity_id("srcfolder"),
+                    "name": "char",
+                    "path": "/char",
+                    "attrib": {"fps": 25.0},
+                },
+            },
+            DST_PROJECT: {
+                _entity_id("dstfolder"): {
+                    "id": _entity_id("dstfolder"),
+                    "name": "assets",
+                    "path": "/assets",
+                    "parentId": None,
+                    "attrib": {},
+                },
+            },
+        }
+        self.products = {
+            SRC_PROJECT: {},
+            DST_PROJECT: {
+                _entity_id("dstproduct"): {
+                    "id": _entity_id("dstproduct"),
+                    "name": "modelExisting",
+                    "productType": "model",
+                    "folderId": _entity_id("dstfolder"),
+                },
+            },
+        }
+        self.versions = {SRC_PROJECT: {}, DST_PROJECT: {}}
+        self.representations = []
+        for idx in range(3):
+            product_id = _entity_id(f"srcproduct{idx}")
+            version_id = _entity_id(f"srcversion{idx}")
+            self.products[SRC_PROJECT][product_id] = {
+                "id": product_id,
+                "name": f"modelMain{idx}",
+                "productType": "model",
+                "folderId": _entity_id("srcfolder"),
+            }
+            self.versions[SRC_PROJECT][version_id] = {
+                "id": version_id,
+                "version": 1,
+                "productId": product_id,
+                "attrib": {"fps": 25.0},
+            }
+            self.representations.append(
+                self._create_src_repre(root, idx, version_id)
+            )
+
+    def _create_src_repre(self, root, idx, version_id):
+        src_dir = os.path.join(root, SRC_PROJECT, f"model{idx}")
+        os.makedirs(src_dir)
+        files = []
+        for frame in range(1001, 1004):
+            filename = f"model{idx}.{frame}.exr"
+            with open(os.path.join(src_dir, filename), "w") as stream:
+                stream.write(f"{idx} {frame}")
+            files.append({
+                "path": f"{{root[work]}}/{SRC_PROJECT}/model{idx}/{filename}"
+            })
+        return {
+            "id": _entity_id(f"srcrepre{idx}"),
+            "name": "exr",
+            "versionId": version_id,
+            "attrib": {
+                "template": (
+                    "{root[work]}/{project[name]}/{folder[name]}"
+                    "/model{idx}.{frame:0>4}.{ext}"
+                ),
+            },
+            "context": {
+                "root": {"work": root},
+                "project": {"name": SRC_PROJECT},
+                "folder": {"name": f"model{idx}"},
+                "idx": idx,
+                "frame": 1001,
+                "ext": "exr",
+            },
+            "files": files,
+        }
+
+    def get_project(self, project_name):
+        self.calls["get_project"] += 1
+        return {"name": project_name, "taskTypes": []}
+
+    def get_versions(self, project_name, version_ids):
+        self.calls["get_versions"] += 1
+        versions = self.versions[project_name]
+        return [versions[i] for i in version_ids if i in versions]
+
+    def get_products(
+        self, project_name, product_ids=None, folder_ids=None, active=None
+    ):
+        self.calls["get_products"] += 1
+        return [
+            product
+            for product in self.products[project_name].values()
+            if (
+                (product_ids and product["id"] in product_ids)
+                or (folder_ids and product["folderId"] in folder_ids)
+            )
+        ]
+
+    def get_folders(
+        self,
+        project_name,
+        folder_ids=None,
+        parent_ids=None,
+        active=None,
+        fields=None,
+        own_attributes=False,
+    ):
+        self.calls["get_folders"] += 1
+        return [
+            folder
+            for folder in self.folders[project_name].values()
+            if (
+                (folder_ids and folder["id"] in folder_ids)
+                or (parent_ids and folder.get("parentId") in parent_ids)
+            )
+        ]
+
+    def get_tasks(self, project_name, folder_ids):
+        self.calls["get_tasks"] += 1
+        return []
+
+    def get_representations(self, project_name, version_ids):
+        self.calls["get_representations"] += 1
+        return [
+            repre
+            for repre in self.representations
+            if repre["versionId"] in version_ids
+        ]
+
+    def get_last_versions(self, project_name, product_ids):
+        self.calls["get_last_versions"] += 1
+        return {
+            product_id: {
+                "id": _entity_id("dstversion"),
+                "version": 4,
+                "productId": product_id,
+            }
+            for product_id in product_ids
+        }
+
+    def get_version_by_name(self, project_name, version, product_id):
+        self.calls["get_version_by_name"] += 1
+        return None
+
+    def slugify_string(self, value):
+        return value
+
+    def __getattr__(self, name):
+        # Single entity queries should not be used in batch
+        raise AssertionError(f"Unexpected call of '{name}'")
+
+
+@pytest.fixture
+def server(tmp_path):
+    root = str(tmp_path).replace("\\", "/")
+    server = MockServer(root)
+    anatomy = FakeAnatomy(root)
+    FakeOperationsSession.committed = []
+
+    def _get_product_name(
+        project_name, task_name, task_type, host_name, product_type, variant,
+        project_settings=None
+    ):
+        return f"{product_type}{variant}"
+
+    def _get_template_data(project_entity, folder_entity, *args):
+        return {
+            "project": {"name": project_entity["name"]},
+            "folder": {"name": folder_entity["name"]},
+        }
+
+    with mock.patch.object(integrate, "ayon_api", server), \
+            mock.patch.object(
+                integrate, "OperationsSession", FakeOperationsSession
+            ), \
+            mock.patch.object(
+                integrate.ProjectPushEntitiesCache,
+                "get_anatomy",
+                return_value=anatomy
+            ), \
+            mock.patch.object(
+                integrate.ProjectPushEntitiesCache,
+                "get_project_settings",
+                return_value={}
+            ), \
+            mock.patch.object(
+                integrate, "get_publish_template_name", return_value="default"
+            ), \
+            mock.patch.object(
+                integrate, "get_product_name", _get_product_name
+            ), \
+            mock.patch.object(
+                integrate, "get_template_data", _get_template_data
+            ):
+        yield server
+
+
+def _item_data(idx, **kwargs):
+    data = {
+        "src_project_name": SRC_PROJECT,
+        "src_version_id": _entity_id(f"srcversion{idx}"),
+        "dst_project_name": DST_PROJECT,
+        "dst_folder_id": _entity_id("dstfolder"),
+        "dst_task_name": None,
+        "variant": "Main",
+        "comment": None,
+        "new_folder_name": None,
+        "dst_version": 1,
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_filename_template_matches_full_formatting():
+    template = StringTemplate(
+        "{product[name]}_v{version:0>3}<.{frame:0>4}><_{udim}>.{ext}"
+    )
+    data = {"product": {"name": "render"}, "version": 2, "ext": "exr"}
+    filename_template = integrate._FilenameTemplate(template, data)
+    for frame, udim in ((None, None), (1, None), (12345, None), (5, "1001")):
+        expected = filename_template.format_strict(frame, udim)
+        assert filename_template.format(frame, udim) == expected
+    # Template was formatted with placeholders
+    assert filename_template._compiled_by_key[(True, False)] is not None
+
+    # Conversion can't be pre-formatted, full formatting is used instead
+    template = StringTemplate("{product[name]}.{frame!s}.{ext}")
+    filename_template = integrate._FilenameTemplate(template, data)
+    assert filename_template.format(10) == "render.10.exr"
+    assert filename_template._compiled_by_key[(True, False)] is None
+
+
+def test_batch_push(server, tmp_path):
+    model = integrate.IntegrateModel(mock.Mock())
+    batch_id = model.create_batch_process(
+        [
+            _item_data(0, new_folder_name="newAsset", variant="A"),
+            _item_data(1, new_folder_name="newAsset", variant="B"),
+            _item_data(2, variant="Existing", dst_version=None),
+        ],
+        max_workers=4,
+    )
+    model.integrate_batch(batch_id)
+
+    status = model.get_batch_status(batch_id)
+    assert status["finished"]
+    assert status["failed_count"] == 0
+    assert status["finished_count"] == 3
+    assert status["files_count"] == status["files_transferred"] == 9
+
+    # Entities were queried in bulk
+    assert server.calls["get_versions"] == 1
+    assert server.calls["get_representations"] == 1
+    assert server.calls["get_tasks"] == 1
+    assert server.calls["get_last_versions"] == 1
+    # Only existing product requires check of version existence
+    assert server.calls["get_version_by_name"] == 1
+
+    created = collections.Counter(
+        entity_type
+        for operation, entity_type, _ in FakeOperationsSession.committed
+        if operation == "create"
+    )
+    # Folder is created once and used by the second item
+    assert created["folder"] == 1
+    assert created["product"] == 2
+    assert created["version"] == 3
+    assert created["representation"] == 3
+
+    dst_dir = tmp_path / DST_PROJECT
+    assert (
+        dst_dir / "newAsset" / "modelB" / "v001" / "modelB_v001.1002.exr"
+    ).read_text() == "1 1002"
+    assert (
+        dst_dir / "assets" / "modelExisting" / "v005"
+        / "modelExisting_v005.1003.exr"
+    ).exists()
+
+
+def test_failed_item_does_not_stop_batch(server):
+    model = integrate.IntegrateModel(mock.Mock())
+    batch_id = model.create_batch_process([
+        _item_data(0, src_version_id=_entity_id("missing")),
+        _item_data(1),
+    ])
+    model.integrate_batch(batch_id)
+
+    status = model.get_batch_status(batch_id)
+    assert status["failed_count"] == 1
+    assert status["finished_count"] == 1
+    failed_status = [
+        item_status
+        for item_status in status["items"].values()
+        if item_status["failed"]
+    ][0]
+    assert "was not found" in failed_status["fail_reason"]
+
+
+def test_dependent_items_canceled_when_creator_fails(server, tmp_path):
+    commit = FakeOperationsSession.commit
+    commits = []
+
+    def _commit(session):
+        commits.append(list(session._operations))
+        # First item creating folder fails
+        if len(commits) == 1:
+            raise RuntimeError("Server error")
+        commit(session)
+
+    model = integrate.IntegrateModel(mock.Mock())
+    batch_id = model.create_batch_process(
+        [
+            _item_data(0, new_folder_name="newAsset", variant="A"),
+            _item_data(1, new_folder_name="newAsset", variant="B"),
+            _item_data(2, variant="Existing", dst_version=None),
+        ],
+        max_workers=4,
+    )
+    processes = model._batch_processes[batch_id].processes
+    with mock.patch.object(FakeOperationsSession, "commit", _commit):
+        model.integrate_batch(batch_id)
+
+    status = model.get_batch_status(batch_id)
+    assert status["failed_count"] == 2
+    assert status["finished_count"] == 1
+    assert processes[1].dependency_item_ids == {processes[0].item_id}
+    assert not processes[2].dependency_item_ids
+
+    # Dependent item did not try to commit
+    assert len(commits) == 2
+    dependent_status = status["items"][processes[1].item_id]
+    assert "Depends on entities of failed item" in (
+        dependent_status["fail_reason"]
+    )
+    created = {
+        entity_type
+        for operation, entity_type, _ in FakeOperationsSession.committed
+        if operation == "create"
+    }
+    assert "folder" not in created
+    # Transferred files of canceled items were removed
+    assert not list((tmp_path / DST_PROJECT / "newAsset").rglob("*.exr"))
+    assert (tmp_path / DST_PROJECT / "assets" / "modelExisting").exists()
+
+
+def test_transfer_failure_events_emitted_from_batch_thread(server):
+    event_threads = set()
+    controller = mock.Mock()
+    controller.emit_event.side_effect = (
+        lambda *args: event_threads.add(threading.current_thread())
+    )
+    process_transaction = FileTransaction.process
+
+    def _process(transaction, *args, **kwargs):
+        if any(
+            "model0" in src for src, _ in transaction._transfers.values()
+        ):
+            raise OSError("Disk is full")
+        return process_transaction(transaction, *args, **kwargs)
+
+    model = integrate.IntegrateModel(controller)
+    batch_id = model.create_batch_process(
+        [_item_data(idx, variant=str(idx)) for idx in range(3)],
+        max_workers=4,
+    )
+    with mock.patch.object(FileTransaction, "process", _process):
+        model.integrate_batch(batch_id)
+
+    status = model.get_batch_status(batch_id)
+    assert status["failed_count"] == 1
+    assert status["finished_count"] == 2
+    assert event_threads == {threading.current_thread()}
+
+
+def test_controller_submits_batch(server):
+    controller = PushToContextController()
+    controller._submission_enabled = True
+    items_data = [_item_data(0), _item_data(1, dst_version=None)]
+    with mock.patch.object(
+        controller, "_get_push_items_data", return_value=items_data
+    ):
+        batch_id = controller.submit(wait=True)
+
+    status = controller.get_batch_status(batch_id)
+    assert status["finished"]
+    assert status["finished_count"] == 2
+
+
+def test_parallel_file_transaction(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    transaction = FileTransaction(max_workers=4)
+    for idx in range(20):
+        src_path = src_dir / f"file{idx}.txt"
+        src_path.write_text(str(idx))
+        transaction.add(str(src_path), str(tmp_path / "dst" / src_path.name))
+
+    progress = []
+    transaction.process(lambda done, total: progress.append((done, total)))
+    transaction.finalize()
+    assert len(transaction.transferred) == 20
+    assert progress[-1] == (20, 20)
+    assert (tmp_path / "dst" / "file7.txt").read_text() == "7"
+
+    # Transferred files are removed on rollback when a transfer fails
+    transaction = FileTransaction(max_workers=4)
+    for idx in range(5):
+        transaction.add(
+            str(src_dir / f"file{idx}.txt"),
+            str(tmp_path / "dst2" / f"file{idx}.txt")
+        )
+    transaction.add(
+        str(src_dir / "missing.txt"), str(tmp_path / "dst2" / "missing.txt")
+    )
+    with pytest.raises(OSError):
+        transaction.process()
+    transaction.rollback()
+    assert not list((tmp_path / "dst2").iterdir())
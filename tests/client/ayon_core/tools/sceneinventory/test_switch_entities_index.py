@@ -0,0 +1,112 @@
+import collections
+from unittest import mock
+
+import pytest
+
+from ayon_core.tools.sceneinventory.models import switch_entities
+from ayon_core.tools.sceneinventory.models import SwitchEntitiesIndex
+
+
+PROJECT_NAME = "test_project"
+
+
+class MockServer:
+    """Mock of 'ayon_api' entity queries counting server calls."""
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.products = [
+            {"id": "p1", "name": "modelMain", "folderId": "f1"},
+            {"id": "p2", "name": "rigMain", "folderId": "f1"},
+            {"id": "p3", "name": "modelMain", "folderId": "f2"},
+            {"id": "p4", "name": "lookMain", "folderId": "f2"},
+        ]
+        self.last_versions = {
+            "p1": {"id": "v1", "productId": "p1", "version": 3},
+            "p2": {"id": "v2", "productId": "p2", "version": 1},
+            "p3": {"id": "v3", "productId": "p3", "version": 2},
+        }
+        self.representations = [
+            {"id": "r1", "name": "abc", "versionId": "v1"},
+            {"id": "r2", "name": "ma", "versionId": "v1"},
+            {"id": "r3", "name": "ma", "versionId": "v2"},
+            {"id": "r4", "name": "abc", "versionId": "v3"},
+            {"id": "r5", "name": "usd", "versionId": "v_old"},
+        ]
+
+    def get_products(self, project_name, folder_ids, fields=None):
+        self.calls["products"] += 1
+        return [
+            product
+            for product in self.products
+            if product["folderId"] in folder_ids
+        ]
+
+    def get_last_versions(self, project_name, product_ids, fields=None):
+        self.calls["last_versions"] += 1
+        return {
+            product_id: self.last_versions[product_id]
+            for product_id in product_ids
+            if product_id in self.last_versions
+        }
+
+    def get_representations(self, project_name, version_ids, fields=None):
+        self.calls["representations"] += 1
+        return [
+            repre
+            for repre in self.representations
+            if repre["versionId"] in version_ids
+        ]
+
+
+@pytest.fixture
+def server():
+    server = MockServer()
+    with mock.patch.object(switch_entities, "ayon_api", server):
+        yield server
+
+
+def test_index_answers_from_memory(server):
+    index = SwitchEntitiesIndex(PROJECT_NAME)
+    index.prefetch_folders(["f1", "f2"])
+    index.prefetch_versions(["v1", "v_old"])
+    assert server.calls == {
+        "products": 1, "last_versions": 1, "representations": 2
+    }
+
+    assert set(index.get_products_by_name("f1")) == {"modelMain", "rigMain"}
+    assert index.get_last_version("f2", "modelMain")["id"] == "v3"
+    # Product without version
+    assert index.get_last_version("f2", "lookMain") is None
+    assert index.get_last_version_repres_by_name("f2", "lookMain") is None
+    assert index.get_last_version("f1", "missing") is None
+    assert set(
+        index.get_last_version_repres_by_name("f1", "modelMain")
+    ) == {"abc", "ma"}
+    assert index.get_last_versions_repre_names("f1") == {
+        "modelMain": {"abc", "ma"},
+        "rigMain": {"ma"},
+    }
+    assert index.get_last_versions_repre_names("f2", ["modelMain"]) == {
+        "modelMain": {"abc"},
+    }
+    assert set(index.get_version_repres_by_name("v_old")) == {"usd"}
+    # Nothing was queried after prefetch
+    assert server.calls == {
+        "products": 1, "last_versions": 1, "representations": 2
+    }
+
+
+def test_index_lazy_folder_and_reset(server):
+    index = SwitchEntitiesIndex(PROJECT_NAME)
+    assert index.get_products_by_name("f3") == {}
+    assert server.calls == {"products": 1}
+
+    assert index.get_product("f1", "rigMain")["id"] == "p2"
+    index.get_products_by_name("f1")
+    assert server.calls == {
+        "products": 2, "last_versions": 1, "representations": 1
+    }
+
+    index.reset()
+    index.get_products_by_name("f1")
+    assert server.calls["products"] == 3
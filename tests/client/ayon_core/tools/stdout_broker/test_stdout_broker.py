@@ -0,0 +1,157 @@
+import sys
+import json
+import time
+import threading
+
+import pytest
+
+pytest.importorskip("websocket")
+
+from ayon_core.tools.tray import HostMsgAction  # noqa: E402
+from ayon_core.tools.stdout_broker import broker  # noqa: E402
+
+
+class FakeWebSocketModule:
+    """Mock of 'websocket' module collecting sent messages."""
+    class WebSocketException(Exception):
+        pass
+
+    def __init__(self, failed_connections=0, failed_sends=0):
+        self.messages = []
+        self.connections = 0
+        self.failed_connections = failed_connections
+        self.failed_sends = failed_sends
+        self._lock = threading.Lock()
+
+    def WebSocket(self):
+        module = self
+
+        class _WebSocket:
+            def connect(self, url, timeout=None):
+                assert url == "ws://localhost:8079/ws/host_listener"
+                with module._lock:
+                    if module.failed_connections:
+                        module.failed_connections -= 1
+                        raise ConnectionRefusedError()
+                    module.connections += 1
+
+            def send(self, message):
+                data = json.loads(message)
+                with module._lock:
+                    if (
+                        data["action"] == HostMsgAction.ADD
+                        and module.failed_sends
+                    ):
+                        module.failed_sends -= 1
+                        raise ConnectionResetError()
+                    module.messages.append(data)
+
+            def close(self):
+                pass
+
+        return _WebSocket()
+
+    def get_actions(self):
+        with self._lock:
+            return [message["action"] for message in self.messages]
+
+    def get_text(self):
+        with self._lock:
+            return "\n".join(
+                message["text"]
+                for message in self.messages
+                if message["action"] == HostMsgAction.ADD
+            )
+
+
+class FastBroker(broker.StdOutBroker):
+    TIMER_TIMEOUT = 0.01
+    RECONNECT_MIN_DELAY = 0.01
+    RECONNECT_MAX_DELAY = 0.05
+
+
+@pytest.fixture
+def create_broker(monkeypatch):
+    monkeypatch.setenv("AYON_WEBSERVER_URL", "http://localhost:8079")
+    brokers = []
+
+    def _create_broker(websocket_module):
+        monkeypatch.setattr(broker, "websocket", websocket_module)
+        stdout_broker = FastBroker("test")
+        brokers.append(stdout_broker)
+        return stdout_broker
+
+    yield _create_broker
+    for stdout_broker in brokers:
+        stdout_broker.stop()
+
+
+def _wait_for(condition, timeout=5):
+    started = time.time()
+    while not condition():
+        assert time.time() - started < timeout
+        time.sleep(0.01)
+
+
+def test_outputs_are_sent_in_batches(create_broker):
+    websocket_module = FakeWebSocketModule()
+    stdout_broker = create_broker(websocket_module)
+    stdout_write = stdout_broker._my_stdout_write
+    stdout_broker.start()
+    stdout_broker.host_connected()
+
+    for idx in range(1000):
+        sys.stdout.write("line {}".format(idx))
+    _wait_for(lambda: "line 999" in websocket_module.get_text())
+
+    actions = websocket_module.get_actions()
+    assert actions[:2] == [
+        HostMsgAction.CONNECTING, HostMsgAction.INITIALIZED
+    ]
+    assert actions.count(HostMsgAction.ADD) < 100
+    # Other outputs, like logs, are sent too
+    lines = [
+        line
+        for line in websocket_module.get_text().split("\n")
+        if line.startswith("line ")
+    ]
+    assert lines == ["line {}".format(idx) for idx in range(1000)]
+
+    stdout_broker.stop()
+    assert websocket_module.get_actions()[-1] == HostMsgAction.CLOSE
+    assert sys.stdout.write != stdout_write
+    assert websocket_module.connections == 1
+
+
+def test_writes_do_not_wait_for_tray(create_broker):
+    websocket_module = FakeWebSocketModule(failed_connections=5)
+    stdout_broker = create_broker(websocket_module)
+    stdout_broker.MAX_LINES = 10
+    stdout_broker.start()
+
+    for idx in range(50):
+        stdout_broker._my_stdout_write("line {}".format(idx))
+
+    _wait_for(lambda: "line 49" in websocket_module.get_text())
+    text = websocket_module.get_text()
+    assert text.startswith("... (40 lines dropped)")
+    assert text.endswith("\n".join(
+        "line {}".format(idx) for idx in range(40, 50)
+    ))
+    assert stdout_broker.dropped_lines == 40
+
+
+def test_lines_are_sent_after_reconnection(create_broker):
+    websocket_module = FakeWebSocketModule(failed_sends=1)
+    stdout_broker = create_broker(websocket_module)
+    stdout_broker.start()
+
+    stdout_broker._my_stderr_write("first")
+    _wait_for(lambda: websocket_module.connections == 2)
+    stdout_broker._my_stderr_write("second")
+    _wait_for(lambda: "second" in websocket_module.get_text())
+
+    assert websocket_module.get_text() == "first\nsecond"
+    assert websocket_module.get_actions().count(
+        HostMsgAction.CONNECTING
+    ) == 2
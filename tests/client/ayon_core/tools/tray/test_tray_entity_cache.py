@@ -0,0 +1,189 @@
+import time
+import collections
+from unittest import mock
+
+import pytest
+
+from ayon_core.tools.common_models import tray_cache
+
+
+PROJECT_NAME = "test_project"
+
+
+class MockServer:
+    """Mock of 'ayon_api' queries counting server calls."""
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.events = []
+
+    def get_projects(self, fields=None):
+        self.calls["projects"] += 1
+        return iter([{"name": PROJECT_NAME, "active": True, "library": False}])
+
+    def get_project(self, project_name):
+        self.calls["project"] += 1
+        if project_name != PROJECT_NAME:
+            return None
+        return {"name": PROJECT_NAME, "statuses": [], "taskTypes": []}
+
+    def get_folders_hierarchy(self, project_name):
+        self.calls["hierarchy"] += 1
+        return {"projectName": project_name, "hierarchy": []}
+
+    def get_tasks(self, project_name, folder_ids, fields=None):
+        self.calls["tasks"] += 1
+        return iter([
+            {"id": "t1", "name": "modeling", "folderId": folder_ids[0]}
+        ])
+
+    def get_project_product_types(self, project_name):
+        self.calls["product_types"] += 1
+        return [{"name": "model"}]
+
+    def get_addons_settings(self, bundle_name, project_name, variant):
+        self.calls["settings"] += 1
+        return {"core": {"bundle": bundle_name, "project": project_name}}
+
+    def get_events(self, topics, newer_than, fields):
+        self.calls["events"] += 1
+        events, self.events = self.events, []
+        return iter(events)
+
+
+@pytest.fixture
+def server():
+    return MockServer()
+
+
+@pytest.fixture
+def entity_cache(server):
+    pytest.importorskip("aiohttp")
+    from ayon_core.tools.tray.webserver import entity_cache
+
+    with mock.patch.object(entity_cache, "ayon_api", server):
+        yield entity_cache
+
+
+@pytest.fixture
+def tray_url(entity_cache):
+    from ayon_core.tools.tray.webserver import (
+        WebServerManager,
+        find_free_port,
+    )
+
+    service = entity_cache.EntityCacheService(events_interval=0)
+    manager = WebServerManager(find_free_port(port_from=8100))
+    service.register(manager)
+    manager.start_server()
+    while manager.webserver_thread.site is None:
+        time.sleep(0.01)
+
+    tray_info = {"started": True, "url": manager.url, "pid": -1}
+    tray_cache.reset_tray_cache_connection()
+    with mock.patch(
+        "ayon_core.tools.tray.lib.get_tray_file_info",
+        return_value=tray_info,
+    ):
+        yield manager.url
+
+    manager.stop_server()
+    manager.webserver_thread.join()
+    tray_cache.reset_tray_cache_connection()
+
+
+def test_values_are_shared_through_tray(server, tray_url):
+    for _ in range(3):
+        assert tray_cache.get_projects()[0]["name"] == PROJECT_NAME
+        assert tray_cache.get_project(PROJECT_NAME)["statuses"] == []
+        assert tray_cache.get_project("missing") is None
+        hierarchy = tray_cache.get_folders_hierarchy(PROJECT_NAME)
+        assert hierarchy["projectName"] == PROJECT_NAME
+        tasks = tray_cache.get_folder_tasks(PROJECT_NAME, "f1")
+        assert tasks[0]["folderId"] == "f1"
+        product_types = tray_cache.get_project_product_types(PROJECT_NAME)
+        assert product_types == [{"name": "model"}]
+        settings = tray_cache.get_addons_settings(
+            "bundle", "production", PROJECT_NAME
+        )
+        assert settings["core"]["project"] == PROJECT_NAME
+
+    assert server.calls == {
+        "projects": 1,
+        "project": 2,
+        "hierarchy": 1,
+        "tasks": 1,
+        "product_types": 1,
+        "settings": 1,
+    }
+
+    tray_cache.get_folders_hierarchy(PROJECT_NAME, refresh=True)
+    assert server.calls["hierarchy"] == 2
+
+    stats = tray_cache.get_tray_cache_stats()
+    assert stats["misses"] == 8
+    assert stats["hits"] == 14
+    assert stats["categories"]["hierarchy"]["hits"] == 2
+
+    assert tray_cache.invalidate_tray_cache(PROJECT_NAME)
+    tray_cache.get_projects()
+    tray_cache.get_folders_hierarchy(PROJECT_NAME)
+    assert server.calls["projects"] == 1
+    assert server.calls["hierarchy"] == 3
+
+
+def test_fallback_without_tray(server):
+    tray_cache.reset_tray_cache_connection()
+    with mock.patch.object(tray_cache, "ayon_api", server), mock.patch(
+        "ayon_core.tools.tray.lib.get_tray_file_info",
+        return_value=None,
+    ):
+        assert tray_cache.get_projects()[0]["name"] == PROJECT_NAME
+        assert tray_cache.get_folder_tasks(PROJECT_NAME, "f1")
+        assert tray_cache.get_tray_cache_stats() is None
+    assert server.calls == {"projects": 1, "tasks": 1}
+
+
+def test_lifetime_and_events(server, entity_cache):
+    service = entity_cache.EntityCacheService(
+        lifetime=60, settings_lifetime=0
+    )
+    getter = mock.Mock(return_value="value")
+
+    assert service.get_value(("hierarchy", PROJECT_NAME), getter) == "value"
+    assert service.get_value(("hierarchy", PROJECT_NAME), getter) == "value"
+    assert getter.call_count == 1
+
+    # Expired value is queried again
+    service.get_value(("settings", None, "bundle"), getter, lifetime=0)
+    service.get_value(("settings", None, "bundle"), getter, lifetime=0)
+    assert getter.call_count == 3
+
+    service.get_value(("hierarchy", "other_project"), getter)
+    service.get_value(("projects", None), getter)
+    assert getter.call_count == 5
+
+    # Folder change invalidates only data of the project
+    server.events = [{
+        "topic": "entity.folder.created",
+        "project": PROJECT_NAME,
+        "createdAt": "9999-01-01T00:00:00+00:00",
+    }]
+    service._next_events_check = 0
+    service.get_value(("hierarchy", PROJECT_NAME), getter)
+    service.get_value(("hierarchy", "other_project"), getter)
+    service.get_value(("projects", None), getter)
+    assert getter.call_count == 6
+    assert service._events_newer_than == "9999-01-01T00:00:00+00:00"
+
+    # Events are not checked again before interval
+    server.events = [{
+        "topic": "entity.project.created",
+        "project": None,
+        "createdAt": "9999-01-01T00:00:01+00:00",
+    }]
+    service.get_value(("projects", None), getter)
+    assert getter.call_count == 6
+    service._next_events_check = 0
+    service.get_value(("projects", None), getter)
+    assert getter.call_count == 7
+    assert server.calls["events"] == 3
@@ -0,0 +1,141 @@
+import os
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+try:
+    from qtpy import QtWidgets, QtGui
+
+    from ayon_core.tools.workfiles.widgets import files_widget_workarea
+    from ayon_core.tools.workfiles.widgets.files_widget_workarea import (
+        FILENAME_ROLE,
+        WorkAreaFilesWidget,
+    )
+except ImportError:
+    pytest.skip(
+        "Qt bindings or UI dependencies are not available",
+        allow_module_level=True
+    )
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    # Icons are not important and icon fonts may differ between versions
+    with mock.patch.object(
+        files_widget_workarea.qtawesome,
+        "icon",
+        side_effect=lambda *args, **kwargs: QtGui.QIcon()
+    ):
+        yield app
+
+
+class _Controller:
+    def __init__(self, file_items):
+        self.callbacks = {}
+        self.file_items = file_items
+        self.expected_workfile_selected = mock.Mock()
+
+    def register_event_callback(self, topic, callback):
+        self.callbacks[topic] = callback
+
+    def emit(self, topic, data):
+        self.callbacks[topic](data)
+
+    def get_workarea_file_items(self, folder_id, task_name):
+        # Scan is slower than rest of the event handling
+        time.sleep(0.05)
+        if isinstance(self.file_items, Exception):
+            raise self.file_items
+        return self.file_items
+
+    def get_user_items_by_name(self):
+        return {}
+
+    def set_selected_workfile_path(self, filepath):
+        pass
+
+
+def _file_item(filename, modified):
+    return SimpleNamespace(
+        filename=filename,
+        filepath=f"/work/{filename}",
+        updated_by=None,
+        modified=modified,
+    )
+
+
+def _wait_for(qt_app, condition, timeout=5.0):
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end, "Condition was not met in time"
+        qt_app.processEvents()
+        time.sleep(0.01)
+
+
+def _selected_filename(widget):
+    return widget._get_selected_info()["filename"]
+
+
+def test_expected_workfile_is_selected_after_refresh(qt_app):
+    controller = _Controller([
+        _file_item("sh010_anim_v001.ma", 10.0),
+        _file_item("sh010_anim_v002.ma", 20.0),
+    ])
+    widget = WorkAreaFilesWidget(controller, None)
+    controller.emit(
+        "selection.task.changed", {"folder_id": "folder", "task_name": "anim"}
+    )
+    _wait_for(qt_app, lambda: _selected_filename(widget) is not None)
+    # Latest modified file is selected by default
+    assert _selected_filename(widget) == "sh010_anim_v002.ma"
+
+    controller.emit("expected_selection_changed", {
+        "folder": {"id": "folder"},
+        "task": {"name": "anim"},
+        "workfile": {"current": True, "name": "sh010_anim_v001.ma"},
+    })
+    # Selection is not changed before refreshed items are filled
+    controller.expected_workfile_selected.assert_not_called()
+
+    _wait_for(qt_app, lambda: controller.expected_workfile_selected.called)
+    controller.expected_workfile_selected.assert_called_once_with(
+        "folder", "anim", "sh010_anim_v001.ma"
+    )
+    assert _selected_filename(widget) == "sh010_anim_v001.ma"
+
+
+def test_failed_refresh_is_logged(qt_app):
+    controller = _Controller(OSError("Storage is not available"))
+    widget = WorkAreaFilesWidget(controller, None)
+    with mock.patch.object(files_widget_workarea, "log") as log:
+        controller.emit(
+            "selection.task.changed",
+            {"folder_id": "folder", "task_name": "anim"}
+        )
+        _wait_for(qt_app, lambda: log.warning.called)
+    assert "Storage is not available" in log.warning.call_args[0][0]
+    assert widget._model.rowCount() == 1
+    assert widget._model.index(0, 0).data(FILENAME_ROLE) is None
+
+
+def test_refresh_result_ignored_in_published_mode(qt_app):
+    controller = _Controller([_file_item("sh010_anim_v001.ma", 10.0)])
+    widget = WorkAreaFilesWidget(controller, None)
+    model = widget._model
+    controller.emit(
+        "selection.task.changed", {"folder_id": "folder", "task_name": "anim"}
+    )
+    thread = model._current_refresh_thread
+    widget.set_published_mode(True)
+
+    _wait_for(qt_app, lambda: not model._refresh_threads)
+    assert thread.isFinished()
+    assert model.get_index_by_filename("sh010_anim_v001.ma").isValid() is (
+        False
+    )
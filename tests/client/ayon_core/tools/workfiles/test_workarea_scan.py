@@ -0,0 +1,111 @@
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from ayon_core.tools.workfiles.abstract import WorkfileInfo
+from ayon_core.tools.workfiles.models import workarea_scan
+from ayon_core.tools.workfiles.models.workarea_scan import (
+    WorkareaFileScanner,
+)
+from ayon_core.tools.workfiles.models.workfiles import (
+    WorkareaModel,
+    WorkfileEntitiesModel,
+)
+
+
+def _set_old_mtime(dirpath):
+    # Make sure the scan is not considered as racy
+    mtime = time.time() - 10
+    os.utime(dirpath, (mtime, mtime))
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    for filename in ("sh010_v001.ma", "sh010_v002.MA", "notes.txt"):
+        (workdir / filename).write_text(filename)
+    (workdir / "subdir.ma").mkdir()
+    _set_old_mtime(workdir)
+    return workdir
+
+
+class FakeController:
+    def __init__(self, workdir, file_scanner):
+        self.workdir = str(workdir)
+        self.entities_model = WorkfileEntitiesModel(self, file_scanner)
+
+    def is_host_valid(self):
+        return True
+
+    def get_workfile_extensions(self):
+        return [".ma"]
+
+    def get_workfile_info(self, folder_id, task_name, filepath):
+        return self.entities_model._prepare_workfile_info_item(
+            folder_id, task_name, None, filepath
+        )
+
+
+def test_scan_is_cached_until_workdir_changes(workdir):
+    scanner = WorkareaFileScanner()
+    with mock.patch.object(
+        workarea_scan.os, "scandir", wraps=os.scandir
+    ) as scandir:
+        files = scanner.get_files(str(workdir), {".ma"})
+        assert sorted(item.filename for item in files) == [
+            "sh010_v001.ma", "sh010_v002.MA"
+        ]
+        scanner.get_files(str(workdir))
+        assert scandir.call_count == 1
+
+        (workdir / "sh010_v003.ma").write_text("")
+        _set_old_mtime(workdir)
+        # Directory modification time is same, but invalidation is forced
+        scanner.invalidate(str(workdir))
+        files = scanner.get_files(str(workdir), {".ma"})
+        assert scandir.call_count == 2
+        assert len(files) == 3
+
+        (workdir / "sh010_v004.ma").write_text("")
+        files = scanner.get_files(str(workdir), {".ma"})
+        assert scandir.call_count == 3
+        assert len(files) == 4
+
+
+def test_scan_collects_stat(workdir):
+    scanner = WorkareaFileScanner()
+    scanned_file = {
+        item.filename: item
+        for item in scanner.get_files(str(workdir))
+    }["sh010_v001.ma"]
+    stat = os.stat(workdir / "sh010_v001.ma")
+    assert scanned_file.size == stat.st_size
+    assert scanned_file.modification_time == stat.st_mtime
+    assert scanner.get_file(scanned_file.filepath) is scanned_file
+    assert scanner.get_files(str(workdir / "missing")) == []
+
+
+def test_workarea_file_items_use_scan(workdir):
+    scanner = WorkareaFileScanner()
+    controller = FakeController(workdir, scanner)
+    model = WorkareaModel(controller, scanner)
+
+    with mock.patch.object(
+        model, "get_workarea_dir_by_context", return_value=str(workdir)
+    ), mock.patch("os.stat", wraps=os.stat) as stat_mock:
+        items = model.get_file_items("folder_id", "task_id", "anim")
+        stat_calls = stat_mock.call_count
+
+    assert sorted(item.filename for item in items) == [
+        "sh010_v001.ma", "sh010_v002.MA"
+    ]
+    # Only directory is stat-ed, files use stat from the scan
+    assert stat_calls == 1
+    info = controller.get_workfile_info(
+        "folder_id", "anim", os.path.join(str(workdir), "sh010_v001.ma")
+    )
+    assert isinstance(info, WorkfileInfo)
+    assert info.filesize == len("sh010_v001.ma")